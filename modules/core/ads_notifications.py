@@ -0,0 +1,200 @@
+"""
+ADS Notification Registry
+Referenzgezählte On-Change Device-Notifications pro PLC-Verbindung
+
+📁 SPEICHERORT: modules/core/ads_notifications.py
+
+Statt jedes Symbol zyklisch zu pollen, meldet die SPS Änderungen selbst
+(ADSTRANS_SERVERONCHA). Pro Symbol existiert genau ein ADS-Handle, egal
+wie viele Widgets es abonniert haben:
+- add()    → erstes Abo registriert das Handle, weitere erhöhen nur den Zähler
+- remove() → letztes Abo gibt das Handle frei
+- bind()   → neue Verbindung: alte Handles verfallen, Zähler bleiben erhalten
+- reattach() → Handles nach Reconnect neu registrieren
+
+Symbole ohne aktives Handle (Registrierung fehlgeschlagen, getrennt)
+bleiben im Polling (is_active() == False).
+
+Genutzt von PLCCommunication und PLCConnection.
+"""
+
+import ctypes
+import os
+import threading
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import pyads
+    PYADS_AVAILABLE = True
+except ImportError:
+    PYADS_AVAILABLE = False
+
+
+class ADSNotificationRegistry:
+    """
+    Verwaltet Device-Notifications einer ADS-Verbindung
+
+    Args:
+        cycle_time_ms: Prüfzyklus der SPS für Änderungen
+        max_delay_ms: Max. Verzögerung bis zur Auslieferung
+    """
+
+    def __init__(self, cycle_time_ms: float = 100.0, max_delay_ms: float = 0.0):
+        self.cycle_time_ms = max(0.0, float(cycle_time_ms))
+        self.max_delay_ms = max(0.0, float(max_delay_ms))
+        self.plc = None
+        self._lock = threading.RLock()
+        # symbol -> {'refs', 'plc_type', 'callback', 'handles'}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self.stats = {
+            'registrations': 0,
+            'registration_failures': 0,
+            'releases': 0,
+            'notifications': 0,
+            'parse_errors': 0
+        }
+
+    def bind(self, plc: Any):
+        """Setzt die (neue) ADS-Verbindung - bestehende Handles verfallen"""
+        with self._lock:
+            self.plc = plc
+            for entry in self._entries.values():
+                entry['handles'] = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def add(self, symbol: str, plc_type: Any, callback: Callable[[str, Any], None]) -> bool:
+        """
+        Erhöht den Referenzzähler und registriert ggf. die Notification
+
+        Returns:
+            True wenn für das Symbol ein aktives Handle besteht
+        """
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry is None:
+                entry = {'refs': 0, 'plc_type': plc_type, 'callback': callback, 'handles': None}
+                self._entries[symbol] = entry
+            entry['refs'] += 1
+            if entry['handles'] is None:
+                self._register(symbol, entry)
+            return entry['handles'] is not None
+
+    def remove(self, symbol: str) -> bool:
+        """
+        Verringert den Referenzzähler, gibt das Handle beim letzten Abo frei
+
+        Returns:
+            True wenn das Handle freigegeben wurde
+        """
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry is None:
+                return False
+            entry['refs'] -= 1
+            if entry['refs'] > 0:
+                return False
+            del self._entries[symbol]
+            self._release(entry)
+            return True
+
+    def is_active(self, symbol: str) -> bool:
+        """True wenn das Symbol per Notification bedient wird"""
+        entry = self._entries.get(symbol)
+        return entry is not None and entry['handles'] is not None
+
+    def ref_count(self, symbol: str) -> int:
+        entry = self._entries.get(symbol)
+        return entry['refs'] if entry else 0
+
+    def reattach(self) -> int:
+        """Registriert alle Symbole ohne aktives Handle neu - Returns: Anzahl neu aktiv"""
+        attached = 0
+        with self._lock:
+            for symbol, entry in self._entries.items():
+                if entry['handles'] is None and self._register(symbol, entry):
+                    attached += 1
+        return attached
+
+    def release_all(self):
+        """Gibt alle Handles frei (Referenzzähler bleiben für reattach())"""
+        with self._lock:
+            for entry in self._entries.values():
+                self._release(entry)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            active = sum(1 for entry in self._entries.values() if entry['handles'] is not None)
+            return {
+                **self.stats,
+                'symbols': len(self._entries),
+                'active': active,
+                'pending': len(self._entries) - active,
+                'cycle_time_ms': self.cycle_time_ms,
+                'max_delay_ms': self.max_delay_ms
+            }
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+
+    def _register(self, symbol: str, entry: Dict[str, Any]) -> bool:
+        plc = self.plc
+        plc_type = entry['plc_type']
+        if plc is None or plc_type is None or not PYADS_AVAILABLE:
+            self.stats['registration_failures'] += 1
+            return False
+
+        def _on_notification(notification, data_name):
+            try:
+                _, _, value = plc.parse_notification(notification, plc_type)
+            except Exception:
+                self.stats['parse_errors'] += 1
+                return
+            self.stats['notifications'] += 1
+            entry['callback'](symbol, value)
+
+        try:
+            length = ctypes.sizeof(plc_type)
+            attr = pyads.NotificationAttrib(
+                length,
+                trans_mode=pyads.ADSTRANS_SERVERONCHA,
+                max_delay=self.max_delay_ms,
+                cycle_time=self.cycle_time_ms
+            )
+            handles = plc.add_device_notification(symbol, attr, _on_notification)
+        except Exception:
+            handles = None
+
+        if not handles:
+            self.stats['registration_failures'] += 1
+            return False
+
+        entry['handles'] = handles
+        entry['wrapper'] = _on_notification  # Referenz halten (ctypes-Callback)
+        self.stats['registrations'] += 1
+        return True
+
+    def _release(self, entry: Dict[str, Any]):
+        handles = entry.get('handles')
+        entry['handles'] = None
+        entry.pop('wrapper', None)
+        if not handles or self.plc is None:
+            return
+        try:
+            self.plc.del_device_notification(*handles)
+            self.stats['releases'] += 1
+        except Exception:
+            pass
+
+
+def create_notification_registry(cycle_time_ms: Optional[float] = None,
+                                 max_delay_ms: Optional[float] = None) -> ADSNotificationRegistry:
+    """Factory mit Defaults aus SMARTHOME_PLC_NOTIFY_CYCLE_MS / _MAX_DELAY_MS"""
+    if cycle_time_ms is None:
+        cycle_time_ms = float(os.getenv('SMARTHOME_PLC_NOTIFY_CYCLE_MS', '100') or 100)
+    if max_delay_ms is None:
+        max_delay_ms = float(os.getenv('SMARTHOME_PLC_NOTIFY_MAX_DELAY_MS', '0') or 0)
+    return ADSNotificationRegistry(cycle_time_ms=cycle_time_ms, max_delay_ms=max_delay_ms)
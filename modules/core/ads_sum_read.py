@@ -0,0 +1,266 @@
+"""
+ADS Sum-Read Helper
+Gebündeltes Lesen vieler PLC-Symbole über ADS-Summenkommandos
+
+📁 SPEICHERORT: modules/core/ads_sum_read.py
+
+Ein Sum-Read liest bis zu MAX_ADS_SUB_COMMANDS Symbole in EINEM ADS-Roundtrip.
+Dieses Modul kapselt:
+- Chunking nach max. Sub-Kommandos pro Request
+- Fehler-Isolation pro Symbol (ADS-Fehlertext im Ergebnis → Symbol fehlt)
+- Fallback auf Einzel-Reads, wenn ein kompletter Chunk fehlschlägt
+  (z.B. unbekanntes Symbol beim Symbol-Info-Lookup)
+- Ausschluss blockierender Symbole nur bei symbol-spezifischem Fehler
+  (andere Reads desselben Aufrufs waren erfolgreich) und nur
+  befristet (EXCLUSION_TTL_S) - ein kurzer Verbindungsaussetzer schiebt
+  das Polling also nicht dauerhaft auf Einzel-Reads
+
+Gegenstück sum_write(): mehrere Symbole in einem ADS-Roundtrip schreiben
+(Reihenfolge der Sub-Kommandos = Reihenfolge der Werte), Ergebnis pro
+Symbol, Einzel-Write-Fallback für fehlgeschlagene Chunks.
+
+Genutzt von PLCCommunication und PLCConnection.
+"""
+
+import ctypes
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import pyads
+    from pyads.errorcodes import ERROR_CODES
+    MAX_ADS_SUB_COMMANDS = int(getattr(pyads.constants, 'MAX_ADS_SUB_COMMANDS', 500))
+    _ADS_ERROR_TEXTS = frozenset(text for code, text in ERROR_CODES.items() if code)
+    ADS_NO_ERROR_TEXT = ERROR_CODES.get(0, 'no error')
+    _STRING_PLC_TYPES = tuple(
+        plc_type for plc_type in (getattr(pyads, 'PLCTYPE_STRING', None), getattr(pyads, 'PLCTYPE_WSTRING', None))
+        if plc_type is not None
+    )
+except ImportError:
+    MAX_ADS_SUB_COMMANDS = 500
+    _ADS_ERROR_TEXTS = frozenset()
+    ADS_NO_ERROR_TEXT = 'no error'
+    _STRING_PLC_TYPES = ()
+
+# Wie lange ein ausgeschlossenes Symbol im Einzel-Read bleibt, bevor es
+# wieder im Sum-Read versucht wird (z.B. nach PLC-Download wieder vorhanden)
+EXCLUSION_TTL_S = 300.0
+
+
+def iter_chunks(items: List[str], size: int) -> Iterator[List[str]]:
+    """Zerlegt eine Liste in Chunks der Länge <= size"""
+    size = max(1, int(size))
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def is_string_plc_type(plc_type: Any) -> bool:
+    """STRING/WSTRING als pyads-Konstante, ctypes-Zeichenarray oder Typname ('STRING(80)')"""
+    if plc_type is None:
+        return False
+    if isinstance(plc_type, str):
+        name = plc_type.strip().upper()
+        return name.startswith('STRING') or name.startswith('WSTRING')
+    if plc_type in _STRING_PLC_TYPES:
+        return True
+    return getattr(plc_type, '_type_', None) in (ctypes.c_char, ctypes.c_wchar)
+
+
+def is_ads_error_value(value: Any, plc_type: Any = None) -> bool:
+    """
+    Prüft ob ein Sum-Read-Ergebnis ein ADS-Fehler ist
+
+    pyads liefert bei Sub-Kommando-Fehlern statt des Werts den
+    Fehlertext aus ERROR_CODES (z.B. 'symbol not found'). Bei STRING-
+    Symbolen ist ein solcher Text ein gültiger Wert und wird nicht geprüft.
+    """
+    if is_string_plc_type(plc_type):
+        return False
+    return isinstance(value, str) and value in _ADS_ERROR_TEXTS
+
+
+def sum_read(
+    plc: Any,
+    names: List[str],
+    chunk_size: int,
+    read_single: Callable[[str], Optional[Any]],
+    excluded: Optional[Dict[str, float]] = None,
+    exclusion_ttl: float = EXCLUSION_TTL_S,
+    plc_types: Optional[Dict[str, Any]] = None
+) -> Tuple[Dict[str, Any], Dict[str, int]]:
+    """
+    Liest Symbole gebündelt per plc.read_list_by_name()
+
+    Args:
+        plc: pyads.Connection (oder kompatibles Objekt, z.B. FakeADSConnection)
+        names: Symbol-Namen (Reihenfolge bleibt erhalten)
+        chunk_size: Max. Sub-Kommandos pro ADS-Request
+        read_single: Fallback-Reader für Einzel-Reads (None = Fehler)
+        excluded: {Symbol: Ablaufzeit (time.monotonic)} für Symbole, die
+            vorübergehend nicht im Sum-Read landen sollen. Ein Symbol wird
+            eingetragen, wenn es im Chunk-Fallback einzeln fehlschlägt,
+            während andere Reads desselben Aufrufs erfolgreich waren
+            (symbol-spezifischer Fehler statt Verbindungsproblem).
+            Abgelaufene oder wieder lesbare Symbole werden entfernt.
+        exclusion_ttl: Dauer eines Ausschlusses in Sekunden
+        plc_types: {Symbol: PLC-Typ} - STRING-Symbole werden nicht als
+            ADS-Fehlertext interpretiert (ohne Typ wird geprüft)
+
+    Returns:
+        (values, stats) - values enthält nur erfolgreich gelesene Symbole
+    """
+    values: Dict[str, Any] = {}
+    stats = {
+        'round_trips': 0,
+        'chunks': 0,
+        'chunk_fallbacks': 0,
+        'single_reads': 0,
+        'symbol_errors': 0
+    }
+    if excluded is None:
+        excluded = {}
+    plc_types = plc_types or {}
+
+    now = time.monotonic()
+    for name in [name for name, expires_at in excluded.items() if expires_at <= now]:
+        del excluded[name]
+
+    chunk_size = max(1, min(int(chunk_size), MAX_ADS_SUB_COMMANDS))
+    batch = [name for name in names if name not in excluded]
+    singles = [name for name in names if name in excluded]
+    fallback_chunks: List[List[str]] = []
+    link_ok = False
+
+    for chunk in iter_chunks(batch, chunk_size):
+        stats['chunks'] += 1
+        try:
+            result = plc.read_list_by_name(chunk, ads_sub_commands=chunk_size)
+            stats['round_trips'] += 1
+            link_ok = True
+        except Exception:
+            # Kompletter Chunk fehlgeschlagen → Einzel-Reads
+            stats['round_trips'] += 1
+            stats['chunk_fallbacks'] += 1
+            fallback_chunks.append(chunk)
+            continue
+
+        for name in chunk:
+            if name not in result:
+                stats['symbol_errors'] += 1
+                continue
+            value = result[name]
+            if is_ads_error_value(value, plc_types.get(name)):
+                stats['symbol_errors'] += 1
+                continue
+            values[name] = value
+
+    def _read_one(name: str) -> bool:
+        stats['single_reads'] += 1
+        stats['round_trips'] += 1
+        value = read_single(name)
+        if value is None:
+            stats['symbol_errors'] += 1
+            return False
+        values[name] = value
+        return True
+
+    for name in singles:
+        if _read_one(name):
+            # Symbol wieder lesbar → zurück in den Sum-Read
+            excluded.pop(name, None)
+            link_ok = True
+
+    failed: List[str] = []
+    for chunk in fallback_chunks:
+        for name in chunk:
+            if _read_one(name):
+                link_ok = True
+            else:
+                failed.append(name)
+
+    # Nur ausschließen, wenn andere Reads durchgingen - schlägt alles fehl,
+    # war es die Verbindung (Timeout, Link weg), nicht das Symbol
+    if failed and link_ok:
+        expires_at = time.monotonic() + max(0.0, float(exclusion_ttl))
+        for name in failed:
+            excluded[name] = expires_at
+
+    return values, stats
+
+
+def sum_write(
+    plc: Any,
+    values: Dict[str, Any],
+    chunk_size: int,
+    write_single: Callable[[str, Any], bool]
+) -> Tuple[Dict[str, bool], Dict[str, int]]:
+    """
+    Schreibt Symbole gebündelt per plc.write_list_by_name()
+
+    Args:
+        plc: pyads.Connection (oder kompatibles Objekt, z.B. FakeADSConnection)
+        values: {Symbol: Wert} - die Dict-Reihenfolge ist die Schreibreihenfolge
+        chunk_size: Max. Sub-Kommandos pro ADS-Request
+        write_single: Fallback-Writer für Einzel-Writes (True = geschrieben)
+
+    Returns:
+        (results, stats) - results enthält für jedes Symbol True/False
+    """
+    results: Dict[str, bool] = {}
+    stats = {
+        'round_trips': 0,
+        'chunks': 0,
+        'chunk_fallbacks': 0,
+        'single_writes': 0,
+        'symbol_errors': 0
+    }
+
+    def _write_one(name: str):
+        stats['single_writes'] += 1
+        stats['round_trips'] += 1
+        try:
+            ok = bool(write_single(name, values[name]))
+        except Exception:
+            ok = False
+        results[name] = ok
+        if not ok:
+            stats['symbol_errors'] += 1
+
+    def _write_chunk(chunk: List[str]):
+        stats['chunks'] += 1
+        stats['round_trips'] += 1
+        try:
+            result = plc.write_list_by_name({name: values[name] for name in chunk},
+                                            ads_sub_commands=chunk_size)
+        except Exception:
+            # Kompletter Chunk fehlgeschlagen (z.B. unbekanntes Symbol beim
+            # Symbol-Info-Lookup) → Einzel-Writes in derselben Reihenfolge
+            stats['chunk_fallbacks'] += 1
+            for name in chunk:
+                _write_one(name)
+            return
+        for name in chunk:
+            ok = result.get(name) == ADS_NO_ERROR_TEXT
+            results[name] = ok
+            if not ok:
+                stats['symbol_errors'] += 1
+
+    chunk_size = max(1, min(int(chunk_size), MAX_ADS_SUB_COMMANDS))
+    chunk: List[str] = []
+    for name, value in values.items():
+        if isinstance(value, dict):
+            # Strukturen brauchen structure_defs → einzeln; schließt den
+            # laufenden Chunk ab, damit die Reihenfolge erhalten bleibt
+            if chunk:
+                _write_chunk(chunk)
+                chunk = []
+            _write_one(name)
+            continue
+        chunk.append(name)
+        if len(chunk) >= chunk_size:
+            _write_chunk(chunk)
+            chunk = []
+    if chunk:
+        _write_chunk(chunk)
+
+    return results, stats
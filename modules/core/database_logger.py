@@ -5,16 +5,32 @@ SQLite-basiertes Logging-System für strukturierte Fehleraufzeichnung
 
 Ersetzt print() durch persistentes Logging.
 Speichert WARNING, ERROR und CRITICAL in SQLite-Datenbank.
+
+Schreibpfad: SQLiteHandler.emit() legt den Eintrag nur in die Queue eines
+SQLiteLogWriter (ein Writer pro DB-Datei); dessen Hintergrund-Thread
+schreibt gebündelt über eine langlebige WAL-Verbindung.
+
+Abfragen: query_logs() filtert per SQL über beim Schreiben abgeleitete
+Spalten (category, action, actor), Indizes und den FTS5-Index
+system_logs_fts über message; Blättern per Keyset (before_id).
+
+Kettenprüfung: verify_chain() liest blockweise und speichert einen
+Checkpoint (letzte geprüfte ID + Hash) in system_logs_checkpoint; der
+LogChainVerifier prüft periodisch nur die neuen Zeilen ab dem Checkpoint.
 """
 
+import atexit
 import sqlite3
 import logging
 import os
+import sys
 import threading
 import hashlib
 import json
+import time
+from collections import deque
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 
 
 class SQLiteHandler(logging.Handler):
@@ -27,12 +43,14 @@ class SQLiteHandler(logging.Handler):
     - Auto-Cleanup: Behält nur letzte 1000 Einträge
     - Thread-safe
     - Automatische Tabellenerstellung
+    - emit() blockiert nicht auf SQLite (Queue des SQLiteLogWriter)
     """
 
     def __init__(self, db_path: str):
         super().__init__()
         self.db_path = db_path
         self._ensure_table()
+        self.writer = DatabaseLogger.get_writer(db_path)
 
         # Setze Level auf WARNING (filtert INFO/DEBUG aus)
         self.setLevel(logging.WARNING)
@@ -56,19 +74,215 @@ class SQLiteHandler(logging.Handler):
         # Nur WARNING und höher speichern
         if record.levelno >= logging.WARNING:
             try:
-                ts = DatabaseLogger._utc_timestamp()
-                msg = self.format(record)
-                DatabaseLogger._insert_log_entry(
-                    self.db_path,
-                    timestamp=ts,
-                    level=record.levelname,
-                    module=record.name,
-                    message=msg
+                self.writer.enqueue(
+                    DatabaseLogger._utc_timestamp(),
+                    record.levelname,
+                    record.name,
+                    self.format(record)
                 )
 
             except Exception:
                 self.handleError(record)
 
+    def flush(self):
+        """Schreibt wartende Einträge sofort (logging.shutdown, Tests)"""
+        try:
+            self.writer.flush()
+        except Exception:
+            pass
+
+    def close(self):
+        self.flush()
+        super().close()
+
+
+class SQLiteLogWriter:
+    """
+    Hintergrund-Writer für system_logs (eine DB-Datei)
+
+    - enqueue(): O(1) in einen begrenzten Ring; ist er voll, wird der älteste
+      wartende Eintrag verworfen (Zähler 'dropped')
+    - ein Writer-Thread schreibt bis zu batch_size Einträge pro Transaktion
+      über eine langlebige Verbindung im WAL-Modus
+    - Hash-Kette im Speicher ab dem letzten entry_hash der DB (beim Öffnen
+      bzw. nach Löschungen einmal gelesen) - setzt voraus, dass nur dieser
+      Prozess in die DB schreibt
+    - write_now(): synchroner Eintrag (Audit) hinter allen wartenden
+      Einträgen, liefert die Row-ID
+    - scheitert ein Batch, werden seine Einträge einmal (vor der Queue)
+      wiederholt; scheitert auch das, zählen sie als 'dropped' und werden
+      auf stderr gemeldet
+
+    Args:
+        db_path: Pfad zur SQLite-Datenbank (Schema wird einmalig geprüft)
+        queue_size: Max. wartende Einträge
+        batch_size: Max. Einträge pro Transaktion
+    """
+
+    def __init__(self, db_path: str, queue_size: int = 10000, batch_size: int = 200):
+        self.db_path = db_path
+        self.queue_size = max(1, int(queue_size))
+        self.batch_size = max(1, int(batch_size))
+        DatabaseLogger.ensure_schema(db_path)
+
+        self._queue: deque = deque()
+        self._retry: List[Tuple[str, str, str, str]] = []  # gescheiterter Batch, ein Versuch
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()  # Verbindung, Hash-Kette, Reihenfolge
+        self._conn: Optional[sqlite3.Connection] = None
+        self._last_hash: Optional[str] = None  # None = aus DB laden
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+        self.stats = {
+            'enqueued': 0,
+            'written': 0,
+            'batches': 0,
+            'sync_writes': 0,
+            'dropped': 0,
+            'errors': 0,
+            'retried': 0,
+            'max_queue': 0,
+            'last_batch_ms': 0.0
+        }
+
+    def enqueue(self, timestamp: str, level: str, module: str, message: str):
+        """Reiht einen Eintrag ein (blockiert nicht auf SQLite)"""
+        with self._cond:
+            if len(self._queue) >= self.queue_size:
+                self._queue.popleft()
+                self.stats['dropped'] += 1
+            self._queue.append((timestamp, level, module, message))
+            self.stats['enqueued'] += 1
+            if len(self._queue) > self.stats['max_queue']:
+                self.stats['max_queue'] = len(self._queue)
+            if self._thread is None and not self._stopping:
+                self._thread = threading.Thread(target=self._loop, daemon=True, name='sqlite-log-writer')
+                self._thread.start()
+            self._cond.notify()
+
+    def write_now(self, timestamp: str, level: str, module: str, message: str) -> int:
+        """Schreibt wartende Einträge und dann diesen Eintrag - Returns: Row-ID"""
+        _, row_id = self._drain(None, (timestamp, level, module, message))
+        return row_id
+
+    def flush(self):
+        """Schreibt alle wartenden Einträge im aufrufenden Thread"""
+        while self._drain(self.batch_size)[0]:
+            pass
+
+    def reset_chain(self):
+        """Nach Löschungen: letzten entry_hash beim nächsten Batch neu lesen"""
+        with self._io_lock:
+            self._last_hash = None
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._retry and not self._stopping:
+                    self._cond.wait()
+                if not self._queue and not self._retry:
+                    return
+            self._drain(self.batch_size)
+
+    def _drain(self, limit: Optional[int], own: Optional[Tuple[str, str, str, str]] = None) -> Tuple[int, int]:
+        """Schreibt bis zu limit wartende Einträge (+ own) in einer Transaktion"""
+        with self._io_lock:
+            with self._cond:
+                retry = self._retry
+                self._retry = []
+                count = len(self._queue) if limit is None else min(limit, len(self._queue))
+                pending = retry + [self._queue.popleft() for _ in range(count)]
+            rows = pending + [own] if own is not None else pending
+            if not rows:
+                return 0, 0
+
+            started = time.monotonic()
+            try:
+                row_id = self._write_rows(rows)
+            except Exception as e:
+                # Verbindung/Kette beim nächsten Batch neu aufbauen
+                self._close_connection()
+                with self._cond:
+                    self.stats['errors'] += 1
+                    # Bereits wiederholte Einträge verwerfen, neue einmal wiederholen
+                    self.stats['dropped'] += len(retry)
+                    self.stats['retried'] += len(pending) - len(retry)
+                    self._retry = pending[len(retry):]
+                if retry:
+                    print(f"!!! LOGGING DATABASE ERROR: {len(retry)} Log-Einträge verworfen ({e})",
+                          file=sys.stderr)
+                if own is not None:
+                    raise
+                return len(pending), 0
+
+        with self._cond:
+            self.stats['written'] += len(rows)
+            self.stats['batches'] += 1
+            self.stats['sync_writes'] += int(own is not None)
+            self.stats['last_batch_ms'] = round((time.monotonic() - started) * 1000.0, 2)
+        return len(pending), row_id
+
+    def _write_rows(self, rows: List[Tuple[str, str, str, str]]) -> int:
+        # Aufruf unter self._io_lock
+        conn = self._connection()
+        prev_hash = self._last_hash
+        if prev_hash is None:
+            prev_hash = DatabaseLogger._read_last_hash(conn)
+        params = []
+        for timestamp, level, module, message in rows:
+            entry_hash = DatabaseLogger._entry_hash(timestamp, level, module, message, prev_hash)
+            params.append((timestamp, level, module, message, prev_hash, entry_hash,
+                           *DatabaseLogger.classify_entry(level, module, message)))
+            prev_hash = entry_hash
+
+        with conn:
+            if len(params) > 1:
+                conn.executemany(DatabaseLogger.INSERT_SQL, params[:-1])
+            cursor = conn.execute(DatabaseLogger.INSERT_SQL, params[-1])
+        self._last_hash = prev_hash
+        return int(cursor.lastrowid or 0)
+
+    def _connection(self) -> sqlite3.Connection:
+        # Aufruf unter self._io_lock
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn = conn
+            self._last_hash = None
+        return self._conn
+
+    def _close_connection(self):
+        # Aufruf unter self._io_lock
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+        self._conn = None
+        self._last_hash = None
+
+    def stop(self, timeout: float = 2.0):
+        """Schreibt wartende Einträge, beendet den Thread und schließt die Verbindung"""
+        with self._cond:
+            self._stopping = True
+            thread = self._thread
+            self._cond.notify_all()
+        if thread is not None:
+            thread.join(timeout=timeout)
+        self.flush()
+        with self._io_lock:
+            self._close_connection()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            stats = dict(self.stats)
+            stats['queued'] = len(self._queue) + len(self._retry)
+        stats['queue_size'] = self.queue_size
+        stats['batch_size'] = self.batch_size
+        return stats
+
 
 class DatabaseLogger:
     """
@@ -79,6 +293,67 @@ class DatabaseLogger:
     """
 
     _db_lock = threading.Lock()
+    _writers: Dict[str, SQLiteLogWriter] = {}
+    _writers_lock = threading.Lock()
+
+    _verifiers: Dict[str, 'LogChainVerifier'] = {}
+
+    INSERT_SQL = """
+        INSERT INTO system_logs (timestamp, level, module, message, prev_hash, entry_hash, category, action, actor)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    # Restart-Kategorien (category): Segmente restart, app, daemon, error in dieser
+    # Reihenfolge, jedes nur wenn das Kriterium zutrifft (z.B. 'restart.daemon.error',
+    # 'app' für "type=app" ohne Restart-Wort) - die Kriterien sind unabhängig
+    RESTART_ACTIONS = ('service_restart_scheduled', 'daemon_restart_scheduled', 'daemon_restart_rejected')
+    RESTART_CONTEXT_WORDS = ('restart', 'neustart', 'type=app', 'type=daemon')
+    RESTART_ERROR_WORDS = ('rejected', 'abgelehnt', 'failed', 'fehler')
+
+    # Filter von /api/admin/logs → GLOB-Muster auf category
+    CATEGORY_FILTERS = {
+        'restart': 'restart*',
+        'restart_app': '*app*',
+        'restart_daemon': '*daemon*',
+        'restart_error': '*error',
+        'audit': 'audit*'
+    }
+
+    FTS_SQL = [
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS system_logs_fts
+        USING fts5(message, content='system_logs', content_rowid='id')
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS system_logs_fts_ai AFTER INSERT ON system_logs BEGIN
+            INSERT INTO system_logs_fts(rowid, message) VALUES (new.id, new.message);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS system_logs_fts_ad AFTER DELETE ON system_logs BEGIN
+            INSERT INTO system_logs_fts(system_logs_fts, rowid, message) VALUES ('delete', old.id, old.message);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS system_logs_fts_au AFTER UPDATE OF message ON system_logs BEGIN
+            INSERT INTO system_logs_fts(system_logs_fts, rowid, message) VALUES ('delete', old.id, old.message);
+            INSERT INTO system_logs_fts(rowid, message) VALUES (new.id, new.message);
+        END
+        """
+    ]
+
+    # Ein Checkpoint pro DB: Stand der letzten vollständigen Kettenprüfung
+    CHECKPOINT_SQL = """
+        CREATE TABLE IF NOT EXISTS system_logs_checkpoint (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            last_id INTEGER NOT NULL,
+            last_hash TEXT NOT NULL,
+            checked INTEGER NOT NULL,
+            ok INTEGER NOT NULL,
+            broken_at_id INTEGER,
+            verified_at TEXT NOT NULL
+        )
+    """
 
     @staticmethod
     def _utc_timestamp() -> str:
@@ -106,7 +381,10 @@ class DatabaseLogger:
                     message TEXT NOT NULL,
                     prev_hash TEXT,
                     entry_hash TEXT,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    category TEXT,
+                    action TEXT,
+                    actor TEXT
                 )
             ''')
             # Migration für ältere DBs
@@ -115,6 +393,11 @@ class DatabaseLogger:
                 conn.execute("ALTER TABLE system_logs ADD COLUMN prev_hash TEXT")
             if 'entry_hash' not in columns:
                 conn.execute("ALTER TABLE system_logs ADD COLUMN entry_hash TEXT")
+            added = [name for name in ('category', 'action', 'actor') if name not in columns]
+            for name in added:
+                conn.execute(f"ALTER TABLE system_logs ADD COLUMN {name} TEXT")
+            if added:
+                DatabaseLogger._backfill_structured_columns(conn)
 
             conn.execute('''
                 CREATE INDEX IF NOT EXISTS idx_timestamp
@@ -124,27 +407,145 @@ class DatabaseLogger:
                 CREATE INDEX IF NOT EXISTS idx_entry_hash
                 ON system_logs(entry_hash)
             ''')
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_module_level_id ON system_logs(module, level, id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_category_id ON system_logs(category, id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_action_id ON system_logs(action, id)")
+            conn.execute(DatabaseLogger.CHECKPOINT_SQL)
+            DatabaseLogger._ensure_fts(conn)
 
     @staticmethod
-    def _insert_log_entry(db_path: str, timestamp: str, level: str, module: str, message: str) -> int:
-        with DatabaseLogger._db_lock:
-            DatabaseLogger.ensure_schema(db_path)
-            with sqlite3.connect(db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                prev_hash_row = conn.execute(
-                    "SELECT entry_hash FROM system_logs ORDER BY id DESC LIMIT 1"
-                ).fetchone()
-                prev_hash = prev_hash_row['entry_hash'] if prev_hash_row and prev_hash_row['entry_hash'] else ''
-                payload = f"{timestamp}|{level}|{module}|{message}|{prev_hash}"
-                entry_hash = hashlib.sha256(payload.encode('utf-8')).hexdigest()
-                cursor = conn.execute(
-                    """
-                    INSERT INTO system_logs (timestamp, level, module, message, prev_hash, entry_hash)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (timestamp, level, module, message, prev_hash, entry_hash)
+    def _ensure_fts(conn: sqlite3.Connection):
+        """FTS5-Index über message (fehlt FTS5, sucht query_logs per LIKE)"""
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'system_logs_fts'"
+        ).fetchone()
+        try:
+            for statement in DatabaseLogger.FTS_SQL:
+                conn.execute(statement)
+        except sqlite3.OperationalError as e:
+            logging.getLogger(__name__).debug(f"FTS5 nicht verfügbar: {e}")
+            return
+        if not exists:
+            # Bestehende Einträge einmalig indizieren
+            conn.execute("INSERT INTO system_logs_fts(system_logs_fts) VALUES ('rebuild')")
+
+    @staticmethod
+    def _backfill_structured_columns(conn: sqlite3.Connection):
+        """Migration: category/action/actor für vorhandene Einträge ableiten"""
+        cursor = conn.execute("SELECT id, level, module, message FROM system_logs")
+        while True:
+            rows = cursor.fetchmany(1000)
+            if not rows:
+                break
+            conn.executemany(
+                "UPDATE system_logs SET category = ?, action = ?, actor = ? WHERE id = ?",
+                [(*DatabaseLogger.classify_entry(level, module, message), row_id)
+                 for row_id, level, module, message in rows]
+            )
+
+    @staticmethod
+    def classify_entry(level: str, module: str, message: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Leitet die strukturierten Spalten eines Eintrags ab (beim Schreiben)
+
+        Returns:
+            (category, action, actor) - Audit-Einträge liefern action/actor
+            aus dem JSON-Payload; category z.B. 'restart.daemon.error', 'audit'
+        """
+        action = actor = None
+        if str(module or '').lower() == 'audit':
+            try:
+                payload = json.loads(str(message or '{}'))
+                action = str(payload.get('action') or '').strip().lower() or None
+                actor = str(payload.get('actor') or '').strip() or None
+            except Exception:
+                pass
+
+        msg = str(message or '').lower()
+        segments = []
+        if action in DatabaseLogger.RESTART_ACTIONS or 'restart' in msg or 'neustart' in msg:
+            segments.append('restart')
+        if action == 'service_restart_scheduled' or 'type=app' in msg:
+            segments.append('app')
+        if action in ('daemon_restart_scheduled', 'daemon_restart_rejected') or 'type=daemon' in msg:
+            segments.append('daemon')
+        if action == 'daemon_restart_rejected' or (
+                any(word in msg for word in DatabaseLogger.RESTART_CONTEXT_WORDS)
+                and any(word in msg for word in DatabaseLogger.RESTART_ERROR_WORDS)):
+            segments.append('error')
+        if segments:
+            category = '.'.join(segments)
+        elif action is not None or str(level or '').upper() == 'AUDIT':
+            category = 'audit'
+        else:
+            category = None
+        return category, action, actor
+
+    @staticmethod
+    def _entry_hash(timestamp: str, level: str, module: str, message: str, prev_hash: str) -> str:
+        payload = f"{timestamp}|{level}|{module}|{message}|{prev_hash}"
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _read_last_hash(conn: sqlite3.Connection) -> str:
+        row = conn.execute("SELECT entry_hash FROM system_logs ORDER BY id DESC LIMIT 1").fetchone()
+        return row[0] if row and row[0] else ''
+
+    @staticmethod
+    def _drop_checkpoint(conn: sqlite3.Connection):
+        """Nach Löschungen: nächste inkrementelle Prüfung beginnt von vorn"""
+        conn.execute(DatabaseLogger.CHECKPOINT_SQL)
+        conn.execute("DELETE FROM system_logs_checkpoint")
+
+    @staticmethod
+    def get_writer(db_path: str) -> SQLiteLogWriter:
+        """SQLiteLogWriter der DB-Datei (einer pro Pfad, Schema-Check beim Anlegen)"""
+        key = os.path.abspath(db_path)
+        with DatabaseLogger._writers_lock:
+            writer = DatabaseLogger._writers.get(key)
+            if writer is None:
+                writer = SQLiteLogWriter(
+                    db_path,
+                    queue_size=int(os.getenv('SMARTHOME_LOG_QUEUE_SIZE', '10000')),
+                    batch_size=int(os.getenv('SMARTHOME_LOG_BATCH_SIZE', '200'))
                 )
-                return int(cursor.lastrowid or 0)
+                DatabaseLogger._writers[key] = writer
+            return writer
+
+    @staticmethod
+    def _flush_writer(db_path: str):
+        """Vor Reads/Löschungen: wartende Einträge des Writers schreiben"""
+        writer = DatabaseLogger._writers.get(os.path.abspath(db_path))
+        if writer is not None:
+            writer.flush()
+
+    @staticmethod
+    def _reset_writer_chain(db_path: str):
+        writer = DatabaseLogger._writers.get(os.path.abspath(db_path))
+        if writer is not None:
+            writer.reset_chain()
+
+    @staticmethod
+    def flush_all():
+        """Schreibt die Queues aller Writer (atexit)"""
+        with DatabaseLogger._writers_lock:
+            writers = list(DatabaseLogger._writers.values())
+        for writer in writers:
+            try:
+                writer.flush()
+            except Exception:
+                pass
+
+    @staticmethod
+    def get_writer_stats() -> Dict[str, Dict[str, Any]]:
+        """Queue-/Batch-Kennzahlen pro DB-Datei"""
+        with DatabaseLogger._writers_lock:
+            writers = list(DatabaseLogger._writers.values())
+        return {os.path.basename(writer.db_path): writer.get_stats() for writer in writers}
+
+    @staticmethod
+    def _insert_log_entry(db_path: str, timestamp: str, level: str, module: str, message: str) -> int:
+        return DatabaseLogger.get_writer(db_path).write_now(timestamp, level, module, message)
 
     @staticmethod
     def setup(db_path: Optional[str] = None, console_level: int = logging.INFO):
@@ -191,6 +592,7 @@ class DatabaseLogger:
             max_entries=policy['max_entries'],
             max_age_days=policy['max_age_days']
         )
+        DatabaseLogger.start_verifier(db_path)
 
         # Bestätigung
         logging.info(f"Database Logger initialisiert: {db_path}")
@@ -213,6 +615,7 @@ class DatabaseLogger:
 
         try:
             if os.path.exists(db_path):
+                DatabaseLogger._flush_writer(db_path)
                 with sqlite3.connect(db_path) as conn:
                     conn.row_factory = sqlite3.Row
                     cursor = conn.execute(
@@ -225,6 +628,86 @@ class DatabaseLogger:
 
         return logs
 
+    @staticmethod
+    def query_logs(
+        db_path: str,
+        limit: int = 100,
+        before_id: Optional[int] = None,
+        level: Optional[str] = None,
+        module: Optional[str] = None,
+        category: Optional[str] = None,
+        action: Optional[str] = None,
+        actor: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Gefilterte Log-Einträge, neueste zuerst (Filter per SQL/Index)
+
+        Args:
+            limit: Maximale Anzahl Einträge
+            before_id: Keyset-Pagination - nur Einträge mit kleinerer ID
+                (nächste Seite: ID des letzten Eintrags der vorigen Seite)
+            level: Level, auch kommagetrennt (z.B. 'WARNING,ERROR')
+            module: Exakter Modulname
+            category: GLOB-Muster auf category (siehe CATEGORY_FILTERS)
+            action, actor: Exakte Werte aus Audit-Einträgen
+            search: Volltextsuche über message (alle Wörter, FTS5)
+
+        Returns:
+            Liste von Dictionaries mit Log-Einträgen
+        """
+        if not os.path.exists(db_path):
+            return []
+        # Schema/Migration einmal pro Writer, wartende Einträge schreiben
+        DatabaseLogger.get_writer(db_path).flush()
+
+        where: List[str] = []
+        params: List[Any] = []
+        if before_id is not None:
+            where.append("l.id < ?")
+            params.append(int(before_id))
+        if level:
+            levels = [part.strip().upper() for part in str(level).split(',') if part.strip()]
+            where.append(f"l.level IN ({', '.join('?' * len(levels))})")
+            params.extend(levels)
+        if module:
+            where.append("l.module = ?")
+            params.append(module)
+        if category:
+            where.append("l.category GLOB ?")
+            params.append(category)
+        if action:
+            where.append("l.action = ?")
+            params.append(str(action).strip().lower())
+        if actor:
+            where.append("l.actor = ?")
+            params.append(actor)
+
+        source = "system_logs l"
+        terms = [term for term in str(search or '').split() if term]
+        with sqlite3.connect(db_path, timeout=5.0) as conn:
+            conn.row_factory = sqlite3.Row
+            if terms:
+                has_fts = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'system_logs_fts'"
+                ).fetchone()
+                if has_fts:
+                    # Jedes Wort als Phrase quoten → keine FTS-Syntax aus Benutzereingaben
+                    source = "system_logs_fts f JOIN system_logs l ON l.id = f.rowid"
+                    where.insert(0, "system_logs_fts MATCH ?")
+                    params.insert(0, ' '.join('"' + term.replace('"', '""') + '"' for term in terms))
+                else:
+                    for term in terms:
+                        where.append("l.message LIKE ?")
+                        params.append(f"%{term}%")
+
+            query = f"SELECT l.* FROM {source}"
+            if where:
+                query += " WHERE " + " AND ".join(where)
+            query += " ORDER BY l.id DESC LIMIT ?"
+            params.append(max(1, int(limit)))
+            return [dict(row) for row in conn.execute(query, params)]
+
     @staticmethod
     def clear_old_logs(db_path: str, keep_count: int = 1000):
         """
@@ -236,7 +719,8 @@ class DatabaseLogger:
         """
         try:
             if os.path.exists(db_path):
-                with sqlite3.connect(db_path) as conn:
+                DatabaseLogger._flush_writer(db_path)
+                with DatabaseLogger._db_lock, sqlite3.connect(db_path) as conn:
                     deleted = conn.execute("""
                         DELETE FROM system_logs
                         WHERE id NOT IN (
@@ -245,9 +729,12 @@ class DatabaseLogger:
                             LIMIT ?
                         )
                     """, (keep_count,))
-
                     if deleted.rowcount > 0:
-                        logging.info(f"Alte Logs gelöscht: {deleted.rowcount} Einträge")
+                        DatabaseLogger._drop_checkpoint(conn)
+
+                DatabaseLogger._reset_writer_chain(db_path)
+                if deleted.rowcount > 0:
+                    logging.info(f"Alte Logs gelöscht: {deleted.rowcount} Einträge")
         except Exception as e:
             logging.error(f"Fehler beim Löschen alter Logs: {e}")
 
@@ -277,7 +764,8 @@ class DatabaseLogger:
                 return 0
 
             keep_count = max(10, int(keep_count))
-            with sqlite3.connect(db_path) as conn:
+            DatabaseLogger._flush_writer(db_path)
+            with DatabaseLogger._db_lock, sqlite3.connect(db_path) as conn:
                 where_keep = " OR ".join(["lower(message) LIKE ?"] * len(preserve_keywords))
                 params = tuple(f"%{kw.lower()}%" for kw in preserve_keywords)
                 query = f"""
@@ -292,6 +780,9 @@ class DatabaseLogger:
                 """
                 cursor = conn.execute(query, (keep_count, *params))
                 deleted_rows = int(getattr(cursor, "rowcount", 0) or 0)
+                if deleted_rows > 0:
+                    DatabaseLogger._drop_checkpoint(conn)
+            DatabaseLogger._reset_writer_chain(db_path)
         except Exception as e:
             logging.error(f"Fehler bei clear_logs_with_audit_protection: {e}")
 
@@ -303,6 +794,7 @@ class DatabaseLogger:
         if not os.path.exists(db_path):
             return stats
 
+        DatabaseLogger._flush_writer(db_path)
         with DatabaseLogger._db_lock:
             DatabaseLogger.ensure_schema(db_path)
             with sqlite3.connect(db_path) as conn:
@@ -322,6 +814,9 @@ class DatabaseLogger:
                 ).rowcount
                 stats['deleted_age'] = max(0, int(deleted_age or 0))
                 stats['deleted_count'] = max(0, int(deleted_count or 0))
+                if stats['deleted_age'] or stats['deleted_count']:
+                    DatabaseLogger._drop_checkpoint(conn)
+        DatabaseLogger._reset_writer_chain(db_path)
         return stats
 
     @staticmethod
@@ -341,39 +836,284 @@ class DatabaseLogger:
         )
 
     @staticmethod
-    def verify_chain(db_path: str, limit: Optional[int] = None) -> Dict[str, Any]:
+    def verify_chain(db_path: str, limit: Optional[int] = None, incremental: bool = False,
+                     chunk_size: int = 1000) -> Dict[str, Any]:
+        """
+        Prüft die Hash-Kette von system_logs
+
+        Liest blockweise (chunk_size Zeilen pro Query, konstanter Speicher).
+        Ohne limit wird das Ergebnis als Checkpoint gespeichert;
+        incremental=True setzt am Checkpoint fort und prüft nur neue Zeilen
+        (Ergebnis wie eine vollständige Prüfung, solange die Zeile des
+        Checkpoints unverändert ist - Löschungen verwerfen ihn).
+
+        Args:
+            limit: Nur die ersten limit Zeilen prüfen (ohne Checkpoint)
+            incremental: Am Checkpoint fortsetzen; Ergebnis zusätzlich mit
+                last_id, new_rows, resumed und verified_at
+
+        Returns:
+            {'ok', 'checked', 'broken_at_id'} (+ Checkpoint-Felder)
+        """
         if not os.path.exists(db_path):
-            return {'ok': True, 'checked': 0, 'broken_at_id': None}
+            result: Dict[str, Any] = {'ok': True, 'checked': 0, 'broken_at_id': None}
+            if incremental:
+                result.update({'last_id': 0, 'new_rows': 0, 'resumed': False, 'verified_at': None})
+            return result
 
-        with sqlite3.connect(db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            query = "SELECT id, timestamp, level, module, message, prev_hash, entry_hash FROM system_logs ORDER BY id ASC"
-            params: tuple = ()
-            if limit is not None:
-                query += " LIMIT ?"
-                params = (int(limit),)
-            rows: List[sqlite3.Row] = conn.execute(query, params).fetchall()
-
-        prev_hash = ''
-        checked = 0
-        for row in rows:
-            checked += 1
-            row_prev_hash = row['prev_hash'] or ''
-            row_entry_hash = row['entry_hash'] or ''
-            if not row_entry_hash:
-                continue
-            source = f"{row['timestamp']}|{row['level']}|{row['module']}|{row['message']}|{row_prev_hash}"
-            expected = hashlib.sha256(source.encode('utf-8')).hexdigest()
-            if row_prev_hash != prev_hash or row_entry_hash != expected:
-                return {'ok': False, 'checked': checked, 'broken_at_id': row['id']}
-            prev_hash = row_entry_hash
-        return {'ok': True, 'checked': checked, 'broken_at_id': None}
+        DatabaseLogger._flush_writer(db_path)
+        chunk_size = max(1, int(chunk_size))
+        remaining = None if limit is None else max(0, int(limit))
+        with DatabaseLogger._db_lock, sqlite3.connect(db_path, timeout=5.0) as conn:
+            last_id, prev_hash, checked, resumed = 0, '', 0, False
+            if incremental and remaining is None:
+                checkpoint = DatabaseLogger._load_checkpoint(conn)
+                if checkpoint is not None and not checkpoint['ok']:
+                    # Kettenbruch bleibt bestehen, bis gelöscht oder voll geprüft wird
+                    checkpoint.update({'new_rows': 0, 'resumed': True})
+                    return checkpoint
+                if checkpoint is not None:
+                    last_id, prev_hash, checked = checkpoint['last_id'], checkpoint['last_hash'], checkpoint['checked']
+                    resumed = True
+
+            new_rows = 0
+            broken_at_id = None
+            while broken_at_id is None and remaining != 0:
+                batch = chunk_size if remaining is None else min(chunk_size, remaining)
+                rows = conn.execute(
+                    "SELECT id, timestamp, level, module, message, prev_hash, entry_hash "
+                    "FROM system_logs WHERE id > ? ORDER BY id ASC LIMIT ?",
+                    (last_id, batch)
+                ).fetchall()
+                for row_id, timestamp, level, module, message, row_prev_hash, row_entry_hash in rows:
+                    new_rows += 1
+                    last_id = row_id
+                    if not row_entry_hash:
+                        continue
+                    row_prev_hash = row_prev_hash or ''
+                    expected = DatabaseLogger._entry_hash(timestamp, level, module, message, row_prev_hash)
+                    if row_prev_hash != prev_hash or row_entry_hash != expected:
+                        broken_at_id = row_id
+                        break
+                    prev_hash = row_entry_hash
+                if remaining is not None:
+                    remaining -= len(rows)
+                if len(rows) < batch:
+                    break
+
+            checked += new_rows
+            result = {'ok': broken_at_id is None, 'checked': checked, 'broken_at_id': broken_at_id}
+            if remaining is None:
+                verified_at = DatabaseLogger._utc_timestamp()
+                conn.execute(DatabaseLogger.CHECKPOINT_SQL)
+                conn.execute(
+                    "INSERT OR REPLACE INTO system_logs_checkpoint "
+                    "(id, last_id, last_hash, checked, ok, broken_at_id, verified_at) "
+                    "VALUES (1, ?, ?, ?, ?, ?, ?)",
+                    (last_id, prev_hash, checked, int(broken_at_id is None), broken_at_id, verified_at)
+                )
+                if incremental:
+                    result.update({'last_id': last_id, 'new_rows': new_rows, 'resumed': resumed,
+                                   'verified_at': verified_at})
+        return result
+
+    @staticmethod
+    def _load_checkpoint(conn: sqlite3.Connection) -> Optional[Dict[str, Any]]:
+        """Gültiger Checkpoint oder None (fehlt bzw. Checkpoint-Zeile verändert)"""
+        conn.execute(DatabaseLogger.CHECKPOINT_SQL)
+        row = conn.execute(
+            "SELECT last_id, last_hash, checked, ok, broken_at_id, verified_at "
+            "FROM system_logs_checkpoint WHERE id = 1"
+        ).fetchone()
+        if row is None:
+            return None
+        last_id, last_hash, checked, ok, broken_at_id, verified_at = row
+        if last_id:
+            current = conn.execute(
+                "SELECT timestamp, level, module, message, prev_hash, entry_hash FROM system_logs WHERE id = ?",
+                (last_id,)
+            ).fetchone()
+            if current is None:
+                return None
+            # Checkpoint-Zeile selbst nachrechnen; ohne entry_hash (Altbestand) zählt nur die Existenz
+            timestamp, level, module, message, row_prev_hash, row_entry_hash = current
+            if ok and row_entry_hash and (
+                row_entry_hash != last_hash
+                or row_entry_hash != DatabaseLogger._entry_hash(timestamp, level, module, message, row_prev_hash or '')
+            ):
+                return None
+        return {
+            'ok': bool(ok),
+            'checked': int(checked),
+            'broken_at_id': broken_at_id,
+            'last_id': int(last_id),
+            'last_hash': last_hash,
+            'verified_at': verified_at
+        }
+
+    @staticmethod
+    def start_verifier(db_path: str, interval: Optional[float] = None) -> Optional['LogChainVerifier']:
+        """
+        Startet den periodischen Ketten-Prüfer der DB-Datei (einer pro Pfad)
+
+        Args:
+            interval: Sekunden zwischen zwei Prüfungen
+                (None = SMARTHOME_LOG_VERIFY_INTERVAL_SECONDS, 0 = aus)
+        """
+        if interval is None:
+            try:
+                interval = float(os.getenv('SMARTHOME_LOG_VERIFY_INTERVAL_SECONDS', '300'))
+            except ValueError:
+                interval = 300.0
+        if interval <= 0:
+            return None
+        key = os.path.abspath(db_path)
+        with DatabaseLogger._writers_lock:
+            verifier = DatabaseLogger._verifiers.get(key)
+            if verifier is None:
+                verifier = DatabaseLogger._verifiers[key] = LogChainVerifier(db_path, interval)
+        verifier.start()
+        return verifier
+
+    @staticmethod
+    def get_verifier_stats() -> Dict[str, Dict[str, Any]]:
+        """Letztes Prüfergebnis pro DB-Datei"""
+        with DatabaseLogger._writers_lock:
+            verifiers = list(DatabaseLogger._verifiers.values())
+        return {os.path.basename(verifier.db_path): verifier.get_status() for verifier in verifiers}
+
+    EXPORT_FIELDS = ['id', 'timestamp', 'level', 'module', 'message', 'prev_hash', 'entry_hash', 'created_at',
+                     'category', 'action', 'actor']
 
     @staticmethod
     def export_logs(db_path: str, limit: int = 1000) -> List[Dict[str, Any]]:
         limit = max(1, min(int(limit), 50000))
         return DatabaseLogger.get_recent_logs(db_path, limit=limit)
 
+    @staticmethod
+    def iter_logs(db_path: str, limit: Optional[int] = None, before_id: Optional[int] = None,
+                  chunk_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Log-Einträge als Generator, neueste zuerst (Streaming-Export)
+
+        Liest in Keyset-Blöcken von chunk_size Zeilen; zwischen den Blöcken
+        bleibt keine Lesetransaktion offen, langsame Downloads halten also
+        weder Writer noch WAL-Checkpoints auf.
+
+        Args:
+            limit: Max. Anzahl Einträge (None = alle)
+            before_id: Nur Einträge mit kleinerer ID
+        """
+        if not os.path.exists(db_path):
+            return
+        DatabaseLogger._flush_writer(db_path)
+        remaining = None if limit is None else max(0, int(limit))
+        chunk_size = max(1, int(chunk_size))
+        conn = sqlite3.connect(db_path, timeout=5.0)
+        conn.row_factory = sqlite3.Row
+        try:
+            while remaining != 0:
+                batch = chunk_size if remaining is None else min(chunk_size, remaining)
+                if before_id is None:
+                    rows = conn.execute("SELECT * FROM system_logs ORDER BY id DESC LIMIT ?", (batch,)).fetchall()
+                else:
+                    rows = conn.execute(
+                        "SELECT * FROM system_logs WHERE id < ? ORDER BY id DESC LIMIT ?", (int(before_id), batch)
+                    ).fetchall()
+                for row in rows:
+                    yield dict(row)
+                if len(rows) < batch:
+                    break
+                before_id = rows[-1]['id']
+                if remaining is not None:
+                    remaining -= len(rows)
+        finally:
+            conn.close()
+
+
+class LogChainVerifier:
+    """
+    Periodische inkrementelle Prüfung der Hash-Kette (Hintergrund-Thread)
+
+    Jeder Lauf prüft nur die seit dem letzten Checkpoint geschriebenen
+    Zeilen; das Ergebnis steht in system_logs_checkpoint und in
+    get_status(). Ein neuer Kettenbruch wird einmal als ERROR geloggt.
+
+    Args:
+        db_path: Pfad zur SQLite-Datenbank
+        interval: Sekunden zwischen zwei Prüfungen
+    """
+
+    def __init__(self, db_path: str, interval: float = 300.0):
+        self.db_path = db_path
+        self.interval = max(1.0, float(interval))
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_result: Optional[Dict[str, Any]] = None
+        self.stats = {
+            'runs': 0,
+            'errors': 0,
+            'rows_checked': 0,
+            'last_run_ms': 0.0
+        }
+
+    def start(self):
+        """Startet den Prüf-Thread (idempotent)"""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name='log-chain-verifier', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        thread = self._thread
+        if thread:
+            thread.join(timeout=2.0)
+        self._thread = None
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self.run_once()
+            self._stop_event.wait(self.interval)
+
+    def run_once(self) -> Optional[Dict[str, Any]]:
+        """Eine inkrementelle Prüfung - Returns: Ergebnis oder None bei Fehler"""
+        started = time.monotonic()
+        try:
+            result = DatabaseLogger.verify_chain(self.db_path, incremental=True)
+        except Exception as e:
+            with self._lock:
+                self.stats['errors'] += 1
+            logging.getLogger(__name__).warning(f"Log-Kettenprüfung fehlgeschlagen: {e}")
+            return None
+
+        with self._lock:
+            previous = self.last_result
+            self.last_result = result
+            self.stats['runs'] += 1
+            self.stats['rows_checked'] += result.get('new_rows', 0)
+            self.stats['last_run_ms'] = round((time.monotonic() - started) * 1000.0, 2)
+        if not result['ok'] and (previous is None or previous.get('broken_at_id') != result['broken_at_id']):
+            logging.getLogger(__name__).error(
+                f"Hash-Kette der System-Logs gebrochen bei ID {result['broken_at_id']}"
+            )
+        return result
+
+    def get_status(self) -> Dict[str, Any]:
+        with self._lock:
+            status = dict(self.stats)
+            status['last_result'] = dict(self.last_result) if self.last_result else None
+        status['interval'] = self.interval
+        status['running'] = bool(self._thread and self._thread.is_alive())
+        return status
+
+
+# Wartende Log-Einträge beim Beenden noch schreiben
+atexit.register(DatabaseLogger.flush_all)
+
 
 # Beispiel-Usage
 if __name__ == '__main__':
@@ -0,0 +1,254 @@
+"""
+Fake ADS Backend
+pyads-kompatible In-Memory-Verbindung für Offline-Tests und Benchmarks
+
+📁 SPEICHERORT: modules/core/fake_ads.py
+
+Bildet die von PLCCommunication/PLCConnection genutzte Teilmenge von
+pyads.Connection nach:
+- open() / close() / is_open / read_state()
+- read_by_name() / write_by_name()
+- read_list_by_name() / write_list_by_name() mit Symbol-Info-Cache und
+  Sub-Kommando-Chunking
+- add_device_notification() / del_device_notification() / parse_notification()
+  (set_value() feuert On-Change-Notifications wie die SPS)
+
+Roundtrips werden gezählt und optional mit simulierter Latenz versehen,
+damit sich Batch-Lesen vs. Einzel-Lesen offline vergleichen lässt.
+
+Usage:
+    fake = FakeADSConnection({'MAIN.bLight': True, 'MAIN.rTemp': 21.5})
+    comm = PLCCommunication()
+    comm.plc = fake
+    comm.connected = True
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import pyads
+    from pyads.errorcodes import ERROR_CODES
+    ADSError = pyads.ADSError
+    MAX_ADS_SUB_COMMANDS = int(getattr(pyads.constants, 'MAX_ADS_SUB_COMMANDS', 500))
+except ImportError:
+    ERROR_CODES = {1808: 'symbol not found'}
+    MAX_ADS_SUB_COMMANDS = 500
+
+    class ADSError(Exception):
+        def __init__(self, err_code: Optional[int] = None, text: Optional[str] = None):
+            self.err_code = err_code
+            super().__init__(text or ERROR_CODES.get(err_code, 'ADS error'))
+
+ADSERR_DEVICE_SYMBOLNOTFOUND = 1808
+ADSSTATE_RUN = 5
+
+
+class FakeNotification:
+    """Ersatz für den ctypes-Notification-Header (Inhalt bereits geparst)"""
+
+    def __init__(self, handle: int, value: Any):
+        self.handle = handle
+        self.value = value
+        self.timestamp = datetime.now(timezone.utc)
+
+
+class FakeADSConnection:
+    """
+    In-Memory ADS-Verbindung
+
+    Args:
+        symbols: Startwerte {symbol_name: value}
+        latency_s: Simulierte Latenz pro ADS-Roundtrip
+        fail_symbols: Symbole, die im Sum-Read/Sum-Write einen
+            Sub-Kommando-Fehler liefern (Symbol existiert, Zugriff schlägt fehl)
+    """
+
+    def __init__(self, symbols: Optional[Dict[str, Any]] = None, latency_s: float = 0.0,
+                 fail_symbols: Optional[Iterable[str]] = None):
+        self.values: Dict[str, Any] = dict(symbols or {})
+        self.latency_s = max(0.0, float(latency_s))
+        self.fail_symbols = set(fail_symbols or [])
+        self._open = False
+        self._lock = threading.RLock()
+        self._symbol_info_cache: Dict[str, bool] = {}
+        self._notifications: Dict[int, tuple] = {}  # handle -> (name, callback)
+        self._next_handle = 1
+
+        # Statistik
+        self.round_trips = 0
+        self.symbol_info_lookups = 0
+        self.single_reads = 0
+        self.sum_reads = 0
+        self.writes = 0
+        self.sum_writes = 0
+        self.write_log: List[tuple] = []  # (symbol, value) in Schreibreihenfolge
+        self.notifications_sent = 0
+
+    # ------------------------------------------------------------------
+    # Verbindung
+    # ------------------------------------------------------------------
+
+    def open(self):
+        self._open = True
+
+    def close(self):
+        self._open = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._open
+
+    def read_state(self):
+        self._round_trip()
+        return (ADSSTATE_RUN, 0)
+
+    def read_device_info(self):
+        return ('FakeADS', type('AdsVersion', (), {'version': 3, 'revision': 1, 'build': 0})())
+
+    # ------------------------------------------------------------------
+    # Lesen / Schreiben
+    # ------------------------------------------------------------------
+
+    def read_by_name(self, data_name: str, plc_datatype: Any = None, **kwargs) -> Any:
+        with self._lock:
+            self._round_trip()
+            self.single_reads += 1
+            if data_name not in self.values or data_name in self.fail_symbols:
+                raise ADSError(ADSERR_DEVICE_SYMBOLNOTFOUND)
+            return self.values[data_name]
+
+    def write_by_name(self, data_name: str, value: Any, plc_datatype: Any = None, **kwargs):
+        with self._lock:
+            self._round_trip()
+            self.writes += 1
+            if data_name not in self.values:
+                raise ADSError(ADSERR_DEVICE_SYMBOLNOTFOUND)
+            self.values[data_name] = value
+            self.write_log.append((data_name, value))
+
+    def read_list_by_name(self, data_names: List[str], cache_symbol_info: bool = True,
+                          ads_sub_commands: int = MAX_ADS_SUB_COMMANDS,
+                          structure_defs: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Sum-Read wie pyads: erst Symbol-Info je neuem Symbol (1 Roundtrip,
+        Exception bei unbekanntem Symbol), dann 1 Roundtrip je Chunk.
+        Sub-Kommando-Fehler erscheinen als ADS-Fehlertext im Ergebnis.
+        """
+        with self._lock:
+            for name in data_names:
+                if cache_symbol_info and name in self._symbol_info_cache:
+                    continue
+                self._round_trip()
+                self.symbol_info_lookups += 1
+                if name not in self.values:
+                    raise ADSError(ADSERR_DEVICE_SYMBOLNOTFOUND)
+                if cache_symbol_info:
+                    self._symbol_info_cache[name] = True
+
+            result: Dict[str, Any] = {}
+            chunk_size = max(1, int(ads_sub_commands))
+            for start in range(0, len(data_names), chunk_size):
+                self._round_trip()
+                self.sum_reads += 1
+                for name in data_names[start:start + chunk_size]:
+                    if name in self.fail_symbols:
+                        result[name] = ERROR_CODES[ADSERR_DEVICE_SYMBOLNOTFOUND]
+                    else:
+                        result[name] = self.values[name]
+            return result
+
+    def write_list_by_name(self, data_names_and_values: Dict[str, Any], cache_symbol_info: bool = True,
+                           ads_sub_commands: int = MAX_ADS_SUB_COMMANDS,
+                           structure_defs: Optional[Dict] = None) -> Dict[str, str]:
+        """
+        Sum-Write wie pyads: Symbol-Info je neuem Symbol, dann 1 Roundtrip
+        je Chunk; Ergebnis pro Symbol 'no error' bzw. ADS-Fehlertext
+        """
+        with self._lock:
+            data_names = list(data_names_and_values)
+            for name in data_names:
+                if cache_symbol_info and name in self._symbol_info_cache:
+                    continue
+                self._round_trip()
+                self.symbol_info_lookups += 1
+                if name not in self.values:
+                    raise ADSError(ADSERR_DEVICE_SYMBOLNOTFOUND)
+                if cache_symbol_info:
+                    self._symbol_info_cache[name] = True
+
+            result: Dict[str, str] = {}
+            chunk_size = max(1, int(ads_sub_commands))
+            for start in range(0, len(data_names), chunk_size):
+                self._round_trip()
+                self.sum_writes += 1
+                for name in data_names[start:start + chunk_size]:
+                    if name in self.fail_symbols:
+                        result[name] = ERROR_CODES[ADSERR_DEVICE_SYMBOLNOTFOUND]
+                        continue
+                    self.values[name] = data_names_and_values[name]
+                    self.write_log.append((name, data_names_and_values[name]))
+                    result[name] = ERROR_CODES.get(0, 'no error')
+            return result
+
+    # ------------------------------------------------------------------
+    # Device-Notifications
+    # ------------------------------------------------------------------
+
+    def add_device_notification(self, data: str, attr: Any, callback, user_handle: Optional[int] = None):
+        with self._lock:
+            self._round_trip()
+            if data not in self.values:
+                raise ADSError(ADSERR_DEVICE_SYMBOLNOTFOUND)
+            handle = self._next_handle
+            self._next_handle += 1
+            self._notifications[handle] = (data, callback)
+            return handle, user_handle if user_handle is not None else handle
+
+    def del_device_notification(self, notification_handle: int, user_handle: int):
+        with self._lock:
+            self._round_trip()
+            self._notifications.pop(notification_handle, None)
+
+    def parse_notification(self, notification: FakeNotification, plc_datatype: Any,
+                           timestamp_as_filetime: bool = False):
+        return notification.handle, notification.timestamp, notification.value
+
+    @property
+    def active_notifications(self) -> int:
+        return len(self._notifications)
+
+    # ------------------------------------------------------------------
+    # Test-Helfer
+    # ------------------------------------------------------------------
+
+    def set_value(self, data_name: str, value: Any):
+        """Setzt einen Wert 'in der SPS' (ohne Roundtrip) und feuert On-Change-Notifications"""
+        with self._lock:
+            changed = self.values.get(data_name) != value
+            self.values[data_name] = value
+            targets = [
+                (handle, callback) for handle, (name, callback) in self._notifications.items()
+                if name == data_name
+            ] if changed else []
+
+        for handle, callback in targets:
+            self.notifications_sent += 1
+            callback(FakeNotification(handle, value), data_name)
+
+    def reset_counters(self):
+        self.round_trips = 0
+        self.symbol_info_lookups = 0
+        self.single_reads = 0
+        self.sum_reads = 0
+        self.writes = 0
+        self.sum_writes = 0
+        self.write_log = []
+        self.notifications_sent = 0
+
+    def _round_trip(self):
+        self.round_trips += 1
+        if self.latency_s:
+            time.sleep(self.latency_s)
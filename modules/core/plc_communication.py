@@ -11,7 +11,10 @@ Verwaltet ADS-Verbindung zum TwinCAT PLC
 """
 
 from module_manager import BaseModule
-from typing import Optional, Any
+from typing import Optional, Any, Dict, List
+from modules.core.ads_sum_read import MAX_ADS_SUB_COMMANDS, sum_read, sum_write
+from modules.core.ads_notifications import create_notification_registry
+from modules.core.plc_value_store import PLCValueStore
 import pyads
 import threading
 import time
@@ -39,7 +42,14 @@ class PLCCommunication(BaseModule):
     DESCRIPTION = "TwinCAT ADS Kommunikation"
     AUTHOR = "TwinCAT Team"
     
-    def __init__(self):
+    def __init__(self, plc_id: Optional[str] = None):
+        """
+        Args:
+            plc_id: ID der Verbindung - Schlüssel im PLCValueStore, muss zur
+                plc_id der Widget-Abos/Routen passen (Default:
+                SMARTHOME_DEFAULT_PLC_ID, sonst 'plc_001'; initialize()
+                übernimmt zusätzlich den Config-Wert 'plc_id')
+        """
         super().__init__()
         self.plc = None
         self.connected = False
@@ -49,10 +59,33 @@ class PLCCommunication(BaseModule):
             'timeout': 5000,
             'auto_reconnect': True
         }
-        self.cache = {}
+        # Werte-Cache: gemeinsamer PLCValueStore (DataGateway bindet den Store
+        # des VariableManagers), Schlüssel (plc_id, variable)
+        self.plc_id = plc_id or self._env_plc_id() or 'plc_001'
+        self.value_store = PLCValueStore()
         self.cache_timeout = 0.1  # 100ms Cache
-        self.cache_max_entries = max(100, int(os.getenv('SMARTHOME_PLC_CACHE_MAX_ENTRIES', '5000')))
-        self.cache_evictions = 0
+
+        # Sum-Read (ADS-Summenkommandos für Batch-Lesen)
+        self.sum_read_chunk_size = max(1, min(
+            MAX_ADS_SUB_COMMANDS,
+            int(os.getenv('SMARTHOME_ADS_SUM_READ_CHUNK', str(MAX_ADS_SUB_COMMANDS)))
+        ))
+        self._sum_read_excluded = {}  # Symbol -> Ablaufzeit (blockiert Sum-Reads)
+        self.sum_read_stats = {
+            'batches': 0,
+            'round_trips': 0,
+            'chunk_fallbacks': 0,
+            'symbol_errors': 0
+        }
+        self.sum_write_stats = {
+            'batches': 0,
+            'round_trips': 0,
+            'chunk_fallbacks': 0,
+            'symbol_errors': 0
+        }
+
+        # Device-Notifications (Push statt Polling, referenzgezählt)
+        self.notifications = create_notification_registry()
         
         # ⭐ v1.1.0: Verbessertes Error-Handling
         self.consecutive_errors = 0
@@ -71,8 +104,14 @@ class PLCCommunication(BaseModule):
         print(f"  ⚡ {self.NAME} v{self.VERSION} initialisiert")
         print(f"     Max Errors: {self.max_errors}, Reconnect-Cooldown: {self.reconnect_cooldown}s")
 
-        # AUTO-CONNECT: Verbinde automatisch wenn AMS NetID konfiguriert ist
         config_mgr = app_context.module_manager.get_module('config_manager')
+
+        # plc_id der Standard-PLC: Env vor Config (module_manager übergibt keine Argumente)
+        configured_id = self._env_plc_id() or (config_mgr.get_config_value('plc_id') if config_mgr else None)
+        if configured_id:
+            self.plc_id = str(configured_id).strip()
+
+        # AUTO-CONNECT: Verbinde automatisch wenn AMS NetID konfiguriert ist
         if config_mgr:
             saved_ams_id = config_mgr.get_config_value('plc_ams_net_id')
             saved_port = config_mgr.get_config_value('plc_ams_port', pyads.PORT_TC2PLC1)
@@ -87,6 +126,10 @@ class PLCCommunication(BaseModule):
                 else:
                     print(f"  ⚠️  Auto-Connect fehlgeschlagen (wird später retry)")
     
+    @staticmethod
+    def _env_plc_id() -> str:
+        return str(os.getenv('SMARTHOME_DEFAULT_PLC_ID', '') or '').strip()
+
     def configure(self, ams_net_id: str, port: int = None, timeout: int = 5000):
         """Konfiguriert PLC-Verbindung"""
         self.config['ams_net_id'] = ams_net_id
@@ -114,6 +157,9 @@ class PLCCommunication(BaseModule):
             self.plc.open()
             self.connected = True
             self.consecutive_errors = 0
+            self._sum_read_excluded.clear()
+            self.notifications.bind(self.plc)
+            self.notifications.reattach()
 
             print(f"  ✓ PLC verbunden: {self.config['ams_net_id']} (Port {self.config['port']})")
             return True
@@ -129,6 +175,7 @@ class PLCCommunication(BaseModule):
         """Trennt PLC-Verbindung"""
         if self.plc:
             try:
+                self.notifications.release_all()
                 self.plc.close()
                 self.connected = False
                 print("  ✓ PLC getrennt")
@@ -178,21 +225,16 @@ class PLCCommunication(BaseModule):
             return None
         
         # Cache-Check
-        if use_cache and variable in self.cache:
-            cached_value, cached_time = self.cache[variable]
-            if time.time() - cached_time < self.cache_timeout:
+        if use_cache:
+            cached_value = self.value_store.get(self.plc_id, variable, self.cache_timeout)
+            if cached_value is not None:
                 return cached_value
         
         try:
             value = self.plc.read_by_name(variable, plc_type)
             
             # Cache speichern
-            if variable not in self.cache and len(self.cache) >= self.cache_max_entries:
-                oldest_key = next(iter(self.cache), None)
-                if oldest_key is not None:
-                    del self.cache[oldest_key]
-                    self.cache_evictions += 1
-            self.cache[variable] = (value, time.time())
+            self.value_store.put(self.plc_id, variable, value)
             
             # ⭐ Reset Fehler-Counter bei Erfolg
             if self.consecutive_errors > 0:
@@ -223,14 +265,68 @@ class PLCCommunication(BaseModule):
             # Stille Fehler (kein Print für jede fehlerhafte Variable)
             return None
     
-    def write_by_name(self, variable: str, value: Any, plc_type: int) -> bool:
+    def read_list_by_name(self, variables: List[str], plc_types: Optional[Dict[str, int]] = None,
+                          use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Liest mehrere Variablen gebündelt per ADS-Sum-Read
+
+        Pro Chunk (max. sum_read_chunk_size Sub-Kommandos) fällt genau ein
+        ADS-Roundtrip an. Fehler einzelner Symbole werden isoliert; schlägt
+        ein ganzer Chunk fehl, wird er per read_by_name() einzeln gelesen.
+
+        Args:
+            variables: Variablen-Namen
+            plc_types: {variable: pyads.PLCTYPE_*} für den Einzel-Fallback
+                (STRING-Werte werden nie als ADS-Fehlertext gewertet)
+            use_cache: Cache verwenden?
+
+        Returns:
+            Dict {variable: wert} - fehlerhafte Variablen fehlen
+        """
+        if not self.connected or not variables:
+            return {}
+
+        plc_types = plc_types or {}
+        if use_cache:
+            values, to_read = self.value_store.get_many(self.plc_id, variables, self.cache_timeout)
+        else:
+            values, to_read = {}, list(variables)
+
+        if not to_read:
+            return values
+
+        read_values, stats = sum_read(
+            self.plc,
+            to_read,
+            self.sum_read_chunk_size,
+            lambda name: self.read_by_name(name, plc_types.get(name, pyads.PLCTYPE_BYTE), use_cache=False),
+            excluded=self._sum_read_excluded,
+            plc_types=plc_types
+        )
+
+        self.sum_read_stats['batches'] += 1
+        for key in ('round_trips', 'chunk_fallbacks', 'symbol_errors'):
+            self.sum_read_stats[key] += stats[key]
+
+        # Einzel-Reads zählen bereits in read_by_name()
+        batched = len(read_values) - (stats['single_reads'] - stats['symbol_errors'])
+        self.total_reads += max(0, batched)
+        if stats['chunks'] > stats['chunk_fallbacks']:
+            self.consecutive_errors = 0
+
+        self.value_store.put_many(self.plc_id, read_values)
+        values.update(read_values)
+
+        return values
+
+    def write_by_name(self, variable: str, value: Any, plc_type: int = None) -> bool:
         """
         Schreibt Variable zum PLC
         
         Args:
             variable: Variablen-Name
             value: Zu schreibender Wert
-            plc_type: pyads.PLCTYPE_*
+            plc_type: pyads.PLCTYPE_* (None = pyads ermittelt den Typ)
         
         Returns:
             True bei Erfolg
@@ -241,9 +337,8 @@ class PLCCommunication(BaseModule):
         try:
             self.plc.write_by_name(variable, value, plc_type)
             
-            # Cache invalidieren
-            if variable in self.cache:
-                del self.cache[variable]
+            # Write-through: bekannter Wert, TTL-Reads gehen wieder zur SPS
+            self.value_store.put(self.plc_id, variable, value, fresh=False)
             
             # ⭐ Reset Fehler-Counter bei Erfolg
             if self.consecutive_errors > 0:
@@ -258,6 +353,74 @@ class PLCCommunication(BaseModule):
             print(f"  ⚠️  Write-Fehler {variable}: {e}")
             return False
     
+    def write_list_by_name(self, values: Dict[str, Any],
+                           plc_types: Optional[Dict[str, int]] = None) -> Dict[str, bool]:
+        """
+        Schreibt mehrere Variablen gebündelt per ADS-Sum-Write
+
+        Die Sub-Kommandos laufen in der Reihenfolge von values; schlägt ein
+        ganzer Chunk fehl, wird er per write_by_name() einzeln geschrieben.
+
+        Args:
+            values: {variable: wert}
+            plc_types: {variable: pyads.PLCTYPE_*} für den Einzel-Fallback
+
+        Returns:
+            Dict {variable: True/False}
+        """
+        if not values:
+            return {}
+        if not self.connected:
+            return {variable: False for variable in values}
+
+        plc_types = plc_types or {}
+        results, stats = sum_write(
+            self.plc,
+            values,
+            self.sum_read_chunk_size,
+            lambda name, value: self.write_by_name(name, value, plc_types.get(name))
+        )
+
+        self.sum_write_stats['batches'] += 1
+        for key in ('round_trips', 'chunk_fallbacks', 'symbol_errors'):
+            self.sum_write_stats[key] += stats[key]
+
+        # Write-through bzw. Invalidierung bei Fehlern (Wert in der SPS unbekannt)
+        for variable, value in values.items():
+            if results.get(variable):
+                self.value_store.put(self.plc_id, variable, value, fresh=False)
+            else:
+                self.value_store.invalidate(self.plc_id, variable)
+
+        # Einzel-Writes zählen bereits in write_by_name()
+        batched = sum(1 for ok in results.values() if ok) - (stats['single_writes'] - stats['symbol_errors'])
+        self.total_writes += max(0, batched)
+        if stats['chunks'] > stats['chunk_fallbacks']:
+            self.consecutive_errors = 0
+        return results
+
+    def add_value_notification(self, variable: str, callback, plc_type: int) -> bool:
+        """
+        Registriert eine On-Change Device-Notification (referenzgezählt)
+
+        Args:
+            variable: Variablen-Name
+            callback: callback(variable, value) - läuft im ADS-Callback-Thread
+            plc_type: pyads.PLCTYPE_* (für Länge und Parsing)
+
+        Returns:
+            True wenn die Variable per Notification bedient wird
+        """
+        return self.notifications.add(variable, plc_type, callback)
+
+    def remove_value_notification(self, variable: str) -> bool:
+        """Gibt eine Referenz frei; beim letzten Abo wird das Handle gelöscht"""
+        return self.notifications.remove(variable)
+
+    def has_value_notification(self, variable: str) -> bool:
+        """True wenn die Variable aktuell per Notification bedient wird"""
+        return self.notifications.is_active(variable)
+
     def toggle_bool(self, variable: str) -> bool:
         """Toggle Bool-Variable (SCHNELL - ohne Cache)"""
         # WICHTIG: use_cache=False für schnelles Toggle!
@@ -293,9 +456,11 @@ class PLCCommunication(BaseModule):
             'ams_net_id': self.config['ams_net_id'],
             'consecutive_errors': self.consecutive_errors,
             'max_errors': self.max_errors,
-            'cached_variables': len(self.cache),
-            'cache_max_entries': self.cache_max_entries,
-            'cache_evictions': self.cache_evictions,
+            'cached_variables': self.value_store.count(self.plc_id),
+            'value_store': self.value_store.get_stats(),
+            'sum_read': dict(self.sum_read_stats, chunk_size=self.sum_read_chunk_size),
+            'sum_write': dict(self.sum_write_stats),
+            'notifications': self.notifications.get_stats(),
             'total_reads': self.total_reads,
             'total_writes': self.total_writes,
             'total_errors': self.total_errors,
@@ -303,8 +468,8 @@ class PLCCommunication(BaseModule):
         }
     
     def clear_cache(self):
-        """Leert Cache"""
-        self.cache.clear()
+        """Invalidiert den Cache (nächste Reads gehen zur SPS)"""
+        self.value_store.invalidate_plc(self.plc_id)
     
     def reset_statistics(self):
         """⭐ v1.1.0: Reset Statistik"""
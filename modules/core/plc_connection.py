@@ -24,8 +24,15 @@ except ImportError:
     # Fallback für direkten Import
     sys.path.append(os.path.dirname(__file__))
     from connection_manager import BaseConnection, ConnectionStatus
-from typing import Any, Dict, Optional
-import threading
+try:
+    from modules.core.ads_sum_read import MAX_ADS_SUB_COMMANDS, sum_read, sum_write
+    from modules.core.ads_notifications import create_notification_registry
+    from modules.core.plc_value_store import PLCValueStore
+except ImportError:
+    from ads_sum_read import MAX_ADS_SUB_COMMANDS, sum_read, sum_write
+    from ads_notifications import create_notification_registry
+    from plc_value_store import PLCValueStore
+from typing import Any, Dict, List, Optional
 import time
 
 # PyADS Import (optional)
@@ -79,12 +86,27 @@ class PLCConnection(BaseConnection):
         # ADS Connection
         self.plc = None
 
-        # Read-Cache
-        self.cache = {}
+        # Read-Cache: gemeinsamer PLCValueStore (DataGateway bindet den Store
+        # des VariableManagers), Schlüssel (connection_id, symbol)
+        self.value_store = PLCValueStore()
         self.cache_timeout = 0.1  # 100ms
-        self.cache_max_entries = max(100, int(os.getenv('SMARTHOME_PLC_CONNECTION_CACHE_MAX_ENTRIES', '5000')))
-        self.cache_lock = threading.RLock()
-        self.stats['cache_evictions'] = 0
+
+        # Sum-Read (ADS-Summenkommandos für Batch-Lesen)
+        self.sum_read_chunk_size = max(1, min(
+            MAX_ADS_SUB_COMMANDS,
+            int(config.get('sum_read_chunk_size') or os.getenv('SMARTHOME_ADS_SUM_READ_CHUNK', str(MAX_ADS_SUB_COMMANDS)))
+        ))
+        self._sum_read_excluded = {}  # Symbol -> Ablaufzeit (blockiert Sum-Reads)
+        self.stats['sum_read_round_trips'] = 0
+        self.stats['sum_read_chunk_fallbacks'] = 0
+        self.stats['sum_write_round_trips'] = 0
+        self.stats['sum_write_chunk_fallbacks'] = 0
+
+        # Device-Notifications (Push statt Polling, referenzgezählt)
+        self.notifications = create_notification_registry(
+            cycle_time_ms=config.get('notification_cycle_ms'),
+            max_delay_ms=config.get('notification_max_delay_ms')
+        )
 
         # Health-Check Variable (optional)
         self.health_check_variable = config.get('health_check_variable', None)
@@ -136,9 +158,11 @@ class PLCConnection(BaseConnection):
             self.reconnect_attempts = 0
             self.last_error = None
 
-            # Cache leeren
-            with self.cache_lock:
-                self.cache.clear()
+            # Cache invalidieren
+            self.value_store.invalidate_plc(self.connection_id)
+            self._sum_read_excluded.clear()
+            self.notifications.bind(self.plc)
+            self.notifications.reattach()
 
             print(f"  ✅ [{self.connection_id}] Verbunden mit {self.ams_net_id}")
 
@@ -166,15 +190,15 @@ class PLCConnection(BaseConnection):
         """
         try:
             if self.plc:
+                self.notifications.release_all()
                 self.plc.close()
                 self.plc = None
 
             self.status = ConnectionStatus.DISCONNECTED
             self.connected_at = None
 
-            # Cache leeren
-            with self.cache_lock:
-                self.cache.clear()
+            # Cache invalidieren
+            self.value_store.invalidate_plc(self.connection_id)
 
             print(f"  🔌 [{self.connection_id}] Getrennt von {self.ams_net_id}")
 
@@ -255,7 +279,7 @@ class PLCConnection(BaseConnection):
 
         # Cache-Check
         if use_cache:
-            cached = self._get_from_cache(symbol)
+            cached = self.value_store.get(self.connection_id, symbol, self.cache_timeout)
             if cached is not None:
                 return cached
 
@@ -271,8 +295,7 @@ class PLCConnection(BaseConnection):
             self.update_stats(packets_received=1, bytes_received=8)  # Geschätzt
 
             # Cache
-            if use_cache:
-                self._put_to_cache(symbol, value)
+            self.value_store.put(self.connection_id, symbol, value)
 
             # Route zu DataGateway
             self._route_to_gateway(symbol, value)
@@ -284,6 +307,64 @@ class PLCConnection(BaseConnection):
             self.stats['errors'] += 1
             return None
 
+    def read_list_by_name(self, symbols: List[str], plc_types: Optional[Dict[str, int]] = None,
+                          use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Liest mehrere PLC-Variablen gebündelt per ADS-Sum-Read
+
+        Im Gegensatz zu read_by_name() werden die Werte NICHT einzeln an das
+        DataGateway geroutet - der Aufrufer (Polling) verarbeitet das Ergebnis
+        selbst, sonst würde die Spam-Protection bei großen Batches greifen.
+
+        Args:
+            symbols: PLC-Symbole
+            plc_types: {symbol: pyads.PLCTYPE_*} für den Einzel-Fallback
+                (STRING-Werte werden nie als ADS-Fehlertext gewertet)
+            use_cache: Cache nutzen?
+
+        Returns:
+            Dict {symbol: wert} - fehlerhafte Symbole fehlen
+        """
+        if not symbols or not self.is_connected():
+            return {}
+
+        plc_types = plc_types or {}
+        if use_cache:
+            values, to_read = self.value_store.get_many(self.connection_id, symbols, self.cache_timeout)
+        else:
+            values, to_read = {}, list(symbols)
+
+        if not to_read:
+            return values
+
+        def read_single(symbol: str) -> Optional[Any]:
+            try:
+                plc_type = plc_types.get(symbol)
+                if plc_type is None:
+                    return self.plc.read_by_name(symbol)
+                return self.plc.read_by_name(symbol, plc_type)
+            except Exception:
+                return None
+
+        read_values, stats = sum_read(
+            self.plc,
+            to_read,
+            self.sum_read_chunk_size,
+            read_single,
+            excluded=self._sum_read_excluded,
+            plc_types=plc_types
+        )
+
+        self.update_stats(packets_received=stats['round_trips'], bytes_received=8 * len(read_values))
+        self.stats['errors'] += stats['symbol_errors']
+        self.stats['sum_read_round_trips'] += stats['round_trips']
+        self.stats['sum_read_chunk_fallbacks'] += stats['chunk_fallbacks']
+
+        self.value_store.put_many(self.connection_id, read_values)
+        values.update(read_values)
+
+        return values
+
     def write_by_name(self, symbol: str, value: Any, plc_type: int = None) -> bool:
         """
         Schreibt PLC-Variable
@@ -309,10 +390,8 @@ class PLCConnection(BaseConnection):
             # Statistik
             self.update_stats(packets_sent=1, bytes_sent=8)  # Geschätzt
 
-            # Cache invalidieren
-            with self.cache_lock:
-                if symbol in self.cache:
-                    del self.cache[symbol]
+            # Write-through: bekannter Wert, TTL-Reads gehen wieder zur SPS
+            self.value_store.put(self.connection_id, symbol, value, fresh=False)
 
             # Route zu DataGateway
             self._route_to_gateway(symbol, value)
@@ -324,6 +403,74 @@ class PLCConnection(BaseConnection):
             self.stats['errors'] += 1
             return False
 
+    def write_list_by_name(self, values: Dict[str, Any],
+                           plc_types: Optional[Dict[str, int]] = None) -> Dict[str, bool]:
+        """
+        Schreibt mehrere PLC-Variablen gebündelt per ADS-Sum-Write
+
+        Wie read_list_by_name() ohne Routing einzelner Werte an das
+        DataGateway - der Aufrufer (Write-Pipeline) meldet die Ergebnisse.
+
+        Args:
+            values: {symbol: wert} - Reihenfolge = Schreibreihenfolge
+            plc_types: {symbol: pyads.PLCTYPE_*} für den Einzel-Fallback
+
+        Returns:
+            Dict {symbol: True/False}
+        """
+        if not values:
+            return {}
+        if not self.is_connected():
+            return {symbol: False for symbol in values}
+
+        plc_types = plc_types or {}
+
+        def write_single(symbol: str, value: Any) -> bool:
+            plc_type = plc_types.get(symbol)
+            if plc_type is None:
+                plc_type = self._detect_plc_type(value)
+            self.plc.write_by_name(symbol, value, plc_type)
+            return True
+
+        results, stats = sum_write(self.plc, values, self.sum_read_chunk_size, write_single)
+
+        written = sum(1 for ok in results.values() if ok)
+        self.update_stats(packets_sent=stats['round_trips'], bytes_sent=8 * written)
+        self.stats['errors'] += stats['symbol_errors']
+        self.stats['sum_write_round_trips'] += stats['round_trips']
+        self.stats['sum_write_chunk_fallbacks'] += stats['chunk_fallbacks']
+
+        # Write-through bzw. Invalidierung bei Fehlern (Wert in der SPS unbekannt)
+        for symbol, value in values.items():
+            if results.get(symbol):
+                self.value_store.put(self.connection_id, symbol, value, fresh=False)
+            else:
+                self.value_store.invalidate(self.connection_id, symbol)
+
+        return results
+
+    def add_value_notification(self, symbol: str, callback, plc_type: int) -> bool:
+        """
+        Registriert eine On-Change Device-Notification (referenzgezählt)
+
+        Args:
+            symbol: PLC-Symbol
+            callback: callback(symbol, value) - läuft im ADS-Callback-Thread
+            plc_type: pyads.PLCTYPE_* (für Länge und Parsing)
+
+        Returns:
+            True wenn das Symbol per Notification bedient wird
+        """
+        return self.notifications.add(symbol, plc_type, callback)
+
+    def remove_value_notification(self, symbol: str) -> bool:
+        """Gibt eine Referenz frei; beim letzten Abo wird das Handle gelöscht"""
+        return self.notifications.remove(symbol)
+
+    def has_value_notification(self, symbol: str) -> bool:
+        """True wenn das Symbol aktuell per Notification bedient wird"""
+        return self.notifications.is_active(symbol)
+
     def read_state(self) -> Optional[tuple]:
         """
         Liest PLC-State (ADS State + Device State)
@@ -362,35 +509,6 @@ class PLCConnection(BaseConnection):
             print(f"  ⚠️  [{self.connection_id}] Device-Info konnte nicht gelesen werden: {e}")
             return None
 
-    # ========================================================================
-    # CACHE
-    # ========================================================================
-
-    def _get_from_cache(self, symbol: str) -> Optional[Any]:
-        """Holt Wert aus Cache"""
-        with self.cache_lock:
-            if symbol in self.cache:
-                value, timestamp = self.cache[symbol]
-                age = time.time() - timestamp
-
-                if age < self.cache_timeout:
-                    return value
-                else:
-                    # Cache abgelaufen
-                    del self.cache[symbol]
-
-            return None
-
-    def _put_to_cache(self, symbol: str, value: Any):
-        """Speichert Wert im Cache"""
-        with self.cache_lock:
-            if symbol not in self.cache and len(self.cache) >= self.cache_max_entries:
-                oldest_key = next(iter(self.cache), None)
-                if oldest_key is not None:
-                    del self.cache[oldest_key]
-                    self.stats['cache_evictions'] = self.stats.get('cache_evictions', 0) + 1
-            self.cache[symbol] = (value, time.time())
-
     # ========================================================================
     # HELPERS
     # ========================================================================
@@ -0,0 +1,296 @@
+"""
+PLC Value Store
+Gemeinsamer Wertespeicher für PLC-Variablen mit TTL und Änderungssequenzen
+
+📁 SPEICHERORT: modules/core/plc_value_store.py
+
+Ersetzt die getrennten Werte-Caches von PLCCommunication, PLCConnection
+(je 100ms-TTL-Dict) und VariableManager.value_cache (unbegrenzt), die
+denselben Wert mehrfach hielten:
+- ein Eintrag pro (plc_id, symbol) mit Wert, Zeitstempel und Sequenz;
+  ein Dict pro PLC (Symbolnamen als Key, keine Tupel-Keys)
+- begrenzte Größe, Eviction nach Aktualisierungsreihenfolge (LRU: ein
+  aktualisierter Eintrag rückt ans Dict-Ende, verdrängt wird der älteste
+  Anfang über alle PLCs)
+- TTL-Reads (get(max_age=...)) bedienen nur Werte, die frisch von der SPS
+  gelesen wurden; Writes setzen den Wert, aber nicht die Frische
+  (write-through + Invalidierung: der nächste TTL-Read geht zur SPS)
+- Sequenz steigt nur bei Wertänderung; publish() meldet, ob sich ein Wert
+  seit der letzten Veröffentlichung geändert hat (Change-Detection des
+  Pollings, auch wenn der Read-Pfad den Wert schon eingetragen hat)
+
+Thread-sicher (Poll-Worker, ADS-Callback-Thread und Write-Pipeline
+schreiben parallel).
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = 20000
+
+
+def _same_value(old: Any, new: Any) -> bool:
+    try:
+        return bool(old is new or old == new)
+    except Exception:
+        # Nicht vergleichbare Werte (z.B. Arrays) gelten als geändert
+        return False
+
+
+class _Entry:
+    __slots__ = ('value', 'stamp', 'seq', 'fresh', 'dirty')
+
+    def __init__(self, value: Any, stamp: float, seq: int, fresh: bool):
+        self.value = value
+        self.stamp = stamp  # letzte Änderung bzw. letzter SPS-Read (time.time())
+        self.seq = seq      # Sequenz der letzten Wertänderung
+        self.fresh = fresh  # stamp stammt von einem SPS-Read (bedient TTL-Reads)
+        self.dirty = True   # Änderung noch nicht veröffentlicht
+
+
+class PLCValueStore:
+    """
+    Begrenzter Wertespeicher pro (plc_id, symbol)
+
+    Args:
+        max_entries: Max. Anzahl Einträge (None = SMARTHOME_PLC_VALUE_STORE_MAX_ENTRIES)
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        if max_entries is None:
+            try:
+                max_entries = int(os.getenv('SMARTHOME_PLC_VALUE_STORE_MAX_ENTRIES', str(DEFAULT_MAX_ENTRIES)))
+            except ValueError:
+                max_entries = DEFAULT_MAX_ENTRIES
+        self.max_entries = max(100, int(max_entries))
+        self.seq = 0
+        self._plcs: Dict[str, Dict[str, _Entry]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'stale_reads': 0,
+            'evictions': 0,
+            'invalidations': 0
+        }
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        plc_id, symbol = key
+        return symbol in self._plcs.get(plc_id, ())
+
+    def count(self, plc_id: str) -> int:
+        """Anzahl Einträge einer PLC"""
+        return len(self._plcs.get(plc_id, ()))
+
+    # ------------------------------------------------------------
+    # SCHREIBEN
+    # ------------------------------------------------------------
+
+    def put(self, plc_id: str, symbol: str, value: Any, fresh: bool = True,
+            stamp: Optional[float] = None) -> int:
+        """
+        Speichert einen Wert
+
+        Args:
+            fresh: True = frisch von der SPS gelesen (bedient TTL-Reads),
+                False = bekannter Wert ohne Read (Write, Aufrufer-Update)
+            stamp: Zeitstempel (Standard: jetzt)
+
+        Returns:
+            Sequenz der letzten Wertänderung des Eintrags
+        """
+        stamp = time.time() if stamp is None else stamp
+        with self._lock:
+            return self._put(plc_id, symbol, value, fresh, stamp).seq
+
+    def put_many(self, plc_id: str, values: Dict[str, Any], fresh: bool = True):
+        """Mehrere Werte einer PLC mit gemeinsamem Zeitstempel (ein Lock)"""
+        stamp = time.time()
+        with self._lock:
+            for symbol, value in values.items():
+                self._put(plc_id, symbol, value, fresh, stamp)
+
+    def publish(self, plc_id: str, symbol: str, value: Any, stamp: Optional[float] = None) -> bool:
+        """
+        Speichert einen Wert und markiert ihn als veröffentlicht
+
+        Returns:
+            True wenn der Wert neu ist oder sich seit der letzten
+            Veröffentlichung geändert hat (auch durch einen Read dazwischen)
+        """
+        stamp = time.time() if stamp is None else stamp
+        with self._lock:
+            entry = self._put(plc_id, symbol, value, False, stamp)
+            changed = entry.dirty
+            entry.dirty = False
+            return changed
+
+    def _put(self, plc_id: str, symbol: str, value: Any, fresh: bool, stamp: float) -> _Entry:
+        # Aufruf unter self._lock
+        entries = self._plcs.get(plc_id)
+        if entries is None:
+            entries = self._plcs[plc_id] = {}
+        entry = entries.get(symbol)
+        if entry is None:
+            self.seq += 1
+            entry = entries[symbol] = _Entry(value, stamp, self.seq, fresh)
+            self._size += 1
+            while self._size > self.max_entries:
+                self._evict_oldest()
+            return entry
+
+        if not _same_value(entry.value, value):
+            self.seq += 1
+            entry.seq = self.seq
+            entry.value = value
+            entry.dirty = True
+        elif not fresh:
+            # Bekannter Wert bestätigt - Frische und Reihenfolge bleiben
+            return entry
+        entry.stamp = stamp
+        entry.fresh = fresh
+        # Ans Ende rücken (Dict-Reihenfolge = Aktualisierungsreihenfolge)
+        del entries[symbol]
+        entries[symbol] = entry
+        return entry
+
+    def _evict_oldest(self):
+        # Aufruf unter self._lock: ältester Anfang über alle PLCs (wenige PLCs)
+        oldest = None
+        for plc_id, entries in self._plcs.items():
+            if entries:
+                symbol = next(iter(entries))
+                if oldest is None or entries[symbol].stamp < oldest[2]:
+                    oldest = (plc_id, symbol, entries[symbol].stamp)
+        if oldest is not None:
+            self._drop(oldest[0], oldest[1])
+            self.stats['evictions'] += 1
+
+    def _drop(self, plc_id: str, symbol: str):
+        # Aufruf unter self._lock
+        entries = self._plcs[plc_id]
+        del entries[symbol]
+        self._size -= 1
+        if not entries:
+            del self._plcs[plc_id]
+
+    def invalidate(self, plc_id: str, symbol: str):
+        """Nächster TTL-Read geht zur SPS (Wert bleibt als letzter Stand)"""
+        with self._lock:
+            entry = self._plcs.get(plc_id, {}).get(symbol)
+            if entry is not None and entry.fresh:
+                entry.fresh = False
+                self.stats['invalidations'] += 1
+
+    def invalidate_plc(self, plc_id: str):
+        """Invalidiert alle Einträge einer PLC (Connect/Disconnect, clear_cache)"""
+        with self._lock:
+            for entry in self._plcs.get(plc_id, {}).values():
+                if entry.fresh:
+                    entry.fresh = False
+                    self.stats['invalidations'] += 1
+
+    def prune(self, max_age: float, plc_id: Optional[str] = None) -> int:
+        """
+        Entfernt Einträge, die länger als max_age Sekunden nicht aktualisiert wurden
+
+        Returns:
+            Anzahl entfernter Einträge
+        """
+        cutoff = time.time() - max_age
+        removed = 0
+        with self._lock:
+            plc_ids = [plc_id] if plc_id is not None else list(self._plcs)
+            for current in plc_ids:
+                entries = self._plcs.get(current)
+                if not entries:
+                    continue
+                stale = []
+                # Älteste Aktualisierung zuerst → Abbruch beim ersten jüngeren Eintrag
+                for symbol, entry in entries.items():
+                    if entry.stamp >= cutoff:
+                        break
+                    stale.append(symbol)
+                for symbol in stale:
+                    self._drop(current, symbol)
+                removed += len(stale)
+        return removed
+
+    def clear(self):
+        with self._lock:
+            self._plcs.clear()
+            self._size = 0
+
+    # ------------------------------------------------------------
+    # LESEN
+    # ------------------------------------------------------------
+
+    def get(self, plc_id: str, symbol: str, max_age: Optional[float] = None, default: Any = None) -> Any:
+        """
+        Wert eines Symbols
+
+        Args:
+            max_age: Nur Werte, die vor weniger als max_age Sekunden von der
+                SPS gelesen wurden (None = letzter bekannter Wert)
+        """
+        with self._lock:
+            return self._get(self._plcs.get(plc_id, {}).get(symbol), max_age, time.time(), default)
+
+    def get_many(self, plc_id: str, symbols: Iterable[str],
+                 max_age: Optional[float] = None) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        TTL-Read mehrerer Symbole (ein Lock)
+
+        Returns:
+            ({symbol: wert} der Treffer, [fehlende/abgelaufene Symbole])
+        """
+        found: Dict[str, Any] = {}
+        missing: List[str] = []
+        now = time.time()
+        with self._lock:
+            entries = self._plcs.get(plc_id, {})
+            for symbol in symbols:
+                value = self._get(entries.get(symbol), max_age, now, _MISSING)
+                if value is _MISSING:
+                    missing.append(symbol)
+                else:
+                    found[symbol] = value
+        return found, missing
+
+    def _get(self, entry: Optional[_Entry], max_age: Optional[float], now: float, default: Any) -> Any:
+        # Aufruf unter self._lock
+        if entry is None:
+            self.stats['misses'] += 1
+            return default
+        if max_age is not None and (not entry.fresh or now - entry.stamp >= max_age):
+            self.stats['stale_reads'] += 1
+            return default
+        self.stats['hits'] += 1
+        return entry.value
+
+    def get_entry(self, plc_id: str, symbol: str) -> Optional[Tuple[Any, float, int]]:
+        """(wert, zeitstempel, sequenz) oder None"""
+        with self._lock:
+            entry = self._plcs.get(plc_id, {}).get(symbol)
+            if entry is None:
+                return None
+            return entry.value, entry.stamp, entry.seq
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            stats['entries'] = self._size
+            stats['plcs'] = {plc_id: len(entries) for plc_id, entries in self._plcs.items()}
+        stats['max_entries'] = self.max_entries
+        stats['seq'] = self.seq
+        return stats
+
+
+_MISSING = object()
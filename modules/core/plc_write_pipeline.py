@@ -0,0 +1,268 @@
+"""
+PLC Write Pipeline
+Gebündelte und zusammengefasste PLC-Writes pro Verbindung
+
+📁 SPEICHERORT: modules/core/plc_write_pipeline.py
+
+Slider-Widgets und schnelle Routen erzeugen viele Writes auf dasselbe
+Symbol. Statt jedes write_by_name() sofort synchron abzusetzen, landen die
+Writes einer Verbindung in einer Queue mit eigenem Writer-Thread:
+- Coalescing: ein neuer Wert für ein wartendes Symbol ersetzt den alten
+  Wert (der ältere Write gilt mit dem neueren als bestätigt)
+- Reihenfolge: das zusammengefasste Symbol rückt an die Position seines
+  letzten Writes - die SPS sieht eine Teilfolge der Writes in
+  Aufrufreihenfolge, Writes auf verschiedene Symbole werden nie vertauscht
+- Batching: die wartenden Writes gehen als ein Multi-Symbol-Write
+  (write_list_by_name → ADS-Sum-Write) raus; ein Batch endet vor dem
+  ersten Symbol, das darin schon vorkommt
+- Fenster: ein Symbol, das vor weniger als window_s geschrieben wurde,
+  sammelt bis zum Fensterende weitere Werte; Writes auf andere Symbole und
+  einzelne Writes nach einer Pause gehen ohne Verzögerung raus
+- Quittung pro Write (WriteTicket.wait), on_written(results) wird pro Batch
+  VOR den Quittungen aufgerufen (Cache/Broadcast des Aufrufers); context
+  (z.B. Correlation-ID) stammt vom letzten zusammengefassten Write
+
+Die Verbindung muss write_by_name() bieten, write_list_by_name() ist
+optional (sonst Einzel-Writes in Queue-Reihenfolge).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from modules.core.ads_sum_read import MAX_ADS_SUB_COMMANDS
+except ImportError:
+    from ads_sum_read import MAX_ADS_SUB_COMMANDS
+
+
+class WriteTicket:
+    """Quittung eines einzelnen Writes"""
+
+    __slots__ = ('symbol', 'value', 'ok', 'error', 'coalesced', '_done')
+
+    def __init__(self, symbol: str, value: Any):
+        self.symbol = symbol
+        self.value = value  # tatsächlich geschriebener Wert (nach Coalescing)
+        self.ok: Optional[bool] = None
+        self.error: Optional[str] = None
+        self.coalesced = False
+        self._done = threading.Event()
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wartet auf die Quittung; False bei Fehler oder Timeout"""
+        if not self._done.wait(timeout):
+            return False
+        return bool(self.ok)
+
+    def _resolve(self, ok: bool, value: Any, error: Optional[str]):
+        self.ok = ok
+        self.value = value
+        self.error = error
+        self._done.set()
+
+
+class _PendingWrite:
+    __slots__ = ('tag', 'symbol', 'value', 'plc_type', 'context', 'tickets')
+
+    def __init__(self, tag: Any, symbol: str, value: Any, plc_type: Any, context: Any, ticket: WriteTicket):
+        self.tag = tag
+        self.symbol = symbol
+        self.value = value
+        self.plc_type = plc_type
+        self.context = context
+        self.tickets = [ticket]
+
+
+class PLCWritePipeline:
+    """
+    Write-Queue mit Writer-Thread für eine PLC-Verbindung
+
+    Args:
+        plc: Verbindung (PLCCommunication, PLCConnection, ...)
+        window_s: Sammelfenster pro Symbol (0 = nur bündeln, was während
+            eines laufenden Writes auflief)
+        max_batch: Max. Writes pro Batch
+        on_written: Callback([(tag, symbol, value, ok, context)]) pro Batch
+        name: Thread-Name
+    """
+
+    def __init__(self, plc: Any, window_s: float = 0.02, max_batch: int = MAX_ADS_SUB_COMMANDS,
+                 on_written: Optional[Callable[[List[Tuple[Any, str, Any, bool, Any]]], None]] = None,
+                 name: str = 'plc-write'):
+        self.plc = plc
+        self.window_s = max(0.0, float(window_s))
+        self.max_batch = max(1, int(max_batch))
+        self.on_written = on_written
+        self.name = name
+        self._pending: 'OrderedDict[Tuple[Any, str], _PendingWrite]' = OrderedDict()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._written_at: Dict[str, float] = {}  # Symbol -> letzter Write (monotonic)
+
+        self.stats = {
+            'submitted': 0,
+            'coalesced': 0,
+            'batches': 0,
+            'multi_writes': 0,
+            'written': 0,
+            'failed': 0,
+            'max_batch': 0,
+            'max_pending': 0,
+            'last_batch_ms': 0.0
+        }
+
+    def submit(self, symbol: str, value: Any, plc_type: Any = None, tag: Any = None,
+               context: Any = None) -> WriteTicket:
+        """
+        Reiht einen Write ein
+
+        Args:
+            symbol: PLC-Symbol
+            value: Wert
+            plc_type: pyads.PLCTYPE_* (None = Verbindung bestimmt den Typ)
+            tag: Zuordnung für on_written (z.B. plc_id), Teil des Coalescing-Keys
+            context: Begleitdaten für on_written (z.B. Correlation-ID)
+        """
+        ticket = WriteTicket(symbol, value)
+        with self._cond:
+            if self._stopping:
+                ticket._resolve(False, value, 'pipeline_stopped')
+                return ticket
+            self.stats['submitted'] += 1
+            key = (tag, symbol)
+            entry = self._pending.get(key)
+            if entry is not None:
+                # Wartender Wert wird überschrieben, ältere Tickets quittiert der
+                # neue Write; Position = letzter Write auf das Symbol
+                for older in entry.tickets:
+                    older.coalesced = True
+                entry.value = value
+                entry.plc_type = plc_type
+                entry.context = context
+                entry.tickets.append(ticket)
+                self._pending.move_to_end(key)
+                self.stats['coalesced'] += 1
+            else:
+                self._pending[key] = _PendingWrite(tag, symbol, value, plc_type, context, ticket)
+                self.stats['max_pending'] = max(self.stats['max_pending'], len(self._pending))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, daemon=True, name=self.name)
+                self._thread.start()
+            self._cond.notify()
+        return ticket
+
+    def write(self, symbol: str, value: Any, plc_type: Any = None, tag: Any = None,
+              timeout: Optional[float] = None) -> bool:
+        """Write mit Warten auf die Quittung"""
+        return self.submit(symbol, value, plc_type, tag).wait(timeout)
+
+    def _take_batch(self) -> List[_PendingWrite]:
+        # Aufruf unter self._cond
+        batch = []
+        symbols = set()
+        pending = self._pending
+        while pending and len(batch) < self.max_batch:
+            entry = next(iter(pending.values()))
+            if entry.symbol in symbols:
+                # Gleiches Symbol unter anderem Tag → nächster Batch
+                break
+            pending.popitem(last=False)
+            symbols.add(entry.symbol)
+            batch.append(entry)
+        return batch
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopping:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                now = time.monotonic()
+                head = next(iter(self._pending.values()))
+                written_at = self._written_at.get(head.symbol)
+                delay = written_at + self.window_s - now if written_at is not None else 0.0
+                if delay > 0 and not self._stopping:
+                    # Heißes Symbol an der Spitze → Fenster abwarten (Reihenfolge bleibt)
+                    self._cond.wait(delay)
+                    continue
+                batch = self._take_batch()
+                for entry in batch:
+                    self._written_at[entry.symbol] = now
+                if len(self._written_at) > 4096:
+                    self._written_at = {
+                        symbol: stamp for symbol, stamp in self._written_at.items()
+                        if stamp + self.window_s > now
+                    }
+            self._write_batch(batch)
+
+    def _write_batch(self, batch: List[_PendingWrite]):
+        started = time.monotonic()
+        results: Dict[str, bool] = {}
+        errors: Dict[str, str] = {}
+        writer = getattr(self.plc, 'write_list_by_name', None)
+        if callable(writer) and len(batch) > 1:
+            try:
+                results = writer(
+                    {entry.symbol: entry.value for entry in batch},
+                    {entry.symbol: entry.plc_type for entry in batch if entry.plc_type is not None}
+                ) or {}
+            except Exception as e:
+                errors = {entry.symbol: str(e) for entry in batch}
+        else:
+            for entry in batch:
+                try:
+                    if entry.plc_type is None:
+                        ok = self.plc.write_by_name(entry.symbol, entry.value)
+                    else:
+                        ok = self.plc.write_by_name(entry.symbol, entry.value, entry.plc_type)
+                    # write_by_name() liefert je nach Verbindung bool oder None
+                    results[entry.symbol] = ok is not False
+                except Exception as e:
+                    errors[entry.symbol] = str(e)
+
+        outcome = []
+        for entry in batch:
+            ok = bool(results.get(entry.symbol, False))
+            if not ok and entry.symbol not in errors:
+                errors[entry.symbol] = 'write_failed'
+            outcome.append((entry.tag, entry.symbol, entry.value, ok, entry.context))
+
+        with self._cond:
+            self.stats['batches'] += 1
+            self.stats['multi_writes'] += int(callable(writer) and len(batch) > 1)
+            self.stats['written'] += sum(1 for item in outcome if item[3])
+            self.stats['failed'] += sum(1 for item in outcome if not item[3])
+            self.stats['max_batch'] = max(self.stats['max_batch'], len(batch))
+            self.stats['last_batch_ms'] = round((time.monotonic() - started) * 1000.0, 2)
+
+        if self.on_written is not None:
+            try:
+                self.on_written(outcome)
+            except Exception:
+                pass
+        for entry, (_, _, value, ok, _) in zip(batch, outcome):
+            for ticket in entry.tickets:
+                ticket._resolve(ok, value, None if ok else errors.get(entry.symbol))
+
+    def stop(self, timeout: float = 2.0):
+        """Schreibt wartende Writes noch ab und beendet den Writer-Thread"""
+        with self._cond:
+            self._stopping = True
+            thread = self._thread
+            self._cond.notify_all()
+        if thread is not None:
+            thread.join(timeout=timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            stats = dict(self.stats)
+            stats['pending'] = len(self._pending)
+        stats['window_ms'] = round(self.window_s * 1000.0, 1)
+        return stats
@@ -0,0 +1,103 @@
+"""
+Stream Export
+Chunk-weiser Export großer Datensätze als NDJSON oder CSV (optional gzip)
+
+📁 SPEICHERORT: modules/core/stream_export.py
+
+Die Zeilen kommen als Iterator (z.B. SQLite-Cursor in Keyset-Blöcken) und
+werden zu Byte-Chunks von ca. chunk_bytes zusammengefasst - der Speicher
+bleibt unabhängig von der Exportgröße konstant. Die Web-Schicht reicht
+den Iterator an eine Flask-Streaming-Response weiter.
+"""
+
+import csv
+import io
+import json
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+STREAM_FORMATS = ('ndjson', 'csv')
+DEFAULT_CHUNK_BYTES = 64 * 1024
+
+MIMETYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+
+def iter_ndjson(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Eine JSON-Zeile pro Datensatz"""
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False, default=str) + '\n'
+
+
+def iter_csv(rows: Iterable[Dict[str, Any]], fieldnames: List[str]) -> Iterator[str]:
+    """Kopfzeile + eine CSV-Zeile pro Datensatz (unbekannte Keys werden ignoriert)"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction='ignore')
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+    # Nur Kopfzeile, falls keine Zeilen kamen
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def iter_chunks(lines: Iterable[str], chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> Iterator[bytes]:
+    """Fasst Textzeilen zu UTF-8-Chunks von ca. chunk_bytes zusammen"""
+    pending: List[bytes] = []
+    size = 0
+    for line in lines:
+        data = line.encode('utf-8')
+        pending.append(data)
+        size += len(data)
+        if size >= chunk_bytes:
+            yield b''.join(pending)
+            pending = []
+            size = 0
+    if pending:
+        yield b''.join(pending)
+
+
+def iter_gzip(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """gzip-Stream über Chunks (eine .gz-Datei, inkrementell komprimiert)"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits=31 → gzip-Header
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def build_export_stream(
+    rows: Iterable[Dict[str, Any]],
+    export_format: str,
+    fieldnames: Optional[List[str]] = None,
+    compress: bool = False,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES
+) -> Tuple[Iterator[bytes], str, str]:
+    """
+    Baut den Byte-Stream eines Exports
+
+    Args:
+        rows: Datensätze (werden erst beim Iterieren gelesen)
+        export_format: 'ndjson' oder 'csv'
+        fieldnames: Spalten für CSV
+        compress: gzip-komprimieren
+
+    Returns:
+        (Chunk-Iterator, Mimetype, Dateiendung)
+    """
+    if export_format not in STREAM_FORMATS:
+        raise ValueError(f"Unbekanntes Stream-Format: {export_format}")
+    if export_format == 'csv':
+        lines = iter_csv(rows, fieldnames or [])
+    else:
+        lines = iter_ndjson(rows)
+    chunks = iter_chunks(lines, chunk_bytes)
+    if compress:
+        return iter_gzip(chunks), 'application/gzip', f"{export_format}.gz"
+    return chunks, MIMETYPES[export_format], export_format
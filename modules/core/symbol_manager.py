@@ -8,7 +8,8 @@ from module_manager import BaseModule
 from typing import List, Dict, Any, Optional
 import json
 import os
-import xml.etree.ElementTree as ET
+
+from modules.plc.tpy_reader import read_tpy
 
 
 class SymbolManager(BaseModule):
@@ -127,27 +128,21 @@ class SymbolManager(BaseModule):
     def import_from_tpy(self, filepath: str) -> bool:
         """Importiert Symbole aus TPY-Datei"""
         try:
-            tree = ET.parse(filepath)
-            root = tree.getroot()
-            
-            symbols = []
-            
-            # Parse alle DataTypes
-            for datatype in root.findall('.//DataType'):
-                name = datatype.get('Name', '')
-                
-                # Parse SubItems
-                for subitem in datatype.findall('.//SubItem'):
-                    subname = subitem.get('Name', '')
-                    subtype = subitem.find('Type').text if subitem.find('Type') is not None else 'UNKNOWN'
-                    
-                    full_name = f"{name}.{subname}" if name else subname
-                    
-                    symbols.append({
-                        'name': full_name,
-                        'type': subtype,
-                        'parent': name
-                    })
+            # Gemeinsamer Streaming-Reader (expandierte Instanz-Symbole, Parse-Cache)
+            parsed = read_tpy(filepath)
+
+            symbols = [
+                {
+                    'name': sym.name,
+                    'type': sym.type,
+                    'parent': sym.name.rsplit('.', 1)[0] if '.' in sym.name else '',
+                    'comment': sym.comment,
+                    'index_group': sym.index_group,
+                    'index_offset': sym.index_offset,
+                    'size': sym.size
+                }
+                for sym in parsed.symbols
+            ]
             
             self.symbols = symbols
             self.symbol_dict = {s['name']: s for s in symbols}
@@ -27,8 +27,16 @@ import math
 import uuid
 import logging
 from collections import OrderedDict, defaultdict
+from itertools import islice
 from datetime import datetime, timezone
 from modules.core.circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitBreakerOpenError
+from modules.core.plc_write_pipeline import PLCWritePipeline, WriteTicket
+from modules.plc.plc_types import DEFAULT_PLC_TYPE, resolve_plc_type
+from modules.gateway.route_index import RouteIndex
+from modules.gateway.route_dispatch import create_route_dispatcher, target_class
+from modules.gateway.telemetry_store import TelemetryStore, parse_source_quotas
+from modules.gateway.poll_scheduler import PollScheduler, fastest_poll_class
+from modules.gateway.plc_poll_workers import PLCPollWorkers
 
 
 logger = logging.getLogger(__name__)
@@ -90,13 +98,8 @@ class DataGateway(BaseModule):
         # Runtime Limits (konfigurierbar via Env)
         self.blob_cache_limit = self._get_env_int('SMARTHOME_BLOB_CACHE_LIMIT_BYTES', self.BLOB_CACHE_LIMIT, min_value=1024 * 1024)
         self.telemetry_cache_limit = self._get_env_int('SMARTHOME_TELEMETRY_CACHE_SIZE', self.TELEMETRY_CACHE_SIZE, min_value=100)
-        default_prune = max(1, self.telemetry_cache_limit // 2)
-        self.telemetry_prune_batch = self._get_env_int(
-            'SMARTHOME_TELEMETRY_PRUNE_BATCH',
-            default_prune,
-            min_value=1,
-            max_value=self.telemetry_cache_limit
-        )
+        # Optionale Quoten pro Quelle, z.B. "mqtt:2000,bt:500"
+        self.telemetry_source_quotas = parse_source_quotas(os.getenv('SMARTHOME_TELEMETRY_SOURCE_QUOTAS', ''))
         self.max_subscribed_variables_per_poll = self._get_env_int(
             'SMARTHOME_MAX_SUBSCRIBED_VARIABLES_PER_POLL',
             2000,
@@ -131,18 +134,52 @@ class DataGateway(BaseModule):
             1,
             min_value=1
         )
-        self._poll_window_cursor = 0
+        # Adaptive Poll-Planung pro Variable (Budget: max_subscribed_variables_per_poll
+        # Reads pro Poll-Intervall)
+        self.poll_scheduler = PollScheduler(budget=self.max_subscribed_variables_per_poll)
+        self._poll_sync_version = None
+        # Reader-Thread pro PLC-Verbindung (Multi-PLC: Zykluszeit = langsamste PLC)
+        self.plc_poll_workers = PLCPollWorkers(
+            timeout=self._get_env_int('SMARTHOME_PLC_POLL_TIMEOUT_MS', 2000, min_value=50) / 1000.0
+        )
+        # Write-Pipeline pro PLC-Verbindung (Coalescing gleicher Symbole + Sum-Write)
+        self.plc_write_window_ms = self._get_env_int('SMARTHOME_PLC_WRITE_COALESCE_MS', 20, min_value=0, max_value=1000)
+        self.plc_write_timeout = self._get_env_int('SMARTHOME_PLC_WRITE_TIMEOUT_MS', 5000, min_value=100) / 1000.0
+        self._write_pipelines: Dict[str, PLCWritePipeline] = {}
+        self._write_pipeline_lock = threading.Lock()
+
+        # Opt-in: ADS Device-Notifications (Push) statt Polling
+        self.plc_notifications_enabled = str(os.getenv('SMARTHOME_PLC_NOTIFICATIONS', 'false')).lower() in (
+            '1', 'true', 'yes', 'on'
+        )
 
         # Caches
         self.blob_cache = OrderedDict()  # key -> (data, timestamp, size)
         self.blob_cache_size = 0
-        self.telemetry_cache = {}  # key -> value
+        # Telemetrie: LRU nach letzter Aktualisierung, pro Key die Sequenz der
+        # letzten Änderung (Delta-Snapshots), Epoch je Prozessstart
+        self.telemetry_cache = TelemetryStore(self.telemetry_cache_limit, self.telemetry_source_quotas)
+        self.telemetry_epoch = uuid.uuid4().hex[:12]
 
         # ⭐ v4.6.0: Routing-Engine
         self.routing_engine = None
         self.routes = []
+        self.route_index = RouteIndex(
+            [], cache_size=self._get_env_int('SMARTHOME_ROUTE_MATCH_CACHE', 4096, min_value=0)
+        )
+        # Routenliste und Index werden nur gemeinsam getauscht (Reload zur Laufzeit)
+        self._routes_lock = threading.Lock()
         self.subscribers = defaultdict(list)  # pattern -> [callbacks]
+        # Fan-out (Routen + Subscriber) außerhalb des Locks, Lanes pro Zielart
+        # (Worker starten erst in initialize())
+        self.route_dispatcher = create_route_dispatcher(
+            workers=self._get_env_int('SMARTHOME_ROUTING_WORKERS', 0, min_value=0, max_value=64),
+            queue_size=self._get_env_int('SMARTHOME_ROUTING_QUEUE_SIZE', 1000, min_value=1),
+            on_overflow=self._on_dispatch_overflow
+        )
         self.dead_letter_queue = OrderedDict()  # dlq_id -> entry
+        # Eigener Lock: Lane-Worker reihen ein, während API-Aufrufe lesen/abarbeiten
+        self._dead_letter_lock = threading.Lock()
 
         # ⭐ v4.6.0: Spam-Protection
         self.source_stats = defaultdict(lambda: {
@@ -154,6 +191,7 @@ class DataGateway(BaseModule):
 
         # Module-Referenzen (werden in initialize() gesetzt)
         self.plc = None
+        self.connection_manager = None
         self.mqtt = None
         self.modbus = None
         self.web_manager = None
@@ -164,8 +202,9 @@ class DataGateway(BaseModule):
             'blob_misses': 0,
             'blob_evictions': 0,
             'telemetry_updates': 0,
-            'telemetry_evictions': 0,
             'polling_backpressure_skips': 0,
+            'plc_notifications': 0,
+            'plc_notification_fallbacks': 0,
             'routes_processed': 0,
             'routes_blocked': 0,
             'spam_events': 0,
@@ -173,13 +212,15 @@ class DataGateway(BaseModule):
             'dlq_enqueued': 0,
             'dlq_reprocessed': 0,
             'dlq_reprocess_failed': 0,
-            'dlq_dropped': 0
+            'dlq_dropped': 0,
+            'dispatch_overflow_dlq': 0
         }
 
         # Missing-symbol protection: track missing symbol warnings to avoid log spam
         # key -> {'count': int, 'last_log': float, 'suspended_until': float}
         self.missing_symbol_stats = {}
         self._circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self._circuit_breaker_lock = threading.Lock()
 
     def set_correlation_id(self, correlation_id: str):
         self._request_context.correlation_id = str(correlation_id or '').strip()
@@ -246,12 +287,15 @@ class DataGateway(BaseModule):
         self.mqtt = mm.get_module('mqtt_integration')
         self.modbus = mm.get_module('modbus_integration')
 
+        # Dispatch-Worker (SMARTHOME_ROUTING_WORKERS > 0)
+        self.route_dispatcher.start()
+
         print(f"  ⚡ {self.NAME} v{self.VERSION} initialisiert")
         print(f"     🖥️  Platform: {self.platform}")
         print(f"     🐳 Docker: {self.is_docker}")
         print(f"     🎮 GPU: {self.capabilities.get('gpu_available', False)}")
         print(f"     💾 Blob-Cache: {self.blob_cache_limit // (1024*1024)} MB")
-        print(f"     📊 Telemetrie-Cache-Limit: {self.telemetry_cache_limit} (Prune-Batch: {self.telemetry_prune_batch})")
+        print(f"     📊 Telemetrie-Cache-Limit: {self.telemetry_cache_limit} (Quoten: {self.telemetry_source_quotas or '-'})")
         print(f"     🔁 Poll-Variablen-Limit/Zyklus: {self.max_subscribed_variables_per_poll}")
 
         # ⭐ v4.6.0: Lade Routing-Konfiguration
@@ -272,15 +316,15 @@ class DataGateway(BaseModule):
             with open(routing_file, 'r', encoding='utf-8') as f:
                 routing_config = json.load(f)
 
-            self.routes = routing_config.get('routes', [])
-            print(f"  ✅ Routing-Engine geladen: {len(self.routes)} Routen")
+            routes = routing_config.get('routes', [])
+            print(f"  ✅ Routing-Engine geladen: {len(routes)} Routen")
 
-            # Validiere Routen
-            self._validate_routes()
+            # Validiere Routen (erst danach sichtbar für route_data)
+            self._validate_routes(routes)
 
         except Exception as e:
             print(f"  ⚠️  Fehler beim Laden der routing.json: {e}")
-            self.routes = []
+            self._validate_routes([])
 
     def _create_default_routing_config(self, filepath: str):
         """Erstellt Standard routing.json Template"""
@@ -309,10 +353,21 @@ class DataGateway(BaseModule):
 
         print(f"  ✅ Standard routing.json erstellt: {filepath}")
 
-    def _validate_routes(self):
-        """Validiert Routing-Regeln"""
+    def _validate_routes(self, routes: Optional[List[Dict]] = None):
+        """
+        Validiert Routing-Regeln und aktiviert sie
+
+        Validiert wird in eine lokale Liste; Routenliste und kompilierter
+        Index werden danach gemeinsam unter _routes_lock getauscht, damit
+        route_data() nie unvalidierte Routen sieht.
+
+        Args:
+            routes: Neue Routen (None = aktuelle self.routes neu validieren)
+        """
+        if routes is None:
+            routes = self.routes
         valid_routes = []
-        for route in self.routes:
+        for route in routes:
             if not isinstance(route, dict):
                 print(f"  ⚠️  Ungültige Route (kein Dict): {route}")
                 continue
@@ -323,11 +378,14 @@ class DataGateway(BaseModule):
 
             valid_routes.append(route)
 
-        removed = len(self.routes) - len(valid_routes)
+        removed = len(routes) - len(valid_routes)
         if removed > 0:
             print(f"  ⚠️  {removed} ungültige Routen entfernt")
 
-        self.routes = valid_routes
+        with self._routes_lock:
+            # Routen in Match-Index kompilieren (verwirft auch den Ergebnis-Cache)
+            self.route_index.build(valid_routes)
+            self.routes = valid_routes
 
     def _detect_docker(self) -> bool:
         """Erkennt ob wir in Docker laufen"""
@@ -361,20 +419,24 @@ class DataGateway(BaseModule):
         breaker = self._circuit_breakers.get(name)
         if breaker:
             return breaker
-        cfg = CircuitBreakerConfig(
-            failure_threshold=self.cb_failure_threshold,
-            recovery_timeout_seconds=self.cb_recovery_seconds,
-            half_open_max_calls=self.cb_half_open_max_calls
-        )
-        breaker = CircuitBreaker(name=name, config=cfg)
-        self._circuit_breakers[name] = breaker
-        return breaker
+        # Routen laufen parallel auf Dispatch-Lanes → Check-then-Insert unter Lock
+        with self._circuit_breaker_lock:
+            breaker = self._circuit_breakers.get(name)
+            if breaker:
+                return breaker
+            cfg = CircuitBreakerConfig(
+                failure_threshold=self.cb_failure_threshold,
+                recovery_timeout_seconds=self.cb_recovery_seconds,
+                half_open_max_calls=self.cb_half_open_max_calls
+            )
+            breaker = CircuitBreaker(name=name, config=cfg)
+            self._circuit_breakers[name] = breaker
+            return breaker
 
     def get_circuit_breaker_stats(self) -> Dict[str, Any]:
-        return {
-            key: breaker.snapshot()
-            for key, breaker in self._circuit_breakers.items()
-        }
+        with self._circuit_breaker_lock:
+            breakers = list(self._circuit_breakers.items())
+        return {key: breaker.snapshot() for key, breaker in breakers}
 
     def _detect_capabilities(self) -> Dict[str, Any]:
         """Erkennt System-Capabilities"""
@@ -500,30 +562,43 @@ class DataGateway(BaseModule):
             print(f"  🚫 INVALID INPUT: {reason}")
             return False
 
+        # Lock nur für Spam-Check; Cache-Mutation lockt in update_telemetry()
         with self.lock:
             # 1. Spam-Protection Check
             if not self._check_spam_protection(source_id):
                 self.stats['routes_blocked'] += 1
                 return False
 
-            # 2. Normalisierung in Unified Data Space
-            datapoint = self._normalize_datapoint(source_id, tag, value, metadata)
-
-            # 3. Aktualisiere Telemetrie-Cache
-            unified_key = f"{source_id}.{tag}"
-            self.update_telemetry(unified_key, value, correlation_id=datapoint.get('correlation_id'))
+        # 2. Normalisierung in Unified Data Space
+        datapoint = self._normalize_datapoint(source_id, tag, value, metadata)
 
-            # 4. Route-Matching und Weiterleitung
-            matched_routes = self._match_routes(datapoint)
+        # 3. Aktualisiere Telemetrie-Cache
+        unified_key = f"{source_id}.{tag}"
+        self.update_telemetry(unified_key, value, correlation_id=datapoint.get('correlation_id'))
 
-            for route in matched_routes:
-                self._execute_route(route, datapoint)
+        # 4. Route-Matching
+        matched_routes = self._match_routes(datapoint)
 
-            # 5. Notify Subscribers
-            self._notify_subscribers(datapoint)
+        # 5. Weiterleitung + Subscriber ohne Lock (Lanes pro Zielart, Reihenfolge pro Quelle bleibt)
+        for route in matched_routes:
+            self._execute_route(route, datapoint)
+        self.route_dispatcher.submit(
+            'subscribers', source_id, self._deliver_to_subscribers, datapoint,
+            coalesce_key=f"subscribers|{unified_key}"
+        )
 
+        with self.lock:
             self.stats['routes_processed'] += 1
-            return True
+        return True
+
+    def _deliver_to_subscribers(self, datapoint: Dict):
+        """Benachrichtigt Subscriber mit der Correlation-ID des Datenpunkts (ohne Gateway-Lock)"""
+        previous_cid = getattr(self._request_context, 'correlation_id', '')
+        self.set_correlation_id(datapoint.get('correlation_id'))
+        try:
+            self._notify_subscribers(datapoint)
+        finally:
+            self.set_correlation_id(previous_cid)
 
     def _validate_ingress_datapoint(self, source_id: Any, tag: Any, value: Any, metadata: Any):
         """
@@ -544,7 +619,7 @@ class DataGateway(BaseModule):
         # Defensiv: nur bekannte Zeichen für IDs/Tags.
         if not re.fullmatch(r"[A-Za-z0-9_.:/-]+", source_id):
             return False, "source_id enthält ungültige Zeichen", source_id, tag, value, metadata
-        if not re.fullmatch(r"[A-Za-z0-9_.:/\\-\\[\\]]+", tag):
+        if not re.fullmatch(r"[A-Za-z0-9_.:/\-\[\]]+", tag):
             return False, "tag enthält ungültige Zeichen", source_id, tag, value, metadata
 
         value_ok, value = self._sanitize_ingress_value(value, depth=0)
@@ -717,43 +792,21 @@ class DataGateway(BaseModule):
         """
         Matched Datenpunkt gegen alle Routing-Regeln
 
+        Nutzt den kompilierten RouteIndex (exact/prefix/wildcard + LRU)
+        statt alle Routen pro Datenpunkt zu durchlaufen.
+
         Returns:
-            Liste der matchenden Routen
+            Liste der matchenden Routen (Reihenfolge wie in routing.json)
         """
-        matched = []
-        source_id = datapoint['source_id']
-        tag = datapoint['tag']
-        full_path = f"{source_id}.{tag}"
-
-        for route in self.routes:
-            # Skip disabled routes
-            if not route.get('enabled', True):
-                continue
-
-            # Pattern matching
-            pattern = route.get('from', '')
-
-            # Wildcard: * matched alles
-            if pattern == '*':
-                matched.append(route)
-                continue
-
-            # Exact match
-            if pattern == full_path or pattern == tag or pattern == source_id:
-                matched.append(route)
-                continue
-
-            # Prefix match (z.B. "plc_001.*")
-            if pattern.endswith('*') and full_path.startswith(pattern[:-1]):
-                matched.append(route)
-                continue
-
-        return matched
+        return list(self.route_index.match(datapoint['source_id'], datapoint['tag']))
 
     def _execute_route(self, route: Dict, datapoint: Dict):
         """
         Führt eine Route aus - sendet Daten an Ziel(e)
 
+        Jedes Ziel läuft auf der Lane seiner Zielart (plc/mqtt/log/widgets);
+        ohne Dispatch-Worker inline im Aufrufer-Thread.
+
         Args:
             route: Routing-Regel
             datapoint: Normalisierter Datenpunkt
@@ -763,17 +816,59 @@ class DataGateway(BaseModule):
             targets = [targets]
 
         for target in targets:
-            try:
-                self._send_to_target(target, datapoint, route)
-            except Exception as e:
-                self._enqueue_dead_letter(
-                    datapoint=datapoint,
-                    route=route,
-                    target=target,
-                    error_class=self._classify_routing_error(e),
-                    error_message=str(e)
-                )
-                print(f"  ⚠️  Routing-Fehler in Route '{route.get('id', 'unknown')}' target='{target}': {e}")
+            if target == "unified_data_space":
+                # Bereits im Telemetrie-Cache durch route_data()
+                continue
+            self.route_dispatcher.submit(
+                target_class(target),
+                datapoint['source_id'],
+                self._deliver_to_target,
+                route,
+                target,
+                datapoint,
+                coalesce_key=f"{route.get('id', '')}|{target}|{datapoint['source_id']}.{datapoint['tag']}"
+            )
+
+    def _on_dispatch_overflow(self, target_kind: str, fn: Callable, args: tuple):
+        """Verworfene Dispatch-Aufträge (drop_*/coalesce-Policy) → Dead-Letter-Queue"""
+        if fn != self._deliver_to_target:
+            # Subscriber-Aufträge haben kein Ziel für einen Retry - nur gezählt
+            return
+        route, target, datapoint = args
+        with self.lock:
+            self.stats['dispatch_overflow_dlq'] += 1
+        self._enqueue_dead_letter(
+            datapoint=datapoint,
+            route=route,
+            target=target,
+            error_class='queue_overflow',
+            error_message=f"Dispatch-Queue '{target_kind}' voll ({self.route_dispatcher.policies.get(target_kind)})"
+        )
+
+    def get_dispatch_stats(self) -> Dict[str, Any]:
+        """Queue-Tiefe, Latenz, Drops/Coalescing pro Zielart"""
+        return {
+            **self.route_dispatcher.get_stats(),
+            'overflow_dlq_total': self.stats['dispatch_overflow_dlq']
+        }
+
+    def _deliver_to_target(self, route: Dict, target: str, datapoint: Dict):
+        """Sendet an ein Ziel, Fehler landen in der Dead-Letter-Queue"""
+        previous_cid = getattr(self._request_context, 'correlation_id', '')
+        self.set_correlation_id(datapoint.get('correlation_id'))
+        try:
+            self._send_to_target(target, datapoint, route)
+        except Exception as e:
+            self._enqueue_dead_letter(
+                datapoint=datapoint,
+                route=route,
+                target=target,
+                error_class=self._classify_routing_error(e),
+                error_message=str(e)
+            )
+            print(f"  ⚠️  Routing-Fehler in Route '{route.get('id', 'unknown')}' target='{target}': {e}")
+        finally:
+            self.set_correlation_id(previous_cid)
 
     def _send_to_target(self, target: str, datapoint: Dict, route: Dict):
         """
@@ -795,10 +890,14 @@ class DataGateway(BaseModule):
         elif target.startswith("plc"):
             plc_id = target.split('.', 1)[0]
             breaker = self._get_circuit_breaker(f"plc:{plc_id}:route")
+            # Erfolg/Fehler des eingereihten Writes meldet _on_plc_writes() an den Breaker
+            if not breaker.allow_request():
+                raise RuntimeError(str(CircuitBreakerOpenError(f"circuit_open:{breaker.name}")))
             try:
-                breaker.call(lambda: self._route_to_plc(target, datapoint, route))
-            except CircuitBreakerOpenError as cb_open:
-                raise RuntimeError(str(cb_open))
+                self._route_to_plc(target, datapoint, route)
+            except Exception as e:
+                breaker.record_failure(error_message=str(e))
+                raise
 
         # MQTT Target
         elif target.startswith("mqtt"):
@@ -832,6 +931,7 @@ class DataGateway(BaseModule):
         return 'routing_error'
 
     def _prune_dead_letter_queue(self):
+        """Kürzt die DLQ auf dead_letter_max_entries (Aufrufer hält _dead_letter_lock)"""
         while len(self.dead_letter_queue) > self.dead_letter_max_entries:
             self.dead_letter_queue.popitem(last=False)
             self.stats['dlq_dropped'] += 1
@@ -866,9 +966,10 @@ class DataGateway(BaseModule):
             'datapoint': safe_datapoint,
             'route': safe_route
         }
-        self.dead_letter_queue[dlq_id] = entry
-        self.stats['dlq_enqueued'] += 1
-        self._prune_dead_letter_queue()
+        with self._dead_letter_lock:
+            self.dead_letter_queue[dlq_id] = entry
+            self.stats['dlq_enqueued'] += 1
+            self._prune_dead_letter_queue()
 
         if self.web_manager:
             try:
@@ -894,19 +995,27 @@ class DataGateway(BaseModule):
         plc_id = parts[0]
         symbol = parts[1]
 
-        # TODO: Multi-PLC Support (Phase 2)
-        # Aktuell: Nutze self.plc (einzelne PLC)
-        if not (self.plc and self.plc.connected):
+        plc = self._get_plc_handle(plc_id)
+        if not (plc and self._plc_connected(plc)):
             raise ConnectionError(f"PLC nicht verbunden: {plc_id}")
 
+        # Nicht auf die Quittung warten: Ingest-Threads (MQTT, Bluetooth) laufen
+        # bei workers=0 hier inline; Fehler reiht _on_plc_writes() in die DLQ ein
+        route_context = {
+            'correlation_id': self.get_correlation_id(),
+            'route': route,
+            'target': target,
+            'datapoint': datapoint
+        }
         try:
-            value = datapoint['value']
-            ok = self.plc.write_by_name(symbol, value)
-            if ok is False:
-                raise RuntimeError(f"PLC-Write fehlgeschlagen: {symbol}")
-            return True
+            ticket = self._write_to_plc(plc_id, plc, symbol, datapoint['value'], wait=False,
+                                        context=route_context)
         except Exception as e:
             raise RuntimeError(f"PLC-Write Fehler ({symbol}): {e}") from e
+        if ticket.done() and not ticket.ok:
+            # Sofort abgelehnt (z.B. Pipeline gestoppt) → Routing-Fehler/DLQ
+            raise RuntimeError(f"PLC-Write fehlgeschlagen: {symbol} ({ticket.error or 'write_failed'})")
+        return True
 
     def _route_to_mqtt(self, target: str, datapoint: Dict, route: Dict):
         """Routet Daten zu MQTT"""
@@ -959,25 +1068,21 @@ class DataGateway(BaseModule):
         """Benachrichtigt registrierte Subscriber"""
         full_path = f"{datapoint['source_id']}.{datapoint['tag']}"
 
-        # FIX: Thread-safe subscriber iteration
+        # Thread-safe: Callbacks unter Lock einsammeln, außerhalb aufrufen
         with self.lock:
             # Exact match subscribers
-            for callback in list(self.subscribers.get(full_path, [])):
-                try:
-                    callback(datapoint)
-                except Exception as e:
-                    print(f"  ⚠️  Subscriber-Fehler: {e}")
-
-            # Wildcard subscribers
-            for pattern, callbacks in list(self.subscribers.items()):
-                if '*' in pattern:
-                    # Simple wildcard matching
-                    if pattern.endswith('*') and full_path.startswith(pattern[:-1]):
-                        for callback in list(callbacks):
-                            try:
-                                callback(datapoint)
-                            except Exception as e:
-                                print(f"  ⚠️  Subscriber-Fehler: {e}")
+            callbacks = list(self.subscribers.get(full_path, []))
+
+            # Wildcard subscribers (Simple wildcard matching)
+            for pattern, pattern_callbacks in self.subscribers.items():
+                if '*' in pattern and pattern.endswith('*') and full_path.startswith(pattern[:-1]):
+                    callbacks.extend(pattern_callbacks)
+
+        for callback in callbacks:
+            try:
+                callback(datapoint)
+            except Exception as e:
+                print(f"  ⚠️  Subscriber-Fehler: {e}")
 
     def subscribe(self, pattern: str, callback: Callable):
         """
@@ -993,15 +1098,17 @@ class DataGateway(BaseModule):
 
             gateway.subscribe("plc_001.MAIN.bAlarm", on_alarm)
         """
-        self.subscribers[pattern].append(callback)
+        with self.lock:
+            self.subscribers[pattern].append(callback)
 
     def unsubscribe(self, pattern: str, callback: Callable):
         """Entfernt Callback für Pattern"""
-        if pattern in self.subscribers:
-            try:
-                self.subscribers[pattern].remove(callback)
-            except ValueError:
-                pass
+        with self.lock:
+            if pattern in self.subscribers:
+                try:
+                    self.subscribers[pattern].remove(callback)
+                except ValueError:
+                    pass
 
     def reset_spam_protection(self, source_id: str):
         """
@@ -1028,14 +1135,18 @@ class DataGateway(BaseModule):
 
     def get_routing_stats(self) -> Dict:
         """Liefert Routing-Statistiken für Admin-UI"""
+        with self._dead_letter_lock:
+            dead_letter_queued = len(self.dead_letter_queue)
         return {
             'routes_loaded': len(self.routes),
+            'route_index': self.route_index.get_stats(),
             'routes_processed': self.stats['routes_processed'],
             'routes_blocked': self.stats['routes_blocked'],
             'spam_events': self.stats['spam_events'],
             'circuit_breakers': self.get_circuit_breaker_stats(),
+            'dispatch': self.get_dispatch_stats(),
             'dead_letter': {
-                'queued': len(self.dead_letter_queue),
+                'queued': dead_letter_queued,
                 'enqueued_total': self.stats['dlq_enqueued'],
                 'reprocessed_total': self.stats['dlq_reprocessed'],
                 'reprocess_failed_total': self.stats['dlq_reprocess_failed'],
@@ -1054,8 +1165,10 @@ class DataGateway(BaseModule):
         }
 
     def get_dead_letter_stats(self) -> Dict[str, Any]:
+        with self._dead_letter_lock:
+            queued = len(self.dead_letter_queue)
         return {
-            'queued': len(self.dead_letter_queue),
+            'queued': queued,
             'enqueued_total': self.stats['dlq_enqueued'],
             'reprocessed_total': self.stats['dlq_reprocessed'],
             'reprocess_failed_total': self.stats['dlq_reprocess_failed'],
@@ -1069,12 +1182,14 @@ class DataGateway(BaseModule):
 
     def get_dead_letters(self, limit: int = 100) -> List[Dict[str, Any]]:
         limit = max(1, min(int(limit), self.dead_letter_max_entries))
-        items = list(self.dead_letter_queue.values())
+        with self._dead_letter_lock:
+            items = list(self.dead_letter_queue.values())
         return items[-limit:]
 
     def clear_dead_letters(self) -> int:
-        removed = len(self.dead_letter_queue)
-        self.dead_letter_queue.clear()
+        with self._dead_letter_lock:
+            removed = len(self.dead_letter_queue)
+            self.dead_letter_queue.clear()
         return removed
 
     def reprocess_dead_letters(self, limit: int = None) -> Dict[str, int]:
@@ -1087,11 +1202,11 @@ class DataGateway(BaseModule):
         requeued = 0
         dropped = 0
 
-        keys = list(self.dead_letter_queue.keys())[:limit]
-        for key in keys:
-            entry = self.dead_letter_queue.pop(key, None)
-            if not entry:
-                continue
+        with self._dead_letter_lock:
+            entries = [self.dead_letter_queue.pop(key) for key in list(self.dead_letter_queue.keys())[:limit]]
+
+        # Zustellung außerhalb des Locks (Ziele können selbst wieder einreihen)
+        for entry in entries:
             processed += 1
 
             route = entry.get('route') or {}
@@ -1101,13 +1216,15 @@ class DataGateway(BaseModule):
 
             try:
                 self._send_to_target(target, datapoint, route)
-                self.stats['dlq_reprocessed'] += 1
+                with self._dead_letter_lock:
+                    self.stats['dlq_reprocessed'] += 1
                 reprocessed_ok += 1
             except Exception as e:
-                self.stats['dlq_reprocess_failed'] += 1
                 attempts += 1
                 if attempts > self.dead_letter_max_attempts:
-                    self.stats['dlq_dropped'] += 1
+                    with self._dead_letter_lock:
+                        self.stats['dlq_reprocess_failed'] += 1
+                        self.stats['dlq_dropped'] += 1
                     dropped += 1
                     continue
 
@@ -1117,10 +1234,13 @@ class DataGateway(BaseModule):
                 entry['last_failed_at_utc'] = self._utc_iso(now)
                 entry['error_class'] = self._classify_routing_error(e)
                 entry['error_message'] = str(e)
-                self.dead_letter_queue[entry['id']] = entry
+                with self._dead_letter_lock:
+                    self.stats['dlq_reprocess_failed'] += 1
+                    self.dead_letter_queue[entry['id']] = entry
                 requeued += 1
 
-        self._prune_dead_letter_queue()
+        with self._dead_letter_lock:
+            self._prune_dead_letter_queue()
         return {
             'processed': processed,
             'reprocessed_ok': reprocessed_ok,
@@ -1219,26 +1339,21 @@ class DataGateway(BaseModule):
             value: Wert (int, float, bool, str)
         """
         with self.lock:
-            # Speichere
-            self.telemetry_cache[key] = value
+            # Speichern + LRU-Eviction (O(1), ältester Aktualisierungsstand zuerst)
+            seq = self.telemetry_cache.set(key, value)
             self.stats['telemetry_updates'] += 1
 
-            # LRU: Begrenze Cache-Größe
-            if len(self.telemetry_cache) > self.telemetry_cache_limit:
-                keys_to_remove = list(self.telemetry_cache.keys())[:self.telemetry_prune_batch]
-                for k in keys_to_remove:
-                    del self.telemetry_cache[k]
-                self.stats['telemetry_evictions'] += len(keys_to_remove)
-
-            # Broadcast Update
-            self._broadcast_telemetry_update(key, value, correlation_id=correlation_id or self.get_correlation_id())
+        # Broadcast Update (außerhalb des Locks - Socket-I/O blockiert sonst Poll-Thread und Ingest)
+        self._broadcast_telemetry_update(
+            key, value, correlation_id=correlation_id or self.get_correlation_id(), seq=seq
+        )
 
-            # Optionaler Hook (z. B. Kamera-Trigger-Regeln im WebManager)
-            if self.web_manager and hasattr(self.web_manager, 'handle_telemetry_update'):
-                try:
-                    self.web_manager.handle_telemetry_update(key, value)
-                except Exception:
-                    pass
+        # Optionaler Hook (z. B. Kamera-Trigger-Regeln im WebManager)
+        if self.web_manager and hasattr(self.web_manager, 'handle_telemetry_update'):
+            try:
+                self.web_manager.handle_telemetry_update(key, value)
+            except Exception:
+                pass
 
     def get_telemetry(self, key: str) -> Optional[Any]:
         """
@@ -1256,7 +1371,67 @@ class DataGateway(BaseModule):
     def get_all_telemetry(self) -> Dict[str, Any]:
         """Gibt alle Telemetrie-Werte zurück"""
         with self.lock:
-            return dict(self.telemetry_cache)
+            return self.telemetry_cache.snapshot()
+
+    @property
+    def telemetry_seq(self) -> int:
+        """Aktuelle (höchste) Telemetrie-Sequenz"""
+        return self.telemetry_cache.seq
+
+    def get_telemetry_store_stats(self) -> Dict[str, Any]:
+        """Cache-Füllstand und Evictions pro Quelle"""
+        with self.lock:
+            return self.telemetry_cache.get_stats()
+
+    def get_telemetry_page(self, after_seq: int = 0, limit: int = 500, epoch: str = None) -> Dict[str, Any]:
+        """
+        Liefert Telemetrie-Keys, die sich nach after_seq geändert haben (aufsteigend)
+
+        Reconnect: Client schickt Epoch + zuletzt gesehene Sequenz und bekommt nur
+        die Änderungen seitdem. Passt die Epoch nicht (Neustart) oder ist die
+        Sequenz unbekannt, startet ein voller Snapshot ab 0 (mode='full').
+        Seiten werden über next_cursor weitergeblättert; Keys, die sich während
+        des Blätterns ändern, rutschen ans Ende und kommen in einer späteren Seite.
+
+        Args:
+            after_seq: Letzte bekannte Sequenz des Clients (0 = Kaltstart)
+            limit: Max. Keys pro Seite
+            epoch: Epoch, zu der after_seq gehört
+
+        Returns:
+            Dict mit epoch, mode, cursor, next_cursor, seq, count, total, has_more, updates
+        """
+        limit = max(1, int(limit))
+        try:
+            after_seq = int(after_seq or 0)
+        except (TypeError, ValueError):
+            after_seq = 0
+
+        with self.lock:
+            head = self.telemetry_cache.seq
+            mode = 'delta'
+            if after_seq <= 0 or epoch != self.telemetry_epoch or after_seq > head:
+                after_seq = 0
+                mode = 'full'
+
+            # Ab der Cursor-Position im Änderungslog, max. limit + 1 Einträge
+            page = list(islice(self.telemetry_cache.iter_changes_since(after_seq), limit + 1))
+            has_more = len(page) > limit
+            del page[limit:]
+            updates = {key: value for key, _, value in page}
+            next_cursor = page[-1][1] if has_more else head
+
+            return {
+                'epoch': self.telemetry_epoch,
+                'mode': mode,
+                'cursor': after_seq,
+                'next_cursor': next_cursor,
+                'seq': head,
+                'count': len(page),
+                'total': self.telemetry_cache.count_changes_since(after_seq),
+                'has_more': has_more,
+                'updates': updates
+            }
 
     # ========================================================================
     # WIDGET SUBSCRIPTION SYNC (behebt UNKNOWN-Variablen)
@@ -1312,16 +1487,7 @@ class DataGateway(BaseModule):
                     if variable:
                         # Konvertiere PLC-Typ zu pyads Konstante
                         try:
-                            import pyads
-                            plc_type_map = {
-                                'BOOL': pyads.PLCTYPE_BOOL,
-                                'INT': pyads.PLCTYPE_INT,
-                                'DINT': pyads.PLCTYPE_DINT,
-                                'REAL': pyads.PLCTYPE_REAL,
-                                'LREAL': pyads.PLCTYPE_LREAL,
-                                'STRING': pyads.PLCTYPE_STRING
-                            }
-                            plc_type = plc_type_map.get(plc_type_str, pyads.PLCTYPE_BOOL)
+                            plc_type = resolve_plc_type(plc_type_str) or resolve_plc_type('BOOL')
 
                             # Vorab-Lesen um Variable zu "subsciben"
                             # (PLC-Cache wird hierdurch initialisiert)
@@ -1341,6 +1507,19 @@ class DataGateway(BaseModule):
     # PLC INTEGRATION
     # ========================================================================
 
+    def _mirror_plc_telemetry(self, symbol: str, value: Any):
+        """
+        Spiegelt einen PLC-Wert als Telemetrie-Key 'PLC.<symbol>'
+
+        Der Spiegel bleibt bewusst neben dem PLCValueStore bestehen: Nur der
+        Telemetrie-Pfad vergibt Sequenzen für telemetry_batch-Frames und
+        Delta-Snapshots beim Reconnect, ruft handle_telemetry_update() (Trigger-
+        Regeln) auf und liefert get_telemetry('PLC.…') für Regel-Engine und
+        Plugins. Er hält nur den letzten Wert pro Symbol und unterliegt der
+        LRU-Grenze des Telemetrie-Caches.
+        """
+        self.update_telemetry(f"PLC.{symbol}", value)
+
     def read_plc(self, symbol: str) -> Optional[Any]:
         """
         Liest PLC-Variable (mit Caching)
@@ -1355,35 +1534,15 @@ class DataGateway(BaseModule):
             return None
 
         try:
-            # Try to resolve plc_type from registered symbol info
-            plc_type = None
+            # plc_type aus registrierter Symbol-Info (vorab aufgelöst)
             try:
-                symbol_info = self.variable_manager.get_symbol_info(symbol)
-                if symbol_info and isinstance(symbol_info.symbol_type, str):
-                    import pyads
-                    type_map = {
-                        'BOOL': pyads.PLCTYPE_BOOL,
-                        'INT': pyads.PLCTYPE_INT,
-                        'DINT': pyads.PLCTYPE_DINT,
-                        'REAL': pyads.PLCTYPE_REAL,
-                        'LREAL': pyads.PLCTYPE_LREAL,
-                        'STRING': pyads.PLCTYPE_STRING,
-                        'BYTE': pyads.PLCTYPE_BYTE
-                    }
-                    plc_type = type_map.get(symbol_info.symbol_type.upper(), None)
+                symbol_info = self.variable_manager.get_symbol_info(symbol, self._default_plc_id())
             except Exception:
-                plc_type = None
-
-            # PLCCommunication.read_by_name requires plc_type positional arg
-            if plc_type is None:
-                import pyads
-                plc_type = pyads.PLCTYPE_BYTE
+                symbol_info = None
+            plc_type = self._resolve_plc_type(symbol_info)
 
             value = self.plc.read_by_name(symbol, plc_type)
-
-            # Cache Update
-            cache_key = f"PLC.{symbol}"
-            self.update_telemetry(cache_key, value)
+            self._mirror_plc_telemetry(symbol, value)
 
             return value
         except Exception as e:
@@ -1405,6 +1564,7 @@ class DataGateway(BaseModule):
         if not self.plc:
             return False
 
+        plc_id = self._default_plc_id()
         try:
             # Auto-Detect PLC-Typ falls nicht angegeben
             if plc_type is None:
@@ -1420,12 +1580,12 @@ class DataGateway(BaseModule):
                 else:
                     plc_type = pyads.PLCTYPE_BOOL  # Fallback
 
-            self.plc.write_by_name(symbol, value, plc_type)
-
-            # Cache Update
-            cache_key = f"PLC.{symbol}"
-            self.update_telemetry(cache_key, value)
-
+            # Über die Write-Pipeline der Standard-PLC (Reihenfolge/Coalescing mit
+            # Routen und Widgets); Cache-Update in _on_plc_writes()
+            ticket = self._write_to_plc(plc_id, self.plc, symbol, value, plc_type)
+            if not ticket.ok:
+                print(f"  ✗ PLC write error ({symbol}): {ticket.error or 'timeout'}")
+                return False
             return True
         except Exception as e:
             print(f"  ✗ PLC write error ({symbol}): {e}")
@@ -1435,10 +1595,12 @@ class DataGateway(BaseModule):
     # WEBSOCKET BROADCASTING
     # ========================================================================
 
-    def _broadcast_telemetry_update(self, key: str, value: Any, correlation_id: str = None):
+    def _broadcast_telemetry_update(self, key: str, value: Any, correlation_id: str = None, seq: int = None):
         """Sendet Telemetrie-Update an alle WebSocket-Clients"""
         if self.web_manager:
-            self.web_manager.broadcast_telemetry(key, value, correlation_id=correlation_id or self.get_correlation_id())
+            self.web_manager.broadcast_telemetry(
+                key, value, correlation_id=correlation_id or self.get_correlation_id(), seq=seq
+            )
 
     def _broadcast_blob_update(self, key: str):
         """Sendet Blob-Update-Notification an alle WebSocket-Clients"""
@@ -1476,13 +1638,17 @@ class DataGateway(BaseModule):
             'limits': {
                 'blob_cache_limit_bytes': self.blob_cache_limit,
                 'telemetry_cache_limit_entries': self.telemetry_cache_limit,
-                'telemetry_prune_batch': self.telemetry_prune_batch,
                 'max_subscribed_variables_per_poll': self.max_subscribed_variables_per_poll
             },
             'blob_stats': self.get_blob_stats(),
             'telemetry_count': len(self.telemetry_cache),
-            'telemetry_evictions': self.stats['telemetry_evictions'],
+            'telemetry_evictions': self.telemetry_cache.evictions,
+            'telemetry_store': self.get_telemetry_store_stats(),
             'polling_backpressure_skips': self.stats['polling_backpressure_skips'],
+            'poll_scheduler': self.get_poll_scheduler_stats(),
+            'plc_pollers': self.get_plc_poller_stats(),
+            'plc_write_pipelines': self.get_write_pipeline_stats(),
+            'plc_notifications': self.get_notification_stats(),
             'circuit_breakers': self.get_circuit_breaker_stats(),
             'dead_letter': self.get_dead_letter_stats(),
             'timestamp_utc': self._utc_iso(),
@@ -1505,9 +1671,18 @@ class DataGateway(BaseModule):
         self.variable_manager = variable_manager
         self.socketio = socketio
         self.poll_interval = poll_interval
+        self.poll_scheduler.set_base_interval(poll_interval)
+        self._poll_sync_version = None
         self.polling_active = False
         self.polling_thread = None
 
+        # Push-Modus: Notifications folgen den Widget-Subscriptions
+        if self.plc_notifications_enabled and hasattr(variable_manager, 'add_subscription_listener'):
+            variable_manager.add_subscription_listener(self._on_subscription_change)
+            for plc_id, var_name in variable_manager.get_all_subscribed_variables():
+                for _ in variable_manager.get_subscribers(var_name, plc_id):
+                    self._on_subscription_change('subscribe', plc_id, var_name)
+
         # Starte Thread
         self.polling_active = True
         self.polling_thread = threading.Thread(
@@ -1517,7 +1692,8 @@ class DataGateway(BaseModule):
         )
         self.polling_thread.start()
 
-        print(f"  ✅ Variable Polling gestartet (Intervall: {poll_interval}s)")
+        mode = "Notifications + Polling-Fallback" if self.plc_notifications_enabled else "Polling"
+        print(f"  ✅ Variable Polling gestartet (Intervall: {poll_interval}s, Modus: {mode})")
 
     def stop_variable_polling(self):
         """Stoppt Background Polling Thread"""
@@ -1537,56 +1713,251 @@ class DataGateway(BaseModule):
 
         logger.info("🔄 Variable Polling Loop gestartet")
 
+        scheduler = self.poll_scheduler
         while self.polling_active:
             try:
-                # Hole alle abonnierten Variablen
-                subscribed_vars = self.variable_manager.get_all_subscribed_variables()
+                # Subscriptions/Poll-Klassen nur nach Änderungen abgleichen
+                version = getattr(self.variable_manager, 'subscription_version', None)
+                if version is None or version != self._poll_sync_version:
+                    self._sync_poll_schedule()
+                    self._poll_sync_version = version
 
-                if not subscribed_vars:
+                if not len(scheduler):
                     # Keine Subscriptions -> Sleep länger
                     time.sleep(1.0)
                     continue
 
-                if len(subscribed_vars) > self.max_subscribed_variables_per_poll:
-                    total = len(subscribed_vars)
-                    limit = self.max_subscribed_variables_per_poll
-                    start = self._poll_window_cursor % total
-                    end = start + limit
-                    if end <= total:
-                        poll_batch = subscribed_vars[start:end]
-                    else:
-                        poll_batch = subscribed_vars[start:] + subscribed_vars[:end - total]
-                    self._poll_window_cursor = (start + limit) % total
-                    self.stats['polling_backpressure_skips'] += (total - limit)
-                else:
-                    poll_batch = subscribed_vars
-
-                # Lese Werte von PLC(s)
-                updates = self._read_subscribed_variables(poll_batch)
-
-                if updates:
-                    # Broadcast Update (Safe-Implementation)
-                    socket_instance = getattr(self, 'socketio', None)
-                    if socket_instance is not None:
-                        try:
-                            socket_instance.emit('variable_updates', updates)
-                        except Exception as e:
-                            logger.debug(f"Broadcast temporär nicht möglich: {e}")
-
-                # Sleep bis nächster Poll
-                time.sleep(self.poll_interval)
+                poll_batch = scheduler.pop_due()
+                self.stats['polling_backpressure_skips'] += scheduler.last_skipped
+
+                if poll_batch:
+                    # Per Notification bediente Variablen nicht pollen
+                    if self.plc_notifications_enabled:
+                        served = []
+                        for key in poll_batch:
+                            if self._is_push_served(*key):
+                                scheduler.defer(key)
+                            else:
+                                served.append(key)
+                        poll_batch = served
+
+                    # Lese Werte von PLC(s)
+                    unread = set()
+                    updates = self._read_subscribed_variables(poll_batch, unread) if poll_batch else {}
+
+                    if updates:
+                        # Zustellung nur an Clients mit passender Subscription
+                        self._emit_variable_updates(updates)
+
+                    # Geänderte Variablen schneller, unveränderte seltener pollen;
+                    # nicht gelesene (Worker-Timeout) ohne Backoff erneut einplanen
+                    now = time.monotonic()
+                    for plc_id, var_name in poll_batch:
+                        if (plc_id, var_name) in unread:
+                            scheduler.retry((plc_id, var_name), now)
+                        else:
+                            scheduler.report((plc_id, var_name), var_name in updates.get(plc_id, {}), now)
+
+                # Sleep bis zur nächsten Fälligkeit
+                next_due = scheduler.next_due()
+                delay = self.poll_interval if next_due is None else next_due - time.monotonic()
+                time.sleep(min(self.poll_interval, max(0.01, delay)))
 
             except Exception as e:
                 logger.error(f"❌ Polling-Fehler: {e}", exc_info=True)
                 time.sleep(1.0)  # Längerer Sleep nach Fehler
 
         logger.info("🛑 Variable Polling Loop beendet")
-    def _read_subscribed_variables(self, subscribed_vars: list) -> dict:
+
+    def _sync_poll_schedule(self):
+        """Übernimmt abonnierte Variablen samt Poll-Klasse in den PollScheduler"""
+        vm = self.variable_manager
+        if hasattr(vm, 'get_poll_classes'):
+            classes = {key: fastest_poll_class(values) for key, values in vm.get_poll_classes().items()}
+        else:
+            classes = {key: 'normal' for key in vm.get_all_subscribed_variables()}
+        self.poll_scheduler.sync(classes)
+
+    def get_poll_scheduler_stats(self) -> Dict[str, Any]:
+        """Poll-Budget-Auslastung und Lag pro Poll-Klasse"""
+        return self.poll_scheduler.get_stats()
+
+    def get_plc_poller_stats(self) -> Dict[str, Any]:
+        """Zykluszeit und Read-Dauer pro PLC-Verbindung"""
+        return self.plc_poll_workers.get_stats()
+
+    # ------------------------------------------------------------
+    # MULTI-PLC: Verbindung pro plc_id
+    # ------------------------------------------------------------
+
+    def _get_connection_manager(self):
+        """ConnectionManager (initialisiert nach dem Gateway → erst bei Bedarf holen)"""
+        if self.connection_manager is None:
+            app_context = getattr(self, '_app_context', None)
+            mm = getattr(app_context, 'module_manager', None)
+            if mm is not None:
+                self.connection_manager = mm.get_module('connection_manager')
+        return self.connection_manager
+
+    def _get_plc_handle(self, plc_id: str):
+        """
+        PLC-Verbindung einer plc_id
+
+        Eigene PLCConnection aus dem ConnectionManager, sonst die
+        Standard-PLC (plc_communication).
+        """
+        conn_mgr = self._get_connection_manager()
+        if conn_mgr is not None:
+            try:
+                conn = conn_mgr.get_connection(plc_id)
+            except Exception:
+                conn = None
+            if conn is not None and callable(getattr(conn, 'read_by_name', None)):
+                return self._bind_value_store(conn)
+        return self._bind_value_store(self.plc)
+
+    def _bind_value_store(self, plc):
+        """
+        Verbindung auf den PLCValueStore des VariableManagers umstellen
+
+        Ein Eintrag pro (plc_id, symbol) dient dann gleichzeitig als TTL-Read-Cache
+        der Verbindung und als Value-Cache des VariableManagers.
+        """
+        store = getattr(getattr(self, 'variable_manager', None), 'value_store', None)
+        if store is not None and plc is not None and hasattr(plc, 'value_store') and plc.value_store is not store:
+            plc.value_store = store
+        return plc
+
+    def _default_plc_id(self) -> str:
+        """plc_id der Standard-PLC (Schlüssel im PLCValueStore)"""
+        return getattr(self.plc, 'plc_id', None) or 'plc_001'
+
+    def _plc_worker_key(self, plc_id: str, plc) -> str:
+        # Alle plc_ids ohne eigene Verbindung teilen sich den Worker der Standard-PLC
+        return 'default' if plc is self.plc else plc_id
+
+    @staticmethod
+    def _plc_connected(plc) -> bool:
+        """plc_communication: Attribut connected, PLCConnection: is_connected()"""
+        connected = getattr(plc, 'connected', None)
+        if connected is None and callable(getattr(plc, 'is_connected', None)):
+            try:
+                return bool(plc.is_connected())
+            except Exception:
+                return False
+        return bool(connected)
+
+    # ------------------------------------------------------------
+    # WRITE-PIPELINE (Coalescing + Sum-Write pro Verbindung)
+    # ------------------------------------------------------------
+
+    def _get_write_pipeline(self, plc_id: str, plc) -> PLCWritePipeline:
+        """Write-Pipeline der Verbindung (neu bei gewechseltem Handle)"""
+        key = self._plc_worker_key(plc_id, plc)
+        with self._write_pipeline_lock:
+            pipeline = self._write_pipelines.get(key)
+            if pipeline is not None and pipeline.plc is plc:
+                return pipeline
+            stale = pipeline
+            pipeline = self._write_pipelines[key] = PLCWritePipeline(
+                plc,
+                window_s=self.plc_write_window_ms / 1000.0,
+                on_written=self._on_plc_writes,
+                name=f"plc-write-{key}"
+            )
+        if stale is not None:
+            stale.stop(timeout=0)
+        return pipeline
+
+    def _write_to_plc(self, plc_id: str, plc, symbol: str, value: Any, plc_type: Any = None,
+                      wait: bool = True, context: Optional[Dict[str, Any]] = None) -> WriteTicket:
+        """
+        Reiht einen Write ein
+
+        Mit wait=True wird auf die Quittung gewartet (max. plc_write_timeout),
+        sonst kommt das Ticket sofort zurück. context (Route-Writes: route,
+        target, datapoint) geht an _on_plc_writes(); ohne context nur die
+        Correlation-ID.
+        """
+        ticket = self._get_write_pipeline(plc_id, plc).submit(
+            symbol, value, plc_type, tag=plc_id,
+            context=context if context is not None else self.get_correlation_id()
+        )
+        if wait:
+            ticket.wait(self.plc_write_timeout)
+        return ticket
+
+    def _on_plc_writes(self, results: list):
+        """
+        Pipeline-Callback pro Batch (Writer-Thread): VariableManager-Cache und
+        Telemetrie mit dem tatsächlich geschriebenen Wert, ein variable_updates-Frame.
+        Route-Writes (Kontext mit route/target/datapoint) melden das Ergebnis an
+        den Circuit Breaker der Route; Fehlschläge landen in der Dead-Letter-Queue.
+        """
+        variable_manager = getattr(self, 'variable_manager', None)
+        updates = {}
+        try:
+            for plc_id, symbol, value, ok, context in results:
+                route_context = context if isinstance(context, dict) else None
+                self.set_correlation_id(route_context.get('correlation_id') if route_context else context)
+                if route_context is not None:
+                    try:
+                        self._settle_route_write(plc_id, symbol, value, ok, route_context)
+                    except Exception as e:
+                        # Übrige Ergebnisse des Batches trotzdem abschließen
+                        logger.error(f"❌ Route-Write-Abschluss fehlgeschlagen: {plc_id}/{symbol}: {e}")
+                if not ok:
+                    logger.warning(f"⚠️  PLC-Write fehlgeschlagen: {plc_id}/{symbol} = {value}")
+                    continue
+                symbol_info = None
+                if variable_manager is not None:
+                    variable_manager.update_value(symbol, value, plc_id)
+                    symbol_info = variable_manager.get_symbol_info(symbol, plc_id)
+                self._mirror_plc_telemetry(symbol, value)
+                updates.setdefault(plc_id, {})[symbol] = self._build_variable_update(plc_id, value, symbol_info)
+        finally:
+            self.clear_correlation_id()
+        if updates:
+            # Broadcast nur an Abonnenten der Variablen
+            self._emit_variable_updates(updates)
+
+    def _settle_route_write(self, plc_id: str, symbol: str, value: Any, ok: bool,
+                            route_context: Dict[str, Any]):
+        """Ergebnis eines Route-Writes: Breaker plc:{id}:route, bei Fehler DLQ"""
+        breaker = self._get_circuit_breaker(f"plc:{plc_id}:route")
+        if ok:
+            breaker.record_success()
+            return
+        error_message = f"PLC-Write fehlgeschlagen: {symbol} = {value}"
+        breaker.record_failure(error_message=error_message)
+        self._enqueue_dead_letter(
+            datapoint=route_context.get('datapoint') or {},
+            route=route_context.get('route') or {},
+            target=route_context.get('target') or f"{plc_id}.{symbol}",
+            error_class='routing_error',
+            error_message=error_message
+        )
+
+    def get_write_pipeline_stats(self) -> Dict[str, Any]:
+        """Coalescing/Batching-Kennzahlen pro Verbindung"""
+        with self._write_pipeline_lock:
+            pipelines = dict(self._write_pipelines)
+        return {key: pipeline.get_stats() for key, pipeline in pipelines.items()}
+
+    def _read_subscribed_variables(self, subscribed_vars: list, unread: Optional[set] = None) -> dict:
         """
         Liest alle abonnierten Variablen von PLC(s)
 
+        Jede plc_id wird über ihre eigene Verbindung gelesen, die Verbindungen
+        parallel auf je einem Reader-Thread (PLCPollWorkers). Unterstützt die
+        Verbindung read_list_by_name(), wird das Poll-Fenster gebündelt per
+        ADS-Sum-Read gelesen (ein Roundtrip pro Chunk statt pro Symbol). Sonst
+        Fallback auf Einzel-Reads.
+
         Args:
             subscribed_vars: Liste von (plc_id, variable_name) Tupeln
+            unread: Optional, erhält (plc_id, variable_name) der Verbindungen,
+                deren Reader-Thread kein Ergebnis geliefert hat (Timeout/belegt)
 
         Returns:
             Dictionary mit Updates: {plc_id: {variable_name: {...}}}
@@ -1603,106 +1974,285 @@ class DataGateway(BaseModule):
                 by_plc[plc_id] = []
             by_plc[plc_id].append(var_name)
 
-        # Lese von jeder PLC
+        # Phase 1: Symbol-Infos + PLC-Typen auflösen, Aufträge pro Verbindung
+        jobs = {}  # worker_key -> [(plc_id, plc, resolved, plc_types)]
         for plc_id, var_names in by_plc.items():
-            if plc_id not in updates:
-                updates[plc_id] = {}
+            updates[plc_id] = {}
+            resolved, plc_types = self._resolve_poll_symbols(plc_id, var_names, logger)
+            if not resolved:
+                continue
+            plc = self._get_plc_handle(plc_id)
+            if plc is None:
+                continue
+            jobs.setdefault(self._plc_worker_key(plc_id, plc), []).append((plc_id, plc, resolved, plc_types))
 
-            for var_name in var_names:
-                try:
-                    # Hole Symbol-Info
-                    symbol_info = self.variable_manager.get_symbol_info(var_name, plc_id)
-                    if not symbol_info:
-                        # Missing symbol - apply backoff to avoid spam
-                        key = f"{plc_id}/{var_name}"
-                        now = time.time()
-                        ms = self.missing_symbol_stats.get(key, {'count': 0, 'last_log': 0, 'suspended_until': 0})
-
-                        # If currently suspended, skip without logging
-                        if ms.get('suspended_until', 0) > now:
-                            continue
-
-                        ms['count'] = ms.get('count', 0) + 1
-                        ms['last_log'] = now
-
-                        # Escalate suspension window: after 3 warnings suspend for 60s
-                        if ms['count'] >= 3:
-                            ms['suspended_until'] = now + 60.0
-                            # Reset count to avoid overflow
-                            ms['count'] = 0
-
-                        self.missing_symbol_stats[key] = ms
-
-                        # Log warning only for first 3 times, then suppressed for 60s
-                        logger_warning = ms.get('count', 0) <= 3
-                        if logger_warning:
-                            logger.warning(f"⚠️  Symbol-Info nicht gefunden: {plc_id}/{var_name} (warn {ms['count']})")
-
-                        # Notify UI but rate-limit these notifications
-                        if self.web_manager and ms.get('count', 0) == 1:
-                            try:
-                                self.web_manager.broadcast_system_event({
-                                    'type': 'symbol_missing',
-                                    'plc_id': plc_id,
-                                    'variable': var_name,
-                                    'message': 'Symbol-Info nicht gefunden'
-                                })
-                            except Exception:
-                                pass
-
-                        continue
-
-                    # Lese Wert von PLC
-                    if self.plc and getattr(self.plc, 'connected', False):
-                        # Resolve plc_type from symbol_info
-                        plc_type = None
-                        try:
-                            if symbol_info and isinstance(symbol_info.symbol_type, str):
-                                import pyads
-                                type_map = {
-                                    'BOOL': pyads.PLCTYPE_BOOL,
-                                    'INT': pyads.PLCTYPE_INT,
-                                    'DINT': pyads.PLCTYPE_DINT,
-                                    'REAL': pyads.PLCTYPE_REAL,
-                                    'LREAL': pyads.PLCTYPE_LREAL,
-                                    'STRING': pyads.PLCTYPE_STRING,
-                                    'BYTE': pyads.PLCTYPE_BYTE
-                                }
-                                plc_type = type_map.get(symbol_info.symbol_type.upper(), None)
-                        except Exception:
-                            plc_type = None
-
-                        # If PLCCommunication expects plc_type, provide a safe default
-                        if plc_type is None:
-                            import pyads
-                            plc_type = pyads.PLCTYPE_BYTE
-
-                        value = self.plc.read_by_name(var_name, plc_type)
-
-                        # Prüfe ob Wert sich geändert hat
-                        cached = self.variable_manager.get_cached_value(var_name, plc_id)
-                        if not cached or cached[0] != value:
-                            # Wert hat sich geändert → Update
-                            self.variable_manager.update_value(var_name, value, plc_id)
-                            # Spiegel in Telemetrie-Cache für Regel-Engine/Frontend
-                            self.update_telemetry(f"PLC.{var_name}", value)
-
-                            updates[plc_id][var_name] = {
-                                'value': value,
-                                'timestamp': time.time(),
-                                'timestamp_utc': self._utc_iso(),
-                                'type': symbol_info.symbol_type,
-                                'plc_id': plc_id,
-                                'correlation_id': self.get_correlation_id()
-                            }
-
-                            logger.debug(f"📊 {plc_id}/{var_name} = {value}")
+        # Phase 2: Werte lesen - pro Verbindung parallel
+        results = self.plc_poll_workers.run({
+            key: (lambda batches=batches: self._read_plc_batches(batches, logger))
+            for key, batches in jobs.items()
+        })
+
+        # Phase 3: Änderungen erkennen (im Poll-Thread, ein gemeinsamer Frame)
+        for key, batches in jobs.items():
+            if key not in results:
+                if unread is not None:
+                    unread.update((plc_id, var_name) for plc_id, _, resolved, _ in batches
+                                  for var_name, _ in resolved)
+                continue
+            values_by_plc = results[key] or {}
+            for plc_id, _, resolved, _ in batches:
+                values = values_by_plc.get(plc_id)
+                if values:
+                    self._apply_polled_values(plc_id, resolved, values, updates[plc_id], logger)
 
+        return updates
+
+    def _resolve_poll_symbols(self, plc_id: str, var_names: list, logger):
+        """Symbol-Infos und PLC-Typen der zu lesenden Variablen"""
+        resolved = []  # [(var_name, symbol_info)]
+        plc_types = {}
+        for var_name in var_names:
+            try:
+                symbol_info = self.variable_manager.get_symbol_info(var_name, plc_id)
+                if not symbol_info:
+                    self._handle_missing_symbol(plc_id, var_name, logger)
+                    continue
+                resolved.append((var_name, symbol_info))
+                plc_types[var_name] = self._resolve_plc_type(symbol_info)
+            except Exception as e:
+                logger.error(f"❌ Fehler beim Lesen von {plc_id}/{var_name}: {e}")
+        return resolved, plc_types
+
+    def _read_plc_batches(self, batches: list, logger) -> Dict[str, Dict[str, Any]]:
+        """Läuft im Reader-Thread der Verbindung: {plc_id: {variable: wert}}"""
+        values_by_plc = {}
+        for plc_id, plc, resolved, plc_types in batches:
+            if not self._plc_connected(plc):
+                continue
+
+            # Sum-Read wenn verfügbar - auch für ein einzelnes Symbol, damit
+            # PLCConnection.read_by_name() Poll-Werte nicht ins Routing gibt
+            names = [var_name for var_name, _ in resolved]
+            batch_reader = getattr(plc, 'read_list_by_name', None)
+            if callable(batch_reader):
+                try:
+                    values = batch_reader(names, plc_types)
                 except Exception as e:
-                    logger.error(f"❌ Fehler beim Lesen von {plc_id}/{var_name}: {e}")
+                    logger.error(f"❌ Sum-Read fehlgeschlagen ({plc_id}, {len(names)} Symbole): {e}")
                     continue
+            else:
+                values = {}
+                for var_name in names:
+                    try:
+                        values[var_name] = plc.read_by_name(var_name, plc_types[var_name])
+                    except Exception as e:
+                        logger.error(f"❌ Fehler beim Lesen von {plc_id}/{var_name}: {e}")
+            values_by_plc[plc_id] = values
+        return values_by_plc
+
+    def _apply_polled_values(self, plc_id: str, resolved: list, values: Dict[str, Any],
+                             plc_updates: Dict[str, Any], logger):
+        """Vergleicht gelesene Werte mit dem Cache und sammelt Änderungen"""
+        for var_name, symbol_info in resolved:
+            if var_name not in values:
+                continue
+            value = values[var_name]
+            try:
+                # Geändert seit dem letzten Broadcast? (Sequenz im PLCValueStore -
+                # der Sum-Read hat den Wert dort bereits eingetragen)
+                if self.variable_manager.update_value(var_name, value, plc_id):
+                    self._mirror_plc_telemetry(var_name, value)
 
-        return updates
+                    plc_updates[var_name] = self._build_variable_update(plc_id, value, symbol_info)
+
+                    logger.debug(f"📊 {plc_id}/{var_name} = {value}")
+
+            except Exception as e:
+                logger.error(f"❌ Fehler beim Lesen von {plc_id}/{var_name}: {e}")
+                continue
+
+    def _emit_variable_updates(self, updates: Dict[str, Dict[str, Any]]):
+        """
+        Sendet variable_updates - raumbasiert über den WebManager, sonst global
+
+        Args:
+            updates: {plc_id: {variable: update}}
+        """
+        try:
+            if self.web_manager and hasattr(self.web_manager, 'emit_variable_updates'):
+                self.web_manager.emit_variable_updates(updates)
+                return
+            socket_instance = getattr(self, 'socketio', None)
+            if socket_instance is not None:
+                socket_instance.emit('variable_updates', updates)
+        except Exception as e:
+            # Verhindert, dass ein fehlerhafter Broadcast den ganzen Loop reißt
+            logger.debug(f"Broadcast temporär nicht möglich: {e}")
+
+    def _build_variable_update(self, plc_id: str, value: Any, symbol_info) -> Dict[str, Any]:
+        """Payload eines Eintrags in 'variable_updates'"""
+        return {
+            'value': value,
+            'timestamp': time.time(),
+            'timestamp_utc': self._utc_iso(),
+            'type': symbol_info.symbol_type if symbol_info else 'UNKNOWN',
+            'plc_id': plc_id,
+            'correlation_id': self.get_correlation_id()
+        }
+
+    # ------------------------------------------------------------
+    # PUSH-MODUS (ADS Device-Notifications)
+    # ------------------------------------------------------------
+
+    def _get_notification_target(self, plc_id: str):
+        """PLC-Verbindung mit Notification-Support (oder None)"""
+        plc = self._get_plc_handle(plc_id)
+        if plc is not None and hasattr(plc, 'add_value_notification'):
+            return plc
+        return None
+
+    def _is_push_served(self, plc_id: str, var_name: str) -> bool:
+        plc = self._get_notification_target(plc_id)
+        if plc is None:
+            return False
+        try:
+            return bool(plc.has_value_notification(var_name))
+        except Exception:
+            return False
+
+    def _on_subscription_change(self, event: str, plc_id: str, var_name: str):
+        """
+        VariableManager-Listener: hält pro Widget-Abo eine Notification-Referenz
+
+        Schlägt die Registrierung fehl, bleibt die Variable im Polling.
+        """
+        plc = self._get_notification_target(plc_id)
+        if plc is None:
+            return
+
+        try:
+            if event == 'subscribe':
+                symbol_info = self.variable_manager.get_symbol_info(var_name, plc_id)
+                # Kein BYTE-Fallback: unaufgelöste Typen (Strukturen, String-Arrays)
+                # bekämen sonst eine 1-Byte-Notification und fielen aus dem Polling
+                plc_type = getattr(symbol_info, 'plc_type', None) if symbol_info else None
+                ok = plc.add_value_notification(
+                    var_name,
+                    lambda symbol, value, _plc_id=plc_id: self._on_plc_notification(_plc_id, symbol, value),
+                    plc_type
+                )
+                if not ok:
+                    self.stats['plc_notification_fallbacks'] += 1
+                    logger.debug(f"Notification nicht registriert, Polling-Fallback: {plc_id}/{var_name}")
+            elif event == 'unsubscribe':
+                plc.remove_value_notification(var_name)
+        except Exception as e:
+            logger.debug(f"Notification-Verwaltung fehlgeschlagen ({event} {plc_id}/{var_name}): {e}")
+
+    def _on_plc_notification(self, plc_id: str, var_name: str, value: Any):
+        """ADS-Callback: Änderung sofort in Cache, Telemetrie und an Clients"""
+        variable_manager = getattr(self, 'variable_manager', None)
+        if variable_manager is None:
+            return
+
+        if not variable_manager.update_value(var_name, value, plc_id):
+            return
+
+        self.stats['plc_notifications'] += 1
+        self._mirror_plc_telemetry(var_name, value)
+
+        symbol_info = variable_manager.get_symbol_info(var_name, plc_id)
+        self._emit_variable_updates({
+            plc_id: {var_name: self._build_variable_update(plc_id, value, symbol_info)}
+        })
+
+    def get_notification_stats(self) -> Dict[str, Any]:
+        """
+        Statistik des Push-Modus
+
+        registry = Standard-PLC, connections = Registry je Verbindung (Standard-PLC
+        unter 'default' plus alle PLCConnections des ConnectionManagers),
+        total = Summe der Zähler über alle Verbindungen.
+        """
+        stats = {
+            'enabled': self.plc_notifications_enabled,
+            'updates': self.stats['plc_notifications'],
+            'fallbacks': self.stats['plc_notification_fallbacks']
+        }
+        connections = {}
+        default_registry = getattr(self.plc, 'notifications', None) if self.plc else None
+        if default_registry is not None and hasattr(default_registry, 'get_stats'):
+            connections['default'] = default_registry.get_stats()
+            stats['registry'] = connections['default']
+
+        conn_mgr = self._get_connection_manager()
+        if conn_mgr is not None:
+            try:
+                plc_connections = conn_mgr.get_all_connections()
+            except Exception:
+                plc_connections = {}
+            for conn_id, conn in plc_connections.items():
+                registry = getattr(conn, 'notifications', None)
+                if registry is None or registry is default_registry or not hasattr(registry, 'get_stats'):
+                    continue
+                connections[conn_id] = registry.get_stats()
+
+        total = {}
+        for registry_stats in connections.values():
+            for key, value in registry_stats.items():
+                if key in ('cycle_time_ms', 'max_delay_ms') or not isinstance(value, (int, float)):
+                    continue
+                total[key] = total.get(key, 0) + value
+        stats['connections'] = connections
+        stats['total'] = total
+        return stats
+
+    def _resolve_plc_type(self, symbol_info) -> Any:
+        """PLCTYPE_* eines Symbols - vorab aufgelöst bei Registrierung (Fallback: BYTE)"""
+        plc_type = getattr(symbol_info, 'plc_type', None)
+        if plc_type is None and symbol_info is not None:
+            plc_type = resolve_plc_type(symbol_info.symbol_type)
+        return plc_type if plc_type is not None else DEFAULT_PLC_TYPE
+
+    def _handle_missing_symbol(self, plc_id: str, var_name: str, logger):
+        """Missing symbol - apply backoff to avoid spam"""
+        key = f"{plc_id}/{var_name}"
+        now = time.time()
+        ms = self.missing_symbol_stats.get(key, {'count': 0, 'last_log': 0, 'suspended_until': 0})
+
+        # If currently suspended, skip without logging
+        if ms.get('suspended_until', 0) > now:
+            return
+
+        ms['count'] = ms.get('count', 0) + 1
+        ms['last_log'] = now
+
+        # Escalate suspension window: after 3 warnings suspend for 60s
+        if ms['count'] >= 3:
+            ms['suspended_until'] = now + 60.0
+            # Reset count to avoid overflow
+            ms['count'] = 0
+
+        self.missing_symbol_stats[key] = ms
+
+        # Log warning only for first 3 times, then suppressed for 60s
+        logger_warning = ms.get('count', 0) <= 3
+        if logger_warning:
+            logger.warning(f"⚠️  Symbol-Info nicht gefunden: {plc_id}/{var_name} (warn {ms['count']})")
+
+        # Notify UI but rate-limit these notifications
+        if self.web_manager and ms.get('count', 0) == 1:
+            try:
+                suggest = getattr(self.variable_manager, 'suggest_symbols', None)
+                self.web_manager.broadcast_system_event({
+                    'type': 'symbol_missing',
+                    'plc_id': plc_id,
+                    'variable': var_name,
+                    'message': 'Symbol-Info nicht gefunden',
+                    'suggestions': suggest(var_name, plc_id) if callable(suggest) else []
+                })
+            except Exception:
+                pass
 
     def write_variable(self, variable_name: str, value: Any, plc_id: str = 'plc_001') -> bool:
         """
@@ -1732,60 +2282,20 @@ class DataGateway(BaseModule):
                 logger.error(f"❌ Symbol nicht gefunden: {plc_id}/{variable_name}")
                 return False
 
-            # Schreibe zu PLC
-            if self.plc and getattr(self.plc, 'connected', False):
-                # ⭐ v4.6.0: plc_type aus Symbol-Info verwenden
-                plc_type = symbol_info.symbol_type
-
-                # Wenn type als String vorliegt, mappe zu pyads PLCTYPE Konstanten
-                try:
-                    import pyads
-                    if isinstance(plc_type, str):
-                        type_map = {
-                            'BOOL': pyads.PLCTYPE_BOOL,
-                            'INT': pyads.PLCTYPE_INT,
-                            'DINT': pyads.PLCTYPE_DINT,
-                            'REAL': pyads.PLCTYPE_REAL,
-                            'LREAL': pyads.PLCTYPE_LREAL,
-                            'STRING': pyads.PLCTYPE_STRING,
-                            'BYTE': pyads.PLCTYPE_BYTE
-                        }
-                        plc_type = type_map.get(plc_type.upper(), None)
-                except Exception:
-                    plc_type = None
-
-                # Fallback: wenn plc_type None, lasse PLC-Connection auto-detect verwenden
-                if plc_type is None:
-                    write_ok = self.plc.write_by_name(variable_name, value)
-                else:
-                    write_ok = self.plc.write_by_name(variable_name, value, plc_type)
-                if write_ok is False:
-                    raise RuntimeError("PLC write returned False")
-
-                # Update Cache
-                self.variable_manager.update_value(variable_name, value, plc_id)
-
-                # Broadcast Update
-                # Prüfe sicher, ob das Attribut existiert UND nicht None ist
-                socket_instance = getattr(self, 'socketio', None) 
-
-                if socket_instance is not None:
-                    try:
-                        socket_instance.emit('variable_updates', {
-                            plc_id: {
-                                variable_name: {
-                                    'value': value,
-                                    'timestamp': time.time(),
-                                    'timestamp_utc': self._utc_iso(),
-                                    'type': symbol_info.symbol_type,
-                                    'plc_id': plc_id,
-                                    'correlation_id': self.get_correlation_id()
-                                }
-                            }
-                        })
-                    except Exception as e:
-                        # Verhindert, dass ein fehlerhafter Broadcast den ganzen Loop reißt
-                        logger.debug(f"Broadcast temporär nicht möglich: {e}") 
+            # Schreibe zur PLC der plc_id
+            plc = self._get_plc_handle(plc_id)
+            if plc and self._plc_connected(plc):
+                # ⭐ v4.6.0: plc_type aus Symbol-Info verwenden (bei Registrierung aufgelöst)
+                plc_type = getattr(symbol_info, 'plc_type', None)
+                if plc_type is None and isinstance(symbol_info.symbol_type, str):
+                    plc_type = resolve_plc_type(symbol_info.symbol_type)
+
+                # Write-Pipeline der Verbindung: fasst schnelle Folge-Writes auf das
+                # Symbol zusammen; Cache/Telemetrie/Broadcast in _on_plc_writes()
+                # (plc_type None → PLC-Connection auto-detect)
+                ticket = self._write_to_plc(plc_id, plc, variable_name, value, plc_type)
+                if not ticket.ok:
+                    raise RuntimeError(f"PLC write failed: {ticket.error or 'timeout'}")
 
                 logger.info(f"✍️  {plc_id}/{variable_name} = {value}")
                 breaker.record_success()
@@ -1807,6 +2317,13 @@ class DataGateway(BaseModule):
         """Cleanup"""
         # Stoppe Polling-Thread
         self.stop_variable_polling()
+        self.plc_poll_workers.stop()
+        with self._write_pipeline_lock:
+            pipelines = list(self._write_pipelines.values())
+            self._write_pipelines.clear()
+        for pipeline in pipelines:
+            pipeline.stop()
+        self.route_dispatcher.stop()
 
         with self.lock:
             self.blob_cache.clear()
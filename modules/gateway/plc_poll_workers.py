@@ -0,0 +1,203 @@
+"""
+PLC Poll Workers
+Parallele Poll-Reads mit einem eigenen Reader-Thread pro PLC-Verbindung
+
+📁 SPEICHERORT: modules/gateway/plc_poll_workers.py
+
+Der Polling-Loop im DataGateway gruppiert die fälligen Variablen nach PLC.
+Statt die Verbindungen nacheinander zu lesen, übergibt er pro Verbindung
+einen Lese-Auftrag an deren Worker und wartet auf alle gemeinsam:
+- ein Worker-Thread pro Verbindung (Key), bei Bedarf gestartet, beendet
+  sich nach idle_timeout ohne Auftrag
+- Zykluszeit = langsamste PLC statt Summe aller PLCs
+- Wartezeit pro Zyklus begrenzt (timeout): eine hängende PLC verzögert den
+  variable_updates-Frame der anderen nicht; ihr Worker bleibt belegt und
+  bekommt erst nach Abschluss wieder einen Auftrag (busy_skips)
+- Aufträge lesen nur (I/O); Änderungserkennung, Cache und Broadcast laufen
+  weiter im Poll-Thread
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class _Worker:
+    __slots__ = ('key', 'cond', 'job', 'thread', 'polls', 'errors', 'timeouts',
+                 'busy_skips', 'last_ms', 'avg_ms', 'max_ms')
+
+    def __init__(self, key: str):
+        self.key = key
+        self.cond = threading.Condition()
+        self.job = None  # (fn, holder, done) solange belegt
+        self.thread: Optional[threading.Thread] = None
+        self.polls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.busy_skips = 0
+        self.last_ms = 0.0
+        self.avg_ms = 0.0
+        self.max_ms = 0.0
+
+
+class PLCPollWorkers:
+    """
+    Reader-Threads pro PLC-Verbindung
+
+    Args:
+        timeout: Max. Wartezeit pro Zyklus auf alle Verbindungen (Sekunden)
+        idle_timeout: Worker ohne Auftrag beenden sich nach dieser Zeit
+        name: Präfix für Thread-Namen
+    """
+
+    def __init__(self, timeout: float = 2.0, idle_timeout: float = 60.0, name: str = 'plc-poll'):
+        self.timeout = max(0.01, float(timeout))
+        self.idle_timeout = max(0.1, float(idle_timeout))
+        self.name = name
+        self._workers: Dict[str, _Worker] = {}
+        self._lock = threading.Lock()
+        self._stopping = False
+
+        self.cycles = 0
+        self.last_cycle_ms = 0.0
+        self.last_serial_ms = 0.0  # Summe der Einzel-Reads im letzten Zyklus
+
+    def run(self, jobs: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+        """
+        Führt die Aufträge parallel auf den Workern ihrer Verbindung aus
+
+        Args:
+            jobs: {verbindungs_key: callable}
+
+        Returns:
+            {verbindungs_key: ergebnis} - Aufträge mit Fehler, Timeout oder
+            belegtem Worker fehlen
+        """
+        if not jobs:
+            return {}
+        started = time.monotonic()
+        pending = {}
+        with self._lock:
+            self._stopping = False
+            for key, fn in jobs.items():
+                worker = self._workers.get(key)
+                if worker is None:
+                    worker = self._spawn(key)
+                with worker.cond:
+                    if worker.job is not None:
+                        # Vorheriger Auftrag läuft noch (Timeout im letzten Zyklus)
+                        worker.busy_skips += 1
+                        continue
+                    holder: Dict[str, Any] = {}
+                    done = threading.Event()
+                    worker.job = (fn, holder, done)
+                    worker.cond.notify()
+                pending[key] = (worker, holder, done)
+
+        results = {}
+        serial_ms = 0.0
+        deadline = started + self.timeout
+        for key, (worker, holder, done) in pending.items():
+            if not done.wait(max(0.0, deadline - time.monotonic())):
+                with worker.cond:
+                    worker.timeouts += 1
+                continue
+            serial_ms += holder.get('elapsed_ms', 0.0)
+            if 'result' in holder:
+                results[key] = holder['result']
+
+        self.cycles += 1
+        self.last_cycle_ms = (time.monotonic() - started) * 1000.0
+        self.last_serial_ms = serial_ms
+        return results
+
+    def _spawn(self, key: str) -> _Worker:
+        # Aufruf unter self._lock
+        worker = _Worker(key)
+        worker.thread = threading.Thread(
+            target=self._loop,
+            args=(worker,),
+            daemon=True,
+            name=f"{self.name}-{key}"
+        )
+        self._workers[key] = worker
+        worker.thread.start()
+        return worker
+
+    def _loop(self, worker: _Worker):
+        while True:
+            with worker.cond:
+                while worker.job is None and not self._stopping:
+                    if not worker.cond.wait(self.idle_timeout):
+                        break
+                job = worker.job
+            if job is None:
+                if self._stopping or self._retire(worker):
+                    return
+                continue
+
+            fn, holder, done = job
+            started = time.monotonic()
+            failed = False
+            try:
+                holder['result'] = fn()
+            except Exception:
+                failed = True
+            elapsed_ms = (time.monotonic() - started) * 1000.0
+            holder['elapsed_ms'] = elapsed_ms
+            with worker.cond:
+                worker.job = None
+                worker.polls += 1
+                worker.errors += int(failed)
+                worker.last_ms = elapsed_ms
+                worker.avg_ms += 0.2 * (elapsed_ms - worker.avg_ms)
+                worker.max_ms = max(worker.max_ms, elapsed_ms)
+            done.set()
+
+    def _retire(self, worker: _Worker) -> bool:
+        """Idle-Worker austragen (nur wenn zwischenzeitlich kein Auftrag kam)"""
+        with self._lock:
+            with worker.cond:
+                if worker.job is not None:
+                    return False
+                if self._workers.get(worker.key) is worker:
+                    del self._workers[worker.key]
+                return True
+
+    def stop(self, timeout: float = 1.0):
+        """Beendet alle Worker (laufende Reads werden nicht abgebrochen)"""
+        with self._lock:
+            self._stopping = True
+            workers = list(self._workers.values())
+            self._workers.clear()
+        for worker in workers:
+            with worker.cond:
+                worker.cond.notify_all()
+        for worker in workers:
+            if worker.thread is not None:
+                worker.thread.join(timeout=timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            workers = list(self._workers.values())
+        connections = {}
+        for worker in workers:
+            with worker.cond:
+                connections[worker.key] = {
+                    'busy': worker.job is not None,
+                    'polls': worker.polls,
+                    'errors': worker.errors,
+                    'timeouts': worker.timeouts,
+                    'busy_skips': worker.busy_skips,
+                    'last_ms': round(worker.last_ms, 2),
+                    'avg_ms': round(worker.avg_ms, 2),
+                    'max_ms': round(worker.max_ms, 2)
+                }
+        return {
+            'workers': len(connections),
+            'timeout_ms': round(self.timeout * 1000.0, 1),
+            'cycles': self.cycles,
+            'last_cycle_ms': round(self.last_cycle_ms, 2),
+            'last_serial_ms': round(self.last_serial_ms, 2),
+            'connections': connections
+        }
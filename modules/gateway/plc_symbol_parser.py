@@ -5,17 +5,18 @@ Parser für TwinCAT .tpy Dateien
 📁 SPEICHERORT: modules/gateway/plc_symbol_parser.py
 
 Features:
-- XML-Parser für .tpy Symbol-Dateien
+- .tpy Symbol-Dateien über den gemeinsamen Streaming-Reader (modules/plc/tpy_reader.py)
 - TreeView-Struktur für hierarchische Symbole
 - Filter nach Datentyp
 - Suche mit Regex
 """
 
-import xml.etree.ElementTree as ET
 import re
 from typing import Dict, List, Any, Optional
 import os
 
+from modules.plc.tpy_reader import read_tpy
+
 
 class PLCSymbolParser:
     """
@@ -45,104 +46,31 @@ class PLCSymbolParser:
             return False
 
         try:
-            tree = ET.parse(self.tpy_file_path)
-            root = tree.getroot()
-
-            # ====================================================================
-            # TEIL 1: Parse DataTypes (Strukturdefinitionen)
-            # ====================================================================
-            datatypes = root.findall('.//DataType')
-            print(f"  > Gefundene DataType-Elemente: {len(datatypes)}")
-
-            for datatype in datatypes:
-                # Hole DataType Name
-                name_elem = datatype.find('Name')
-                if name_elem is None or name_elem.text is None:
-                    continue
-
-                datatype_name = name_elem.text.strip()
-
-                # Parse SubItems (die eigentlichen Variablen)
-                subitems = datatype.findall('.//SubItem')
-
-                for subitem in subitems:
-                    # Hole SubItem Name
-                    subname_elem = subitem.find('Name')
-                    if subname_elem is None or subname_elem.text is None:
-                        continue
-
-                    subname = subname_elem.text.strip()
-
-                    # Hole Type
-                    type_elem = subitem.find('Type')
-                    symbol_type = type_elem.text.strip() if type_elem is not None and type_elem.text else 'UNKNOWN'
-
-                    # Hole Comment (optional)
-                    comment_elem = subitem.find('Comment')
-                    comment = ''
-                    if comment_elem is not None and comment_elem.text:
-                        comment = comment_elem.text.strip()
-
-                    # Baue Full Name: DataType.SubItem
-                    full_name = f"{datatype_name}.{subname}" if datatype_name else subname
-
-                    # Kategorie ermitteln
-                    category = 'Variable'
-                    if datatype_name.startswith('_fb') or datatype_name.startswith('fb'):
-                        category = 'FunctionBlock'
-                    elif 'arr' in datatype_name.lower() or 'array' in symbol_type.lower():
-                        category = 'Array'
-
-                    self.symbols.append({
-                        'name': full_name,
-                        'type': symbol_type,
-                        'category': category,
-                        'parent': datatype_name,
-                        'comment': comment,
-                        'path': self._get_symbol_path(full_name)
-                    })
-
-            print(f"  > DataType-Symbole: {len(self.symbols)}")
-
-            # ====================================================================
-            # TEIL 2: Parse Symbol-Tabelle (MAIN.* Programmvariablen)
-            # ====================================================================
-            # Suche nach <Symbol><Name> Elementen (nicht in DataTypes)
-            programs = root.findall('.//Program')
-
-            for program in programs:
-                # Suche nach PrgInfo/Symbol
-                prginfo = program.find('.//PrgInfo')
-                if prginfo is None:
-                    continue
-
-                symbols_in_program = prginfo.findall('.//Symbol')
-
-                for symbol_elem in symbols_in_program:
-                    name_elem = symbol_elem.find('Name')
-                    if name_elem is None or name_elem.text is None:
-                        continue
-
-                    symbol_name = name_elem.text.strip()
-
-                    # Versuche Typ zu ermitteln
-                    # Meist gibt es keinen Type direkt, sondern nur Name
-                    # Der Typ wird zur Laufzeit von der PLC aufgelöst
-                    symbol_type = 'UNKNOWN'
-
-                    # Kategorie
+            # Gemeinsamer Streaming-Reader: gleiche Symbolmenge wie der Symbol-Browser
+            parsed = read_tpy(self.tpy_file_path)
+            print(f"  > Gefundene DataType-Elemente: {parsed.datatype_count}")
+
+            self.symbols = []
+            for sym in parsed.symbols:
+                # Kategorie ermitteln
+                if sym.type in parsed.fb_types:
+                    category = 'FunctionBlock'
+                elif sym.type.upper().startswith('ARRAY'):
+                    category = 'Array'
+                elif sym.type == 'UNKNOWN':
+                    # Programmvariable ohne Typ (Typ wird zur Laufzeit von der PLC aufgelöst)
                     category = 'ProgramVariable'
+                else:
+                    category = 'Variable'
 
-                    self.symbols.append({
-                        'name': symbol_name,
-                        'type': symbol_type,
-                        'category': category,
-                        'parent': 'MAIN',
-                        'comment': '',
-                        'path': self._get_symbol_path(symbol_name)
-                    })
-
-            print(f"  > Program-Symbole: {len(self.symbols) - len(datatypes) * 10}")  # Grobe Schätzung
+                self.symbols.append({
+                    'name': sym.name,
+                    'type': sym.type,
+                    'category': category,
+                    'parent': sym.name.rsplit('.', 1)[0] if '.' in sym.name else '',
+                    'comment': sym.comment.strip(),
+                    'path': self._get_symbol_path(sym.name)
+                })
 
             # Baue hierarchische Struktur
             self._build_tree()
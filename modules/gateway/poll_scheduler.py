@@ -0,0 +1,337 @@
+"""
+Poll Scheduler
+Adaptive Poll-Planung pro Variable mit Prioritätsklassen
+
+📁 SPEICHERORT: modules/gateway/poll_scheduler.py
+
+Ersetzt das globale Poll-Intervall mit Round-Robin-Fenster im
+DataGateway-Polling-Loop:
+- Heap nach Fälligkeit (due-Zeit) pro Variable; ein Poll-Zyklus liest nur
+  die fälligen Variablen
+- Klassen fast/normal/slow (Widget-Typ oder explizite Binding-Option) mit
+  eigenem Basis-Intervall relativ zum Poll-Intervall
+- adaptiv: unveränderte Werte verlängern das Intervall schrittweise bis zum
+  Klassen-Maximum, eine Änderung setzt es auf das Basis-Intervall zurück
+- Poll-Budget als Token-Bucket (max_subscribed_variables_per_poll Reads pro
+  Basis-Intervall); was nicht ins Budget passt, wandert in die Backlog-Queue
+  seiner Klasse und wird als Lag/Backlog sichtbar (inkrementell gezählt,
+  kein Heap-Scan pro Zyklus); `skipped` zählt jede Variable einmal pro
+  Fälligkeit, die sie auf das Budget warten musste
+
+Wird nur vom Poll-Thread verändert; get_stats() liest unter Lock.
+"""
+
+import heapq
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+POLL_CLASSES = ('fast', 'normal', 'slow')
+DEFAULT_POLL_CLASS = 'normal'
+
+# Basis-Intervall als Faktor des Poll-Intervalls und max. Backoff-Faktor
+CLASS_INTERVAL_FACTORS = {'fast': 0.5, 'normal': 1.0, 'slow': 10.0}
+CLASS_MAX_BACKOFF = {'fast': 2.0, 'normal': 8.0, 'slow': 3.0}
+BACKOFF_FACTOR = 1.5
+
+# Widget-Typ → Klasse (Schalter/Status reagieren sofort, Trends dürfen träge sein)
+WIDGET_POLL_CLASSES = {
+    'switch': 'fast', 'boolean': 'fast', 'button': 'fast', 'status': 'fast', 'alarm': 'fast',
+    'slider': 'normal', 'number': 'normal', 'gauge': 'normal', 'text': 'normal',
+    'chart': 'slow', 'trend': 'slow', 'temperature': 'slow', 'climate': 'slow', 'energy': 'slow'
+}
+
+
+def resolve_poll_class(explicit: Optional[str] = None, widget_type: Optional[str] = None) -> str:
+    """Poll-Klasse aus expliziter Binding-Option, sonst aus dem Widget-Typ"""
+    explicit = str(explicit or '').strip().lower()
+    if explicit in POLL_CLASSES:
+        return explicit
+    return WIDGET_POLL_CLASSES.get(str(widget_type or '').strip().lower(), DEFAULT_POLL_CLASS)
+
+
+def fastest_poll_class(classes: Iterable[str]) -> str:
+    """Schnellste Klasse mehrerer Widgets auf derselben Variable"""
+    ranks = [POLL_CLASSES.index(cls) for cls in classes if cls in POLL_CLASSES]
+    return POLL_CLASSES[min(ranks)] if ranks else DEFAULT_POLL_CLASS
+
+
+class _PollEntry:
+    __slots__ = ('poll_class', 'base', 'interval', 'max_interval', 'due', 'version', 'overdue')
+
+    def __init__(self, poll_class: str, base: float, max_interval: float, due: float):
+        self.poll_class = poll_class
+        self.base = base
+        self.interval = base
+        self.max_interval = max_interval
+        self.due = due
+        self.version = 0
+        self.overdue = 0  # pop_due()-Zyklus, seit dem die Variable im Backlog wartet (0 = nicht)
+
+
+class PollScheduler:
+    """
+    Fälligkeits-Heap über abonnierte Variablen
+
+    Args:
+        base_interval: Poll-Intervall der Klasse normal (Sekunden)
+        budget: Max. Reads pro base_interval
+    """
+
+    def __init__(self, base_interval: float = 0.5, budget: int = 2000, stats_window: float = 5.0):
+        self.base_interval = max(0.01, float(base_interval))
+        self.budget = max(1, int(budget))
+        self.stats_window = max(0.1, float(stats_window))
+        self._entries: Dict[Hashable, _PollEntry] = {}
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        # Fällig, aber über Budget: FIFO pro Klasse (lazy gelöscht über version)
+        self._overdue: Dict[str, deque] = {cls: deque() for cls in POLL_CLASSES}
+        self._backlog: Dict[str, int] = {cls: 0 for cls in POLL_CLASSES}
+        self._cycle = 0
+        self._lock = threading.Lock()
+
+        self._tokens = float(self.budget)
+        self._last_refill: Optional[float] = None
+        self._window_start: Optional[float] = None
+        self._window_granted = 0.0
+        self._window_used = 0
+        self.utilisation: Optional[float] = None  # letztes abgeschlossenes Fenster
+
+        self.polls = 0
+        self.changes = 0
+        self.deferred = 0
+        self.skipped = 0
+        self.last_skipped = 0
+        self.last_backlog = 0
+        self._class_lag: Dict[str, Dict[str, float]] = {
+            cls: {'lag_ms_avg': 0.0, 'lag_ms_max': 0.0, 'backlog': 0} for cls in POLL_CLASSES
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Planung
+    # ------------------------------------------------------------------
+
+    def set_base_interval(self, base_interval: float):
+        """Neues Poll-Intervall; bestehende Variablen starten mit dem neuen Basis-Intervall"""
+        with self._lock:
+            self.base_interval = max(0.01, float(base_interval))
+            now = time.monotonic()
+            for key, entry in self._entries.items():
+                self._configure(entry, entry.poll_class)
+                self._schedule(key, entry, min(entry.due, now + entry.base))
+
+    def _configure(self, entry: _PollEntry, poll_class: str):
+        entry.poll_class = poll_class
+        entry.base = self.base_interval * CLASS_INTERVAL_FACTORS[poll_class]
+        entry.max_interval = entry.base * CLASS_MAX_BACKOFF[poll_class]
+        entry.interval = entry.base
+
+    def _leave_backlog(self, entry: _PollEntry):
+        if entry.overdue:
+            entry.overdue = 0
+            self._backlog[entry.poll_class] -= 1
+
+    def _schedule(self, key: Hashable, entry: _PollEntry, due: float):
+        # Jede Neuplanung ersetzt den alten Heap-/Backlog-Eintrag (lazy gelöscht über version)
+        self._leave_backlog(entry)
+        entry.version += 1
+        entry.due = due
+        heapq.heappush(self._heap, (due, entry.version, key))
+
+    def sync(self, classes: Dict[Hashable, str], now: Optional[float] = None):
+        """
+        Gleicht die geplanten Variablen mit den Subscriptions ab
+
+        Args:
+            classes: {(plc_id, variable): poll_class} aller abonnierten Variablen
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            for key in [key for key in self._entries if key not in classes]:
+                self._leave_backlog(self._entries.pop(key))
+            for key, poll_class in classes.items():
+                poll_class = poll_class if poll_class in POLL_CLASSES else DEFAULT_POLL_CLASS
+                entry = self._entries.get(key)
+                if entry is None:
+                    entry = self._entries[key] = _PollEntry(poll_class, 0.0, 0.0, now)
+                    self._configure(entry, poll_class)
+                    self._schedule(key, entry, now)
+                elif entry.poll_class != poll_class:
+                    self._leave_backlog(entry)
+                    self._configure(entry, poll_class)
+                    self._schedule(key, entry, min(entry.due, now + entry.base))
+            if len(self._heap) > 4 * len(self._entries) + 64:
+                self._heap = [(entry.due, entry.version, key) for key, entry in self._entries.items()]
+                heapq.heapify(self._heap)
+            for cls, queue in self._overdue.items():
+                if len(queue) > 2 * self._backlog[cls] + 64:
+                    self._overdue[cls] = deque(item for item in queue if self._valid(item))
+
+    def _refill(self, now: float):
+        if self._last_refill is None:
+            self._last_refill = now
+            self._window_start = now
+            return
+        elapsed = max(0.0, now - self._last_refill)
+        self._last_refill = now
+        granted = self.budget * elapsed / self.base_interval
+        self._tokens = min(float(self.budget), self._tokens + granted)
+        self._window_granted += granted
+
+    def _valid(self, item: Tuple[float, int, Hashable]) -> bool:
+        entry = self._entries.get(item[2])
+        return entry is not None and entry.version == item[1]
+
+    def _backlog_front(self, poll_class: str) -> Optional[Tuple[float, int, Hashable]]:
+        queue = self._overdue[poll_class]
+        while queue and not self._valid(queue[0]):
+            queue.popleft()
+        return queue[0] if queue else None
+
+    def pop_due(self, now: Optional[float] = None) -> List[Hashable]:
+        """Fällige Variablen (früheste zuerst), begrenzt durch das Poll-Budget"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._refill(now)
+            self._cycle += 1
+            cycle = self._cycle
+
+            # Neu fällige Variablen einmal pro Fälligkeit in den Backlog ihrer Klasse
+            heap = self._heap
+            became_due = 0
+            while heap and heap[0][0] <= now:
+                item = heapq.heappop(heap)
+                if not self._valid(item):
+                    continue
+                entry = self._entries[item[2]]
+                entry.overdue = cycle
+                self._overdue[entry.poll_class].append(item)
+                self._backlog[entry.poll_class] += 1
+                became_due += 1
+
+            # Früheste Fälligkeit über alle Klassen zuerst, bis das Budget erschöpft ist
+            limit = int(self._tokens)
+            batch = []
+            served_new = 0
+            cycle_max = {cls: 0.0 for cls in POLL_CLASSES}
+            while len(batch) < limit:
+                fronts = [(item[0], cls) for cls in POLL_CLASSES
+                          for item in (self._backlog_front(cls),) if item is not None]
+                if not fronts:
+                    break
+                due, poll_class = min(fronts)
+                key = self._overdue[poll_class].popleft()[2]
+                entry = self._entries[key]
+                if entry.overdue == cycle:
+                    served_new += 1
+                self._leave_backlog(entry)
+                batch.append(key)
+                lag_ms = (now - due) * 1000.0
+                lag = self._class_lag[poll_class]
+                lag['lag_ms_avg'] += 0.2 * (lag_ms - lag['lag_ms_avg'])
+                cycle_max[poll_class] = max(cycle_max[poll_class], lag_ms)
+            self._tokens -= len(batch)
+            self.polls += len(batch)
+
+            # Rest wartet auf Budget: Backlog als Gauge, Skips einmal pro Fälligkeit
+            self.last_skipped = became_due - served_new
+            self.skipped += self.last_skipped
+            self.last_backlog = sum(self._backlog.values())
+            for cls in POLL_CLASSES:
+                oldest = self._backlog_front(cls)
+                if oldest is not None:
+                    cycle_max[cls] = max(cycle_max[cls], (now - oldest[0]) * 1000.0)
+                self._class_lag[cls]['lag_ms_max'] = cycle_max[cls]
+                self._class_lag[cls]['backlog'] = self._backlog[cls]
+
+            self._window_used += len(batch)
+            if now - self._window_start >= self.stats_window:
+                granted = self._window_granted
+                self.utilisation = min(1.0, self._window_used / granted) if granted > 0 else 0.0
+                self._window_start = now
+                self._window_granted = 0.0
+                self._window_used = 0
+            return batch
+
+    def report(self, key: Hashable, changed: bool, now: Optional[float] = None):
+        """Ergebnis eines Polls: Änderung → Basis-Intervall, sonst Backoff"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            if changed:
+                self.changes += 1
+                entry.interval = entry.base
+            else:
+                entry.interval = min(entry.interval * BACKOFF_FACTOR, entry.max_interval)
+            self._schedule(key, entry, now + entry.interval)
+
+    def defer(self, key: Hashable, now: Optional[float] = None):
+        """Variable diesmal nicht gelesen (z.B. per Notification bedient)"""
+        self.deferred += 1
+        self.report(key, False, now)
+
+    def retry(self, key: Hashable, now: Optional[float] = None):
+        """Variable nicht gelesen (z.B. Read-Timeout): gleiches Intervall, kein Backoff"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._schedule(key, entry, now + entry.interval)
+
+    def next_due(self) -> Optional[float]:
+        """Früheste Fälligkeit (monotonic) oder None ohne geplante Variablen"""
+        with self._lock:
+            backlog = [item[0] for item in map(self._backlog_front, POLL_CLASSES) if item is not None]
+            if backlog:
+                return min(backlog)
+            while self._heap:
+                due, version, key = self._heap[0]
+                entry = self._entries.get(key)
+                if entry is not None and entry.version == version:
+                    return due
+                heapq.heappop(self._heap)
+            return None
+
+    def interval_of(self, key: Hashable) -> Optional[float]:
+        entry = self._entries.get(key)
+        return entry.interval if entry is not None else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            classes = {}
+            for cls in POLL_CLASSES:
+                entries = [entry for entry in self._entries.values() if entry.poll_class == cls]
+                lag = self._class_lag[cls]
+                classes[cls] = {
+                    'variables': len(entries),
+                    'base_interval_ms': round(self.base_interval * CLASS_INTERVAL_FACTORS[cls] * 1000.0, 1),
+                    'avg_interval_ms': round(
+                        sum(entry.interval for entry in entries) / len(entries) * 1000.0, 1
+                    ) if entries else 0.0,
+                    'lag_ms_avg': round(lag['lag_ms_avg'], 2),
+                    'lag_ms_max': round(lag['lag_ms_max'], 2),
+                    'backlog': int(lag['backlog'])
+                }
+            utilisation = self.utilisation
+            if utilisation is None:
+                # Noch kein Fenster abgeschlossen → laufendes Fenster
+                granted = self._window_granted
+                utilisation = min(1.0, self._window_used / granted) if granted > 0 else 0.0
+            return {
+                'scheduled': len(self._entries),
+                'budget_per_interval': self.budget,
+                'base_interval_ms': round(self.base_interval * 1000.0, 1),
+                'utilisation': round(utilisation, 3),
+                'polls': self.polls,
+                'changes': self.changes,
+                'deferred': self.deferred,
+                'skipped': self.skipped,
+                'backlog': self.last_backlog,
+                'classes': classes
+            }
@@ -10,11 +10,214 @@ import sqlite3
 import threading
 import time
 from collections import deque
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional, Set
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import requests
 
+SQLITE_INSERT_SQL = """
+    INSERT OR IGNORE INTO ring_events (
+        id, cam_id, camera_name, device_id, kind, trigger,
+        created_at, created_at_local, ding_ts, answered, state, source,
+        payload_json, stored_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class _RetentionSchedule:
+    """Amortisierte Retention: fällig nach `every` Inserts oder `interval` Sekunden mit neuen Inserts"""
+
+    def __init__(self, every: int, interval: float):
+        self.every = max(1, int(every))
+        self.interval = max(0.0, float(interval))
+        self.pending = 0
+        self.last_run = time.monotonic()
+        self.runs = 0
+        self.deleted = 0
+
+    def add(self, inserted: int) -> None:
+        self.pending += max(0, int(inserted))
+
+    def due(self) -> bool:
+        if self.pending >= self.every:
+            return True
+        return self.pending > 0 and time.monotonic() - self.last_run >= self.interval
+
+    def done(self, deleted: int) -> None:
+        self.pending = 0
+        self.last_run = time.monotonic()
+        self.runs += 1
+        self.deleted += max(0, int(deleted))
+
+
+class _SQLiteEventWriter:
+    """
+    Langlebige Verbindung (WAL) zu einer ring_events-DB
+
+    - Schema wird einmal beim Öffnen angelegt
+    - insert(): alle Zeilen per executemany in einer Transaktion
+    - Retention amortisiert über Rowid-Grenzen (behält die zuletzt
+      eingefügten max_entries Zeilen, ohne COUNT und Sortierung)
+
+    Zugriff nur unter dem SQLite-Lock des Stores.
+    """
+
+    def __init__(self, db_path: str, init_schema: Callable[[sqlite3.Connection], None], retention: _RetentionSchedule):
+        self.db_path = db_path
+        self._init_schema = init_schema
+        self.retention = retention
+        self.conn: Optional[sqlite3.Connection] = None
+        self.batches = 0
+        self.inserted = 0
+
+    def connection(self) -> sqlite3.Connection:
+        # Datei extern gelöscht → neu anlegen statt in den verwaisten Inode zu schreiben
+        if self.conn is not None and not os.path.exists(self.db_path):
+            self.close()
+        if self.conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=5.0, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._init_schema(conn)
+            self.conn = conn
+        return self.conn
+
+    def insert(self, rows: List[Tuple[Any, ...]]) -> int:
+        conn = self.connection()
+        before = conn.total_changes
+        with conn:
+            conn.executemany(SQLITE_INSERT_SQL, rows)
+        inserted = conn.total_changes - before
+        self.batches += 1
+        self.inserted += inserted
+        self.retention.add(inserted)
+        return inserted
+
+    def enforce_retention(self, max_entries: int, force: bool = False) -> int:
+        if not force and not self.retention.due():
+            return 0
+        conn = self.connection()
+        row = conn.execute(
+            "SELECT rowid FROM ring_events ORDER BY rowid DESC LIMIT 1 OFFSET ?", (max_entries,)
+        ).fetchone()
+        deleted = 0
+        if row is not None:
+            with conn:
+                deleted = conn.execute("DELETE FROM ring_events WHERE rowid <= ?", (row[0],)).rowcount
+        self.retention.done(deleted)
+        return deleted
+
+    def close(self) -> None:
+        if self.conn is not None:
+            try:
+                self.conn.close()
+            except Exception:
+                pass
+            self.conn = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "path": self.db_path,
+            "open": self.conn is not None,
+            "batches": self.batches,
+            "inserted": self.inserted,
+            "retention_runs": self.retention.runs,
+            "retention_deleted": self.retention.deleted,
+            "retention_pending": self.retention.pending,
+        }
+
+
+class _MySQLConnectionPool:
+    """
+    Kleiner Verbindungspool für das MySQL-Backend (eine Server-/Login-Konfiguration)
+
+    Bis zu `size` Verbindungen bleiben offen und werden vor der Wiederverwendung
+    per ping geprüft; bei Fehlern wird die Verbindung verworfen. Das Schema
+    wird je Tabelle einmal angelegt.
+    """
+
+    def __init__(self, connect: Callable[[], Tuple[Any, str]], size: int, retention: _RetentionSchedule):
+        self._connect = connect
+        self.size = max(1, int(size))
+        self.retention = retention
+        self.schema_tables: Set[str] = set()
+        self._idle: deque = deque()
+        self._lock = threading.Lock()
+        self._closed = False
+        self.stats = {"created": 0, "reused": 0, "discarded": 0, "batches": 0, "inserted": 0}
+
+    @contextmanager
+    def connection(self) -> Iterator[Tuple[Any, str]]:
+        conn = None
+        driver = ""
+        with self._lock:
+            if self._idle:
+                conn, driver = self._idle.pop()
+        if conn is not None:
+            try:
+                conn.ping(reconnect=True)
+                self._count("reused")
+            except Exception:
+                self._discard(conn)
+                conn = None
+        if conn is None:
+            conn, driver = self._connect()
+            self._count("created")
+        try:
+            yield conn, driver
+        except Exception:
+            self._discard(conn)
+            raise
+        with self._lock:
+            if not self._closed and len(self._idle) < self.size:
+                self._idle.append((conn, driver))
+                return
+        self._discard(conn)
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[key] += amount
+
+    def record_batch(self, inserted: int) -> None:
+        with self._lock:
+            self.stats["batches"] += 1
+            self.stats["inserted"] += inserted
+        self.retention.add(inserted)
+
+    def _discard(self, conn: Any) -> None:
+        self._count("discarded")
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+        for conn, _driver in idle:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            idle = len(self._idle)
+            stats = dict(self.stats)
+        return {
+            "size": self.size,
+            "idle": idle,
+            **stats,
+            "retention_runs": self.retention.runs,
+            "retention_deleted": self.retention.deleted,
+            "retention_pending": self.retention.pending,
+        }
+
 
 class RingEventStore:
     SUPPORTED_BACKENDS = {"memory", "sqlite", "influxdb"}
@@ -29,6 +232,14 @@ class RingEventStore:
         self._memory = deque(maxlen=2000)
         self._memory_meta: Dict[str, Any] = {}
         self._status_note = ""
+        # Persistente Backend-Verbindungen (Schema einmalig, gebündelte Writes)
+        self._sqlite_writers: Dict[str, _SQLiteEventWriter] = {}
+        self._mysql_lock = threading.Lock()
+        self._mysql_pool: Optional[_MySQLConnectionPool] = None
+        self._mysql_pool_key: Optional[Tuple[Any, ...]] = None
+        self.retention_every = int(os.getenv("SMARTHOME_RING_EVENT_RETENTION_EVERY", "100"))
+        self.retention_interval = float(os.getenv("SMARTHOME_RING_EVENT_RETENTION_SECONDS", "60"))
+        self.mysql_pool_size = int(os.getenv("SMARTHOME_RING_EVENT_MYSQL_POOL_SIZE", "3"))
 
     @classmethod
     def default_config(cls) -> Dict[str, Any]:
@@ -114,7 +325,7 @@ class RingEventStore:
         active_backend = self._resolve_runtime_backend(normalized)
         if active_backend == "sqlite":
             self._init_sqlite_schema(self._resolve_sqlite_path(normalized))
-            self._enforce_sqlite_retention(normalized)
+            self._enforce_sqlite_retention(normalized, force=True)
         elif active_backend == "mysql":
             self._init_mysql_schema(normalized)
         return self.get_status(normalized)
@@ -172,31 +383,77 @@ class RingEventStore:
         }
 
     def record_event(self, event: Dict[str, Any], config: Optional[Dict[str, Any]]) -> bool:
+        return self.record_events([event], config) > 0
+
+    def record_events(self, events: Iterable[Dict[str, Any]], config: Optional[Dict[str, Any]]) -> int:
+        """Speichert mehrere Events gebündelt (SQLite/MySQL: eine Transaktion, InfluxDB: ein Request).
+
+        Returns:
+            Anzahl übernommener Events mit ID (bereits gespeicherte werden ignoriert)
+        """
         normalized = self.normalize_config(config)
         active = self._resolve_runtime_backend(normalized)
-        entry = self._normalize_event(event)
-        if not entry.get("id"):
-            return False
+        entries = [entry for entry in (self._normalize_event(event) for event in events) if entry.get("id")]
+        if not entries:
+            return 0
 
         try:
-            if active == "sqlite":
-                self._write_sqlite_event(entry, normalized)
-                return True
-            if active == "mysql":
-                self._write_mysql_event(entry, normalized)
-                return True
-            if active == "influxdb":
-                self._write_influxdb_event(entry, normalized)
-                return True
-            self._write_memory_event(entry, normalized)
+            self._write_backend_events(active, entries, normalized)
         except Exception as exc:
+            self._reset_backend(active, normalized)
             fallback = self._fallback_backend_after_runtime_error(active)
             self._status_note = f"{active} ist derzeit nicht erreichbar ({exc}). Fallback: {fallback}."
-            if fallback == "sqlite":
-                self._write_sqlite_event(entry, normalized)
-            elif fallback == "memory":
-                self._write_memory_event(entry, normalized)
-        return True
+            self._write_backend_events(fallback, entries, normalized)
+        return len(entries)
+
+    def _write_backend_events(self, backend: str, entries: List[Dict[str, Any]], config: Dict[str, Any]) -> None:
+        if backend == "sqlite":
+            self._write_sqlite_events(entries, config)
+        elif backend == "mysql":
+            self._write_mysql_events(entries, config)
+        elif backend == "influxdb":
+            self._write_influxdb_events(entries, config)
+        else:
+            for entry in entries:
+                self._write_memory_event(entry, config)
+
+    def _reset_backend(self, backend: str, config: Dict[str, Any]) -> None:
+        """Verwirft gecachte Verbindung/Schema nach einem Fehler (nächster Zugriff baut neu auf)"""
+        if backend == "sqlite":
+            with self._sqlite_lock:
+                writer = self._sqlite_writers.pop(self._resolve_sqlite_path(config), None)
+                if writer is not None:
+                    writer.close()
+        elif backend == "mysql":
+            with self._mysql_lock:
+                pool, self._mysql_pool, self._mysql_pool_key = self._mysql_pool, None, None
+            if pool is not None:
+                pool.close()
+
+    def close(self) -> None:
+        """Schließt alle offenen Backend-Verbindungen"""
+        with self._sqlite_lock:
+            writers = list(self._sqlite_writers.values())
+            self._sqlite_writers.clear()
+            for writer in writers:
+                writer.close()
+        with self._mysql_lock:
+            pool, self._mysql_pool, self._mysql_pool_key = self._mysql_pool, None, None
+        if pool is not None:
+            pool.close()
+
+    def get_writer_stats(self) -> Dict[str, Any]:
+        """Zähler der persistenten Writer (Batches, Retention-Läufe, Pool)"""
+        with self._sqlite_lock:
+            sqlite_stats = [writer.get_stats() for writer in self._sqlite_writers.values()]
+        with self._mysql_lock:
+            pool = self._mysql_pool
+        return {
+            "sqlite": sqlite_stats,
+            "mysql": pool.get_stats() if pool is not None else None,
+            "retention_every": self.retention_every,
+            "retention_interval_seconds": self.retention_interval,
+        }
 
     def list_events(
         self,
@@ -223,6 +480,54 @@ class RingEventStore:
                 return self._read_sqlite_events(requested_limit, kind_filter, normalized)
             return self._read_memory_events(requested_limit, kind_filter)
 
+    def iter_events(
+        self,
+        kinds: Optional[Iterable[str]],
+        config: Optional[Dict[str, Any]],
+        limit: Optional[int] = None,
+        chunk_size: int = 500,
+    ) -> Iterator[Dict[str, Any]]:
+        """Alle gespeicherten Events als Generator (Streaming-Export), Reihenfolge wie list_events.
+
+        SQLite/MySQL lesen in Keyset-Bloecken von chunk_size Zeilen; zwischen den
+        Bloecken bleiben weder Lock noch Lesetransaktion offen.
+        """
+        normalized = self.normalize_config(config)
+        kind_filter = {str(item or "").strip().lower() for item in (kinds or set()) if str(item or "").strip()}
+        remaining = None if limit is None else max(0, int(limit))
+        chunk_size = max(1, int(chunk_size))
+        active = self._resolve_runtime_backend(normalized)
+        produced = False
+        try:
+            for item in self._iter_backend_events(active, remaining, kind_filter, normalized, chunk_size):
+                produced = True
+                yield item
+        except Exception as exc:
+            if produced:
+                raise
+            fallback = self._fallback_backend_after_runtime_error(active)
+            self._status_note = f"{active} ist derzeit nicht erreichbar ({exc}). Fallback: {fallback}."
+            yield from self._iter_backend_events(fallback, remaining, kind_filter, normalized, chunk_size)
+
+    def _iter_backend_events(
+        self,
+        backend: str,
+        limit: Optional[int],
+        kind_filter: Set[str],
+        config: Dict[str, Any],
+        chunk_size: int,
+    ) -> Iterator[Dict[str, Any]]:
+        if backend == "sqlite":
+            return self._iter_sqlite_events(limit, kind_filter, config, chunk_size)
+        if backend == "mysql":
+            return self._iter_mysql_events(limit, kind_filter, config, chunk_size)
+        if backend == "influxdb":
+            # Flux-Query liefert ohnehin ein begrenztes Ergebnis (max_entries)
+            return iter(self._read_influxdb_events(limit or config["max_entries"], kind_filter, config))
+        with self._memory_lock:
+            size = len(self._memory)
+        return iter(self._read_memory_events(min(limit, size) if limit is not None else size, kind_filter))
+
     def record_health_status(self, snapshot: Dict[str, Any], config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         normalized = self.normalize_config(config)
         active = self._resolve_runtime_backend(normalized)
@@ -369,58 +674,79 @@ class RingEventStore:
             conn = mysql.connector.connect(**connection_args)
             return conn, "mysql.connector"
 
+    def _get_mysql_pool(self, config: Dict[str, Any]) -> _MySQLConnectionPool:
+        mysql_cfg = config.get("mysql") if isinstance(config.get("mysql"), dict) else {}
+        key = tuple(mysql_cfg.get(name) for name in ("host", "port", "user", "password", "database"))
+        stale = None
+        with self._mysql_lock:
+            if self._mysql_pool is None or self._mysql_pool_key != key:
+                stale = self._mysql_pool
+                self._mysql_pool = _MySQLConnectionPool(
+                    lambda: self._connect_mysql(config),
+                    self.mysql_pool_size,
+                    _RetentionSchedule(self.retention_every, self.retention_interval),
+                )
+                self._mysql_pool_key = key
+            pool = self._mysql_pool
+        if stale is not None:
+            stale.close()
+        return pool
+
+    def _mysql_connection(self, config: Dict[str, Any]):
+        return self._get_mysql_pool(config).connection()
+
     def _mysql_table_name(self, config: Dict[str, Any]) -> str:
         mysql_cfg = config.get("mysql") if isinstance(config.get("mysql"), dict) else {}
         table = str(mysql_cfg.get("table") or "ring_events").strip() or "ring_events"
         return "".join(ch for ch in table if ch.isalnum() or ch == "_") or "ring_events"
 
     def _init_mysql_schema(self, config: Dict[str, Any]) -> None:
-        conn, driver = self._connect_mysql(config)
+        pool = self._get_mysql_pool(config)
         table = self._mysql_table_name(config)
+        if table in pool.schema_tables:
+            return
         meta_table = f"{table}_meta"
-        try:
+        with pool.connection() as (conn, driver):
             cursor = conn.cursor()
-            cursor.execute(
-                f"""
-                CREATE TABLE IF NOT EXISTS `{table}` (
-                    id VARCHAR(191) PRIMARY KEY,
-                    cam_id VARCHAR(191) NOT NULL,
-                    camera_name VARCHAR(255) NOT NULL,
-                    device_id VARCHAR(191) NOT NULL,
-                    kind VARCHAR(64) NOT NULL,
-                    trigger_name VARCHAR(64) NOT NULL,
-                    created_at VARCHAR(64) NULL,
-                    created_at_local VARCHAR(64) NULL,
-                    ding_ts DOUBLE NULL,
-                    answered TINYINT NULL,
-                    state VARCHAR(64) NULL,
-                    source VARCHAR(64) NOT NULL,
-                    payload_json LONGTEXT NOT NULL,
-                    stored_at DOUBLE NOT NULL,
-                    INDEX idx_ring_events_ding_ts (ding_ts),
-                    INDEX idx_ring_events_kind (kind),
-                    INDEX idx_ring_events_stored_at (stored_at)
-                ) CHARACTER SET utf8mb4
-                """
-            )
-            cursor.execute(
-                f"""
-                CREATE TABLE IF NOT EXISTS `{meta_table}` (
-                    meta_key VARCHAR(191) PRIMARY KEY,
-                    meta_value LONGTEXT NOT NULL,
-                    updated_at DOUBLE NOT NULL,
-                    INDEX idx_ring_event_meta_updated_at (updated_at)
-                ) CHARACTER SET utf8mb4
-                """
-            )
-            if driver == "mysql.connector":
-                conn.commit()
-        finally:
             try:
+                cursor.execute(
+                    f"""
+                    CREATE TABLE IF NOT EXISTS `{table}` (
+                        id VARCHAR(191) PRIMARY KEY,
+                        cam_id VARCHAR(191) NOT NULL,
+                        camera_name VARCHAR(255) NOT NULL,
+                        device_id VARCHAR(191) NOT NULL,
+                        kind VARCHAR(64) NOT NULL,
+                        trigger_name VARCHAR(64) NOT NULL,
+                        created_at VARCHAR(64) NULL,
+                        created_at_local VARCHAR(64) NULL,
+                        ding_ts DOUBLE NULL,
+                        answered TINYINT NULL,
+                        state VARCHAR(64) NULL,
+                        source VARCHAR(64) NOT NULL,
+                        payload_json LONGTEXT NOT NULL,
+                        stored_at DOUBLE NOT NULL,
+                        INDEX idx_ring_events_ding_ts (ding_ts),
+                        INDEX idx_ring_events_kind (kind),
+                        INDEX idx_ring_events_stored_at (stored_at)
+                    ) CHARACTER SET utf8mb4
+                    """
+                )
+                cursor.execute(
+                    f"""
+                    CREATE TABLE IF NOT EXISTS `{meta_table}` (
+                        meta_key VARCHAR(191) PRIMARY KEY,
+                        meta_value LONGTEXT NOT NULL,
+                        updated_at DOUBLE NOT NULL,
+                        INDEX idx_ring_event_meta_updated_at (updated_at)
+                    ) CHARACTER SET utf8mb4
+                    """
+                )
+                if driver == "mysql.connector":
+                    conn.commit()
+            finally:
                 cursor.close()
-            except Exception:
-                pass
-            conn.close()
+        pool.schema_tables.add(table)
 
     def _resolve_sqlite_path(self, config: Dict[str, Any]) -> str:
         sqlite_cfg = config.get("sqlite") if isinstance(config.get("sqlite"), dict) else {}
@@ -479,87 +805,82 @@ class RingEventStore:
                 break
         return result
 
-    def _write_mysql_event(self, event: Dict[str, Any], config: Dict[str, Any]) -> None:
+    def _event_row(self, event: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Spaltenwerte eines Events für SQLite/MySQL (gleiche Reihenfolge wie die INSERTs)"""
+        return (
+            event["id"],
+            event.get("cam_id") or "",
+            event.get("camera_name") or "",
+            event.get("device_id") or "",
+            event.get("kind") or "unknown",
+            event.get("trigger") or event.get("kind") or "unknown",
+            event.get("created_at"),
+            event.get("created_at_local"),
+            event.get("ding_ts"),
+            self._to_nullable_int(event.get("answered")),
+            str(event.get("state")) if event.get("state") is not None else None,
+            event.get("source") or "ring_api",
+            json.dumps(event, ensure_ascii=False),
+            time.time(),
+        )
+
+    def _write_mysql_events(self, events: List[Dict[str, Any]], config: Dict[str, Any]) -> None:
         self._init_mysql_schema(config)
-        conn, driver = self._connect_mysql(config)
+        pool = self._get_mysql_pool(config)
         table = self._mysql_table_name(config)
-        try:
+        rows = [self._event_row(event) for event in events]
+        with pool.connection() as (conn, driver):
             cursor = conn.cursor()
-            cursor.execute(
-                f"""
-                INSERT IGNORE INTO `{table}` (
-                    id, cam_id, camera_name, device_id, kind, trigger_name,
-                    created_at, created_at_local, ding_ts, answered, state, source,
-                    payload_json, stored_at
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """,
-                (
-                    event["id"],
-                    event.get("cam_id") or "",
-                    event.get("camera_name") or "",
-                    event.get("device_id") or "",
-                    event.get("kind") or "unknown",
-                    event.get("trigger") or event.get("kind") or "unknown",
-                    event.get("created_at"),
-                    event.get("created_at_local"),
-                    event.get("ding_ts"),
-                    self._to_nullable_int(event.get("answered")),
-                    str(event.get("state")) if event.get("state") is not None else None,
-                    event.get("source") or "ring_api",
-                    json.dumps(event, ensure_ascii=False),
-                    time.time(),
-                ),
-            )
-            if driver == "mysql.connector":
-                conn.commit()
-            self._enforce_mysql_retention(config, conn=conn, cursor=cursor, driver=driver)
-        finally:
             try:
-                cursor.close()
-            except Exception:
-                pass
-            conn.close()
-
-    def _enforce_mysql_retention(self, config: Dict[str, Any], conn=None, cursor=None, driver: str = "") -> None:
-        own_connection = conn is None or cursor is None
-        if own_connection:
-            conn, driver = self._connect_mysql(config)
-            cursor = conn.cursor()
-        table = self._mysql_table_name(config)
-        max_entries = max(100, min(int(config.get("max_entries") or 2000), 50000))
-        try:
-            cursor.execute(f"SELECT COUNT(*) AS count FROM `{table}`")
-            row = cursor.fetchone()
-            total = int((row.get("count") if isinstance(row, dict) else row[0]) or 0)
-            if total > max_entries:
-                cursor.execute(
+                cursor.executemany(
                     f"""
-                    DELETE FROM `{table}`
-                    WHERE id NOT IN (
-                        SELECT id FROM (
-                            SELECT id FROM `{table}`
-                            ORDER BY COALESCE(ding_ts, 0) DESC, COALESCE(created_at, '') DESC, stored_at DESC
-                            LIMIT %s
-                        ) keep_rows
-                    )
+                    INSERT IGNORE INTO `{table}` (
+                        id, cam_id, camera_name, device_id, kind, trigger_name,
+                        created_at, created_at_local, ding_ts, answered, state, source,
+                        payload_json, stored_at
+                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                     """,
-                    (max_entries,),
+                    rows,
                 )
+                inserted = max(0, int(cursor.rowcount or 0))
                 if driver == "mysql.connector":
                     conn.commit()
-        finally:
-            if own_connection:
+                pool.record_batch(inserted)
+                if pool.retention.due():
+                    self._enforce_mysql_retention(config, conn=conn, cursor=cursor, driver=driver)
+            finally:
+                cursor.close()
+
+    def _enforce_mysql_retention(self, config: Dict[str, Any], conn=None, cursor=None, driver: str = "") -> None:
+        """Löscht alles vor dem stored_at der max_entries-neuesten Zeile (Index-Bereich statt COUNT + NOT IN)"""
+        if conn is None or cursor is None:
+            with self._mysql_connection(config) as (own_conn, own_driver):
+                own_cursor = own_conn.cursor()
                 try:
-                    cursor.close()
-                except Exception:
-                    pass
-                conn.close()
+                    self._enforce_mysql_retention(config, conn=own_conn, cursor=own_cursor, driver=own_driver)
+                finally:
+                    own_cursor.close()
+            return
+        table = self._mysql_table_name(config)
+        max_entries = max(100, min(int(config.get("max_entries") or 2000), 50000))
+        cursor.execute(
+            f"SELECT stored_at FROM `{table}` ORDER BY stored_at DESC LIMIT 1 OFFSET %s",
+            (max_entries - 1,),
+        )
+        row = cursor.fetchone()
+        deleted = 0
+        if row:
+            bound = row.get("stored_at") if isinstance(row, dict) else row[0]
+            cursor.execute(f"DELETE FROM `{table}` WHERE stored_at < %s", (bound,))
+            deleted = max(0, int(cursor.rowcount or 0))
+            if driver == "mysql.connector":
+                conn.commit()
+        self._get_mysql_pool(config).retention.done(deleted)
 
     def _read_mysql_events(self, limit: int, kind_filter: Set[str], config: Dict[str, Any]) -> List[Dict[str, Any]]:
-        conn, _driver = self._connect_mysql(config)
         table = self._mysql_table_name(config)
         result: List[Dict[str, Any]] = []
-        try:
+        with self._mysql_connection(config) as (conn, _driver):
             cursor = conn.cursor()
             query = f"SELECT payload_json FROM `{table}`"
             params: List[Any] = []
@@ -569,70 +890,108 @@ class RingEventStore:
                 params.extend(sorted(kind_filter))
             query += " ORDER BY COALESCE(ding_ts, 0) DESC, COALESCE(created_at, '') DESC, stored_at DESC LIMIT %s"
             params.append(limit)
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            for row in rows:
-                payload_json = row.get("payload_json") if isinstance(row, dict) else row[0]
-                try:
-                    item = json.loads(payload_json) if payload_json else {}
-                except Exception:
-                    item = {}
-                if isinstance(item, dict) and item.get("id"):
-                    result.append(self._normalize_event(item))
-        finally:
             try:
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+            finally:
                 cursor.close()
+        for row in rows:
+            payload_json = row.get("payload_json") if isinstance(row, dict) else row[0]
+            try:
+                item = json.loads(payload_json) if payload_json else {}
             except Exception:
-                pass
-            conn.close()
+                item = {}
+            if isinstance(item, dict) and item.get("id"):
+                result.append(self._normalize_event(item))
         return result
 
+    def _iter_mysql_events(
+        self, limit: Optional[int], kind_filter: Set[str], config: Dict[str, Any], chunk_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        table = self._mysql_table_name(config)
+        order_key = "COALESCE(ding_ts, 0), COALESCE(created_at, ''), stored_at, id"
+        after: Optional[List[Any]] = None
+        remaining = limit
+        while remaining != 0:
+            batch = chunk_size if remaining is None else min(chunk_size, remaining)
+            where: List[str] = []
+            params: List[Any] = []
+            if kind_filter:
+                where.append(f"LOWER(kind) IN ({', '.join(['%s'] * len(kind_filter))})")
+                params.extend(sorted(kind_filter))
+            if after is not None:
+                where.append(f"({order_key}) < (%s, %s, %s, %s)")
+                params.extend(after)
+            query = f"SELECT payload_json, {order_key} FROM `{table}`"
+            if where:
+                query += " WHERE " + " AND ".join(where)
+            query += " ORDER BY COALESCE(ding_ts, 0) DESC, COALESCE(created_at, '') DESC, stored_at DESC, id DESC LIMIT %s"
+            params.append(batch)
+
+            with self._mysql_connection(config) as (conn, _driver):
+                cursor = conn.cursor()
+                try:
+                    cursor.execute(query, params)
+                    rows = [list(row.values()) if isinstance(row, dict) else list(row) for row in cursor.fetchall()]
+                finally:
+                    cursor.close()
+
+            for row in rows:
+                item = self._parse_payload(row[0])
+                if item is not None:
+                    yield item
+            if len(rows) < batch:
+                return
+            after = rows[-1][1:]
+            if remaining is not None:
+                remaining -= len(rows)
+
+    def _parse_payload(self, payload_json: Any) -> Optional[Dict[str, Any]]:
+        try:
+            item = json.loads(payload_json) if payload_json else {}
+        except Exception:
+            item = {}
+        if isinstance(item, dict) and item.get("id"):
+            return self._normalize_event(item)
+        return None
+
     def _write_mysql_health(self, snapshot: Dict[str, Any], config: Dict[str, Any]) -> None:
         self._init_mysql_schema(config)
-        conn, driver = self._connect_mysql(config)
         meta_table = f"{self._mysql_table_name(config)}_meta"
-        try:
+        with self._mysql_connection(config) as (conn, driver):
             cursor = conn.cursor()
-            for key, value in snapshot.items():
-                cursor.execute(
+            try:
+                cursor.executemany(
                     f"""
                     INSERT INTO `{meta_table}` (meta_key, meta_value, updated_at)
                     VALUES (%s, %s, %s)
                     ON DUPLICATE KEY UPDATE meta_value = VALUES(meta_value), updated_at = VALUES(updated_at)
                     """,
-                    (key, json.dumps(value, ensure_ascii=False), time.time()),
+                    [(key, json.dumps(value, ensure_ascii=False), time.time()) for key, value in snapshot.items()],
                 )
-            if driver == "mysql.connector":
-                conn.commit()
-        finally:
-            try:
+                if driver == "mysql.connector":
+                    conn.commit()
+            finally:
                 cursor.close()
-            except Exception:
-                pass
-            conn.close()
 
     def _read_mysql_health(self, config: Dict[str, Any]) -> Dict[str, Any]:
         self._init_mysql_schema(config)
-        conn, _driver = self._connect_mysql(config)
         meta_table = f"{self._mysql_table_name(config)}_meta"
         result: Dict[str, Any] = {}
-        try:
+        with self._mysql_connection(config) as (conn, _driver):
             cursor = conn.cursor()
-            cursor.execute(f"SELECT meta_key, meta_value FROM `{meta_table}`")
-            rows = cursor.fetchall()
-            for row in rows:
-                key = row.get("meta_key") if isinstance(row, dict) else row[0]
-                value = row.get("meta_value") if isinstance(row, dict) else row[1]
-                try:
-                    result[str(key)] = json.loads(value)
-                except Exception:
-                    result[str(key)] = value
-        finally:
             try:
+                cursor.execute(f"SELECT meta_key, meta_value FROM `{meta_table}`")
+                rows = cursor.fetchall()
+            finally:
                 cursor.close()
+        for row in rows:
+            key = row.get("meta_key") if isinstance(row, dict) else row[0]
+            value = row.get("meta_value") if isinstance(row, dict) else row[1]
+            try:
+                result[str(key)] = json.loads(value)
             except Exception:
-                pass
-            conn.close()
+                result[str(key)] = value
         return result
 
     def _influx_headers(self, config: Dict[str, Any], content_type: str) -> Dict[str, str]:
@@ -694,7 +1053,7 @@ class RingEventStore:
                 pass
         return int(time.time() * 1_000_000_000)
 
-    def _write_influxdb_event(self, event: Dict[str, Any], config: Dict[str, Any]) -> None:
+    def _write_influxdb_events(self, events: List[Dict[str, Any]], config: Dict[str, Any]) -> None:
         influx_cfg = config.get("influxdb") if isinstance(config.get("influxdb"), dict) else {}
         url = str(influx_cfg.get("url") or "").rstrip("/")
         org = str(influx_cfg.get("org") or "").strip()
@@ -705,7 +1064,7 @@ class RingEventStore:
             f"{url}/api/v2/write",
             params={"org": org, "bucket": bucket, "precision": "ns"},
             headers=self._influx_headers(config, "text/plain; charset=utf-8"),
-            data=self._event_to_influx_line(event, config).encode("utf-8"),
+            data="\n".join(self._event_to_influx_line(event, config) for event in events).encode("utf-8"),
             timeout=8,
         )
         response.raise_for_status()
@@ -825,14 +1184,29 @@ from(bucket: "{bucket}")
             return False
         return None
 
-    def _connect_sqlite(self, db_path: str):
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+    def _sqlite_writer(self, db_path: str) -> _SQLiteEventWriter:
+        """Persistenter Writer je DB-Pfad (nur unter self._sqlite_lock aufrufen)"""
+        writer = self._sqlite_writers.get(db_path)
+        if writer is None:
+            writer = _SQLiteEventWriter(
+                db_path,
+                self._create_sqlite_schema,
+                _RetentionSchedule(self.retention_every, self.retention_interval),
+            )
+            self._sqlite_writers[db_path] = writer
+        return writer
+
+    def _sqlite_connection(self, db_path: str) -> sqlite3.Connection:
+        """Langlebige Verbindung inkl. Schema (nur unter self._sqlite_lock; `with` = Transaktion)"""
+        return self._sqlite_writer(db_path).connection()
 
     def _init_sqlite_schema(self, db_path: str) -> None:
-        with self._sqlite_lock, self._connect_sqlite(db_path) as conn:
+        with self._sqlite_lock:
+            self._sqlite_connection(db_path)
+
+    @staticmethod
+    def _create_sqlite_schema(conn: sqlite3.Connection) -> None:
+        with conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS ring_events (
@@ -856,6 +1230,14 @@ from(bucket: "{bucket}")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_ring_events_ding_ts ON ring_events(ding_ts DESC)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_ring_events_kind ON ring_events(kind)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_ring_events_stored_at ON ring_events(stored_at DESC)")
+            # Sortierung von list_events/Export (Keyset ohne Sortierlauf)
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_ring_events_order ON ring_events(
+                    COALESCE(ding_ts, 0) DESC, COALESCE(created_at, '') DESC, stored_at DESC, id DESC
+                )
+                """
+            )
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS ring_event_meta (
@@ -866,39 +1248,14 @@ from(bucket: "{bucket}")
                 """
             )
             conn.execute("CREATE INDEX IF NOT EXISTS idx_ring_event_meta_updated_at ON ring_event_meta(updated_at DESC)")
-            conn.commit()
 
-    def _write_sqlite_event(self, event: Dict[str, Any], config: Dict[str, Any]) -> None:
+    def _write_sqlite_events(self, events: List[Dict[str, Any]], config: Dict[str, Any]) -> None:
         db_path = self._resolve_sqlite_path(config)
-        self._init_sqlite_schema(db_path)
-        with self._sqlite_lock, self._connect_sqlite(db_path) as conn:
-            conn.execute(
-                """
-                INSERT OR IGNORE INTO ring_events (
-                    id, cam_id, camera_name, device_id, kind, trigger,
-                    created_at, created_at_local, ding_ts, answered, state, source,
-                    payload_json, stored_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    event["id"],
-                    event.get("cam_id") or "",
-                    event.get("camera_name") or "",
-                    event.get("device_id") or "",
-                    event.get("kind") or "unknown",
-                    event.get("trigger") or event.get("kind") or "unknown",
-                    event.get("created_at"),
-                    event.get("created_at_local"),
-                    event.get("ding_ts"),
-                    self._to_nullable_int(event.get("answered")),
-                    str(event.get("state")) if event.get("state") is not None else None,
-                    event.get("source") or "ring_api",
-                    json.dumps(event, ensure_ascii=False),
-                    time.time(),
-                ),
-            )
-            conn.commit()
-        self._enforce_sqlite_retention(config)
+        rows = [self._event_row(event) for event in events]
+        with self._sqlite_lock:
+            writer = self._sqlite_writer(db_path)
+            writer.insert(rows)
+            writer.enforce_retention(config["max_entries"])
 
     @staticmethod
     def _to_nullable_int(value: Any) -> Optional[int]:
@@ -906,32 +1263,16 @@ from(bucket: "{bucket}")
             return None
         return 1 if bool(value) else 0
 
-    def _enforce_sqlite_retention(self, config: Dict[str, Any]) -> None:
+    def _enforce_sqlite_retention(self, config: Dict[str, Any], force: bool = False) -> None:
         db_path = self._resolve_sqlite_path(config)
         max_entries = max(100, min(int(config.get("max_entries") or 2000), 50000))
-        with self._sqlite_lock, self._connect_sqlite(db_path) as conn:
-            row = conn.execute("SELECT COUNT(*) AS count FROM ring_events").fetchone()
-            total = int(row["count"] or 0)
-            if total <= max_entries:
-                return
-            conn.execute(
-                """
-                DELETE FROM ring_events
-                WHERE id IN (
-                    SELECT id FROM ring_events
-                    ORDER BY COALESCE(ding_ts, 0) DESC, COALESCE(created_at, '') DESC, stored_at DESC
-                    LIMIT -1 OFFSET ?
-                )
-                """,
-                (max_entries,),
-            )
-            conn.commit()
+        with self._sqlite_lock:
+            self._sqlite_writer(db_path).enforce_retention(max_entries, force=force)
 
     def _read_sqlite_events(self, limit: int, kind_filter: Set[str], config: Dict[str, Any]) -> List[Dict[str, Any]]:
         db_path = self._resolve_sqlite_path(config)
         if not os.path.exists(db_path):
             return []
-        self._init_sqlite_schema(db_path)
 
         query = """
             SELECT payload_json
@@ -945,7 +1286,7 @@ from(bucket: "{bucket}")
         query += " ORDER BY COALESCE(ding_ts, 0) DESC, COALESCE(created_at, '') DESC, stored_at DESC LIMIT ?"
         params.append(limit)
 
-        with self._sqlite_lock, self._connect_sqlite(db_path) as conn:
+        with self._sqlite_lock, self._sqlite_connection(db_path) as conn:
             rows = conn.execute(query, params).fetchall()
 
         result: List[Dict[str, Any]] = []
@@ -958,30 +1299,65 @@ from(bucket: "{bucket}")
                 result.append(self._normalize_event(item))
         return result
 
+    def _iter_sqlite_events(
+        self, limit: Optional[int], kind_filter: Set[str], config: Dict[str, Any], chunk_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        db_path = self._resolve_sqlite_path(config)
+        if not os.path.exists(db_path):
+            return
+
+        order_key = "COALESCE(ding_ts, 0), COALESCE(created_at, ''), stored_at, id"
+        after: Optional[List[Any]] = None
+        remaining = limit
+        while remaining != 0:
+            batch = chunk_size if remaining is None else min(chunk_size, remaining)
+            where: List[str] = []
+            params: List[Any] = []
+            if kind_filter:
+                where.append(f"lower(kind) IN ({', '.join('?' for _ in kind_filter)})")
+                params.extend(sorted(kind_filter))
+            if after is not None:
+                where.append(f"({order_key}) < (?, ?, ?, ?)")
+                params.extend(after)
+            query = f"SELECT payload_json, {order_key} FROM ring_events"
+            if where:
+                query += " WHERE " + " AND ".join(where)
+            query += " ORDER BY COALESCE(ding_ts, 0) DESC, COALESCE(created_at, '') DESC, stored_at DESC, id DESC LIMIT ?"
+            params.append(batch)
+
+            with self._sqlite_lock, self._sqlite_connection(db_path) as conn:
+                rows = [tuple(row) for row in conn.execute(query, params).fetchall()]
+
+            for row in rows:
+                item = self._parse_payload(row[0])
+                if item is not None:
+                    yield item
+            if len(rows) < batch:
+                return
+            after = list(rows[-1][1:])
+            if remaining is not None:
+                remaining -= len(rows)
+
     def _write_sqlite_health(self, snapshot: Dict[str, Any], config: Dict[str, Any]) -> None:
         db_path = self._resolve_sqlite_path(config)
-        self._init_sqlite_schema(db_path)
-        with self._sqlite_lock, self._connect_sqlite(db_path) as conn:
-            for key, value in snapshot.items():
-                conn.execute(
-                    """
-                    INSERT INTO ring_event_meta (meta_key, meta_value, updated_at)
-                    VALUES (?, ?, ?)
-                    ON CONFLICT(meta_key) DO UPDATE SET
-                        meta_value = excluded.meta_value,
-                        updated_at = excluded.updated_at
-                    """,
-                    (key, json.dumps(value, ensure_ascii=False), time.time()),
-                )
-            conn.commit()
+        with self._sqlite_lock, self._sqlite_connection(db_path) as conn:
+            conn.executemany(
+                """
+                INSERT INTO ring_event_meta (meta_key, meta_value, updated_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(meta_key) DO UPDATE SET
+                    meta_value = excluded.meta_value,
+                    updated_at = excluded.updated_at
+                """,
+                [(key, json.dumps(value, ensure_ascii=False), time.time()) for key, value in snapshot.items()],
+            )
 
     def _read_sqlite_health(self, config: Dict[str, Any]) -> Dict[str, Any]:
         db_path = self._resolve_sqlite_path(config)
         if not os.path.exists(db_path):
             return {}
-        self._init_sqlite_schema(db_path)
         result: Dict[str, Any] = {}
-        with self._sqlite_lock, self._connect_sqlite(db_path) as conn:
+        with self._sqlite_lock, self._sqlite_connection(db_path) as conn:
             rows = conn.execute("SELECT meta_key, meta_value FROM ring_event_meta").fetchall()
         for row in rows:
             try:
@@ -12,6 +12,10 @@ logger = logging.getLogger(__name__)
 
 RING_LOGIN_URL = "https://account.ring.com/account/login"
 RING_HELP_URL = "https://support.help.ring.com/"
+RING_EVENT_EXPORT_FIELDS = [
+    'id', 'cam_id', 'camera_name', 'device_id', 'kind', 'trigger', 'created_at',
+    'created_at_local', 'ding_ts', 'answered', 'state', 'source',
+]
 
 
 def _find_keyword_in_payload(payload: Any, keywords: set[str]) -> str:
@@ -294,6 +298,27 @@ def register_ring_routes(
             logger.error("Fehler bei GET /api/ring/events: %s", e, exc_info=True)
             return jsonify({'success': False, 'error': str(e), 'events': []}), 500
 
+    @app.route('/api/ring/events/export', methods=['GET'])
+    def ring_export_events():
+        """Gespeicherte Ring-Events chunkweise als ndjson/csv (gzip=1 komprimiert)."""
+        try:
+            from modules.core.stream_export import STREAM_FORMATS
+
+            export_format = str(request.args.get('format', 'ndjson') or 'ndjson').strip().lower()
+            if export_format not in STREAM_FORMATS:
+                return jsonify({'success': False, 'error': f'Format nicht unterstützt: {export_format}'}), 400
+            kinds = [part.strip().lower() for part in str(request.args.get('kinds', '') or '').split(',') if part.strip()]
+            limit = request.args.get('limit', 0, type=int)
+            compress = str(request.args.get('gzip', '0')).strip().lower() in ('1', 'true', 'yes', 'on')
+            events = manager._iter_ring_events(kinds=kinds, limit=limit if limit > 0 else None)
+            return manager._stream_export_response(
+                events, export_format, 'ring_events_export',
+                fieldnames=RING_EVENT_EXPORT_FIELDS, compress=compress
+            )
+        except Exception as e:
+            logger.error("Fehler bei GET /api/ring/events/export: %s", e, exc_info=True)
+            return jsonify({'success': False, 'error': str(e)}), 500
+
     @app.route('/api/ring/diagnostics', methods=['GET'])
     def ring_diagnostics():
         try:
@@ -569,6 +594,7 @@ def list_ring_events(manager: Any, limit: int = 25, kinds: str = '') -> Dict[str
                             first_error = str(result.get('error') or '').strip()
                         continue
                     api_success = True
+                    batch = []
                     for event in result.get('events') or []:
                         normalized = _normalize_ring_event_entry(
                             cam['cam_id'],
@@ -581,7 +607,8 @@ def list_ring_events(manager: Any, limit: int = 25, kinds: str = '') -> Dict[str
                             continue
                         if kind_filter and normalized['kind'].lower() not in kind_filter and normalized['trigger'].lower() not in kind_filter:
                             continue
-                        manager._store_ring_event(normalized)
+                        batch.append(normalized)
+                    manager._store_ring_events(batch)
         except Exception as e:
             logger.warning("Ring-Ereignisse konnten nicht von der API geladen werden: %s", e)
             if not first_error:
@@ -645,14 +672,16 @@ def ring_event_loop(manager: Any) -> None:
                     continue
 
                 newest_ding = None
+                batch = []
                 for event in events:
                     normalized = _normalize_ring_event_entry(cam_id, cam_name, device_id, event, source='ring_api')
                     event_id = str(normalized.get('id') or '')
                     if not event_id:
                         continue
-                    manager._store_ring_event(normalized)
+                    batch.append(normalized)
                     if str(normalized.get('kind') or '').lower() == 'ding' and newest_ding is None:
                         newest_ding = normalized
+                manager._store_ring_events(batch)
 
                 if newest_ding and manager._ring_last_event_ids.get(cam_id) != newest_ding['id']:
                     manager._ring_last_event_ids[cam_id] = newest_ding['id']
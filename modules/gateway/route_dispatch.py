@@ -0,0 +1,354 @@
+"""
+Route Dispatcher
+Fan-out von Routen und Subscriber-Callbacks außerhalb des Gateway-Locks
+
+📁 SPEICHERORT: modules/gateway/route_dispatch.py
+
+route_data() hält den Gateway-Lock nur noch für Spam-Check und
+Cache-Mutation. Die eigentliche Auslieferung läuft hier auf einem
+begrenzten Worker-Pool pro Zielart:
+- Zielarten: plc, mqtt, log, widgets, subscribers
+- pro Zielart N Lanes mit je einer begrenzten Queue und einem Worker
+- Lane innerhalb der Zielart = hash(source_id) % N → Reihenfolge pro
+  Quelle und Zielart bleibt erhalten
+- ein langsamer MQTT-Publish staut nur die mqtt-Lanes, PLC-Writes und
+  Subscriber laufen unabhängig weiter
+- Backpressure: volle Lane blockiert den Aufrufer (gemessen), statt
+  Datenpunkte zu verwerfen oder die Reihenfolge zu brechen
+- Aufrufe aus einem Worker heraus (z.B. Subscriber ruft route_data())
+  laufen inline, damit sich Lanes nicht gegenseitig blockieren
+
+Überlauf-Policies pro Zielart (SMARTHOME_ROUTING_QUEUE_POLICY):
+- block:       Aufrufer wartet (Default, verlustfrei)
+- drop_newest: neuer Auftrag wird verworfen → on_overflow()
+- drop_oldest: ältester wartender Auftrag wird verworfen → on_overflow()
+- coalesce:    wartender Auftrag mit gleichem Key (Ziel + Datenpunkt) wird
+               durch den neuen Wert ersetzt (Position bleibt), bei voller
+               Lane zusätzlich drop_oldest
+
+on_overflow(target, fn, args) erhält verworfene Aufträge, der DataGateway
+legt sie in die Dead-Letter-Queue.
+
+workers=0 oder nicht gestartet → alles inline im Aufrufer-Thread.
+"""
+
+import os
+import threading
+import time
+import zlib
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+DISPATCH_TARGETS = ('plc', 'mqtt', 'log', 'widgets', 'subscribers')
+QUEUE_POLICIES = ('block', 'drop_newest', 'drop_oldest', 'coalesce')
+
+
+def parse_queue_policies(raw: str) -> Dict[str, str]:
+    """Parst "plc:block,mqtt:coalesce" → {'plc': 'block', 'mqtt': 'coalesce'}"""
+    policies: Dict[str, str] = {}
+    for part in str(raw or '').split(','):
+        if ':' not in part:
+            continue
+        target, policy = (item.strip().lower() for item in part.split(':', 1))
+        if target in DISPATCH_TARGETS and policy in QUEUE_POLICIES:
+            policies[target] = policy
+    return policies
+
+
+def target_class(target: str) -> Optional[str]:
+    """Ordnet ein Routing-Ziel seiner Lane-Gruppe zu (None = inline)"""
+    target = str(target or '')
+    if target.startswith('plc'):
+        return 'plc'
+    if target.startswith('mqtt'):
+        return 'mqtt'
+    if target.startswith('log'):
+        return 'log'
+    if target == 'widgets':
+        return 'widgets'
+    return None
+
+
+class _Lane:
+    __slots__ = ('target', 'index', 'items', 'pending', 'cond', 'thread', 'max_depth', 'busy')
+
+    def __init__(self, target: str, index: int):
+        self.target = target
+        self.index = index
+        self.items: deque = deque()      # [fn, args, enqueued_at, coalesce_key]
+        self.pending: Dict[str, list] = {}  # coalesce_key -> wartendes Item
+        self.cond = threading.Condition()
+        self.thread: Optional[threading.Thread] = None
+        self.max_depth = 0
+        self.busy = False
+
+
+def _new_target_stats() -> Dict[str, float]:
+    return {
+        'submitted': 0,
+        'completed': 0,
+        'errors': 0,
+        'backpressure_waits': 0,
+        'backpressure_wait_ms_total': 0.0,
+        'backpressure_wait_ms_max': 0.0,
+        'dropped': 0,
+        'coalesced': 0,
+        'latency_ms_total': 0.0,
+        'latency_ms_max': 0.0
+    }
+
+
+class RouteDispatcher:
+    """
+    Begrenzter Worker-Pool pro Zielart mit Reihenfolge pro Quelle
+
+    Args:
+        workers: Lanes/Worker-Threads pro Zielart (0 = inline)
+        queue_size: Max. wartende Aufträge pro Lane
+        targets: Zielarten mit eigenen Lanes
+        policies: Überlauf-Policy pro Zielart (Default: block)
+        on_overflow: Callback(target, fn, args) für verworfene Aufträge
+        name: Präfix für Thread-Namen
+    """
+
+    def __init__(self, workers: int = 0, queue_size: int = 1000,
+                 targets=DISPATCH_TARGETS, policies: Optional[Dict[str, str]] = None,
+                 on_overflow: Optional[Callable[[str, Callable, tuple], None]] = None,
+                 name: str = 'route-dispatch'):
+        self.workers = max(0, int(workers))
+        self.queue_size = max(1, int(queue_size))
+        self.name = name
+        self.on_overflow = on_overflow
+        self.policies: Dict[str, str] = {
+            target: (policies or {}).get(target, 'block') for target in targets
+        }
+        self._lanes: Dict[str, List[_Lane]] = {
+            target: [_Lane(target, i) for i in range(self.workers)]
+            for target in targets
+        }
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._running = False
+        self.inline_calls = 0
+        self.target_stats: Dict[str, Dict[str, float]] = {target: _new_target_stats() for target in targets}
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self):
+        """Startet die Worker-Threads (idempotent)"""
+        with self._state_lock:
+            if not self.enabled or self._running:
+                return
+            self._running = True
+            for lanes in self._lanes.values():
+                for lane in lanes:
+                    lane.thread = threading.Thread(
+                        target=self._worker,
+                        args=(lane,),
+                        name=f"{self.name}-{lane.target}-{lane.index}",
+                        daemon=True
+                    )
+                    lane.thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        """Arbeitet wartende Aufträge ab und beendet die Worker"""
+        with self._state_lock:
+            if not self._running:
+                return
+            self._running = False
+            lanes = [lane for group in self._lanes.values() for lane in group]
+        for lane in lanes:
+            with lane.cond:
+                lane.cond.notify_all()
+        for lane in lanes:
+            if lane.thread:
+                lane.thread.join(timeout=timeout)
+                lane.thread = None
+
+    def submit(self, target: Optional[str], key: str, fn: Callable[..., Any], *args,
+               coalesce_key: Optional[str] = None) -> bool:
+        """
+        Reiht fn(*args) in die Lane (target, key) ein
+
+        Args:
+            coalesce_key: Gleicher Key ersetzt einen noch wartenden Auftrag
+                (nur bei Policy 'coalesce')
+
+        Returns:
+            True wenn asynchron eingereiht/zusammengefasst, False wenn inline
+            ausgeführt oder verworfen
+        """
+        lanes = self._lanes.get(target) if target else None
+        if not lanes or not self._running or getattr(self._local, 'lane', None) is not None:
+            with self._stats_lock:
+                self.inline_calls += 1
+            self._run(target, fn, args, None)
+            return False
+
+        policy = self.policies.get(target, 'block')
+        lane = lanes[zlib.crc32(str(key).encode('utf-8')) % len(lanes)]
+        waited_ms = None
+        coalesced = False
+        accepted = True
+        dropped = None
+        run_inline = False
+        with lane.cond:
+            if policy == 'coalesce' and coalesce_key is not None:
+                pending = lane.pending.get(coalesce_key)
+                if pending is not None:
+                    pending[0], pending[1] = fn, args
+                    coalesced = True
+
+            if not coalesced and not self._running:
+                # stop() lief nach der Prüfung oben - der Lane-Worker beendet sich
+                run_inline = True
+            elif not coalesced and len(lane.items) >= self.queue_size:
+                if policy == 'block':
+                    wait_start = time.perf_counter()
+                    while len(lane.items) >= self.queue_size and self._running:
+                        lane.cond.wait(0.1)
+                    waited_ms = (time.perf_counter() - wait_start) * 1000.0
+                    # Wartezeit durch stop() beendet → nicht mehr einreihen
+                    run_inline = not self._running
+                elif policy == 'drop_newest':
+                    accepted = False
+                    dropped = (fn, args)
+                else:
+                    oldest = lane.items.popleft()
+                    if oldest[3] is not None and lane.pending.get(oldest[3]) is oldest:
+                        del lane.pending[oldest[3]]
+                    dropped = (oldest[0], oldest[1])
+
+            if accepted and not coalesced and not run_inline:
+                item = [fn, args, time.perf_counter(), coalesce_key if policy == 'coalesce' else None]
+                lane.items.append(item)
+                if item[3] is not None:
+                    lane.pending[item[3]] = item
+                depth = len(lane.items)
+                if depth > lane.max_depth:
+                    lane.max_depth = depth
+                lane.cond.notify_all()
+
+        with self._stats_lock:
+            stats = self.target_stats[target]
+            if coalesced:
+                stats['coalesced'] += 1
+            elif run_inline:
+                self.inline_calls += 1
+            elif accepted:
+                stats['submitted'] += 1
+            if dropped is not None:
+                stats['dropped'] += 1
+            if waited_ms is not None:
+                stats['backpressure_waits'] += 1
+                stats['backpressure_wait_ms_total'] += waited_ms
+                stats['backpressure_wait_ms_max'] = max(stats['backpressure_wait_ms_max'], waited_ms)
+
+        if dropped is not None and self.on_overflow is not None:
+            try:
+                self.on_overflow(target, dropped[0], dropped[1])
+            except Exception as e:
+                print(f"  ⚠️  Overflow-Handler fehlgeschlagen ({self.name}/{target}): {e}")
+        if run_inline:
+            self._run(target, fn, args, None)
+            return False
+        return accepted
+
+    def drain(self, timeout: float = 5.0) -> bool:
+        """Wartet bis alle Lanes leer sind - Returns: True wenn leer"""
+        deadline = time.time() + timeout
+        for lanes in self._lanes.values():
+            for lane in lanes:
+                while lane.items or lane.busy:
+                    if time.time() >= deadline:
+                        return False
+                    time.sleep(0.001)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        targets = {}
+        with self._stats_lock:
+            for target, raw in self.target_stats.items():
+                stats = dict(raw)
+                lanes = self._lanes[target]
+                completed = stats['completed']
+                stats['latency_ms_avg'] = round(stats['latency_ms_total'] / completed, 3) if completed else 0.0
+                stats['latency_ms_total'] = round(stats['latency_ms_total'], 3)
+                stats['backpressure_wait_ms_total'] = round(stats['backpressure_wait_ms_total'], 3)
+                stats['queued'] = sum(len(lane.items) for lane in lanes)
+                stats['max_depth'] = max((lane.max_depth for lane in lanes), default=0)
+                stats['policy'] = self.policies.get(target, 'block')
+                targets[target] = stats
+            inline_calls = self.inline_calls
+        return {
+            'workers_per_target': self.workers,
+            'queue_size': self.queue_size,
+            'running': self._running,
+            'inline_calls': inline_calls,
+            'queued': sum(stats['queued'] for stats in targets.values()),
+            'targets': targets
+        }
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+
+    def _worker(self, lane: _Lane):
+        self._local.lane = (lane.target, lane.index)
+        while True:
+            with lane.cond:
+                while not lane.items and self._running:
+                    lane.cond.wait()
+                if not lane.items:
+                    return
+                item = lane.items.popleft()
+                fn, args, enqueued_at, coalesce_key = item
+                if coalesce_key is not None and lane.pending.get(coalesce_key) is item:
+                    del lane.pending[coalesce_key]
+                lane.busy = True
+                lane.cond.notify_all()
+            try:
+                self._run(lane.target, fn, args, enqueued_at)
+            finally:
+                lane.busy = False
+
+    def _run(self, target: Optional[str], fn: Callable[..., Any], args: tuple, enqueued_at: Optional[float]):
+        try:
+            fn(*args)
+            failed = False
+        except Exception as e:
+            failed = True
+            print(f"  ⚠️  Dispatch-Fehler ({self.name}/{target}): {e}")
+        if enqueued_at is None:
+            return
+        latency_ms = (time.perf_counter() - enqueued_at) * 1000.0
+        with self._stats_lock:
+            stats = self.target_stats[target]
+            stats['completed'] += 1
+            if failed:
+                stats['errors'] += 1
+            stats['latency_ms_total'] += latency_ms
+            stats['latency_ms_max'] = max(stats['latency_ms_max'], latency_ms)
+
+
+def create_route_dispatcher(workers: Optional[int] = None, queue_size: Optional[int] = None,
+                            policies: Optional[Dict[str, str]] = None,
+                            on_overflow: Optional[Callable[[str, Callable, tuple], None]] = None) -> RouteDispatcher:
+    """
+    Factory mit Defaults aus SMARTHOME_ROUTING_WORKERS,
+    SMARTHOME_ROUTING_QUEUE_SIZE und SMARTHOME_ROUTING_QUEUE_POLICY
+    """
+    if workers is None:
+        workers = int(os.getenv('SMARTHOME_ROUTING_WORKERS', '0') or 0)
+    if queue_size is None:
+        queue_size = int(os.getenv('SMARTHOME_ROUTING_QUEUE_SIZE', '1000') or 1000)
+    if policies is None:
+        policies = parse_queue_policies(os.getenv('SMARTHOME_ROUTING_QUEUE_POLICY', ''))
+    return RouteDispatcher(workers=workers, queue_size=queue_size, policies=policies, on_overflow=on_overflow)
@@ -0,0 +1,150 @@
+"""
+Route Index
+Kompiliertes Route-Matching für DataGateway.route_data()
+
+📁 SPEICHERORT: modules/gateway/route_index.py
+
+Die Routen aus routing.json werden einmalig (beim Laden/_validate_routes)
+in einen Index übersetzt, statt pro Datenpunkt alle Routen zu durchlaufen:
+- exact:    Pattern → Routen (Match auf full_path, tag oder source_id)
+- prefix:   Zeichen-Trie für "xyz*"-Patterns (Match auf full_path)
+- wildcard: "*" matched alles (= Trie-Wurzel)
+- LRU:      (source_id, tag) → Ergebnis-Tupel, wird beim Rebuild verworfen
+
+Die Ergebnisreihenfolge entspricht der Reihenfolge in routing.json,
+deaktivierte Routen werden beim Kompilieren übersprungen.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+
+
+class _TrieNode:
+    __slots__ = ('children', 'routes')
+
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.routes: List[int] = []
+
+
+class RouteIndex:
+    """
+    Match-Index über eine Routenliste
+
+    Args:
+        routes: Validierte Routen (Dicts mit 'from'/'to'/'enabled')
+        cache_size: Max. Einträge im Match-Ergebnis-LRU (0 = aus)
+    """
+
+    def __init__(self, routes: List[Dict[str, Any]] = None, cache_size: int = 4096):
+        self.cache_size = max(0, int(cache_size))
+        self._lock = threading.Lock()
+        self._cache: 'OrderedDict[Tuple[str, str], Tuple[Dict, ...]]' = OrderedDict()
+        self.generation = 0
+        self.stats = {
+            'lookups': 0,
+            'cache_hits': 0,
+            'cache_misses': 0,
+            'cache_evictions': 0,
+            'rebuilds': 0
+        }
+        self.build(routes or [])
+
+    def build(self, routes: List[Dict[str, Any]]):
+        """Kompiliert die Routen neu und leert den Ergebnis-Cache"""
+        exact: Dict[str, List[int]] = {}
+        root = _TrieNode()
+        compiled: List[Dict[str, Any]] = []
+        prefix_count = 0
+
+        for route in routes:
+            if not route.get('enabled', True):
+                continue
+            position = len(compiled)
+            compiled.append(route)
+            pattern = str(route.get('from', ''))
+
+            # Exakter Vergleich gilt für jedes Pattern (auch "abc*" == tag "abc*")
+            exact.setdefault(pattern, []).append(position)
+
+            if pattern.endswith('*'):
+                node = root
+                for char in pattern[:-1]:
+                    child = node.children.get(char)
+                    if child is None:
+                        child = _TrieNode()
+                        node.children[char] = child
+                    node = child
+                node.routes.append(position)
+                prefix_count += 1
+
+        with self._lock:
+            self._routes = compiled
+            self._exact = exact
+            self._trie = root
+            self._prefix_count = prefix_count
+            self._cache.clear()
+            self.generation += 1
+            self.stats['rebuilds'] += 1
+
+    def match(self, source_id: str, tag: str) -> Tuple[Dict[str, Any], ...]:
+        """Liefert alle passenden Routen in Konfigurationsreihenfolge"""
+        key = (source_id, tag)
+        with self._lock:
+            self.stats['lookups'] += 1
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.stats['cache_hits'] += 1
+                return cached
+            self.stats['cache_misses'] += 1
+            generation = self.generation
+            routes, exact, trie = self._routes, self._exact, self._trie
+
+        result = self._lookup(routes, exact, trie, source_id, tag)
+
+        if self.cache_size:
+            with self._lock:
+                # Zwischenzeitlicher Rebuild → Ergebnis nicht cachen
+                if generation == self.generation:
+                    self._cache[key] = result
+                    if len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+                        self.stats['cache_evictions'] += 1
+        return result
+
+    @staticmethod
+    def _lookup(routes, exact, trie, source_id: str, tag: str) -> Tuple[Dict[str, Any], ...]:
+        full_path = f"{source_id}.{tag}"
+        positions = set()
+        for key in (full_path, tag, source_id):
+            hits = exact.get(key)
+            if hits:
+                positions.update(hits)
+
+        node = trie
+        positions.update(node.routes)
+        for char in full_path:
+            node = node.children.get(char)
+            if node is None:
+                break
+            positions.update(node.routes)
+
+        if not positions:
+            return ()
+        return tuple(routes[pos] for pos in sorted(positions))
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.stats['lookups']
+            return {
+                **self.stats,
+                'routes': len(self._routes),
+                'exact_patterns': len(self._exact),
+                'prefix_patterns': self._prefix_count,
+                'cache_entries': len(self._cache),
+                'cache_size': self.cache_size,
+                'hit_rate': round(self.stats['cache_hits'] / lookups, 4) if lookups else 0.0,
+                'generation': self.generation
+            }
@@ -0,0 +1,178 @@
+"""
+Socket Rooms
+Subscription-basierte Socket.IO-Zustellung für Variablen und Telemetrie
+
+📁 SPEICHERORT: modules/gateway/socket_rooms.py
+
+Jede Widget-Subscription (subscribe_variable) tritt einem Raum pro Variable
+bei (`var:<plc_id>:<variable>`), Telemetrie-Abos einem Raum pro Key
+(`telemetry:<key>`) bzw. dem Vollstrom-Raum `telemetry:*`. Die Registry
+führt dazu einen Referenzzähler pro (sid, Raum), damit mehrere Widgets
+eines Clients auf dieselbe Variable den Raum erst beim letzten
+Unsubscribe verlassen.
+
+Beim Versand werden die geänderten Räume auf die Clients abgebildet und
+Clients mit identischer Interessenmenge zu einem Emit zusammengefasst
+(`to=[sid, ...]` → Socket.IO kodiert das Paket nur einmal). Ausgehende
+Bytes skalieren so mit dem tatsächlichen Interesse statt mit
+Clients × alle Variablen.
+"""
+
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+TELEMETRY_ALL_ROOM = 'telemetry:*'
+
+
+def variable_room(plc_id: str, variable: str) -> str:
+    """Raumname für eine PLC-Variable"""
+    return f"var:{plc_id}:{variable}"
+
+
+def telemetry_room(key: str) -> str:
+    """Raumname für einen einzelnen Telemetrie-Key"""
+    return f"telemetry:{key}"
+
+
+class SocketRoomRegistry:
+    """
+    Thread-sichere Zuordnung sid ↔ Räume
+
+    Ein "Owner" ist der Grund einer Mitgliedschaft (z.B. scoped_widget_id);
+    pro Owner gibt es genau einen Raum, pro (sid, Raum) einen Zähler.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._owners: Dict[str, Dict[str, str]] = {}          # sid -> owner -> room
+        self._sid_rooms: Dict[str, Dict[str, int]] = {}       # sid -> room -> refcount
+        self._room_sids: Dict[str, Set[str]] = {}             # room -> sids
+        self.stats = {
+            'joins': 0,
+            'leaves': 0,
+            'deliveries': 0,
+            'emits': 0,
+            'recipients': 0,
+            'unrouted_items': 0
+        }
+
+    def bind(self, sid: str, owner: str, room: str) -> Tuple[bool, Optional[str]]:
+        """
+        Ordnet owner dem Raum zu
+
+        Returns:
+            (joined, left_room): joined=True wenn der sid den Raum neu betritt,
+            left_room = Raum, den der sid dadurch verlassen hat (Rebind) oder None
+        """
+        with self._lock:
+            owners = self._owners.setdefault(sid, {})
+            previous = owners.get(owner)
+            if previous == room:
+                return False, None
+            left_room = self._release(sid, previous) if previous is not None else None
+            owners[owner] = room
+            rooms = self._sid_rooms.setdefault(sid, {})
+            joined = room not in rooms
+            rooms[room] = rooms.get(room, 0) + 1
+            if joined:
+                self._room_sids.setdefault(room, set()).add(sid)
+                self.stats['joins'] += 1
+            return joined, left_room
+
+    def unbind(self, sid: str, owner: str) -> Optional[str]:
+        """Löst owner - Returns: Raum, falls der sid ihn damit verlassen hat"""
+        with self._lock:
+            owners = self._owners.get(sid)
+            if not owners or owner not in owners:
+                return None
+            room = owners.pop(owner)
+            if not owners:
+                self._owners.pop(sid, None)
+            return self._release(sid, room)
+
+    def drop_sid(self, sid: str) -> List[str]:
+        """Entfernt alle Mitgliedschaften eines getrennten Clients"""
+        with self._lock:
+            self._owners.pop(sid, None)
+            rooms = self._sid_rooms.pop(sid, {})
+            for room in rooms:
+                members = self._room_sids.get(room)
+                if members is not None:
+                    members.discard(sid)
+                    if not members:
+                        self._room_sids.pop(room, None)
+                self.stats['leaves'] += 1
+            return list(rooms)
+
+    def _release(self, sid: str, room: str) -> Optional[str]:
+        rooms = self._sid_rooms.get(sid)
+        if not rooms or room not in rooms:
+            return None
+        rooms[room] -= 1
+        if rooms[room] > 0:
+            return None
+        del rooms[room]
+        if not rooms:
+            self._sid_rooms.pop(sid, None)
+        members = self._room_sids.get(room)
+        if members is not None:
+            members.discard(sid)
+            if not members:
+                self._room_sids.pop(room, None)
+        self.stats['leaves'] += 1
+        return room
+
+    def members(self, room: str) -> Set[str]:
+        with self._lock:
+            return set(self._room_sids.get(room, ()))
+
+    def rooms_of(self, sid: str) -> List[str]:
+        with self._lock:
+            return list(self._sid_rooms.get(sid, {}))
+
+    def group_by_interest(self, rooms: Iterable[str],
+                          exclude: Iterable[str] = ()) -> List[Tuple[List[str], Tuple[str, ...]]]:
+        """
+        Bildet Räume auf Empfängergruppen ab
+
+        Returns:
+            Liste (sids, rooms) - alle sids einer Gruppe interessieren sich
+            für exakt dieselben Räume und bekommen denselben Payload
+        """
+        excluded = set(exclude)
+        interest: Dict[str, List[str]] = {}
+        unrouted = 0
+        with self._lock:
+            for room in rooms:
+                members = self._room_sids.get(room)
+                if not members:
+                    unrouted += 1
+                    continue
+                for sid in members:
+                    if sid not in excluded:
+                        interest.setdefault(sid, []).append(room)
+
+            groups: Dict[Tuple[str, ...], List[str]] = {}
+            for sid, sid_rooms in interest.items():
+                groups.setdefault(tuple(sid_rooms), []).append(sid)
+
+            self.stats['deliveries'] += 1
+            self.stats['emits'] += len(groups)
+            self.stats['recipients'] += len(interest)
+            self.stats['unrouted_items'] += unrouted
+        return [(sorted(sids), room_key) for room_key, sids in groups.items()]
+
+    def record_broadcast(self, recipients: int):
+        """Zählt ein Emit an einen Sammelraum (z.B. telemetry:*)"""
+        with self._lock:
+            self.stats['emits'] += 1
+            self.stats['recipients'] += recipients
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                **self.stats,
+                'clients': len(self._sid_rooms),
+                'rooms': len(self._room_sids),
+                'memberships': sum(len(rooms) for rooms in self._sid_rooms.values())
+            }
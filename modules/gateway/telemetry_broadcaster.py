@@ -0,0 +1,190 @@
+"""
+Telemetry Broadcaster
+Bündelt Telemetrie-Änderungen zu Frames für Socket.IO
+
+📁 SPEICHERORT: modules/gateway/telemetry_broadcaster.py
+
+Statt pro update_telemetry() ein eigenes `telemetry_update`-Emit an alle
+Clients zu senden, sammelt der Broadcaster geänderte Keys und sendet sie
+mit fester Frame-Rate (SMARTHOME_TELEMETRY_BATCH_HZ, Default 15 Hz) als
+EIN `telemetry_batch`:
+- pro Key gilt innerhalb eines Frames nur der letzte Wert - mit `seq` der
+  Wert mit der höchsten Sequenz; die zuletzt angenommene Sequenz pro Key
+  bleibt auch über den Flush hinaus gemerkt (begrenzt auf max_keys, LRU),
+  ein verspätetes publish() eines älteren Werts wird also auch nach dem
+  Frame des neueren verworfen
+- leere Frames werden nicht gesendet
+- `seq` = höchste Telemetrie-Sequenz im Frame (Reconnect-Cursor der Clients)
+- Kennzahlen: gesparte Emits, Keys/Frame, Flush-Latenz (älteste Änderung
+  bis Emit)
+
+Genutzt von WebManager.broadcast_telemetry().
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+
+class TelemetryBroadcaster:
+    """
+    Frame-basierter Telemetrie-Versand
+
+    Args:
+        emit: Callback(event, payload) - i.d.R. socketio.emit
+        frame_hz: Flush-Frequenz (Frames pro Sekunde)
+        event: Event-Name des Batch-Frames
+        max_keys: Max. Keys mit gemerkter letzter Sequenz (wie der Telemetrie-Cache)
+    """
+
+    def __init__(self, emit: Callable[[str, Dict[str, Any]], None], frame_hz: float = 15.0,
+                 event: str = 'telemetry_batch', max_keys: int = 10000):
+        self.emit = emit
+        self.frame_hz = max(0.5, float(frame_hz))
+        self.event = event
+        self.max_keys = max(1, int(max_keys))
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Any] = {}
+        self._last_seq: 'OrderedDict[str, int]' = OrderedDict()
+        self._pending_since: Optional[float] = None
+        self._last_cid = ''
+        self._max_seq: Optional[int] = None
+        self._frame = 0
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self.stats = {
+            'published': 0,
+            'coalesced': 0,
+            'stale_dropped': 0,
+            'frames': 0,
+            'keys_flushed': 0,
+            'emit_errors': 0,
+            'flush_latency_ms_total': 0.0,
+            'flush_latency_ms_max': 0.0
+        }
+
+    @property
+    def frame_interval(self) -> float:
+        return 1.0 / self.frame_hz
+
+    def start(self):
+        """Startet den Flush-Thread (idempotent)"""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name='telemetry-broadcaster', daemon=True)
+            self._thread.start()
+
+    def stop(self, flush: bool = True):
+        """Beendet den Flush-Thread, sendet optional den letzten Frame"""
+        self._stop_event.set()
+        thread = self._thread
+        if thread:
+            thread.join(timeout=2.0)
+        self._thread = None
+        if flush:
+            self.flush()
+
+    def publish(self, key: str, value: Any, correlation_id: str = None, seq: int = None):
+        """Merkt einen geänderten Key für den nächsten Frame vor"""
+        now = time.time()
+        with self._lock:
+            if seq is not None:
+                last_seq = self._last_seq.get(key)
+                if last_seq is not None and seq < last_seq:
+                    # Älterer Wert kam nach dem neueren an (Broadcast außerhalb des
+                    # Gateway-Locks) - auch wenn der neuere schon gesendet wurde
+                    self.stats['stale_dropped'] += 1
+                    return
+                self._last_seq[key] = seq
+                self._last_seq.move_to_end(key)
+                if len(self._last_seq) > self.max_keys:
+                    self._last_seq.popitem(last=False)
+            pending = self._pending.get(key)
+            if pending is not None:
+                self.stats['coalesced'] += 1
+            elif self._pending_since is None:
+                self._pending_since = now
+            self._pending[key] = (value, now, seq)
+            self.stats['published'] += 1
+            if correlation_id:
+                self._last_cid = correlation_id
+            if seq is not None and (self._max_seq is None or seq > self._max_seq):
+                self._max_seq = seq
+
+    def flush(self) -> int:
+        """Sendet alle vorgemerkten Keys als einen Frame - Returns: Anzahl Keys"""
+        with self._lock:
+            if not self._pending:
+                return 0
+            pending = self._pending
+            since = self._pending_since
+            cid = self._last_cid
+            max_seq = self._max_seq
+            self._pending = {}
+            self._pending_since = None
+            self._max_seq = None
+            self._frame += 1
+            frame = self._frame
+
+        now = time.time()
+        payload = {
+            'frame': frame,
+            'count': len(pending),
+            'updates': {key: value for key, (value, _, _) in pending.items()},
+            'timestamps': {key: ts for key, (_, ts, _) in pending.items()},
+            'timestamp': now,
+            'timestamp_utc': datetime.fromtimestamp(now, tz=timezone.utc).isoformat().replace('+00:00', 'Z'),
+            'correlation_id': cid
+        }
+        if max_seq is not None:
+            payload['seq'] = max_seq
+        try:
+            self.emit(self.event, payload)
+            failed = False
+        except Exception as e:
+            failed = True
+            print(f"  ⚠️  Telemetrie-Frame fehlgeschlagen: {e}")
+
+        latency_ms = (time.time() - since) * 1000.0 if since else 0.0
+        with self._lock:
+            if failed:
+                self.stats['emit_errors'] += 1
+            else:
+                self.stats['frames'] += 1
+                self.stats['keys_flushed'] += len(pending)
+            self.stats['flush_latency_ms_total'] += latency_ms
+            self.stats['flush_latency_ms_max'] = max(self.stats['flush_latency_ms_max'], latency_ms)
+        return len(pending)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            pending = len(self._pending)
+            running = bool(self._thread and self._thread.is_alive())
+        frames = stats['frames'] + stats['emit_errors']
+        return {
+            **stats,
+            'frame_hz': self.frame_hz,
+            'running': running,
+            'pending_keys': pending,
+            # Ohne Batching wäre jedes publish() ein eigenes Emit gewesen
+            'emits_saved': max(0, stats['published'] - stats['frames'] - pending),
+            'keys_per_frame_avg': round(stats['keys_flushed'] / stats['frames'], 2) if stats['frames'] else 0.0,
+            'flush_latency_ms_avg': round(stats['flush_latency_ms_total'] / frames, 3) if frames else 0.0,
+            'flush_latency_ms_total': round(stats['flush_latency_ms_total'], 3)
+        }
+
+    def _run(self):
+        interval = self.frame_interval
+        next_tick = time.monotonic() + interval
+        while not self._stop_event.wait(max(0.0, next_tick - time.monotonic())):
+            next_tick += interval
+            # Nach Stau (z.B. langsames Emit) nicht nachholen, sondern neu takten
+            now = time.monotonic()
+            if next_tick < now:
+                next_tick = now + interval
+            self.flush()
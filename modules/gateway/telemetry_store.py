@@ -0,0 +1,241 @@
+"""
+Telemetry Store
+Recency-geordneter Telemetrie-Cache mit O(1)-Touch/Evict
+
+📁 SPEICHERORT: modules/gateway/telemetry_store.py
+
+Ersetzt das frühere Dict + `list(keys)[:prune_batch]`-Pruning in
+DataGateway.update_telemetry():
+- eine OrderedDict in Aktualisierungsreihenfolge: set() schiebt den Key ans
+  Ende, Eviction nimmt vom Anfang (least-recently-updated) → O(1)
+- dieselbe Reihenfolge ist aufsteigend nach Sequenz → Delta-Abfragen für
+  Reconnects laufen rückwärts nur über die Änderungen
+- Seiten ab einer Sequenz (Snapshot-Blättern) über ein append-only
+  Änderungslog: Startposition per Bisektion, Anzahl lebender Einträge per
+  Fenwick-Baum → O(log n + Seite) statt O(Änderungen) pro Seite
+- optionale Quoten pro Quelle (erstes Key-Segment, z.B. "PLC", "mqtt", "bt"),
+  damit ein lauter MQTT-Baum keine PLC-Werte verdrängt; pro Quelle eigene
+  Recency-Liste und Eviction-Zähler
+
+Nicht thread-sicher: DataGateway hält beim Zugriff self.lock.
+"""
+
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+def telemetry_source(key: str) -> str:
+    """Quelle eines Telemetrie-Keys (erstes Segment: 'PLC.MAIN.x' → 'PLC')"""
+    return str(key).split('.', 1)[0]
+
+
+def parse_source_quotas(raw: str) -> Dict[str, int]:
+    """Parst "mqtt:2000,bt:500" → {'mqtt': 2000, 'bt': 500}"""
+    quotas: Dict[str, int] = {}
+    for part in str(raw or '').split(','):
+        if ':' not in part:
+            continue
+        source, limit = (item.strip() for item in part.rsplit(':', 1))
+        try:
+            value = int(limit)
+        except ValueError:
+            continue
+        if source and value > 0:
+            quotas[source] = value
+    return quotas
+
+
+class _Entry:
+    __slots__ = ('value', 'seq', 'source', 'pos')
+
+    def __init__(self, value: Any, seq: int, source: str):
+        self.value = value
+        self.seq = seq
+        self.source = source
+        self.pos = -1  # Position im Änderungslog
+
+
+class _ChangeLog:
+    """
+    Append-only (seq, key)-Log, aufsteigend nach Sequenz
+
+    Überholte Positionen (Key neu gesetzt/verdrängt) bleiben stehen und
+    werden im Fenwick-Baum als tot gezählt; TelemetryStore baut das Log
+    neu auf, sobald es doppelt so groß wie der Cache ist.
+    """
+
+    __slots__ = ('seqs', 'keys', '_tree')
+
+    def __init__(self):
+        self.seqs: List[int] = []
+        self.keys: List[str] = []
+        self._tree: List[int] = [0]  # 1-basiert, Anzahl lebender Einträge
+
+    def __len__(self) -> int:
+        return len(self.seqs)
+
+    def append(self, seq: int, key: str) -> int:
+        pos = len(self.seqs)
+        self.seqs.append(seq)
+        self.keys.append(key)
+        index = pos + 1
+        self._tree.append(1 + self._prefix(index - 1) - self._prefix(index - (index & -index)))
+        return pos
+
+    def discard(self, pos: int):
+        index = pos + 1
+        while index < len(self._tree):
+            self._tree[index] -= 1
+            index += index & -index
+
+    def _prefix(self, index: int) -> int:
+        total = 0
+        while index > 0:
+            total += self._tree[index]
+            index -= index & -index
+        return total
+
+    def after(self, seq: int) -> Tuple[int, int]:
+        """Erste Position mit Sequenz > seq und Anzahl lebender Einträge ab dort"""
+        start = bisect_right(self.seqs, seq)
+        return start, self._prefix(len(self.seqs)) - self._prefix(start)
+
+
+class TelemetryStore:
+    """
+    LRU-Telemetrie-Cache mit Sequenzen und Quellen-Quoten
+
+    Args:
+        limit: Max. Anzahl Keys insgesamt
+        quotas: Max. Keys pro Quelle ({'mqtt': 2000}); Quellen ohne Eintrag
+            sind nur durch limit begrenzt
+    """
+
+    def __init__(self, limit: int, quotas: Optional[Dict[str, int]] = None):
+        self.limit = max(1, int(limit))
+        self.quotas = dict(quotas or {})
+        self.seq = 0
+        self._entries: 'OrderedDict[str, _Entry]' = OrderedDict()
+        self._by_source: Dict[str, 'OrderedDict[str, None]'] = {}
+        self._log = _ChangeLog()
+        self.evictions = 0
+        self._evictions_by_source: Dict[str, Dict[str, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def set(self, key: str, value: Any) -> int:
+        """Speichert/aktualisiert key, markiert ihn als jüngsten - Returns: Sequenz"""
+        self.seq += 1
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.value = value
+            entry.seq = self.seq
+            self._entries.move_to_end(key)
+            self._by_source[entry.source].move_to_end(key)
+            self._log_change(key, entry)
+            return self.seq
+
+        source = telemetry_source(key)
+        quota = self.quotas.get(source)
+        keys = self._by_source.get(source)
+        if quota is not None and keys is not None and len(keys) >= quota:
+            # Quote voll → ältesten Key derselben Quelle verdrängen
+            self._evict(next(iter(keys)), 'quota')
+
+        entry = self._entries[key] = _Entry(value, self.seq, source)
+        self._log_change(key, entry)
+        # Erst nach der Eviction holen: _evict() entfernt leer gewordene Quellen
+        self._by_source.setdefault(source, OrderedDict())[key] = None
+        while len(self._entries) > self.limit:
+            self._evict(next(iter(self._entries)), 'lru')
+        return self.seq
+
+    def get(self, key: str, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        return entry.value if entry is not None else default
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Alle Werte (älteste Änderung zuerst)"""
+        return {key: entry.value for key, entry in self._entries.items()}
+
+    def changes_since(self, after_seq: int) -> List[Tuple[str, int, Any]]:
+        """Keys mit Sequenz > after_seq, aufsteigend - O(Änderungen)"""
+        changed = []
+        entries = self._entries
+        for key in reversed(entries):
+            entry = entries[key]
+            if entry.seq <= after_seq:
+                break
+            changed.append((key, entry.seq, entry.value))
+        changed.reverse()
+        return changed
+
+    def iter_changes_since(self, after_seq: int) -> Iterator[Tuple[str, int, Any]]:
+        """Wie changes_since(), aber lazy ab der Cursor-Position im Änderungslog"""
+        log, entries = self._log, self._entries
+        pos, _ = log.after(after_seq)
+        while pos < len(log):
+            key = log.keys[pos]
+            entry = entries.get(key)
+            if entry is not None and entry.pos == pos:
+                yield key, entry.seq, entry.value
+            pos += 1
+
+    def count_changes_since(self, after_seq: int) -> int:
+        """Anzahl Keys mit Sequenz > after_seq - O(log n)"""
+        return self._log.after(after_seq)[1]
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        for key, entry in self._entries.items():
+            yield key, entry.value
+
+    def clear(self):
+        self._entries.clear()
+        self._by_source.clear()
+        self._log = _ChangeLog()
+
+    def _log_change(self, key: str, entry: _Entry):
+        if entry.pos >= 0:
+            self._log.discard(entry.pos)
+        if len(self._log) >= 2 * len(self._entries) + 64:
+            # Überholte Positionen verwerfen (Cache-Reihenfolge = Sequenzreihenfolge)
+            self._log = _ChangeLog()
+            for other_key, other in self._entries.items():
+                if other is not entry:
+                    other.pos = self._log.append(other.seq, other_key)
+        entry.pos = self._log.append(entry.seq, key)
+
+    def _evict(self, key: str, reason: str):
+        entry = self._entries.pop(key)
+        self._log.discard(entry.pos)
+        keys = self._by_source.get(entry.source)
+        if keys is not None:
+            keys.pop(key, None)
+            if not keys:
+                self._by_source.pop(entry.source, None)
+        self.evictions += 1
+        counters = self._evictions_by_source.setdefault(entry.source, {'lru': 0, 'quota': 0})
+        counters[reason] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        sources = {}
+        for source in set(self._by_source) | set(self._evictions_by_source):
+            counters = self._evictions_by_source.get(source, {'lru': 0, 'quota': 0})
+            sources[source] = {
+                'entries': len(self._by_source.get(source, ())),
+                'quota': self.quotas.get(source),
+                'evictions_lru': counters['lru'],
+                'evictions_quota': counters['quota']
+            }
+        return {
+            'entries': len(self._entries),
+            'limit': self.limit,
+            'seq': self.seq,
+            'evictions': self.evictions,
+            'sources': sources
+        }
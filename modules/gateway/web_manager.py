@@ -28,8 +28,9 @@ from datetime import datetime, timezone
 
 # Flask & SocketIO (lazy import)
 try:
-    from flask import Flask, render_template, jsonify, request, send_file, has_request_context, g
-    from flask_socketio import SocketIO, emit
+    from flask import Flask, Response, render_template, jsonify, request, send_file, has_request_context, g
+    from flask import stream_with_context
+    from flask_socketio import SocketIO, emit, join_room, leave_room
     import io
     FLASK_AVAILABLE = True
 except ImportError:
@@ -43,6 +44,13 @@ try:
     from modules.gateway.ring_event_store import RingEventStore
     from modules.gateway import ring_support
     from modules.plc.variable_manager import create_variable_manager
+    from modules.plc.symbol_index import SymbolSearchIndex, StaleCursorError
+    from modules.plc.tpy_reader import read_tpy
+    from modules.gateway.telemetry_broadcaster import TelemetryBroadcaster
+    from modules.gateway.poll_scheduler import resolve_poll_class
+    from modules.gateway.socket_rooms import (
+        SocketRoomRegistry, TELEMETRY_ALL_ROOM, variable_room, telemetry_room
+    )
     MANAGERS_AVAILABLE = True
 except ImportError:
     MANAGERS_AVAILABLE = False
@@ -154,6 +162,33 @@ class WebManager(BaseModule):
         self._feature_flags = self._load_feature_flags()
         # Socket-spezifische Widget-Subscriptions (sid -> set(scoped_widget_id))
         self._sid_widget_subscriptions = {}
+        # Telemetrie-Frames: telemetry_batch mit fester Rate (0 = aus),
+        # Legacy telemetry_update pro Key nur per Flag (oder ohne Batching)
+        self._telemetry_batch_hz = max(0.0, float(os.getenv('SMARTHOME_TELEMETRY_BATCH_HZ', '15') or 0))
+        self._telemetry_legacy_events = str(os.getenv('SMARTHOME_TELEMETRY_LEGACY_EVENTS', 'false')).lower() in (
+            '1', 'true', 'yes', 'on'
+        ) or self._telemetry_batch_hz <= 0
+        # Reconnect-Snapshots: Seitengröße und Kennzahlen
+        self._telemetry_snapshot_chunk = min(5000, max(50, int(os.getenv('SMARTHOME_TELEMETRY_SNAPSHOT_CHUNK', '500'))))
+        self._telemetry_snapshot_stats = {
+            'legacy_connects': 0,
+            'full_connects': 0,
+            'delta_connects': 0,
+            'pages': 0,
+            'keys_sent': 0
+        }
+        # Raum-basierte Zustellung (variable_updates/Telemetrie nur an Abonnenten)
+        self._socket_rooms_enabled = str(os.getenv('SMARTHOME_SOCKET_ROOMS', 'true')).lower() in (
+            '1', 'true', 'yes', 'on'
+        )
+        self.socket_rooms = SocketRoomRegistry() if MANAGERS_AVAILABLE else None
+        self.telemetry_broadcaster = None
+        if MANAGERS_AVAILABLE and self._telemetry_batch_hz > 0:
+            self.telemetry_broadcaster = TelemetryBroadcaster(
+                self._emit_telemetry_frame,
+                frame_hz=self._telemetry_batch_hz,
+                max_keys=int(os.getenv('SMARTHOME_TELEMETRY_CACHE_SIZE', '10000') or 10000)
+            )
 
     def initialize(self, app_context: Any):
         """Initialisiert das Modul und erzwingt absolute Pfade für alle Manager."""
@@ -215,6 +250,7 @@ class WebManager(BaseModule):
                 # ⭐ v4.6.0: Initialize Variable Manager
                 logger.info("Initialisiere Variable Manager...")
                 self.variable_manager = create_variable_manager()
+                self.variable_manager.set_suggestion_provider(self._suggest_symbol_names)
                 self._trigger_store = CameraTriggerStore(os.path.join(conf_dir, 'automation_rules.db'))
                 self._ring_event_store = RingEventStore(root_dir, conf_dir)
                 self._configure_ring_event_store()
@@ -224,6 +260,7 @@ class WebManager(BaseModule):
                     try:
                         cached_symbols = self.symbol_browser.get_symbols('plc_001')
                         if cached_symbols:
+                            self.variable_manager.set_type_aliases(self.symbol_browser.get_type_aliases('plc_001'), 'plc_001')
                             self.variable_manager.register_symbols_bulk(cached_symbols, 'plc_001')
                             logger.info(f"✅ Variable Manager: {len(cached_symbols)} Symbole registriert")
                         else:
@@ -648,6 +685,31 @@ class WebManager(BaseModule):
             return False
         return self._ring_event_store.record_event(event, self._get_ring_event_storage_settings())
 
+    def _store_ring_events(self, events: List[Dict[str, Any]]) -> int:
+        """Mehrere Ring-Events in einem Batch speichern (eine Transaktion)"""
+        if not self._ring_event_store or not events:
+            return 0
+        return self._ring_event_store.record_events(events, self._get_ring_event_storage_settings())
+
+    def _stream_export_response(self, rows, export_format: str, download_name: str,
+                                fieldnames: List[str] = None, compress: bool = False):
+        """Flask-Streaming-Response für einen chunkweisen Export (ndjson/csv)"""
+        from modules.core.stream_export import build_export_stream
+        chunks, mimetype, extension = build_export_stream(
+            rows, export_format, fieldnames=fieldnames, compress=compress
+        )
+        response = Response(stream_with_context(chunks), mimetype=mimetype)
+        response.headers['Content-Disposition'] = f'attachment; filename={download_name}.{extension}'
+        response.headers['X-Accel-Buffering'] = 'no'
+        return response
+
+    def _iter_ring_events(self, kinds: List[str] = None, limit: int = None):
+        if not self._ring_event_store:
+            return iter(())
+        return self._ring_event_store.iter_events(
+            kinds=kinds, config=self._get_ring_event_storage_settings(), limit=limit
+        )
+
     def _read_ring_events(self, limit: int = 25, kinds: List[str] = None) -> List[Dict[str, Any]]:
         if not self._ring_event_store:
             return []
@@ -1805,49 +1867,80 @@ class WebManager(BaseModule):
 
         @self.app.route('/api/variables/search', methods=['GET'])
         def search_variables():
-            """Serverseitige Variablensuche (skalierbar für große Symbolmengen)."""
+            """
+            Serverseitige Variablensuche über den Symbol-Suchindex
+
+            Query-Parameter: q/query, type, path (Pfad-Präfix), limit, cursor
+            """
             try:
                 conn_id = request.args.get('connection_id', 'plc_001')
                 query = (request.args.get('q') or request.args.get('query') or '').strip().lower()
                 type_filter = (request.args.get('type') or '').strip().upper()
+                path_prefix = (request.args.get('path') or '').strip()
+                cursor = (request.args.get('cursor') or '').strip() or None
                 limit = max(1, min(int(request.args.get('limit', 200)), 1000))
 
-                symbols = []
+                started = time.perf_counter()
+                virtual_symbols = self._get_gateway_virtual_symbols()
                 if self.symbol_browser:
-                    symbols = self.symbol_browser.get_symbols(conn_id, force_refresh=False) or []
-
-                # Gateway virtuelle Variablen ergänzen
-                symbols.extend(self._get_gateway_virtual_symbols())
+                    index = self.symbol_browser.get_search_index(conn_id, extra_symbols=virtual_symbols)
+                else:
+                    index = SymbolSearchIndex(
+                        (sym['name'], sym['type'], sym.get('comment', '')) for sym in virtual_symbols
+                    )
 
-                results = []
-                for sym in symbols:
-                    if not isinstance(sym, dict):
-                        continue
-                    name = str(sym.get('name', ''))
-                    sym_type = str(sym.get('type', ''))
-                    if query and query not in name.lower():
-                        continue
-                    if type_filter and type_filter not in sym_type.upper():
-                        continue
-                    results.append({
-                        'name': name,
-                        'type': sym_type,
-                        'comment': sym.get('comment', '')
-                    })
-                    if len(results) >= limit:
-                        break
+                try:
+                    result = index.search(query, type_filter=type_filter, limit=limit,
+                                          cursor=cursor, path_prefix=path_prefix)
+                except StaleCursorError as e:
+                    return jsonify({'success': False, 'error': str(e), 'error_code': 'cursor_stale',
+                                    'generation': index.generation, 'variables': []}), 409
+                except ValueError as e:
+                    return jsonify({'success': False, 'error': str(e), 'variables': []}), 400
 
                 return jsonify({
                     'success': True,
                     'query': query,
-                    'count': len(results),
+                    'count': result['count'],
+                    'total': result['total'],
                     'limit': limit,
-                    'variables': results
+                    'generation': result['generation'],
+                    'next_cursor': result['next_cursor'],
+                    'facets': result['facets'],
+                    'took_ms': round((time.perf_counter() - started) * 1000.0, 3),
+                    'variables': result['variables']
                 })
             except Exception as e:
                 logger.error(f"Variable-Suche Fehler: {e}", exc_info=True)
                 return jsonify({'success': False, 'error': str(e), 'variables': []}), 500
 
+        @self.app.route('/api/plc/symbols/tree', methods=['GET'])
+        def get_plc_symbol_tree():
+            """
+            Eine Ebene des Symbolbaums mit Kind-/Symbolzahlen (lazy Aufklappen)
+
+            Query-Parameter: path (leer = Wurzel, z.B. MAIN.fbLights), connection_id, offset, limit
+            """
+            conn_id = request.args.get('connection_id', 'plc_001')
+            path = (request.args.get('path') or '').strip()
+            try:
+                offset = max(0, int(request.args.get('offset', 0)))
+                limit = max(1, min(int(request.args.get('limit', 500)), 5000))
+            except ValueError:
+                return jsonify({'success': False, 'error': 'offset und limit müssen Zahlen sein'}), 400
+
+            if not self.symbol_browser:
+                return jsonify({'success': False, 'error': 'Symbol-Browser nicht verfügbar'}), 503
+
+            try:
+                level = self.symbol_browser.get_tree_index(conn_id).level(path, offset=offset, limit=limit)
+                if level is None:
+                    return jsonify({'success': False, 'error': f'Pfad nicht gefunden: {path}', 'path': path}), 404
+                return jsonify({'success': True, 'connection_id': conn_id, **level})
+            except Exception as e:
+                logger.error(f"Symbolbaum Fehler: {e}", exc_info=True)
+                return jsonify({'success': False, 'error': str(e)}), 500
+
         @self.app.route('/api/plc/symbols/upload', methods=['POST'])
         def upload_tpy():
             """TPY-Datei Upload und Parsing"""
@@ -1872,21 +1965,13 @@ class WebManager(BaseModule):
                 file.save(filepath)
                 logger.info(f"TPY-Datei gespeichert: {filepath}")
 
-                # TPY-Datei parsen (einfaches XML-Parsing)
+                # TPY-Datei parsen (Streaming-Reader; Ergebnis landet im Parse-Cache,
+                # der Symbol-Browser parst dieselbe Datei danach nicht erneut)
                 symbol_count = 0
                 try:
-                    import xml.etree.ElementTree as ET
-                    tree = ET.parse(filepath)
-                    root = tree.getroot()
-
-                    # Zähle Symbole (DataType-Elemente mit name-Attribut)
-                    symbols = root.findall('.//{http://www.beckhoff.com/schemas/2011/07/TcPOU}Symbol')
-                    if not symbols:
-                        # Fallback: suche nach anderen XML-Strukturen
-                        symbols = root.findall('.//Symbol')
-
-                    symbol_count = len(symbols)
-                    logger.info(f"TPY-Parsing: {symbol_count} Symbole gefunden")
+                    parsed = read_tpy(filepath, cache_dir=getattr(self.symbol_browser, 'tpy_cache_dir', None))
+                    symbol_count = len(parsed.symbols)
+                    logger.info(f"TPY-Parsing: {symbol_count} Symbole gefunden ({parsed.source})")
 
                 except Exception as parse_error:
                     logger.warning(f"TPY-Parsing-Fehler: {parse_error}")
@@ -1900,6 +1985,9 @@ class WebManager(BaseModule):
                     try:
                         cached_count = self.symbol_browser.load_symbols_from_tpy(filepath, 'plc_001')
                         logger.info(f"Symbol-Cache aktualisiert: {cached_count} Symbole gespeichert")
+                        if self.variable_manager and cached_count:
+                            self.variable_manager.set_type_aliases(self.symbol_browser.get_type_aliases('plc_001'), 'plc_001')
+                            self.variable_manager.register_symbols_bulk(self.symbol_browser.get_symbols('plc_001'), 'plc_001')
                     except Exception as cache_error:
                         logger.warning(f"Cache-Speicherung fehlgeschlagen: {cache_error}")
 
@@ -1957,8 +2045,7 @@ class WebManager(BaseModule):
 
                     # Speichere im Symbol-Browser-Cache
                     if self.symbol_browser:
-                        self.symbol_browser.symbol_cache['plc_001'] = symbols_list
-                        self.symbol_browser.cache_timestamp['plc_001'] = time.time()
+                        self.symbol_browser.set_symbols('plc_001', symbols_list)
                         self.symbol_browser.save_cache_to_file(self.symbol_browser.cache_file, 'plc_001')
                         logger.info(f"Symbol-Cache aktualisiert: {len(symbols_list)} Symbole")
 
@@ -2392,7 +2479,13 @@ class WebManager(BaseModule):
 
         @self.app.route('/api/admin/logs')
         def get_system_logs():
-            """System-Logs aus SQLite-Datenbank"""
+            """System-Logs aus SQLite-Datenbank
+
+            Filter werden per SQL ausgewertet: filter (all, audit, restart,
+            restart_app, restart_daemon, restart_error), level, module,
+            action, actor, q (Volltext). Nächste Seite per before_id; der
+            Header X-Next-Before-Id enthält den Cursor, solange die Seite voll ist.
+            """
             try:
                 from modules.core.database_logger import DatabaseLogger
 
@@ -2403,84 +2496,39 @@ class WebManager(BaseModule):
                 limit = max(1, min(limit, 500))
                 filter_mode = str(request.args.get('filter', 'all') or 'all').strip().lower()
 
-                def _audit_action(log_row: Dict[str, Any]) -> str:
-                    if str(log_row.get('module') or '').lower() != 'audit':
-                        return ''
-                    try:
-                        payload = json.loads(str(log_row.get('message') or '{}'))
-                        return str(payload.get('action') or '').strip().lower()
-                    except Exception:
-                        return ''
-
-                def _is_restart_log(log_row: Dict[str, Any]) -> bool:
-                    msg = str(log_row.get('message') or '').lower()
-                    action = _audit_action(log_row)
-                    return (
-                        action in ('service_restart_scheduled', 'daemon_restart_scheduled', 'daemon_restart_rejected')
-                        or 'restart' in msg
-                        or 'neustart' in msg
-                    )
-
-                def _is_restart_app(log_row: Dict[str, Any]) -> bool:
-                    msg = str(log_row.get('message') or '').lower()
-                    action = _audit_action(log_row)
-                    return action == 'service_restart_scheduled' or 'type=app' in msg
-
-                def _is_restart_daemon(log_row: Dict[str, Any]) -> bool:
-                    msg = str(log_row.get('message') or '').lower()
-                    action = _audit_action(log_row)
-                    return action in ('daemon_restart_scheduled', 'daemon_restart_rejected') or 'type=daemon' in msg
-
-                def _is_restart_error(log_row: Dict[str, Any]) -> bool:
-                    msg = str(log_row.get('message') or '').lower()
-                    action = _audit_action(log_row)
-                    has_restart_context = (
-                        'restart' in msg
-                        or 'neustart' in msg
-                        or 'type=app' in msg
-                        or 'type=daemon' in msg
-                    )
-                    has_error_marker = (
-                        'rejected' in msg
-                        or 'abgelehnt' in msg
-                        or 'failed' in msg
-                        or 'fehler' in msg
-                    )
-                    return (
-                        action == 'daemon_restart_rejected'
-                        or (has_restart_context and has_error_marker)
-                    )
-
-                if filter_mode in ('restart', 'restart_app', 'restart_daemon', 'restart_error'):
-                    # Restart-Events sind häufig nur Teilmenge: größeren Suchraum laden
-                    # und anschließend serverseitig filtern.
-                    search_limit = min(limit * 10, 5000)
-                    raw_logs = DatabaseLogger.get_recent_logs(db_path, limit=search_limit)
-                    if filter_mode == 'restart_app':
-                        logs = [log for log in raw_logs if _is_restart_app(log)][:limit]
-                    elif filter_mode == 'restart_daemon':
-                        logs = [log for log in raw_logs if _is_restart_daemon(log)][:limit]
-                    elif filter_mode == 'restart_error':
-                        logs = [log for log in raw_logs if _is_restart_error(log)][:limit]
-                    else:
-                        logs = [log for log in raw_logs if _is_restart_log(log)][:limit]
-                else:
-                    logs = DatabaseLogger.get_recent_logs(db_path, limit=limit)
+                logs = DatabaseLogger.query_logs(
+                    db_path,
+                    limit=limit,
+                    before_id=request.args.get('before_id', None, type=int),
+                    level=request.args.get('level') or None,
+                    module=request.args.get('module') or None,
+                    category=DatabaseLogger.CATEGORY_FILTERS.get(filter_mode),
+                    action=request.args.get('action') or None,
+                    actor=request.args.get('actor') or None,
+                    search=request.args.get('q') or None
+                )
 
-                return jsonify(logs)
+                response = jsonify(logs)
+                response.headers['X-Next-Before-Id'] = str(logs[-1]['id']) if len(logs) == limit else ''
+                return response
             except Exception as e:
                 logger.error(f"Fehler beim Laden der Logs: {e}", exc_info=True)
                 return jsonify({'error': str(e)}), 500
 
         @self.app.route('/api/admin/logs/verify')
         def verify_system_logs():
-            """Prüft die manipulationserschwerende Hash-Kette der Logs."""
+            """Prüft die manipulationserschwerende Hash-Kette der Logs.
+
+            Standard: inkrementell ab dem gespeicherten Checkpoint (nur neue
+            Zeilen); full=1 prüft die gesamte Tabelle neu.
+            """
             try:
                 from modules.core.database_logger import DatabaseLogger
                 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
                 db_path = os.path.join(project_root, 'config', 'system_logs.db')
                 limit = request.args.get('limit', None, type=int)
-                result = DatabaseLogger.verify_chain(db_path, limit=limit)
+                full = str(request.args.get('full', '0')).strip().lower() in ('1', 'true', 'yes', 'on')
+                result = DatabaseLogger.verify_chain(db_path, limit=limit, incremental=not full)
                 return jsonify(result)
             except Exception as e:
                 logger.error(f"Fehler bei GET /api/admin/logs/verify: {e}", exc_info=True)
@@ -2488,17 +2536,26 @@ class WebManager(BaseModule):
 
         @self.app.route('/api/admin/logs/export')
         def export_system_logs():
-            """Exportiert Logs für Nachvollziehbarkeit (json/csv)."""
+            """Exportiert Logs für Nachvollziehbarkeit (json/csv/ndjson).
+
+            csv und ndjson werden chunkweise gestreamt (limit=0 = alle
+            Einträge, gzip=1 komprimiert); json bleibt ein Dokument mit
+            max. 50000 Einträgen.
+            """
             try:
                 from modules.core.database_logger import DatabaseLogger
+                from modules.core.stream_export import STREAM_FORMATS
                 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
                 db_path = os.path.join(project_root, 'config', 'system_logs.db')
                 limit = request.args.get('limit', 1000, type=int)
                 export_format = (request.args.get('format') or 'json').strip().lower()
-                logs = DatabaseLogger.export_logs(db_path, limit=limit)
+                compress = str(request.args.get('gzip', '0')).strip().lower() in ('1', 'true', 'yes', 'on')
+                logs = None
+                if export_format not in STREAM_FORMATS:
+                    logs = DatabaseLogger.export_logs(db_path, limit=limit)
 
                 actor = request.headers.get('X-Admin-User') or request.remote_addr or 'unknown'
-                DatabaseLogger.audit_event(
+                audit_id = DatabaseLogger.audit_event(
                     db_path=db_path,
                     action='logs_export',
                     actor=str(actor),
@@ -2509,23 +2566,16 @@ class WebManager(BaseModule):
                     }
                 )
 
-                if export_format == 'csv':
-                    import csv
-                    buffer = io.StringIO()
-                    writer = csv.DictWriter(
-                        buffer,
-                        fieldnames=['id', 'timestamp', 'level', 'module', 'message', 'prev_hash', 'entry_hash', 'created_at']
+                if logs is None:
+                    # Stand vor dem Audit-Eintrag dieses Exports, gelesen erst beim Senden
+                    rows = DatabaseLogger.iter_logs(
+                        db_path,
+                        limit=limit if limit > 0 else None,
+                        before_id=audit_id or None
                     )
-                    writer.writeheader()
-                    for row in logs:
-                        writer.writerow(row)
-                    out = io.BytesIO(buffer.getvalue().encode('utf-8'))
-                    out.seek(0)
-                    return send_file(
-                        out,
-                        as_attachment=True,
-                        download_name='system_logs_export.csv',
-                        mimetype='text/csv'
+                    return self._stream_export_response(
+                        rows, export_format, 'system_logs_export',
+                        fieldnames=DatabaseLogger.EXPORT_FIELDS, compress=compress
                     )
 
                 payload = {
@@ -3136,16 +3186,40 @@ class WebManager(BaseModule):
                         'telemetry_count': gw_status.get('telemetry_count', 0),
                         'telemetry_evictions': gw_status.get('telemetry_evictions', 0),
                         'polling_backpressure_skips': gw_status.get('polling_backpressure_skips', 0),
+                        'poll_scheduler': gw_status.get('poll_scheduler', {}),
                         'dead_letter': gw_status.get('dead_letter', {}),
                         'limits': gw_status.get('limits', {})
                     }
+                    if hasattr(gateway, 'get_dispatch_stats'):
+                        stats['protocols']['gateway']['routing_dispatch'] = gateway.get_dispatch_stats()
                 except Exception:
                     pass
             stats['protocols']['websocket'] = {
                 'name': 'WebSocket',
                 'active_clients': ws_clients,
-                'messages_sent': 0
+                'messages_sent': 0,
+                'legacy_telemetry_events': self._telemetry_legacy_events
             }
+            if self.telemetry_broadcaster is not None:
+                stats['protocols']['websocket']['telemetry_batch'] = self.telemetry_broadcaster.get_stats()
+            with self.lock:
+                stats['protocols']['websocket']['telemetry_snapshot'] = {
+                    'chunk': self._telemetry_snapshot_chunk,
+                    **self._telemetry_snapshot_stats
+                }
+            if self.socket_rooms is not None:
+                stats['protocols']['websocket']['rooms'] = {
+                    'enabled': self._socket_rooms_enabled,
+                    **self.socket_rooms.get_stats()
+                }
+            try:
+                from modules.core.database_logger import DatabaseLogger
+                stats['log_writers'] = DatabaseLogger.get_writer_stats()
+                stats['log_verifiers'] = DatabaseLogger.get_verifier_stats()
+            except Exception:
+                pass
+            if self._ring_event_store is not None:
+                stats['ring_event_writer'] = self._ring_event_store.get_writer_stats()
 
             return jsonify(stats)
 
@@ -4325,9 +4399,13 @@ class WebManager(BaseModule):
                 # ⭐ v4.6.0: Hole plc_type aus Symbol-Info
                 symbol_info = self.variable_manager.get_symbol_info(variable, plc_id)
                 if not symbol_info:
-                    return jsonify({'status': 'error', 'message': 'Symbol nicht gefunden'}), 404
+                    return jsonify({
+                        'status': 'error',
+                        'message': 'Symbol nicht gefunden',
+                        'suggestions': self.variable_manager.suggest_symbols(variable, plc_id)
+                    }), 404
 
-                value = plc.read_by_name(variable, symbol_info.symbol_type)
+                value = symbol_info.read(plc)
                 timestamp = time.time()
 
                 # Cache aktualisieren
@@ -4368,18 +4446,37 @@ class WebManager(BaseModule):
         """Setup SocketIO Events für Echtzeit-Kommunikation"""
 
         @self.socketio.on('connect')
-        def handle_connect():
-            """Client verbunden"""
+        def handle_connect(auth=None):
+            """
+            Client verbunden
+
+            Auth (optional, Socket.IO v4):
+            {
+                "telemetry_epoch": "3f2a9c1b7d4e",
+                "telemetry_seq": 18231
+            }
+
+            Mit telemetry_seq gibt es statt initial_telemetry seitenweise
+            telemetry_snapshot-Frames (nur Änderungen seit telemetry_seq).
+            """
             client_id = request.sid
             with self.lock:
                 self.connected_clients.add(client_id)
                 self._sid_widget_subscriptions.setdefault(client_id, set())
+            # Default: voller Telemetrie-Strom (subscribe_telemetry schränkt ein)
+            self._join_owner_room(client_id, '__telemetry_all__', TELEMETRY_ALL_ROOM)
             print(f"  🔌 Client verbunden: {client_id} (Total: {len(self.connected_clients)})")
 
-            # Sende initial alle Telemetrie-Daten
             if self.data_gateway:
-                telemetry = self.data_gateway.get_all_telemetry()
-                emit('initial_telemetry', telemetry)
+                if (isinstance(auth, dict) and 'telemetry_seq' in auth
+                        and hasattr(self.data_gateway, 'get_telemetry_page')):
+                    # Versionierter Client: Delta bzw. erste Snapshot-Seite
+                    self._emit_telemetry_snapshot(auth.get('telemetry_epoch'), auth.get('telemetry_seq'))
+                else:
+                    # Legacy: gesamte Telemetrie in einem Event
+                    with self.lock:
+                        self._telemetry_snapshot_stats['legacy_connects'] += 1
+                    emit('initial_telemetry', self.data_gateway.get_all_telemetry())
                 emit('request_context', {'correlation_id': f"ws-connect-{client_id[:8]}-{int(time.time() * 1000)}"})
 
         @self.socketio.on('disconnect')
@@ -4395,6 +4492,9 @@ class WebManager(BaseModule):
                         self.variable_manager.unsubscribe_widget(scoped_widget_id)
                 except Exception as e:
                     logger.debug(f"Subscription-Cleanup fehlgeschlagen ({client_id}): {e}")
+            if self.socket_rooms is not None:
+                # Socket.IO entfernt den sid selbst aus allen Räumen
+                self.socket_rooms.drop_sid(client_id)
             with self.lock:
                 self.connected_clients.discard(client_id)
             print(f"  🔌 Client getrennt: {client_id} (Total: {len(self.connected_clients)})")
@@ -4412,7 +4512,9 @@ class WebManager(BaseModule):
             {
                 "widget_id": "widget_123",
                 "variable": "Light.Light_EG_WZ.bOn",
-                "plc_id": "plc_001"
+                "plc_id": "plc_001",
+                "widget_type": "switch",   # optional, bestimmt die Poll-Klasse
+                "poll_class": "fast"       # optional: fast | normal | slow
             }
             """
             if not self.variable_manager:
@@ -4430,10 +4532,12 @@ class WebManager(BaseModule):
                     return
 
                 scoped_widget_id = f"{client_id}:{widget_id}"
+                poll_class = resolve_poll_class(data.get('poll_class'), data.get('widget_type'))
                 # Subscribe Widget
-                self.variable_manager.subscribe_widget(scoped_widget_id, variable, plc_id)
+                self.variable_manager.subscribe_widget(scoped_widget_id, variable, plc_id, poll_class=poll_class)
                 with self.lock:
                     self._sid_widget_subscriptions.setdefault(client_id, set()).add(scoped_widget_id)
+                self._join_owner_room(client_id, scoped_widget_id, variable_room(plc_id, variable))
 
                 # Sende aktuellen Wert sofort zurück
                 cached = self.variable_manager.get_cached_value(variable, plc_id)
@@ -4505,6 +4609,7 @@ class WebManager(BaseModule):
                         sid_set.discard(scoped_widget_id)
                         if not sid_set:
                             self._sid_widget_subscriptions.pop(client_id, None)
+                self._leave_owner_room(client_id, scoped_widget_id)
 
                 logger.info(f"📌 Widget {widget_id} unsubscribed")
 
@@ -4517,6 +4622,157 @@ class WebManager(BaseModule):
                 logger.error(f"Fehler bei unsubscribe_variable: {e}", exc_info=True)
                 emit('error', {'message': str(e)})
 
+        @self.socketio.on('request_telemetry_snapshot')
+        def handle_request_telemetry_snapshot(data):
+            """
+            Nächste Snapshot-Seite (Client blättert selbst weiter)
+
+            Data Format:
+            {
+                "epoch": "3f2a9c1b7d4e",
+                "cursor": 500
+            }
+            """
+            data = data or {}
+            if not self.data_gateway or not hasattr(self.data_gateway, 'get_telemetry_page'):
+                emit('error', {'message': 'Telemetrie-Snapshot nicht verfügbar'})
+                return
+            self._emit_telemetry_snapshot(data.get('epoch'), data.get('cursor'), follow_up=True)
+
+        @self.socketio.on('subscribe_telemetry')
+        def handle_subscribe_telemetry(data):
+            """
+            Client wählt seine Telemetrie-Keys
+
+            Data Format:
+            {
+                "keys": ["PLC.MAIN.bOn", "bluetooth.temp"],
+                "all": false
+            }
+
+            Ohne Keys (oder mit all=true) bleibt der volle Strom aktiv.
+            """
+            data = data or {}
+            client_id = request.sid
+            keys = [str(key) for key in (data.get('keys') or []) if key]
+            want_all = bool(data.get('all', not keys))
+
+            if want_all:
+                self._join_owner_room(client_id, '__telemetry_all__', TELEMETRY_ALL_ROOM)
+            else:
+                self._leave_owner_room(client_id, '__telemetry_all__')
+            for key in keys:
+                self._join_owner_room(client_id, f"telemetry-key:{key}", telemetry_room(key))
+
+            emit('subscribe_telemetry_success', {'all': want_all, 'keys': keys})
+
+        @self.socketio.on('unsubscribe_telemetry')
+        def handle_unsubscribe_telemetry(data):
+            """
+            Client beendet Telemetrie-Abos
+
+            Data Format:
+            {
+                "keys": ["PLC.MAIN.bOn"],
+                "all": true
+            }
+            """
+            data = data or {}
+            client_id = request.sid
+            keys = [str(key) for key in (data.get('keys') or []) if key]
+            if data.get('all'):
+                self._leave_owner_room(client_id, '__telemetry_all__')
+            for key in keys:
+                self._leave_owner_room(client_id, f"telemetry-key:{key}")
+
+            emit('unsubscribe_telemetry_success', {'all': bool(data.get('all')), 'keys': keys})
+
+    def _emit_telemetry_snapshot(self, epoch: str, after_seq: Any, follow_up: bool = False):
+        """Sendet eine telemetry_snapshot-Seite an den aktuellen Client"""
+        page = self.data_gateway.get_telemetry_page(
+            after_seq=after_seq, limit=self._telemetry_snapshot_chunk, epoch=epoch
+        )
+        with self.lock:
+            stats = self._telemetry_snapshot_stats
+            if not follow_up:
+                stats['full_connects' if page['mode'] == 'full' else 'delta_connects'] += 1
+            stats['pages'] += 1
+            stats['keys_sent'] += page['count']
+        emit('telemetry_snapshot', page)
+
+    def _join_owner_room(self, sid: str, owner: str, room: str):
+        """Tritt (refcounted) einem Socket.IO-Raum bei - nur im Socket-Handler-Kontext"""
+        if self.socket_rooms is None:
+            return
+        joined, left_room = self.socket_rooms.bind(sid, owner, room)
+        if left_room:
+            leave_room(left_room, sid=sid, namespace='/')
+        if joined:
+            join_room(room, sid=sid, namespace='/')
+
+    def _leave_owner_room(self, sid: str, owner: str):
+        """Verlässt den Raum eines Owners, sobald kein Widget ihn mehr braucht"""
+        if self.socket_rooms is None:
+            return
+        left_room = self.socket_rooms.unbind(sid, owner)
+        if left_room:
+            leave_room(left_room, sid=sid, namespace='/')
+
+    def _rooms_active(self) -> bool:
+        return self._socket_rooms_enabled and self.socket_rooms is not None
+
+    def emit_variable_updates(self, updates: Dict[str, Dict[str, Any]]):
+        """
+        Sendet variable_updates nur an Clients mit passender Subscription
+
+        Clients mit gleicher Interessenmenge teilen sich ein Emit.
+
+        Args:
+            updates: {plc_id: {variable: update}}
+        """
+        if not self.socketio or not updates:
+            return
+        if not self._rooms_active():
+            self.socketio.emit('variable_updates', updates)
+            return
+
+        rooms = {}
+        for plc_id, variables in updates.items():
+            for variable, update in (variables or {}).items():
+                rooms[variable_room(plc_id, variable)] = (plc_id, variable, update)
+
+        for sids, room_key in self.socket_rooms.group_by_interest(rooms):
+            payload: Dict[str, Dict[str, Any]] = {}
+            for room in room_key:
+                plc_id, variable, update = rooms[room]
+                payload.setdefault(plc_id, {})[variable] = update
+            self.socketio.emit('variable_updates', payload, to=sids)
+
+    def _emit_telemetry_frame(self, event: str, payload: Dict[str, Any]):
+        """Emit-Callback des TelemetryBroadcaster (Vollstrom-Raum + Key-Abos)"""
+        if not self.socketio:
+            return
+        if not self._rooms_active():
+            self.socketio.emit(event, payload)
+            return
+
+        full_stream = self.socket_rooms.members(TELEMETRY_ALL_ROOM)
+        if full_stream:
+            self.socketio.emit(event, payload, to=TELEMETRY_ALL_ROOM)
+            self.socket_rooms.record_broadcast(len(full_stream))
+
+        updates = payload.get('updates') or {}
+        timestamps = payload.get('timestamps') or {}
+        rooms = {telemetry_room(key): key for key in updates}
+        for sids, room_key in self.socket_rooms.group_by_interest(rooms, exclude=full_stream):
+            keys = [rooms[room] for room in room_key]
+            self.socketio.emit(event, {
+                **payload,
+                'count': len(keys),
+                'updates': {key: updates[key] for key in keys},
+                'timestamps': {key: timestamps.get(key) for key in keys}
+            }, to=sids)
+
     def _load_cameras_config_for_monitor(self) -> Dict[str, Any]:
         path = os.path.join(os.path.abspath(os.getcwd()), 'config', 'cameras.json')
         if os.path.exists(path):
@@ -4530,6 +4786,13 @@ class WebManager(BaseModule):
     def _get_ring_camera_configs(self) -> List[Dict[str, str]]:
         return ring_support.get_ring_camera_configs(self)
 
+    def _suggest_symbol_names(self, plc_id: str, variable_name: str, limit: int = 5) -> List[str]:
+        """Ähnliche Symbolnamen aus dem Symbol-Suchindex (für unbekannte Variablen)."""
+        if not self.symbol_browser:
+            return []
+        index = self.symbol_browser.get_search_index(plc_id, extra_symbols=self._get_gateway_virtual_symbols())
+        return index.suggest(variable_name, limit=limit)
+
     def _get_gateway_virtual_symbols(self) -> List[Dict[str, Any]]:
         """Gateway-eigene Variablen für die Symbolauswahl (z. B. Ring)."""
         symbols = []
@@ -5067,25 +5330,37 @@ class WebManager(BaseModule):
         except Exception as e:
             logger.debug(f"Trigger-Regelverarbeitung fehlgeschlagen ({key}): {e}")
 
-    def broadcast_telemetry(self, key: str, value: Any, correlation_id: str = None):
+    def broadcast_telemetry(self, key: str, value: Any, correlation_id: str = None, seq: int = None):
         """
-        Sendet Telemetrie-Update an alle Clients
+        Sendet Telemetrie-Update an alle Clients mit Interesse am Key
 
         Args:
             key: Telemetrie-Key
             value: Wert
+            seq: Telemetrie-Sequenz der Änderung (Reconnect-Cursor)
         """
         if not self.running or not self.socketio:
             return
 
-        self.socketio.emit('telemetry_update', {
-            'key': key,
-            'value': value,
-            'timestamp': time.time(),
-            'timestamp_utc': self._utc_iso(),
-            'correlation_id': correlation_id or self._get_request_id()
-        })
-        logger.debug("Socket telemetry_update: key=%s cid=%s", key, correlation_id or self._get_request_id())
+        if self.telemetry_broadcaster is not None:
+            # Gebündelt im nächsten telemetry_batch-Frame (letzter Wert pro Key)
+            self.telemetry_broadcaster.publish(key, value, correlation_id=correlation_id, seq=seq)
+
+        if self._telemetry_legacy_events:
+            payload = {
+                'key': key,
+                'value': value,
+                'timestamp': time.time(),
+                'timestamp_utc': self._utc_iso(),
+                'correlation_id': correlation_id or self._get_request_id()
+            }
+            if seq is not None:
+                payload['seq'] = seq
+            if self._rooms_active():
+                self.socketio.emit('telemetry_update', payload, to=[TELEMETRY_ALL_ROOM, telemetry_room(key)])
+            else:
+                self.socketio.emit('telemetry_update', payload)
+            logger.debug("Socket telemetry_update: key=%s cid=%s", key, correlation_id or self._get_request_id())
 
     def broadcast_event(self, event_type: str, data: Dict[str, Any]):
         """
@@ -5122,6 +5397,8 @@ class WebManager(BaseModule):
         # Setup SocketIO Events
         if self.socketio:
             self._setup_socketio()
+        if self.telemetry_broadcaster is not None:
+            self.telemetry_broadcaster.start()
         self._start_ring_event_monitor()
 
         try:
@@ -5139,10 +5416,16 @@ class WebManager(BaseModule):
         finally:
             self.running = False
             self._stop_ring_event_monitor()
+            if self.telemetry_broadcaster is not None:
+                self.telemetry_broadcaster.stop(flush=False)
 
     def shutdown(self):
         self.running = False
         self._stop_ring_event_monitor()
+        if self._ring_event_store is not None:
+            self._ring_event_store.close()
+        if self.telemetry_broadcaster is not None:
+            self.telemetry_broadcaster.stop(flush=False)
 
         # ⭐ v4.6.0: Stop Variable Polling
         if self.data_gateway:
@@ -0,0 +1,156 @@
+"""
+PLC Type Resolver
+Löst TwinCAT-Typnamen einmalig in pyads/ctypes PLCTYPE_* auf
+
+📁 SPEICHERORT: modules/plc/plc_types.py
+
+Unterstützt:
+- Elementare Typen (BOOL, INT, UDINT, LREAL, TIME, ...) inkl. INT16/UINT32-Schreibweise
+- STRING / STRING(n) → PLCTYPE_STRING * (n + 1)
+- WSTRING
+- ARRAY [a..b(, c..d)] OF <elementarer Typ> → ctypes-Array
+- Enum-/Alias-Typen aus den TPY-DataTypes (z.B. eMode → INT)
+- Suffixe wie "REAL (VAR_IN_OUT)"
+
+Unbekannte Typen (Strukturen, FBs, POINTER) liefern None - der Aufrufer
+entscheidet über den Fallback (DEFAULT_PLC_TYPE).
+
+Die Auflösung passiert bei der Symbol-Registrierung, nicht im Poll-Loop.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+try:
+    import pyads
+    PYADS_AVAILABLE = True
+except ImportError:
+    PYADS_AVAILABLE = False
+
+
+if PYADS_AVAILABLE:
+    _PRIMITIVES: Dict[str, Any] = {
+        'BOOL': pyads.PLCTYPE_BOOL,
+        'BIT': pyads.PLCTYPE_BOOL,
+        'BYTE': pyads.PLCTYPE_BYTE,
+        'USINT': pyads.PLCTYPE_USINT,
+        'UINT8': pyads.PLCTYPE_USINT,
+        'SINT': pyads.PLCTYPE_SINT,
+        'INT8': pyads.PLCTYPE_SINT,
+        'WORD': pyads.PLCTYPE_WORD,
+        'UINT': pyads.PLCTYPE_UINT,
+        'UINT16': pyads.PLCTYPE_UINT,
+        'INT': pyads.PLCTYPE_INT,
+        'INT16': pyads.PLCTYPE_INT,
+        'DWORD': pyads.PLCTYPE_DWORD,
+        'UDINT': pyads.PLCTYPE_UDINT,
+        'UINT32': pyads.PLCTYPE_UDINT,
+        'DINT': pyads.PLCTYPE_DINT,
+        'INT32': pyads.PLCTYPE_DINT,
+        'ULINT': pyads.PLCTYPE_ULINT,
+        'UINT64': pyads.PLCTYPE_ULINT,
+        'LINT': pyads.PLCTYPE_LINT,
+        'INT64': pyads.PLCTYPE_LINT,
+        'REAL': pyads.PLCTYPE_REAL,
+        'LREAL': pyads.PLCTYPE_LREAL,
+        'TIME': pyads.PLCTYPE_TIME,
+        'TOD': pyads.PLCTYPE_TOD,
+        'TIME_OF_DAY': pyads.PLCTYPE_TOD,
+        'DATE': pyads.PLCTYPE_DATE,
+        'DT': pyads.PLCTYPE_DT,
+        'DATE_AND_TIME': pyads.PLCTYPE_DT,
+        'STRING': pyads.PLCTYPE_STRING,
+        'WSTRING': pyads.PLCTYPE_WSTRING,
+    }
+    DEFAULT_PLC_TYPE = pyads.PLCTYPE_BYTE
+else:
+    _PRIMITIVES = {}
+    DEFAULT_PLC_TYPE = None
+
+_SUFFIX_RE = re.compile(r'^(.*?)\s+\(.*\)$')
+_STRING_RE = re.compile(r'^STRING\s*[\(\[]\s*(\d+)\s*[\)\]]$')
+_ARRAY_RE = re.compile(r'^ARRAY\s*\[(.+?)\]\s*OF\s+(.+)$')
+_RANGE_RE = re.compile(r'^\s*(-?\d+)\s*\.\.\s*(-?\d+)\s*$')
+_MAX_ALIAS_DEPTH = 16
+
+
+def _normalize(type_name: str) -> str:
+    name = str(type_name or '').strip()
+    match = _SUFFIX_RE.match(name)
+    if match:
+        name = match.group(1).strip()
+    return name.upper()
+
+
+def _array_elements(dims: str) -> Optional[int]:
+    elements = 1
+    for dim in dims.split(','):
+        match = _RANGE_RE.match(dim)
+        if not match:
+            return None
+        lower, upper = int(match.group(1)), int(match.group(2))
+        if upper < lower:
+            return None
+        elements *= (upper - lower + 1)
+    return elements
+
+
+class PLCTypeResolver:
+    """
+    Memoisierter Typ-Resolver pro PLC
+
+    Args:
+        aliases: {Typname: Basistyp} aus den TPY-DataTypes
+            (Enums, Alias-Typen, benannte Arrays)
+    """
+
+    def __init__(self, aliases: Optional[Dict[str, str]] = None):
+        self.aliases = {str(k).strip().upper(): str(v) for k, v in (aliases or {}).items() if k and v}
+        self._memo: Dict[str, Any] = {}
+
+    def resolve(self, type_name: str) -> Optional[Any]:
+        """Liefert den ctypes-Typ oder None (unbekannt/Struktur)"""
+        if type_name in self._memo:
+            return self._memo[type_name]
+        resolved = self._resolve(_normalize(type_name), 0)
+        self._memo[type_name] = resolved
+        return resolved
+
+    def _resolve(self, name: str, depth: int) -> Optional[Any]:
+        if not PYADS_AVAILABLE or not name or depth > _MAX_ALIAS_DEPTH:
+            return None
+
+        primitive = _PRIMITIVES.get(name)
+        if primitive is not None:
+            return primitive
+
+        match = _STRING_RE.match(name)
+        if match:
+            return pyads.PLCTYPE_STRING * (int(match.group(1)) + 1)
+
+        match = _ARRAY_RE.match(name)
+        if match:
+            elements = _array_elements(match.group(1))
+            element_type = self._resolve(_normalize(match.group(2)), depth + 1)
+            # Nur Arrays elementarer Zahlentypen (keine String-/Struktur-Arrays)
+            if not elements or element_type is None or hasattr(element_type, '_length_'):
+                return None
+            if element_type in (pyads.PLCTYPE_STRING, pyads.PLCTYPE_WSTRING):
+                return None
+            return element_type * elements
+
+        alias = self.aliases.get(name)
+        if alias is not None:
+            return self._resolve(_normalize(alias), depth + 1)
+
+        return None
+
+
+_DEFAULT_RESOLVER = PLCTypeResolver()
+
+
+@lru_cache(maxsize=1024)
+def resolve_plc_type(type_name: str) -> Optional[Any]:
+    """Auflösung ohne TPY-Aliase (elementare Typen, STRING(n), ARRAY)"""
+    return _DEFAULT_RESOLVER._resolve(_normalize(type_name), 0)
@@ -10,9 +10,11 @@ Features v4.6.0:
 - ⭐ Rekursive SubItem-Expansion aus DataTypes Section
 - ⭐ Intelligente Duplikat-Entfernung (bevorzugt Symbole mit Type)
 - ⭐ Korrekte Type-Detection (BOOL, INT, REAL, STRING, etc.)
-- ⭐ Hierarchische TreeView-Struktur für das Frontend
+- ⭐ Hierarchische TreeView-Struktur für das Frontend (gecachter Baum, ebenenweise abrufbar)
 - ⭐ Fix: Robustes JSON-Caching gegen NoneType-Pfad-Fehler
 - ⭐ Multi-PLC Support via Connection Manager
+- ⭐ TPY-Parsing über modules/plc/tpy_reader.py (Streaming + Parse-Cache)
+- ⭐ Binärer Symbol-Cache (symbol_cache.bin, mmap, lazy) mit Migration von symbol_cache.json
 
 Änderungen v4.6.0:
 - FIX: Intelligente Duplikat-Entfernung bevorzugt Symbole mit Type
@@ -28,8 +30,14 @@ Features v4.6.0:
 import time
 import json
 import os
+import threading
 from typing import Dict, List, Any, Optional
 
+from modules.plc.symbol_index import SymbolSearchIndex
+from modules.plc.symbol_tree import SymbolTreeIndex
+from modules.plc.tpy_reader import read_tpy
+from modules.plc.symbol_cache_file import MappedSymbolTable, is_binary_cache, write_symbol_cache
+
 # Versuche pyads zu importieren, um ADS-Funktionalität bereitzustellen
 try:
     import pyads
@@ -80,6 +88,13 @@ class PLCSymbolBrowser:
         self.conn_mgr = connection_manager
         self.symbol_cache = {}
         self.cache_timestamp = {}
+        self.type_aliases = {}  # connection_id -> {Typname: Basistyp} (Enums/Aliase aus TPY)
+        # Symbol-Generation pro Verbindung (steigt bei jeder neuen Symbolmenge)
+        self.symbol_generation = {}
+        self._search_indexes = {}  # connection_id -> (generation, signature, SymbolSearchIndex)
+        self._tree_indexes = {}  # connection_id -> (generation, SymbolTreeIndex)
+        self._index_builds = 0  # Index-Generation (eindeutig über alle Rebuilds)
+        self._index_lock = threading.Lock()
 
         # Pfad-Initialisierung (Absoluter Pfad-Fix für v4.6.0)
         base_path = os.path.abspath(os.getcwd())
@@ -89,7 +104,12 @@ class PLCSymbolBrowser:
         if not os.path.exists(self.cache_dir):
             os.makedirs(self.cache_dir, exist_ok=True)
 
-        self.cache_file = os.path.join(self.cache_dir, "symbol_cache.json")
+        # Binärformat (modules/plc/symbol_cache_file.py); ein vorhandenes
+        # symbol_cache.json wird beim Laden automatisch migriert
+        self.cache_file = os.path.join(self.cache_dir, "symbol_cache.bin")
+        self._cache_file_state = {}  # Pfad -> ((mtime_ns, size), connection_id)
+        # Parse-Cache für TPY-Dateien (nach Inhalts-Hash)
+        self.tpy_cache_dir = os.path.join(self.cache_dir, 'tpy')
 
     def get_symbols(self, connection_id: str, force_refresh: bool = False) -> List[Dict]:
         """
@@ -103,7 +123,7 @@ class PLCSymbolBrowser:
         # 1. RAM-Cache Prüfung (TTL 300 Sekunden)
         if not force_refresh and connection_id in self.symbol_cache:
             if time.time() - self.cache_timestamp.get(connection_id, 0) < 300:
-                return [s.to_dict() for s in self.symbol_cache[connection_id]]
+                return self._symbol_dicts(self.symbol_cache[connection_id])
 
         # 2. Versuche Disk-Cache zu laden (gibt gecachte Symbole zurück)
         print(f"  ℹ️ Lade Symbole aus Cache für {connection_id}...")
@@ -113,7 +133,7 @@ class PLCSymbolBrowser:
         # Wenn Cache-Daten vorhanden sind, gebe sie zurück
         if cached_data:
             print(f"  ✓ {len(cached_data)} Symbole aus Cache geladen.")
-            return [s.to_dict() for s in cached_data]
+            return self._symbol_dicts(cached_data)
 
         # 3. Kein Cache - versuche ConnectionManager
         if self.conn_mgr:
@@ -126,6 +146,66 @@ class PLCSymbolBrowser:
         print(f"  ⚠️ Keine Symbole verfügbar für {connection_id}. Bitte TPY hochladen oder PLC verbinden.")
         return []
 
+    def set_symbols(self, connection_id: str, symbols_list: List[PLCSymbol], timestamp: float = None):
+        """Ersetzt die Symbolmenge einer Verbindung und erhöht deren Generation"""
+        previous = self.symbol_cache.get(connection_id)
+        self.symbol_cache[connection_id] = symbols_list
+        self.cache_timestamp[connection_id] = timestamp if timestamp is not None else time.time()
+        self.symbol_generation[connection_id] = self.symbol_generation.get(connection_id, 0) + 1
+        if isinstance(previous, MappedSymbolTable) and previous is not symbols_list:
+            # Mapping freigeben (sonst ein Handle pro Reload; unter Windows
+            # scheitert os.replace() auf die noch gemappte Cache-Datei)
+            with self._index_lock:
+                self._tree_indexes.pop(connection_id, None)  # liest über das alte Mapping
+            previous.close()
+
+    @staticmethod
+    def _symbol_dicts(symbols) -> List[Dict]:
+        """Symbole als Dicts; gemappte Caches liefern sie direkt aus den Spalten"""
+        if isinstance(symbols, MappedSymbolTable):
+            return symbols.to_dicts()
+        return [s.to_dict() for s in symbols]
+
+    def get_search_index(self, connection_id: str, extra_symbols: List[Dict] = None) -> SymbolSearchIndex:
+        """
+        Suchindex der Verbindung (einmal pro Symbol-Generation aufgebaut)
+
+        Args:
+            connection_id: Verbindungs-ID
+            extra_symbols: Zusätzliche Symbole als Dicts (z.B. Gateway-Variablen);
+                ändern sie sich, wird der Index neu aufgebaut
+        """
+        if connection_id not in self.symbol_cache:
+            # Einmalig Disk-Cache/PLC laden, danach bleibt der Index im RAM
+            self.get_symbols(connection_id)
+
+        extra = [
+            (str(sym.get('name', '')), str(sym.get('type', '')), sym.get('comment', ''))
+            for sym in (extra_symbols or []) if isinstance(sym, dict)
+        ]
+        signature = tuple(entry[0] for entry in extra)
+        generation = self.symbol_generation.get(connection_id, 0)
+
+        with self._index_lock:
+            cached = self._search_indexes.get(connection_id)
+            if cached is not None and cached[0] == generation and cached[1] == signature:
+                return cached[2]
+            symbols = self.symbol_cache.get(connection_id, [])
+            if isinstance(symbols, MappedSymbolTable):
+                entries = list(symbols.entries()) + extra
+            else:
+                entries = [(s.name, s.symbol_type, s.comment) for s in symbols] + extra
+            self._index_builds += 1
+            index = SymbolSearchIndex(entries, generation=self._index_builds)
+            self._search_indexes[connection_id] = (generation, signature, index)
+            return index
+
+    def get_type_aliases(self, connection_id: str) -> Dict[str, str]:
+        """Enum-/Alias-Typen der Verbindung ({Typname: Basistyp})"""
+        if connection_id not in self.type_aliases:
+            self.load_cache_from_file(self.cache_file)
+        return dict(self.type_aliases.get(connection_id, {}))
+
     def _fetch_from_plc(self, plc_conn, connection_id):
         """Führt die eigentliche ADS-Abfrage durch (Optimiert für pyads 3.5.0)."""
         try:
@@ -156,8 +236,7 @@ class PLCSymbolBrowser:
                 symbols_list.append(plc_symbol)
 
             # RAM-Cache aktualisieren
-            self.symbol_cache[connection_id] = symbols_list
-            self.cache_timestamp[connection_id] = time.time()
+            self.set_symbols(connection_id, symbols_list)
 
             # Disk-Cache für Offline-Betrieb sichern
             self.save_cache_to_file(self.cache_file, connection_id)
@@ -169,83 +248,124 @@ class PLCSymbolBrowser:
             print(f"  ✗ ADS Error (3.5.0) bei Symbol-Abfrage: {e}")
             return []
 
+    def get_tree_index(self, connection_id: str) -> SymbolTreeIndex:
+        """Symbolbaum der Verbindung (einmal pro Symbol-Generation aufgebaut)"""
+        if connection_id not in self.symbol_cache:
+            self.get_symbols(connection_id)
+
+        generation = self.symbol_generation.get(connection_id, 0)
+        with self._index_lock:
+            cached = self._tree_indexes.get(connection_id)
+            if cached is not None and cached[0] == generation:
+                return cached[1]
+            symbols = self.symbol_cache.get(connection_id, [])
+            if isinstance(symbols, MappedSymbolTable):
+                names = (symbols.name(i) for i in range(len(symbols)))
+                lookup = symbols.record
+            else:
+                names = (s.name for s in symbols)
+
+                def lookup(position):
+                    return symbols[position].to_dict()
+            tree = SymbolTreeIndex(names, lookup, generation=generation)
+            self._tree_indexes[connection_id] = (generation, tree)
+            return tree
+
     def get_tree(self, connection_id: str) -> Dict[str, Any]:
         """Konvertiert die flache Symbolliste in eine Baumstruktur für die UI."""
-        symbols = self.get_symbols(connection_id)
-        tree = {'name': 'PLC_ROOT', 'children': [], 'type': 'folder'}
-        for s in symbols:
-            self._add_to_tree(tree, s)
-        return tree
-
-    def _add_to_tree(self, tree, symbol):
-        """Hilfsmethode: Splittet Symbolnamen und ordnet sie hierarchisch in den Baum ein."""
-        parts = symbol['name'].split('.')
-        current = tree
-        for i, part in enumerate(parts):
-            if 'children' not in current:
-                current['children'] = []
-
-            # Prüfe, ob dieser Teilpfad bereits existiert
-            child = next((c for c in current['children'] if c['name'] == part), None)
-
-            if not child:
-                is_leaf = (i == len(parts) - 1)
-                child = {
-                    'name': part,
-                    'full_name': '.'.join(parts[:i + 1]),
-                    'type': symbol['type'] if is_leaf else 'STRUCT',
-                    'is_leaf': is_leaf
-                }
-
-                if is_leaf:
-                    # Metadaten nur an Blättern (Variablen) anhängen
-                    child.update({
-                        'size': symbol['size'],
-                        'comment': symbol['comment'],
-                        'index_group': symbol['index_group'],
-                        'index_offset': symbol['index_offset']
-                    })
-                else:
-                    # Strukturelemente erhalten eine Liste für Kinder
-                    child['children'] = []
-
-                current['children'].append(child)
-            current = child
+        return self.get_tree_index(connection_id).to_nested()
 
     def save_cache_to_file(self, file_path, connection_id):
-        """Speichert die Symbolliste einer Verbindung als JSON-Datei."""
+        """
+        Speichert die Symbolliste einer Verbindung
+
+        Binärformat (symbol_cache_file); Pfade mit Endung .json schreiben den
+        bisherigen JSON-Export (zum Debuggen).
+        """
         try:
             # Sicherstellen, dass Pfad ein String ist (v4.6.0 Fix)
             f_path = str(file_path)
-            data = {
-                'connection_id': connection_id,
-                'timestamp': self.cache_timestamp.get(connection_id),
-                'symbols': [s.to_dict() for s in self.symbol_cache[connection_id]]
-            }
-            with open(f_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            if f_path.endswith('.json'):
+                data = {
+                    'connection_id': connection_id,
+                    'timestamp': self.cache_timestamp.get(connection_id),
+                    'symbols': self._symbol_dicts(self.symbol_cache[connection_id]),
+                    'type_aliases': self.type_aliases.get(connection_id, {})
+                }
+                with open(f_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2)
+            else:
+                write_symbol_cache(f_path, connection_id, self.cache_timestamp.get(connection_id),
+                                   self.symbol_cache[connection_id], self.type_aliases.get(connection_id, {}))
+            self._cache_file_state[f_path] = (self._file_key(f_path), connection_id)
         except Exception as e:
             print(f"  ⚠️ Fehler beim Speichern des Symbol-Caches: {e}")
 
+    @staticmethod
+    def _file_key(path: str):
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+
     def load_cache_from_file(self, file_path):
-        """Lädt eine gespeicherte Symbolliste von der Disk."""
-        # Prüfen, ob die Datei existiert und Pfad valide ist
-        if not file_path or not os.path.exists(file_path):
+        """
+        Lädt eine gespeicherte Symbolliste von der Disk
+
+        Binär-Caches werden gemappt (PLCSymbol-Objekte entstehen erst beim
+        Zugriff). Liegt daneben ein neueres symbol_cache.json (Altformat), wird
+        es eingelesen und als Binär-Cache neu geschrieben.
+        """
+        if not file_path:
             return False
+        path = str(file_path)
+        legacy_path = os.path.splitext(path)[0] + '.json'
 
         try:
-            with open(str(file_path), 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                cid = data.get('connection_id')
+            if legacy_path != path and os.path.exists(legacy_path) and (
+                    not os.path.exists(path) or os.path.getmtime(legacy_path) > os.path.getmtime(path)):
+                cid = self._load_json_cache(legacy_path)
+                if cid:
+                    self.save_cache_to_file(path, cid)
+                    print(f"  ✓ Symbol-Cache migriert: {os.path.basename(legacy_path)} → {os.path.basename(path)}")
+                return cid is not None
+
+            # Prüfen, ob die Datei existiert und Pfad valide ist
+            if not os.path.exists(path):
+                return False
+
+            key = self._file_key(path)
+            state = self._cache_file_state.get(path)
+            if state is not None and state[0] == key and state[1] in self.symbol_cache:
+                # Datei unverändert → RAM-Stand bleibt gültig, kein erneutes Laden
+                self.cache_timestamp[state[1]] = time.time()
+                return True
+
+            if is_binary_cache(path):
+                table = MappedSymbolTable(path, PLCSymbol)
+                cid = table.connection_id
                 if cid:
-                    # Dictionary-Daten zurück in PLCSymbol Objekte mappen
-                    self.symbol_cache[cid] = [PLCSymbol(**s) for s in data.get('symbols', [])]
-                    self.cache_timestamp[cid] = data.get('timestamp', time.time())
+                    self.set_symbols(cid, table, table.timestamp or time.time())
+                    self.type_aliases[cid] = table.type_aliases
+            else:
+                cid = self._load_json_cache(path)
+            if cid:
+                self._cache_file_state[path] = (key, cid)
             return True
         except Exception as e:
             print(f"  ⚠️ Fehler beim Laden des Symbol-Caches: {e}")
             return False
 
+    def _load_json_cache(self, path: str) -> Optional[str]:
+        """Liest das bisherige JSON-Format - Returns: connection_id"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        cid = data.get('connection_id')
+        if cid:
+            # Dictionary-Daten zurück in PLCSymbol Objekte mappen
+            self.set_symbols(cid, [PLCSymbol(**s) for s in data.get('symbols', [])],
+                              data.get('timestamp', time.time()))
+            self.type_aliases[cid] = data.get('type_aliases', {}) or {}
+        return cid
+
 
     def load_symbols_from_tpy(self, tpy_filepath: str, connection_id: str = 'plc_001') -> int:
         """
@@ -259,208 +379,33 @@ class PLCSymbolBrowser:
             Anzahl der geladenen Symbole
         """
         try:
-            import xml.etree.ElementTree as ET
-
-            # Parse TPY-Datei
-            tree = ET.parse(tpy_filepath)
-            root = tree.getroot()
-
-            print(f"  📂 Root-Element: {root.tag}")
-
-            # Suche ALLE Symbol-Elemente (funktioniert für TwinCAT 2 & 3)
-            all_symbols = root.findall('.//Symbol')
-            print(f"  🔍 Gefunden: {len(all_symbols)} <Symbol> Elemente (Top-Level)")
-
-            # SCHRITT 1: Baue DataType-Map (für TwinCAT 2 TPY Format)
-            # DataTypes enthalten die SubItem-Definitionen für Strukturen/FBs
-            datatype_by_name = {}
-            all_datatypes = root.findall('.//DataTypes/DataType')
-            print(f"  🔍 Gefunden: {len(all_datatypes)} <DataType> Elemente")
-
-            for dt in all_datatypes:
-                dt_name_elem = dt.find('Name')
-                if dt_name_elem is not None and dt_name_elem.text:
-                    dt_name = dt_name_elem.text.strip()
-                    if dt_name:
-                        datatype_by_name[dt_name] = dt
-
-            print(f"  📚 DataType-Map erstellt: {len(datatype_by_name)} Typen")
-
-            # SCHRITT 2: Hilfsfunktion zum Text-Extrahieren
-            def get_text(element, tag_name, default=''):
-                """Extrahiert Text aus einem Child-Element"""
-                elem = element.find(tag_name)
-                if elem is not None and elem.text:
-                    return elem.text.strip()
-                return element.get(tag_name) or default
-
-            # SCHRITT 3: Rekursive DataType-Expansion (wie convert_tpy_csv.py)
-            def expand_datatype_subitems(datatype_name, parent_name, depth=0):
-                """Expandiert SubItems aus einem DataType rekursiv
-
-                Beispiel:
-                - FB_Light (DataType mit SubItems)
-                  - bOn (BOOL)
-                  - bOff (BOOL)
-                  - RisingEdgeOn (R_TRIG - ist auch ein DataType!)
-                    - Q (BOOL)
-                    - M (BOOL)
-                """
-                if depth > 20:  # Schutz vor Endlos-Rekursion
-                    return []
-
-                dt = datatype_by_name.get(datatype_name)
-                if dt is None:
-                    return []
-
-                symbols = []
-
-                # Durchsuche alle SubItems dieses DataTypes
-                for si in dt.findall('./SubItem'):
-                    si_name = get_text(si, 'Name')
-                    if not si_name or si_name.isspace():
-                        continue
-
-                    si_type = get_text(si, 'Type', 'UNKNOWN')
-                    full_name = f"{parent_name}.{si_name}"
-
-                    # Füge dieses SubItem als Symbol hinzu
-                    symbols.append((full_name, si, si_type))
-
-                    # Wenn der Typ des SubItems selbst ein DataType ist, expandiere rekursiv
-                    if si_type in datatype_by_name:
-                        sub_symbols = expand_datatype_subitems(si_type, full_name, depth + 1)
-                        symbols.extend(sub_symbols)
-
-                return symbols
-
-            # SCHRITT 4: Sammle alle Symbole + ihre DataType-expandierten SubItems
-            all_symbol_tuples = []
-
-            for sym in all_symbols:
-                # Top-Symbol Name
-                top_name = get_text(sym, 'Name')
-                if not top_name or top_name.isspace():
-                    continue
-
-                # Top-Symbol Type (kann leer sein in TwinCAT 2!)
-                top_type = get_text(sym, 'Type', 'UNKNOWN')
-
-                # Füge Top-Symbol hinzu
-                all_symbol_tuples.append((top_name, sym, top_type))
-
-                # Wenn das Symbol einen Typ hat, der in DataTypes definiert ist,
-                # expandiere dessen SubItems rekursiv
-                if top_type and top_type != 'UNKNOWN' and top_type in datatype_by_name:
-                    sub_symbols = expand_datatype_subitems(top_type, top_name)
-                    all_symbol_tuples.extend(sub_symbols)
-
-                # FALLBACK: Falls Symbol direkte SubItems hat (TwinCAT 3 Format)
-                # werden diese auch erfasst
-                for subitem in sym.findall('./SubItem'):
-                    si_name = get_text(subitem, 'Name')
-                    if si_name and not si_name.isspace():
-                        si_type = get_text(subitem, 'Type', 'UNKNOWN')
-                        full_name = f"{top_name}.{si_name}"
-                        all_symbol_tuples.append((full_name, subitem, si_type))
-
-                        # Rekursiv für verschachtelte SubItems
-                        if si_type in datatype_by_name:
-                            nested = expand_datatype_subitems(si_type, full_name)
-                            all_symbol_tuples.extend(nested)
-
-            print(f"  🔍 Rekursiv gefunden: {len(all_symbol_tuples)} Symbole (inkl. DataType-SubItems)")
-
-            # Entferne Duplikate (INTELLIGENTE Duplikat-Entfernung)
-            # Problem: Manche Symbole existieren mehrfach in TPY (mit und ohne Type)
-            # Lösung: Bevorzuge Symbole mit Type gegenüber Symbolen ohne Type
-            symbol_map = {}  # name -> (element, type, priority)
-
-            for symbol_tuple in all_symbol_tuples:
-                # Tuple kann 2 oder 3 Elemente haben:
-                # - (name, element) für alte Symbole ohne Type
-                # - (name, element, type) für neue DataType-expandierte Symbole
-                if len(symbol_tuple) == 3:
-                    full_name, sym_elem, sym_type = symbol_tuple
-                else:
-                    full_name, sym_elem = symbol_tuple
-                    sym_type = None
-
-                if not full_name:
-                    continue
-
-                # Bestimme Priorität (höher = besser):
-                # 1. Symbole mit echtem Type (nicht UNKNOWN, nicht None)
-                # 2. Symbole ohne Type
-                if sym_type and sym_type != 'UNKNOWN':
-                    priority = 10
-                else:
-                    priority = 1
-
-                # Behalte Symbol nur wenn es neu ist ODER höhere Priorität hat
-                if full_name not in symbol_map or priority > symbol_map[full_name][2]:
-                    symbol_map[full_name] = (sym_elem, sym_type, priority)
-
-            # Konvertiere Map zurück zu Liste
-            unique_symbols = [(name, elem, typ) for name, (elem, typ, _) in symbol_map.items()]
-
-            print(f"  ✅ {len(unique_symbols)} eindeutige Symbole extrahiert")
-
-            # Konvertiere XML-Symbole zu PLCSymbol-Objekten
-            symbols_list = []
-
-            for full_name, sym_elem, extracted_type in unique_symbols:
-                # Name ist bereits vollständig (z.B. "MAIN.fbController.nValue")
-                name = full_name
-
-                # Überspringe Symbole mit leerem Namen
-                if not name or name.isspace():
-                    continue
-
-                # Type: Verwende extracted_type wenn vorhanden, sonst aus XML extrahieren
-                if extracted_type and extracted_type != 'UNKNOWN':
-                    sym_type = extracted_type
-                else:
-                    type_elem = sym_elem.find('Type')
-                    if type_elem is not None and type_elem.text:
-                        sym_type = type_elem.text.strip()
-                    else:
-                        sym_type = sym_elem.get('Type') or sym_elem.get('type') or 'UNKNOWN'
-
-                # Comment extrahieren (optional)
-                comment_elem = sym_elem.find('Comment')
-                comment = comment_elem.text if comment_elem is not None and comment_elem.text else ''
-
-                # Index Group & Offset extrahieren (für TPY-Dateien)
-                igroup_elem = sym_elem.find('IGroup')
-                index_group = int(igroup_elem.text) if igroup_elem is not None and igroup_elem.text else 0
-
-                ioffset_elem = sym_elem.find('IOffset')
-                index_offset = int(ioffset_elem.text) if ioffset_elem is not None and ioffset_elem.text else 0
-
-                # Size/BitSize extrahieren
-                bitsize_elem = sym_elem.find('BitSize')
-                if bitsize_elem is not None and bitsize_elem.text:
-                    size = int(bitsize_elem.text) // 8  # Bits → Bytes
-                else:
-                    size = 0
-
-                # Erstelle PLCSymbol
-                plc_symbol = PLCSymbol(
-                    name=name,  # Vollständiger Pfad inkl. Parent-Namen
-                    symbol_type=sym_type,
-                    index_group=index_group,
-                    index_offset=index_offset,
-                    size=size,
-                    comment=comment
+            # Streaming-Parser mit Parse-Cache (unveränderte Datei → kein erneutes Parsen)
+            parsed = read_tpy(tpy_filepath, cache_dir=self.tpy_cache_dir)
+            if parsed.source == 'parse':
+                print(f"  📚 TPY geparst in {parsed.parse_ms:.0f} ms: {parsed.datatype_count} DataTypes, "
+                      f"{parsed.symbol_elements} <Symbol> Elemente")
+            else:
+                print(f"  ⚡ TPY unverändert (Parse-Cache: {parsed.source})")
+            print(f"  ✅ {len(parsed.symbols)} eindeutige Symbole extrahiert")
+
+            symbols_list = [
+                PLCSymbol(
+                    name=sym.name,  # Vollständiger Pfad inkl. Parent-Namen
+                    symbol_type=sym.type,
+                    index_group=sym.index_group,
+                    index_offset=sym.index_offset,
+                    size=sym.size,
+                    comment=sym.comment
                 )
-                symbols_list.append(plc_symbol)
+                for sym in parsed.symbols
+            ]
+            type_aliases = dict(parsed.type_aliases)
 
             print(f"  💾 {len(symbols_list)} Symbole konvertiert zu PLCSymbol-Objekten")
 
             # Speichere im RAM-Cache
-            self.symbol_cache[connection_id] = symbols_list
-            self.cache_timestamp[connection_id] = time.time()
+            self.set_symbols(connection_id, symbols_list)
+            self.type_aliases[connection_id] = type_aliases
 
             # Speichere im Disk-Cache für Offline-Betrieb
             self.save_cache_to_file(self.cache_file, connection_id)
@@ -0,0 +1,281 @@
+"""
+Symbol Cache File
+Kompaktes, versioniertes Binärformat für den Symbol-Cache (ersetzt symbol_cache.json)
+
+📁 SPEICHERORT: modules/plc/symbol_cache_file.py
+
+Aufbau (little-endian, alle Abschnitte 4-Byte-ausgerichtet):
+- Header: Magic "SHSYMC", Version, Symbolanzahl, Stringanzahl, Länge Meta-Block
+- Meta-Block (JSON): connection_id, timestamp, type_aliases
+- String-Tabelle: Offsets (u32, Anzahl+1) + UTF-8-Blob; Namen, Typen und
+  Kommentare werden dedupliziert (Typen/Kommentare wiederholen sich stark)
+- Spalten (je u32 pro Symbol): name, type, comment (String-IDs),
+  index_group, index_offset, size
+
+Beim Laden wird die Datei per mmap eingeblendet; MappedSymbolTable liest
+Spalten direkt aus dem Mapping und erzeugt PLCSymbol-Objekte bzw. Strings
+erst beim Zugriff.
+
+JSON-Export zum Debuggen:
+    python -m modules.plc.symbol_cache_file config/cache/symbol_cache.bin export.json
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+MAGIC = b'SHSYMC'
+FORMAT_VERSION = 1
+_HEADER = struct.Struct('<6sHIII')
+_COLUMNS = ('name', 'type', 'comment', 'index_group', 'index_offset', 'size')
+_NATIVE_LE = sys.byteorder == 'little'
+
+
+class SymbolCacheFormatError(ValueError):
+    """Datei ist kein (kompatibler) binärer Symbol-Cache"""
+
+
+def is_binary_cache(path: str) -> bool:
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def _pad4(length: int) -> int:
+    return (4 - length % 4) % 4
+
+
+def _u32_bytes(values: Iterable[int]) -> bytes:
+    data = array('I', values)
+    if not _NATIVE_LE:
+        data.byteswap()
+    return data.tobytes()
+
+
+def write_symbol_cache(path: str, connection_id: str, timestamp: Optional[float],
+                       symbols: Iterable[Any], type_aliases: Optional[Dict[str, str]] = None):
+    """
+    Schreibt den Symbol-Cache atomar (tmp-Datei + os.replace)
+
+    Args:
+        symbols: Objekte mit name, symbol_type, comment, index_group,
+            index_offset, size (PLCSymbol)
+    """
+    string_ids: Dict[str, int] = {}
+    strings: List[bytes] = []
+
+    def intern(value: Any) -> int:
+        text = '' if value is None else str(value)
+        sid = string_ids.get(text)
+        if sid is None:
+            sid = string_ids[text] = len(strings)
+            strings.append(text.encode('utf-8'))
+        return sid
+
+    columns = [array('I') for _ in _COLUMNS]
+    for sym in symbols:
+        columns[0].append(intern(sym.name))
+        columns[1].append(intern(sym.symbol_type))
+        columns[2].append(intern(sym.comment))
+        columns[3].append(int(sym.index_group or 0) & 0xFFFFFFFF)
+        columns[4].append(int(sym.index_offset or 0) & 0xFFFFFFFF)
+        columns[5].append(int(sym.size or 0) & 0xFFFFFFFF)
+
+    meta = json.dumps({
+        'connection_id': connection_id,
+        'timestamp': timestamp,
+        'type_aliases': type_aliases or {}
+    }, separators=(',', ':')).encode('utf-8')
+
+    offsets = array('I', [0])
+    for encoded in strings:
+        offsets.append(offsets[-1] + len(encoded))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(columns[0]), len(strings), len(meta)))
+        f.write(meta + b'\0' * _pad4(len(meta)))
+        f.write(_u32_bytes(offsets))
+        for column in columns:
+            f.write(_u32_bytes(column))
+        f.write(b''.join(strings))
+    os.replace(tmp_path, path)
+
+
+class MappedSymbolTable(Sequence):
+    """
+    Symbolliste über einem gemappten Binär-Cache
+
+    Verhält sich wie eine Liste von PLCSymbol-Objekten; Objekte werden beim
+    ersten Zugriff über `factory` erzeugt und gemerkt.
+    """
+
+    def __init__(self, path: str, factory: Callable[..., Any]):
+        self.path = path
+        self._factory = factory
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views: List[memoryview] = []
+        try:
+            with memoryview(self._mmap) as buf:
+                self._parse(buf)
+        except Exception:
+            self.close()
+            raise
+        self._decoded: List[Optional[str]] = [None] * (len(self._offsets) - 1)
+        self._objects: Dict[int, Any] = {}
+
+    def _parse(self, buf: memoryview):
+        if len(buf) < _HEADER.size:
+            raise SymbolCacheFormatError("Datei zu kurz")
+        magic, version, count, string_count, meta_len = _HEADER.unpack_from(buf, 0)
+        if magic != MAGIC:
+            raise SymbolCacheFormatError("Kein binärer Symbol-Cache")
+        if version != FORMAT_VERSION:
+            raise SymbolCacheFormatError(f"Nicht unterstützte Cache-Version {version}")
+
+        pos = _HEADER.size
+        self.meta = json.loads(bytes(buf[pos:pos + meta_len]).decode('utf-8'))
+        pos += meta_len + _pad4(meta_len)
+
+        def u32(length: int):
+            nonlocal pos
+            end = pos + 4 * length
+            if end > len(buf):
+                raise SymbolCacheFormatError("Datei abgeschnitten")
+            view = buf[pos:end]
+            self._views.append(view)
+            pos = end
+            if _NATIVE_LE:
+                view = view.cast('I')
+                self._views.append(view)
+                return view
+            swapped = array('I', bytes(view))
+            swapped.byteswap()
+            return swapped
+
+        self._offsets = u32(string_count + 1)
+        self._name, self._type, self._comment, self._group, self._offset, self._size = (
+            u32(count) for _ in _COLUMNS
+        )
+        self._blob = buf[pos:]
+        self._views.append(self._blob)
+        if len(self._blob) < self._offsets[string_count]:
+            raise SymbolCacheFormatError("String-Tabelle abgeschnitten")
+        self._count = count
+
+    @property
+    def connection_id(self) -> Optional[str]:
+        return self.meta.get('connection_id')
+
+    @property
+    def timestamp(self) -> Optional[float]:
+        return self.meta.get('timestamp')
+
+    @property
+    def type_aliases(self) -> Dict[str, str]:
+        return dict(self.meta.get('type_aliases') or {})
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        obj = self._objects.get(index)
+        if obj is None:
+            obj = self._objects[index] = self._factory(**self.record(index))
+        return obj
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(self._count):
+            yield self[index]
+
+    def _string(self, sid: int) -> str:
+        text = self._decoded[sid]
+        if text is None:
+            text = self._decoded[sid] = str(self._blob[self._offsets[sid]:self._offsets[sid + 1]], 'utf-8')
+        return text
+
+    def name(self, index: int) -> str:
+        return self._string(self._name[index])
+
+    def record(self, index: int) -> Dict[str, Any]:
+        """Symbol als Dict (Format von PLCSymbol.to_dict), ohne PLCSymbol zu erzeugen"""
+        return {
+            'name': self._string(self._name[index]),
+            'type': self._string(self._type[index]),
+            'index_group': self._group[index],
+            'index_offset': self._offset[index],
+            'size': self._size[index],
+            'comment': self._string(self._comment[index])
+        }
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        string = self._string
+        return [
+            {'name': string(name), 'type': string(sym_type), 'index_group': group,
+             'index_offset': offset, 'size': size, 'comment': string(comment)}
+            for name, sym_type, comment, group, offset, size in zip(
+                self._name, self._type, self._comment, self._group, self._offset, self._size
+            )
+        ]
+
+    def entries(self) -> Iterator[Tuple[str, str, str]]:
+        """(name, type, comment) für den Suchindex"""
+        string = self._string
+        for name, sym_type, comment in zip(self._name, self._type, self._comment):
+            yield string(name), string(sym_type), string(comment)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'symbols': self._count,
+            'strings': len(self._offsets) - 1,
+            'decoded_strings': sum(1 for text in self._decoded if text is not None),
+            'materialized_symbols': len(self._objects),
+            'file_bytes': len(self._mmap) if not self._mmap.closed else 0
+        }
+
+    def close(self):
+        """Gibt das Mapping frei (bereits erzeugte Symbole bleiben gültig)"""
+        if self._mmap.closed:
+            return
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._mmap.close()
+
+
+def export_json(path: str, json_path: str, factory: Callable[..., Any] = dict) -> int:
+    """Exportiert einen Binär-Cache im bisherigen symbol_cache.json-Format"""
+    table = MappedSymbolTable(path, factory)
+    try:
+        data = {
+            'connection_id': table.connection_id,
+            'timestamp': table.timestamp,
+            'symbols': table.to_dicts(),
+            'type_aliases': table.type_aliases
+        }
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        return len(table)
+    finally:
+        table.close()
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        print("Verwendung: python -m modules.plc.symbol_cache_file <symbol_cache.bin> <export.json>")
+        raise SystemExit(2)
+    exported = export_json(sys.argv[1], sys.argv[2])
+    print(f"✓ {exported} Symbole nach {sys.argv[2]} exportiert")
@@ -0,0 +1,272 @@
+"""
+Symbol Search Index
+Persistenter In-Memory-Suchindex für /api/variables/search
+
+📁 SPEICHERORT: modules/plc/symbol_index.py
+
+Wird pro Verbindung und Symbol-Generation einmal aufgebaut (statt pro
+Tastendruck get_symbols() → to_dict() → lineare Suche):
+- Arrays: Namen, lower-case Namen, Typen (interned), Kommentare
+- Trigramm-Index: Trigramm → aufsteigende Symbol-IDs (Teilstring-Suche ab
+  3 Zeichen prüft nur die kürzeste Posting-Liste)
+- Präfix-Index: nach lower-case Namen sortierte IDs, Bereich per bisect
+  (Punktpfade wie "main.fblights." → zusammenhängender Block), nutzbar als
+  Suchbereich (path_prefix)
+- Typ-Facette: Typ → IDs, Trefferzahlen pro Typ im Ergebnis
+- Ranking: exakt < Präfix < Blattname-Präfix < Segment-Anfang < Teilstring,
+  danach kürzere Namen zuerst
+- Cursor-Pagination: "<generation>:<offset>", veraltete Cursor (Index neu
+  aufgebaut) werden mit StaleCursorError abgewiesen
+- Vorschläge ("Meinten Sie"): Trigramm-Überlappung für unbekannte Namen
+"""
+
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+NGRAM = 3
+
+
+class StaleCursorError(ValueError):
+    """Cursor gehört zu einer älteren Index-Generation"""
+
+
+def _ngrams(text: str) -> set:
+    return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+class SymbolSearchIndex:
+    """
+    Unveränderlicher Suchindex über eine Symbolmenge
+
+    Args:
+        entries: Iterable aus (name, type, comment)
+        generation: Symbol-Generation, aus der der Index gebaut wurde
+        cache_size: Max. gecachte Ranking-Ergebnisse (für Folgeseiten)
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str, str]], generation: int = 0, cache_size: int = 64):
+        self.generation = int(generation)
+        self.cache_size = max(0, int(cache_size))
+        self._cache: 'OrderedDict[Tuple[str, str, str], Tuple[Tuple[int, ...], Dict[str, int]]]' = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        names: List[str] = []
+        types: List[str] = []
+        comments: List[str] = []
+        seen = set()
+        for name, sym_type, comment in entries:
+            name = str(name or '')
+            if not name or name in seen:
+                continue
+            seen.add(name)
+            names.append(name)
+            types.append(sys.intern(str(sym_type or 'UNKNOWN')))
+            comments.append(str(comment or ''))
+
+        self._names = names
+        self._types = types
+        self._comments = comments
+        self._lower = [name.lower() for name in names]
+
+        grams: Dict[str, array] = {}
+        for sid, lower in enumerate(self._lower):
+            for gram in _ngrams(lower):
+                posting = grams.get(gram)
+                if posting is None:
+                    posting = grams[gram] = array('I')
+                posting.append(sid)
+        self._grams = grams
+
+        self._sorted_ids = sorted(range(len(names)), key=self._lower.__getitem__)
+        self._sorted_lower = [self._lower[sid] for sid in self._sorted_ids]
+        self._name_rank = array('I', bytes(4 * len(names)))
+        for rank, sid in enumerate(self._sorted_ids):
+            self._name_rank[sid] = rank
+
+        type_ids: Dict[str, array] = {}
+        for sid, sym_type in enumerate(types):
+            type_ids.setdefault(sym_type.upper(), array('I')).append(sid)
+        self._type_ids = type_ids
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    # ------------------------------------------------------------------
+    # Suche
+    # ------------------------------------------------------------------
+
+    def search(self, query: str = '', type_filter: str = '', limit: int = 200,
+               cursor: Optional[str] = None, path_prefix: str = '') -> Dict[str, Any]:
+        """
+        Sucht Symbole (Teilstring, case-insensitive) mit optionalem Typ-Filter
+        und optionalem Pfad-Präfix (z.B. "MAIN.fbLights.")
+
+        Returns:
+            Dict mit generation, total, count, next_cursor, facets, variables
+        """
+        query = str(query or '').strip().lower()
+        type_filter = str(type_filter or '').strip().upper()
+        path_prefix = str(path_prefix or '').strip().lower()
+        limit = max(1, int(limit))
+        offset = self._parse_cursor(cursor)
+
+        ranked, facets = self._ranked(query, type_filter, path_prefix)
+        page = ranked[offset:offset + limit]
+        end = offset + len(page)
+        return {
+            'generation': self.generation,
+            'total': len(ranked),
+            'count': len(page),
+            'offset': offset,
+            'next_cursor': f"{self.generation}:{end}" if end < len(ranked) else None,
+            'facets': facets,
+            'variables': [
+                {'name': self._names[sid], 'type': self._types[sid], 'comment': self._comments[sid]}
+                for sid in page
+            ]
+        }
+
+    def suggest(self, name: str, limit: int = 5, min_score: float = 0.35) -> List[str]:
+        """
+        "Meinten Sie"-Vorschläge: Symbole mit den meisten gemeinsamen
+        Trigrammen (Dice-Koeffizient über die Trigramm-Postings)
+        """
+        query = str(name or '').strip().lower()
+        grams = _ngrams(query)
+        if not grams:
+            return []
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for sid in self._grams.get(gram, ()):
+                shared[sid] = shared.get(sid, 0) + 1
+
+        scored = []
+        for sid, count in shared.items():
+            lower = self._lower[sid]
+            score = 2.0 * count / (len(grams) + max(1, len(lower) - NGRAM + 1))
+            if score >= min_score and lower != query:
+                scored.append((-score, len(lower), lower, sid))
+        scored.sort()
+        return [self._names[item[3]] for item in scored[:max(1, int(limit))]]
+
+    def prefix_ids(self, prefix: str) -> List[int]:
+        """IDs aller Symbole mit Namenspräfix (case-insensitive), nach Name sortiert"""
+        prefix = str(prefix or '').lower()
+        start = bisect_left(self._sorted_lower, prefix)
+        end = bisect_left(self._sorted_lower, prefix + '\uffff', lo=start)
+        return self._sorted_ids[start:end]
+
+    def _parse_cursor(self, cursor: Optional[str]) -> int:
+        if not cursor:
+            return 0
+        try:
+            generation, offset = (int(part) for part in str(cursor).split(':', 1))
+        except ValueError:
+            raise ValueError(f"Ungültiger Cursor: {cursor}")
+        if generation != self.generation:
+            raise StaleCursorError(
+                f"Cursor gehört zu Generation {generation}, Index ist bei {self.generation}"
+            )
+        return max(0, offset)
+
+    def _ranked(self, query: str, type_filter: str, path_prefix: str) -> Tuple[Tuple[int, ...], Dict[str, int]]:
+        key = (query, type_filter, path_prefix)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        allowed_types = None
+        if type_filter:
+            allowed_types = {t for t in self._type_ids if type_filter in t}
+
+        scope = self.prefix_ids(path_prefix) if path_prefix else None
+
+        if not query:
+            if scope is not None:
+                ids = scope if allowed_types is None else [
+                    sid for sid in scope if self._types[sid].upper() in allowed_types
+                ]
+                ranked = tuple(ids)
+            elif allowed_types is None:
+                ranked = tuple(self._sorted_ids)
+            else:
+                ids = [sid for t in allowed_types for sid in self._type_ids[t]]
+                ranked = tuple(sorted(ids, key=self._name_rank.__getitem__))
+        else:
+            candidates = self._candidates(query)
+            if scope is not None and len(scope) < len(candidates):
+                candidates = scope
+            elif scope is not None:
+                in_scope = set(scope)
+                candidates = [sid for sid in candidates if sid in in_scope]
+            ranked = tuple(self._rank(candidates, query, allowed_types))
+
+        facets: Dict[str, int] = {}
+        types = self._types
+        for sid in ranked:
+            sym_type = types[sid]
+            facets[sym_type] = facets.get(sym_type, 0) + 1
+        top = dict(sorted(facets.items(), key=lambda item: (-item[1], item[0]))[:20])
+
+        result = (ranked, top)
+        if self.cache_size:
+            with self._cache_lock:
+                self._cache[key] = result
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return result
+
+    def _candidates(self, query: str) -> Iterable[int]:
+        if len(query) < NGRAM:
+            # Kurze Queries: kein Trigramm → Vollscan über lower-case Namen
+            return range(len(self._names))
+        postings = []
+        for gram in _ngrams(query):
+            posting = self._grams.get(gram)
+            if posting is None:
+                return ()
+            postings.append(posting)
+        # Kürzeste Posting-Liste, Rest per Teilstring-Prüfung
+        return min(postings, key=len)
+
+    def _rank(self, candidates: Iterable[int], query: str, allowed_types) -> List[int]:
+        lower_names = self._lower
+        types = self._types
+        scored = []
+        for sid in candidates:
+            lower = lower_names[sid]
+            pos = lower.find(query)
+            if pos < 0:
+                continue
+            if allowed_types is not None and types[sid].upper() not in allowed_types:
+                continue
+            if pos == 0:
+                score = 0 if len(lower) == len(query) else 1
+            else:
+                leaf_start = lower.rfind('.') + 1
+                if lower.startswith(query, leaf_start):
+                    score = 2
+                elif lower[pos - 1] == '.':
+                    score = 3
+                else:
+                    score = 4
+            scored.append((score, len(lower), lower, sid))
+        scored.sort()
+        return [item[3] for item in scored]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cache_lock:
+            cached = len(self._cache)
+        return {
+            'generation': self.generation,
+            'symbols': len(self._names),
+            'ngrams': len(self._grams),
+            'types': len(self._type_ids),
+            'cached_queries': cached
+        }
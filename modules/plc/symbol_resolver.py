@@ -0,0 +1,161 @@
+"""
+Symbol Resolver
+Fallback-Auflösung für VariableManager.get_symbol_info bei Fehlschlägen
+
+📁 SPEICHERORT: modules/plc/symbol_resolver.py
+
+- Normalisierter Schlüssel-Index pro PLC (casefold, "MAIN."-Präfix entfernt):
+  Schreibvarianten wie "ncounter", "MAIN.NCOUNTER" → ein Hash-Lookup
+- Heuristischer Alias-Index (Blattname, ohne Typ-Präfix, snake_case, ohne
+  erstes Segment), kleingeschrieben, erster Treffer gewinnt
+- Beide Indizes entstehen erst beim ersten Fehlschlag der PLC und werden
+  danach bei Registrierungen inkrementell ergänzt
+- Begrenzter Negativ-Cache (FIFO) für nicht auflösbare Namen; Einträge gelten
+  nur für die Symbol-Generation der PLC, in der sie entstanden sind
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
+
+# Alias-Heuristik (vorkompiliert, läuft pro Symbol)
+TYPE_PREFIX_RE = re.compile(r'^[a-z]{1,2}(?=[A-Z0-9])')
+_CAMEL_WORD_RE = re.compile('(.)([A-Z][a-z]+)')
+_CAMEL_BOUNDARY_RE = re.compile('([a-z0-9])([A-Z])')
+
+
+def camel_to_snake(s: str) -> str:
+    s1 = _CAMEL_WORD_RE.sub(r'\1_\2', s)
+    return _CAMEL_BOUNDARY_RE.sub(r'\1_\2', s1).strip('_').lower()
+
+
+def normalize_symbol_key(name: str) -> str:
+    """Vergleichsschlüssel: casefold, ohne führendes "MAIN." """
+    key = str(name or '').strip().casefold()
+    if key.startswith('main.'):
+        key = key[5:]
+    return key
+
+
+def alias_keys(full_name: str) -> Set[str]:
+    """
+    Kleingeschriebene heuristische Alias-Schlüssel eines Symbols
+
+    Aus dem letzten Segment (ohne Typ-Präfix, snake_case) und dem Namen
+    ohne erstes Segment; Groß-/Klein- und Title_Case-Varianten fallen auf
+    denselben Schlüssel. Der normalisierte Schlüssel des Symbols selbst
+    ist nicht enthalten.
+    """
+    parts = full_name.split('.')
+    last = parts[-1]
+    keys = {last.lower()}
+    stripped = TYPE_PREFIX_RE.sub('', last)
+    if stripped:
+        keys.add(stripped.lower())
+    snake = camel_to_snake(stripped)
+    if snake:
+        keys.add(snake)
+    if len(parts) > 1:
+        keys.add('.'.join(parts[1:]).lower())
+    keys.discard(full_name.lower())
+    keys.discard(normalize_symbol_key(full_name))
+    return keys
+
+
+class _PLCIndex:
+    __slots__ = ('normalized', 'aliases')
+
+    def __init__(self):
+        self.normalized: Dict[str, str] = {}
+        self.aliases: Dict[str, str] = {}
+
+    def add(self, full_name: str):
+        # Erster Eintrag gewinnt (Registrierungsreihenfolge)
+        self.normalized.setdefault(normalize_symbol_key(full_name), full_name)
+        for key in alias_keys(full_name):
+            self.aliases.setdefault(key, full_name)
+
+
+class SymbolResolver:
+    """
+    Fallback-Indizes und Negativ-Cache für eine Symbol-Registry
+
+    Args:
+        miss_cache_size: Max. gemerkte Fehlschläge (0 = kein Negativ-Cache)
+    """
+
+    def __init__(self, miss_cache_size: int = 4096):
+        self.miss_cache_size = max(0, int(miss_cache_size))
+        self._generations: Dict[str, int] = {}
+        self._indexes: Dict[str, _PLCIndex] = {}
+        self._misses: 'OrderedDict[Tuple[str, str], int]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._miss_hits = 0
+        self._index_builds = 0
+
+    def generation(self, plc_id: str) -> int:
+        return self._generations.get(plc_id, 0)
+
+    def symbol_added(self, plc_id: str, full_name: str):
+        """Neues Symbol: Generation erhöhen, gebaute Indizes ergänzen"""
+        with self._lock:
+            self._generations[plc_id] = self._generations.get(plc_id, 0) + 1
+            index = self._indexes.get(plc_id)
+            if index is not None:
+                index.add(full_name)
+
+    def invalidate(self, plc_id: str):
+        """Negativ-Cache der PLC verwerfen (z.B. nach neuen Config-Aliasen)"""
+        with self._lock:
+            self._generations[plc_id] = self._generations.get(plc_id, 0) + 1
+
+    def is_known_miss(self, plc_id: str, name: str) -> bool:
+        # Lesepfad ohne Lock (läuft pro Poll-Zyklus); veraltete Einträge
+        # verdrängt remember_miss() bzw. die Kapazitätsgrenze
+        generation = self._misses.get((plc_id, name))
+        if generation is None or generation != self._generations.get(plc_id, 0):
+            return False
+        self._miss_hits += 1
+        return True
+
+    def remember_miss(self, plc_id: str, name: str):
+        if not self.miss_cache_size:
+            return
+        with self._lock:
+            self._misses[(plc_id, name)] = self._generations.get(plc_id, 0)
+            self._misses.move_to_end((plc_id, name))
+            while len(self._misses) > self.miss_cache_size:
+                self._misses.popitem(last=False)
+
+    def lookup(self, plc_id: str, name: str,
+               names: Callable[[], Iterable[str]]) -> Optional[str]:
+        """
+        Vollständiger Symbolname zu einer Schreibvariante bzw. einem Alias
+
+        Args:
+            names: liefert alle Symbolnamen der PLC (nur für den ersten Aufbau)
+        """
+        with self._lock:
+            index = self._indexes.get(plc_id)
+            if index is None:
+                index = self._indexes[plc_id] = _PLCIndex()
+                for full_name in names():
+                    index.add(full_name)
+                self._index_builds += 1
+        full_name = index.normalized.get(normalize_symbol_key(name))
+        if full_name is None:
+            full_name = index.aliases.get(str(name).strip().lower())
+        return full_name
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'indexed_plcs': len(self._indexes),
+                'index_builds': self._index_builds,
+                'normalized_keys': sum(len(index.normalized) for index in self._indexes.values()),
+                'alias_keys': sum(len(index.aliases) for index in self._indexes.values()),
+                'negative_entries': len(self._misses),
+                'negative_hits': self._miss_hits,
+                'negative_capacity': self.miss_cache_size
+            }
@@ -0,0 +1,187 @@
+"""
+Symbol Tree Index
+Vorberechneter Symbolbaum für ebenenweises (lazy) Aufklappen
+
+📁 SPEICHERORT: modules/plc/symbol_tree.py
+
+Ersetzt den Neuaufbau pro Aufruf in PLCSymbolBrowser.get_tree() (lineare
+Kindsuche pro Pfadebene → quadratisch bei breiten Strukturen):
+- Kinder pro Knoten als Dict nach Namen → Einfügen O(Pfadtiefe)
+- Pfad-Lookup über die Punkt-Segmente, jede Ebene O(1)
+- Kind- und Symbolzahlen pro Knoten einmalig beim Aufbau
+- Blatt-Metadaten (Typ, Größe, Kommentar, ...) erst bei der Ausgabe über
+  den Index in der Symbolliste
+- wird einmal pro Symbol-Generation gebaut (PLCSymbolBrowser.get_tree_index)
+"""
+
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+def split_symbol_path(name: str) -> List[str]:
+    """
+    Zerlegt einen Symbolnamen in Pfad-Segmente
+
+    Globale TwinCAT-Symbole mit führendem Punkt (".ADSIGRP_DEVICE_DATA")
+    behalten den Punkt im ersten Segment.
+    """
+    parts = str(name).split('.')
+    if len(parts) > 1 and parts[0] == '':
+        parts = ['.' + parts[1]] + parts[2:]
+    return parts
+
+
+class _Node:
+    __slots__ = ('name', 'full_name', 'children', 'symbol', 'leaf_count')
+
+    def __init__(self, name: str, full_name: str):
+        self.name = name
+        self.full_name = full_name
+        self.children: Optional[Dict[str, '_Node']] = None
+        self.symbol = -1  # Index in der Symbolliste, -1 = reiner Ordner
+        self.leaf_count = 0
+
+
+class SymbolTreeIndex:
+    """
+    Baum über eine Symbolmenge
+
+    Args:
+        names: Symbolnamen in Listenreihenfolge
+        lookup: Index → Symbol-Dict (name, type, size, comment, index_group, index_offset)
+        generation: Symbol-Generation, aus der der Baum gebaut wurde
+    """
+
+    def __init__(self, names: Iterable[str], lookup: Callable[[int], Dict[str, Any]], generation: int = 0):
+        self.generation = int(generation)
+        self._lookup = lookup
+        self.root = _Node('PLC_ROOT', '')
+        self.root.children = {}
+        self.node_count = 0
+
+        for position, name in enumerate(names):
+            if not name:
+                continue
+            node = self.root
+            full_name = ''
+            for part in split_symbol_path(name):
+                full_name = f"{full_name}.{part}" if full_name else part
+                if node.children is None:
+                    node.children = {}
+                child = node.children.get(part)
+                if child is None:
+                    child = node.children[part] = _Node(part, full_name)
+                    self.node_count += 1
+                node = child
+            if node.symbol < 0:
+                node.symbol = position
+
+        # Symbolzahlen pro Teilbaum (iterativ, Kinder vor Eltern)
+        order = [self.root]
+        for node in order:
+            if node.children:
+                order.extend(node.children.values())
+        for node in reversed(order):
+            count = 1 if node.symbol >= 0 else 0
+            if node.children:
+                count += sum(child.leaf_count for child in node.children.values())
+            node.leaf_count = count
+
+    def find(self, path: str) -> Optional[_Node]:
+        """Knoten zu einem Pfad ('' = Wurzel)"""
+        path = str(path or '').strip()
+        if not path:
+            return self.root
+        node = self.root
+        for part in split_symbol_path(path):
+            if not node.children:
+                return None
+            node = node.children.get(part)
+            if node is None:
+                return None
+        return node
+
+    def _describe(self, node: _Node) -> Dict[str, Any]:
+        child_count = len(node.children) if node.children else 0
+        entry = {
+            'name': node.name,
+            'full_path': node.full_name,
+            'type': 'folder' if child_count else 'symbol',
+            'child_count': child_count,
+            'leaf_count': node.leaf_count,
+            'is_symbol': node.symbol >= 0
+        }
+        if node.symbol >= 0:
+            symbol = self._lookup(node.symbol)
+            entry.update({
+                'data_type': symbol.get('type', 'UNKNOWN'),
+                'size': symbol.get('size', 0),
+                'comment': symbol.get('comment', ''),
+                'index_group': symbol.get('index_group', 0),
+                'index_offset': symbol.get('index_offset', 0)
+            })
+        return entry
+
+    def level(self, path: str = '', offset: int = 0, limit: int = 500) -> Optional[Dict[str, Any]]:
+        """
+        Eine Ebene des Baums (direkte Kinder von path), seitenweise
+
+        Returns:
+            None wenn der Pfad nicht existiert, sonst Dict mit node, total,
+            offset, count, children
+        """
+        node = self.find(path)
+        if node is None:
+            return None
+        offset = max(0, int(offset))
+        limit = max(1, int(limit))
+        children = list(islice(node.children.values(), offset, offset + limit)) if node.children else []
+        total = len(node.children) if node.children else 0
+        return {
+            'generation': self.generation,
+            'path': node.full_name,
+            'node': self._describe(node) if node is not self.root else None,
+            'total': total,
+            'offset': offset,
+            'count': len(children),
+            'has_more': offset + len(children) < total,
+            'children': [self._describe(child) for child in children]
+        }
+
+    def to_nested(self) -> Dict[str, Any]:
+        """Kompletter Baum im bisherigen get_tree()-Format"""
+        def convert(node: _Node) -> Dict[str, Any]:
+            has_children = bool(node.children)
+            entry = {
+                'name': node.name,
+                'full_name': node.full_name,
+                'type': 'STRUCT',
+                'is_leaf': not has_children
+            }
+            if node.symbol >= 0:
+                symbol = self._lookup(node.symbol)
+                if not has_children:
+                    entry['type'] = symbol.get('type', 'UNKNOWN')
+                entry.update({
+                    'size': symbol.get('size', 0),
+                    'comment': symbol.get('comment', ''),
+                    'index_group': symbol.get('index_group', 0),
+                    'index_offset': symbol.get('index_offset', 0)
+                })
+            if has_children:
+                entry['children'] = [convert(child) for child in node.children.values()]
+            return entry
+
+        return {
+            'name': 'PLC_ROOT',
+            'children': [convert(child) for child in self.root.children.values()],
+            'type': 'folder'
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'generation': self.generation,
+            'nodes': self.node_count,
+            'symbols': self.root.leaf_count,
+            'top_level': len(self.root.children or {})
+        }
@@ -0,0 +1,356 @@
+"""
+TPY Reader
+Streaming-Parser für TwinCAT .tpy Dateien mit Parse-Cache
+
+📁 SPEICHERORT: modules/plc/tpy_reader.py
+
+Gemeinsame Grundlage für PLCSymbolBrowser.load_symbols_from_tpy,
+PLCSymbolParser.parse und SymbolManager.import_from_tpy (bisher drei
+ET.parse()-Implementierungen mit unterschiedlichen Ergebnissen):
+- iterparse: DataTypes und Symbole werden beim Schließen des Elements
+  ausgelesen und sofort freigegeben → Speicher wächst nicht mit der Datei
+- DataType-Expansion iterativ und pro Typ memoisiert: jeder Struktur-/FB-Typ
+  wird einmal zu relativen Pfaden aufgelöst und dann nur noch mit dem
+  Instanznamen präfixiert
+- Parse-Cache nach SHA-256 des Dateiinhalts: im RAM (LRU) und optional auf
+  Disk (JSON), ein erneuter Upload derselben Datei parst nicht noch einmal
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+TPY_CACHE_VERSION = 1
+MEMORY_CACHE_ENTRIES = 4
+DISK_CACHE_ENTRIES = 8
+
+
+class TpySymbol(NamedTuple):
+    """Ein expandiertes Symbol (vollständiger Pfad)"""
+    name: str
+    type: str
+    comment: str = ''
+    index_group: int = 0
+    index_offset: int = 0
+    size: int = 0
+
+
+@dataclass
+class TpyParseResult:
+    """Ergebnis eines TPY-Parse-Vorgangs (geteilt über den Cache - nicht verändern)"""
+    content_hash: str
+    symbols: Tuple[TpySymbol, ...]
+    type_aliases: Dict[str, str]
+    fb_types: FrozenSet[str] = frozenset()
+    datatype_count: int = 0
+    symbol_elements: int = 0
+    parse_ms: float = 0.0
+    # 'parse' | 'memory' | 'disk'
+    source: str = field(default='parse', compare=False)
+
+
+class _Member(NamedTuple):
+    name: str
+    type: str
+    comment: str
+    size: int
+
+
+class _DataType:
+    __slots__ = ('members', 'alias', 'is_fb')
+
+    def __init__(self, members: List[_Member], alias: str, is_fb: bool):
+        self.members = members
+        self.alias = alias
+        self.is_fb = is_fb
+
+
+_memory_cache: 'OrderedDict[str, TpyParseResult]' = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+def file_content_hash(path: str) -> str:
+    """SHA-256 des Dateiinhalts (blockweise gelesen)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_tpy(path: str, cache_dir: Optional[str] = None) -> TpyParseResult:
+    """
+    Liest eine TPY-Datei (mit RAM-/Disk-Cache nach Inhalts-Hash)
+
+    Args:
+        path: Pfad zur .tpy Datei
+        cache_dir: Verzeichnis für den Disk-Cache (None = nur RAM-Cache)
+
+    Raises:
+        OSError: Datei nicht lesbar
+        ET.ParseError: Kein gültiges XML
+    """
+    content_hash = file_content_hash(path)
+
+    with _memory_lock:
+        cached = _memory_cache.get(content_hash)
+        if cached is not None:
+            _memory_cache.move_to_end(content_hash)
+            return _with_source(cached, 'memory')
+
+    result = _load_disk_cache(cache_dir, content_hash) if cache_dir else None
+    if result is None:
+        started = time.perf_counter()
+        result = parse_tpy(path, content_hash)
+        result.parse_ms = round((time.perf_counter() - started) * 1000.0, 3)
+        if cache_dir:
+            _store_disk_cache(cache_dir, result)
+
+    with _memory_lock:
+        _memory_cache[content_hash] = result
+        while len(_memory_cache) > MEMORY_CACHE_ENTRIES:
+            _memory_cache.popitem(last=False)
+    return result
+
+
+def clear_memory_cache():
+    with _memory_lock:
+        _memory_cache.clear()
+
+
+def parse_tpy(path: str, content_hash: str = '') -> TpyParseResult:
+    """Parst eine TPY-Datei ohne Cache"""
+    datatypes, tops = _stream(path)
+    symbols = _expand(datatypes, tops)
+    return TpyParseResult(
+        content_hash=content_hash,
+        symbols=tuple(symbols),
+        type_aliases={name: dt.alias for name, dt in datatypes.items() if dt.alias},
+        fb_types=frozenset(name for name, dt in datatypes.items() if dt.is_fb),
+        datatype_count=len(datatypes),
+        symbol_elements=len(tops)
+    )
+
+
+# ----------------------------------------------------------------------
+# Streaming
+# ----------------------------------------------------------------------
+
+def _text(elem, tag: str, default: str = '') -> str:
+    """Text eines Child-Elements (gestrippt), sonst gleichnamiges Attribut"""
+    child = elem.find(tag)
+    if child is not None and child.text:
+        return child.text.strip()
+    return elem.get(tag) or default
+
+
+def _int(elem, tag: str) -> int:
+    try:
+        return int(elem.findtext(tag) or 0)
+    except ValueError:
+        return 0
+
+
+def _member(elem) -> Optional[_Member]:
+    name = _text(elem, 'Name')
+    if not name or name.isspace():
+        return None
+    return _Member(name, _text(elem, 'Type', 'UNKNOWN'), elem.findtext('Comment') or '',
+                   _int(elem, 'BitSize') // 8)
+
+
+def _read_datatype(elem) -> _DataType:
+    members = [m for m in (_member(si) for si in elem.findall('SubItem')) if m is not None]
+    name = (elem.findtext('Name') or '').strip()
+    alias = ''
+    if not members and not name.upper().startswith('ARRAY'):
+        # Enum-/Alias-Typ ohne SubItems (z.B. eMode → INT) für die Typ-Auflösung
+        base_type = (elem.findtext('Type') or '').strip()
+        if base_type and base_type != name:
+            dims = []
+            for array_info in elem.findall('ArrayInfo'):
+                try:
+                    lower = int(array_info.findtext('LBound', '0'))
+                    elements = int(array_info.findtext('Elements', '0'))
+                except ValueError:
+                    dims = []
+                    break
+                dims.append(f"{lower}..{lower + elements - 1}")
+            alias = f"ARRAY [{','.join(dims)}] OF {base_type}" if dims else base_type
+    return _DataType(members, alias, elem.find('FbInfo') is not None)
+
+
+def _read_symbol(elem) -> Optional[Tuple[TpySymbol, List[_Member]]]:
+    name = _text(elem, 'Name')
+    if not name or name.isspace():
+        return None
+    sym_type = _text(elem, 'Type') or elem.get('type') or 'UNKNOWN'
+    symbol = TpySymbol(name, sym_type, elem.findtext('Comment') or '',
+                       _int(elem, 'IGroup'), _int(elem, 'IOffset'), _int(elem, 'BitSize') // 8)
+    # TwinCAT 3: SubItems direkt am Symbol
+    direct = [m for m in (_member(si) for si in elem.findall('SubItem')) if m is not None]
+    return symbol, direct
+
+
+def _stream(path: str) -> Tuple[Dict[str, _DataType], List[Tuple[TpySymbol, List[_Member]]]]:
+    datatypes: Dict[str, _DataType] = {}
+    tops: List[Tuple[TpySymbol, List[_Member]]] = []
+    stack = []
+    for event, elem in ET.iterparse(path, events=('start', 'end')):
+        if event == 'start':
+            stack.append(elem)
+            continue
+        stack.pop()
+        parent = stack[-1] if stack else None
+        if elem.tag == 'DataType' and parent is not None and parent.tag == 'DataTypes':
+            name = (elem.findtext('Name') or '').strip()
+            if name:
+                datatypes[name] = _read_datatype(elem)
+        elif elem.tag == 'Symbol':
+            top = _read_symbol(elem)
+            if top is not None:
+                tops.append(top)
+            elem.clear()
+        if parent is not None and len(stack) <= 2:
+            # Abgeschlossene Abschnitte/Einträge (DataType, Function, Program, ...) freigeben
+            elem.clear()
+            parent.remove(elem)
+    return datatypes, tops
+
+
+# ----------------------------------------------------------------------
+# Expansion
+# ----------------------------------------------------------------------
+
+def _expand(datatypes: Dict[str, _DataType],
+            tops: List[Tuple[TpySymbol, List[_Member]]]) -> List[TpySymbol]:
+    memo: Dict[str, Tuple[_Member, ...]] = {}
+
+    def members_of(type_name: str) -> Tuple[_Member, ...]:
+        """Alle (auch verschachtelten) Member eines Typs mit relativem Pfad"""
+        if type_name in memo:
+            return memo[type_name]
+        pending = [(type_name, False)]
+        active = set()
+        while pending:
+            current, ready = pending.pop()
+            if current in memo:
+                continue
+            dt = datatypes[current]
+            if not ready:
+                active.add(current)
+                pending.append((current, True))
+                pending.extend(
+                    (m.type, False) for m in dt.members
+                    if m.type in datatypes and m.type not in memo and m.type not in active
+                )
+                continue
+            active.discard(current)
+            expanded = []
+            for member in dt.members:
+                expanded.append(member)
+                # Zyklen (Typ bereits in Arbeit) werden nicht weiter expandiert
+                for nested in memo.get(member.type, ()):
+                    expanded.append(nested._replace(name=f"{member.name}.{nested.name}"))
+            memo[current] = tuple(expanded)
+        return memo[type_name]
+
+    def with_prefix(prefix: str, members) -> List[TpySymbol]:
+        return [TpySymbol(f"{prefix}.{m.name}", m.type, m.comment, 0, 0, m.size) for m in members]
+
+    collected: List[TpySymbol] = []
+    for symbol, direct in tops:
+        collected.append(symbol)
+        if symbol.type in datatypes:
+            collected.extend(with_prefix(symbol.name, members_of(symbol.type)))
+        for member in direct:
+            collected.extend(with_prefix(symbol.name, (member,)))
+            if member.type in datatypes:
+                collected.extend(with_prefix(f"{symbol.name}.{member.name}", members_of(member.type)))
+
+    # Duplikate: erstes Vorkommen bestimmt die Position, ein Eintrag mit echtem
+    # Typ ersetzt einen ohne Typ (TPY listet Programmvariablen doppelt)
+    by_name: Dict[str, int] = {}
+    unique: List[TpySymbol] = []
+    for symbol in collected:
+        index = by_name.get(symbol.name)
+        if index is None:
+            by_name[symbol.name] = len(unique)
+            unique.append(symbol)
+        elif unique[index].type == 'UNKNOWN' and symbol.type != 'UNKNOWN':
+            unique[index] = symbol
+    return unique
+
+
+# ----------------------------------------------------------------------
+# Disk-Cache
+# ----------------------------------------------------------------------
+
+def _with_source(result: TpyParseResult, source: str) -> TpyParseResult:
+    return TpyParseResult(
+        content_hash=result.content_hash, symbols=result.symbols, type_aliases=result.type_aliases,
+        fb_types=result.fb_types, datatype_count=result.datatype_count,
+        symbol_elements=result.symbol_elements, parse_ms=0.0, source=source
+    )
+
+
+def _cache_path(cache_dir: str, content_hash: str) -> str:
+    return os.path.join(cache_dir, f"tpy_{content_hash}.json")
+
+
+def _load_disk_cache(cache_dir: str, content_hash: str) -> Optional[TpyParseResult]:
+    path = _cache_path(cache_dir, content_hash)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != TPY_CACHE_VERSION or data.get('content_hash') != content_hash:
+            return None
+        return TpyParseResult(
+            content_hash=content_hash,
+            symbols=tuple(TpySymbol(*row) for row in data.get('symbols', [])),
+            type_aliases=data.get('type_aliases', {}) or {},
+            fb_types=frozenset(data.get('fb_types', [])),
+            datatype_count=int(data.get('datatype_count', 0)),
+            symbol_elements=int(data.get('symbol_elements', 0)),
+            source='disk'
+        )
+    except (OSError, ValueError, TypeError) as e:
+        print(f"  ⚠️ TPY-Parse-Cache unlesbar ({os.path.basename(path)}): {e}")
+        return None
+
+
+def _store_disk_cache(cache_dir: str, result: TpyParseResult):
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        path = _cache_path(cache_dir, result.content_hash)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': TPY_CACHE_VERSION,
+                'content_hash': result.content_hash,
+                'datatype_count': result.datatype_count,
+                'symbol_elements': result.symbol_elements,
+                'type_aliases': result.type_aliases,
+                'fb_types': sorted(result.fb_types),
+                'symbols': [list(symbol) for symbol in result.symbols]
+            }, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+        # Nur die jüngsten Einträge behalten
+        entries = sorted(
+            (os.path.join(cache_dir, name) for name in os.listdir(cache_dir)
+             if name.startswith('tpy_') and name.endswith('.json')),
+            key=os.path.getmtime, reverse=True
+        )
+        for stale in entries[DISK_CACHE_ENTRIES:]:
+            os.remove(stale)
+    except OSError as e:
+        print(f"  ⚠️ TPY-Parse-Cache nicht gespeichert: {e}")
@@ -7,19 +7,25 @@ Zentrale Verwaltung von Variable-Subscriptions und Widget-Mappings
 Features:
 - Symbol-Registry (Metadaten-Speicherung)
 - Widget-Subscriptions (Widget → Variable Zuordnung)
-- Value-Cache (aktuelle Werte mit Timestamp)
+- Value-Cache (aktuelle Werte mit Timestamp) im gemeinsamen PLCValueStore
 - Multi-PLC Support (plc_id als Prefix)
+- Fallback-Auflösung über normalisierte Schlüssel/Aliase mit Negativ-Cache
+  (SymbolResolver) und "Meinten Sie"-Vorschläge
 """
 
-import time
+import os
 import logging
-from typing import Dict, Set, Optional, Any, Tuple
-from dataclasses import dataclass
+from typing import Dict, Set, Optional, Any, Tuple, List, Callable
+from dataclasses import dataclass, field
+
+from modules.core.plc_value_store import PLCValueStore
+from modules.plc.plc_types import DEFAULT_PLC_TYPE, PLCTypeResolver
+from modules.plc.symbol_resolver import SymbolResolver
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SymbolInfo:
     """Symbol-Metadaten"""
     name: str
@@ -29,6 +35,13 @@ class SymbolInfo:
     size: int
     comment: str
     plc_id: str = 'plc_001'
+    # Bei Registrierung aufgelöster pyads/ctypes-Typ (None = unbekannt)
+    plc_type: Any = field(default=None, repr=False, compare=False)
+
+    def read(self, plc, use_cache: bool = True) -> Any:
+        """Liest den Wert mit dem vorab aufgelösten Typ (Fallback: BYTE)"""
+        plc_type = self.plc_type if self.plc_type is not None else DEFAULT_PLC_TYPE
+        return plc.read_by_name(self.name, plc_type, use_cache=use_cache)
 
     def to_dict(self):
         return {
@@ -53,13 +66,24 @@ class VariableManager:
     - Value-Cache für schnelle Zugriffe
     """
 
-    def __init__(self):
-        # Symbol-Registry: (plc_id, variable_name) → SymbolInfo
+    def __init__(self, value_store: Optional[PLCValueStore] = None):
+        # Symbol-Registry: (plc_id, variable_name) → SymbolInfo (nur echte Symbolnamen)
         self.symbols: Dict[Tuple[str, str], SymbolInfo] = {}
 
         # Alias-Registry: (plc_id, alias) -> full_symbol_name
+        # (Config-Aliase und bereits aufgelöste Lookups)
         self.alias_map: Dict[Tuple[str, str], str] = {}
 
+        # Fallback-Indizes (normalisiert/heuristische Aliase) + Negativ-Cache
+        try:
+            miss_cache_size = int(os.getenv('SMARTHOME_SYMBOL_MISS_CACHE', '4096'))
+        except ValueError:
+            miss_cache_size = 4096
+        self.resolver = SymbolResolver(miss_cache_size)
+
+        # Vorschläge für unbekannte Namen: provider(plc_id, name, limit) -> [Symbolnamen]
+        self._suggestion_provider: Optional[Callable[[str, str, int], List[str]]] = None
+
         # Pending-Aliase: (plc_id, full_symbol_name) -> [aliases]
         # Wird verwendet, wenn Alias aus config geladen wird, aber das Full-Symbol
         # noch nicht registriert ist (z.B. vor dem Symbol-Cache-Load)
@@ -71,8 +95,22 @@ class VariableManager:
         # Reverse-Mapping: widget_id → (plc_id, variable_name)
         self.widget_mappings: Dict[str, Tuple[str, str]] = {}
 
-        # Value-Cache: (plc_id, variable_name) → (value, timestamp)
-        self.value_cache: Dict[Tuple[str, str], Tuple[Any, float]] = {}
+        # Poll-Klasse pro Widget (fast/normal/slow, siehe PollScheduler)
+        self.widget_poll_classes: Dict[str, str] = {}
+
+        # Zählt Änderungen an Subscriptions/Poll-Klassen (Polling gleicht nur dann ab)
+        self.subscription_version = 0
+
+        # Value-Cache: (plc_id, variable_name) → Wert/Timestamp/Sequenz; dieselben
+        # Einträge nutzen die PLC-Verbindungen als TTL-Read-Cache (DataGateway bindet)
+        self.value_store = value_store if value_store is not None else PLCValueStore()
+
+        # Subscription-Listener: callback(event, plc_id, variable_name)
+        # event = 'subscribe' | 'unsubscribe' (ein Aufruf pro Widget-Abo)
+        self._subscription_listeners: List[Callable[[str, str, str], None]] = []
+
+        # Typ-Resolver pro PLC (kennt Enum-/Alias-Typen aus der TPY)
+        self.type_resolvers: Dict[str, PLCTypeResolver] = {}
 
         logger.info("✅ Variable Manager initialisiert")
         # Lade benutzerdefinierte Alias-Mappings (falls vorhanden)
@@ -89,34 +127,43 @@ class VariableManager:
             symbol_info: SymbolInfo mit allen Metadaten
         """
         key = (symbol_info.plc_id, symbol_info.name)
+        if symbol_info.plc_type is None:
+            symbol_info.plc_type = self._get_type_resolver(symbol_info.plc_id).resolve(symbol_info.symbol_type)
+        is_new = key not in self.symbols
         self.symbols[key] = symbol_info
-        logger.debug(f"Symbol registriert: {symbol_info.plc_id}/{symbol_info.name}")
 
-        # Generiere automatische Aliase für bessere Lesbarkeit
-        try:
-            aliases = self._generate_aliases(symbol_info.name)
-            for alias in aliases:
+        if is_new:
+            self.resolver.symbol_added(symbol_info.plc_id, symbol_info.name)
+
+        # Wende ggf. Pending-Aliase an, die aus config/alias_mappings.json geladen wurden
+        pending = self.pending_aliases.pop(key, None)
+        if pending:
+            for alias in pending:
                 alias_key = (symbol_info.plc_id, alias)
-                # Registriere Alias nur wenn noch nicht vorhanden (vermeide Überschreiben)
                 if alias_key not in self.symbols:
-                    self.symbols[alias_key] = symbol_info
                     self.alias_map[alias_key] = symbol_info.name
-                    logger.debug(f"Alias registriert: {symbol_info.plc_id}/{alias} -> {symbol_info.name}")
-        except Exception as e:
-            logger.debug(f"Alias-Generierung fehlgeschlagen für {symbol_info.name}: {e}")
+                    logger.debug(f"Config-Alias registriert: {symbol_info.plc_id}/{alias} -> {symbol_info.name}")
 
-        # Wende ggf. Pending-Aliase an, die aus config/alias_mappings.json geladen wurden
-        try:
-            full_key = (symbol_info.plc_id, symbol_info.name)
-            if full_key in self.pending_aliases:
-                for alias in self.pending_aliases.pop(full_key):
-                    alias_key = (symbol_info.plc_id, alias)
-                    if alias_key not in self.symbols:
-                        self.symbols[alias_key] = symbol_info
-                        self.alias_map[alias_key] = symbol_info.name
-                        logger.debug(f"Config-Alias registriert: {symbol_info.plc_id}/{alias} -> {symbol_info.name}")
-        except Exception:
-            pass
+    def set_type_aliases(self, aliases: Dict[str, str], plc_id: str = 'plc_001'):
+        """
+        Setzt Enum-/Alias-Typen (aus TPY-DataTypes) und löst registrierte Symbole neu auf
+
+        Args:
+            aliases: {Typname: Basistyp}, z.B. {'eMode': 'INT'}
+            plc_id: PLC-ID
+        """
+        resolver = PLCTypeResolver(aliases)
+        self.type_resolvers[plc_id] = resolver
+        for (symbol_plc_id, _), symbol_info in self.symbols.items():
+            if symbol_plc_id == plc_id:
+                symbol_info.plc_type = resolver.resolve(symbol_info.symbol_type)
+
+    def _get_type_resolver(self, plc_id: str) -> PLCTypeResolver:
+        resolver = self.type_resolvers.get(plc_id)
+        if resolver is None:
+            resolver = PLCTypeResolver()
+            self.type_resolvers[plc_id] = resolver
+        return resolver
 
     def register_symbols_bulk(self, symbols: list, plc_id: str = 'plc_001'):
         """
@@ -161,61 +208,6 @@ class VariableManager:
 
         logger.info(f"📚 {count} Symbole registriert für PLC {plc_id}")
 
-    def _generate_aliases(self, full_name: str) -> list:
-        """
-        Generiert heuristische Alias-Namen aus einem vollständigen PLC-Symbolnamen.
-
-        Beispiele:
-          - MAIN.VbAusgang6 -> VbAusgang6, bAusgang6, vb_ausgang6, ausgang6
-          - MAIN.fbLichter.bLichtWohnzimmer -> bLichtWohnzimmer, licht_wohnzimmer
-
-        Die Aliase sind rein heuristisch; spezifische Mappings können später in
-        einer konfigurationsdatei (`config/alias_mappings.json`) ergänzt werden.
-        """
-        import re
-
-        parts = full_name.split('.')
-        last = parts[-1] if parts else full_name
-
-        aliases = set()
-
-        # 1) raw last segment
-        aliases.add(last)
-
-        # 2) strip common single-letter type prefixes (b, n, r, s) when followed by uppercase
-        stripped = re.sub(r'^[a-z]{1,2}(?=[A-Z0-9])', '', last)
-        if stripped and stripped != last:
-            aliases.add(stripped)
-
-        # 3) camelCase -> snake_case (lower) and Title_Case (readable)
-        def camel_to_snake(s):
-            s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', s)
-            s2 = re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1)
-            return s2.strip('_').lower()
-
-        snake = camel_to_snake(stripped)
-        if snake:
-            aliases.add(snake)
-            # also add a Title_Case variant for nicer display (underscores kept)
-            aliases.add('_'.join([w.capitalize() for w in snake.split('_')]))
-
-        # 4) short-name without 'MAIN.' prefix
-        if len(parts) > 1:
-            short = '.'.join(parts[1:])
-            aliases.add(short)
-
-        # 5) lowercase/uppercase variants for matching
-        to_add = set()
-        for a in list(aliases):
-            to_add.add(a.lower())
-            to_add.add(a.upper())
-        aliases.update(to_add)
-
-        # Remove the original full_name if accidentally included
-        aliases.discard(full_name)
-
-        return list(aliases)
-
     def load_alias_mappings(self, path: str = None) -> bool:
         """
         Lädt benutzerdefinierte Alias-Mappings aus `config/alias_mappings.json`.
@@ -248,20 +240,22 @@ class VariableManager:
 
                     # Wenn Full-Symbol schon registriert -> setze Alias direkt
                     if full_key in self.symbols:
-                        self.symbols[alias_key] = self.symbols[full_key]
                         self.alias_map[alias_key] = full
                         logger.debug(f"Config-Alias registriert: {plc_id}/{alias} -> {full}")
                     else:
                         # Merke als Pending-Alias, wird bei Symbol-Registrierung angewandt
                         self.pending_aliases.setdefault(full_key, []).append(alias)
 
+                self.resolver.invalidate(plc_id)
+
             return True
 
         except Exception as e:
             logger.warning(f"Fehler beim Laden der Alias-Mappings: {e}")
             return False
 
-    def subscribe_widget(self, widget_id: str, variable_name: str, plc_id: str = 'plc_001'):
+    def subscribe_widget(self, widget_id: str, variable_name: str, plc_id: str = 'plc_001',
+                         poll_class: str = 'normal'):
         """
         Widget abonniert eine Variable
 
@@ -269,22 +263,35 @@ class VariableManager:
             widget_id: Eindeutige Widget-ID
             variable_name: Vollständiger Symbol-Name (z.B. "Light.Light_EG_WZ.bOn")
             plc_id: PLC-ID (Standard: 'plc_001')
+            poll_class: Poll-Priorität des Widgets (fast/normal/slow)
         """
         key = (plc_id, variable_name)
 
+        # Widget wechselt die Variable → altes Abo sauber beenden
+        previous = self.widget_mappings.get(widget_id)
+        if previous is not None and previous != key:
+            self.unsubscribe_widget(widget_id)
+
         # Erstelle Subscription-Set falls nicht vorhanden
         if key not in self.subscriptions:
             self.subscriptions[key] = set()
 
         # Füge Widget zu Subscription hinzu
+        is_new = widget_id not in self.subscriptions[key]
         self.subscriptions[key].add(widget_id)
 
         # Speichere Reverse-Mapping
         self.widget_mappings[widget_id] = key
+        if is_new or self.widget_poll_classes.get(widget_id) != poll_class:
+            self.widget_poll_classes[widget_id] = poll_class
+            self.subscription_version += 1
 
         logger.info(f"📌 Widget {widget_id} abonniert {plc_id}/{variable_name}")
         logger.debug(f"   Insgesamt {len(self.subscriptions[key])} Subscriber für diese Variable")
 
+        if is_new:
+            self._notify_subscription_listeners('subscribe', plc_id, variable_name)
+
     def unsubscribe_widget(self, widget_id: str):
         """
         Widget beendet Subscription
@@ -301,7 +308,9 @@ class VariableManager:
         plc_id, variable_name = key
 
         # Entferne aus Subscription-Set
+        removed = False
         if key in self.subscriptions:
+            removed = widget_id in self.subscriptions[key]
             self.subscriptions[key].discard(widget_id)
 
             # Wenn keine Subscriber mehr → Entferne Key
@@ -311,9 +320,32 @@ class VariableManager:
 
         # Entferne Reverse-Mapping
         del self.widget_mappings[widget_id]
+        self.widget_poll_classes.pop(widget_id, None)
+        self.subscription_version += 1
 
         logger.info(f"📌 Widget {widget_id} Subscription beendet")
 
+        if removed:
+            self._notify_subscription_listeners('unsubscribe', plc_id, variable_name)
+
+    def add_subscription_listener(self, callback: Callable[[str, str, str], None]):
+        """
+        Registriert einen Listener für Subscription-Änderungen
+
+        Args:
+            callback: callback(event, plc_id, variable_name) mit
+                event = 'subscribe' | 'unsubscribe' (pro Widget-Abo)
+        """
+        if callback not in self._subscription_listeners:
+            self._subscription_listeners.append(callback)
+
+    def _notify_subscription_listeners(self, event: str, plc_id: str, variable_name: str):
+        for callback in list(self._subscription_listeners):
+            try:
+                callback(event, plc_id, variable_name)
+            except Exception as e:
+                logger.debug(f"Subscription-Listener fehlgeschlagen ({event} {plc_id}/{variable_name}): {e}")
+
     def get_subscribers(self, variable_name: str, plc_id: str = 'plc_001') -> Set[str]:
         """
         Gibt alle Widget-IDs zurück die diese Variable abonniert haben
@@ -328,6 +360,18 @@ class VariableManager:
         key = (plc_id, variable_name)
         return self.subscriptions.get(key, set())
 
+    def get_poll_classes(self) -> Dict[Tuple[str, str], List[str]]:
+        """
+        Poll-Klassen der Widgets pro abonnierter Variable
+
+        Returns:
+            {(plc_id, variable_name): [poll_class, ...]}
+        """
+        classes: Dict[Tuple[str, str], List[str]] = {}
+        for widget_id, key in list(self.widget_mappings.items()):
+            classes.setdefault(key, []).append(self.widget_poll_classes.get(widget_id, 'normal'))
+        return classes
+
     def get_all_subscribed_variables(self) -> list:
         """
         Gibt alle abonnierten Variablen zurück
@@ -337,18 +381,23 @@ class VariableManager:
         """
         return list(self.subscriptions.keys())
 
-    def update_value(self, variable_name: str, value: Any, plc_id: str = 'plc_001'):
+    def update_value(self, variable_name: str, value: Any, plc_id: str = 'plc_001') -> bool:
         """
-        Aktualisiert Value-Cache
+        Aktualisiert Value-Cache und markiert den Wert als veröffentlicht
 
         Args:
             variable_name: Symbol-Name
             value: Neuer Wert
             plc_id: PLC-ID
+
+        Returns:
+            True wenn der Wert neu ist oder sich seit dem letzten update_value()
+            geändert hat (auch wenn ein PLC-Read ihn schon eingetragen hat)
         """
-        key = (plc_id, variable_name)
-        self.value_cache[key] = (value, time.time())
-        logger.debug(f"💾 Cache aktualisiert: {plc_id}/{variable_name} = {value}")
+        changed = self.value_store.publish(plc_id, variable_name, value)
+        if changed:
+            logger.debug(f"💾 Cache aktualisiert: {plc_id}/{variable_name} = {value}")
+        return changed
 
     def get_cached_value(self, variable_name: str, plc_id: str = 'plc_001') -> Optional[Tuple[Any, float]]:
         """
@@ -361,8 +410,8 @@ class VariableManager:
         Returns:
             Tuple (value, timestamp) oder None
         """
-        key = (plc_id, variable_name)
-        return self.value_cache.get(key)
+        entry = self.value_store.get_entry(plc_id, variable_name)
+        return entry[:2] if entry is not None else None
 
     def get_symbol_info(self, variable_name: str, plc_id: str = 'plc_001') -> Optional[SymbolInfo]:
         """
@@ -377,35 +426,63 @@ class VariableManager:
         """
         # Direct hit
         key = (plc_id, variable_name)
-        if key in self.symbols:
-            return self.symbols[key]
-
-        # Fallbacks to handle different naming styles (short names, MAIN prefix, case variants)
-        candidates = []
-
-        # If variable already contains a dot, try case-variants
-        if '.' in variable_name:
-            candidates.append(variable_name)
-            candidates.append(variable_name.upper())
-            candidates.append(variable_name.lower())
-        else:
-            # Try with MAIN. prefix (common in configs)
-            candidates.append(f"MAIN.{variable_name}")
-            candidates.append(f"MAIN.{variable_name}".upper())
-            candidates.append(f"MAIN.{variable_name}".lower())
-            # Also try raw name with different casing
-            candidates.append(variable_name.upper())
-            candidates.append(variable_name.lower())
-
-        for name in candidates:
-            k = (plc_id, name)
-            if k in self.symbols:
-                # Cache this as direct mapping to speed up future lookups
-                self.symbols[key] = self.symbols[k]
-                return self.symbols[k]
-
+        symbol_info = self.symbols.get(key)
+        if symbol_info is not None:
+            return symbol_info
+
+        # Config-Alias oder bereits aufgelöster Lookup
+        full_name = self.alias_map.get(key)
+        if full_name is not None:
+            symbol_info = self.symbols.get((plc_id, full_name))
+            if symbol_info is not None:
+                return symbol_info
+
+        # Bekannter Fehlschlag in dieser Symbol-Generation → kein erneuter Fallback
+        if self.resolver.is_known_miss(plc_id, variable_name):
+            return None
+
+        # Schreibvarianten (Groß-/Kleinschreibung, MAIN-Präfix) und heuristische
+        # Aliase (Blattname, snake_case, ...): je ein Hash-Lookup
+        full_name = self.resolver.lookup(
+            plc_id, variable_name,
+            lambda: [name for symbol_plc_id, name in list(self.symbols) if symbol_plc_id == plc_id]
+        )
+        if full_name is not None:
+            symbol_info = self.symbols.get((plc_id, full_name))
+            if symbol_info is not None:
+                # Als Alias merken → nächster Lookup ohne Fallback
+                self.alias_map[key] = full_name
+                return symbol_info
+
+        self.resolver.remember_miss(plc_id, variable_name)
         return None
 
+    def set_suggestion_provider(self, provider: Optional[Callable[[str, str, int], List[str]]]):
+        """
+        Setzt die Quelle für "Meinten Sie"-Vorschläge
+
+        Args:
+            provider: provider(plc_id, variable_name, limit) -> Liste von Symbolnamen
+                (z.B. über den Symbol-Suchindex des Symbol-Browsers)
+        """
+        self._suggestion_provider = provider
+
+    def suggest_symbols(self, variable_name: str, plc_id: str = 'plc_001', limit: int = 5) -> List[str]:
+        """
+        Ähnliche Symbolnamen für einen nicht auflösbaren Namen
+
+        Returns:
+            Liste von Symbolnamen (leer ohne Provider oder bei Fehlern)
+        """
+        provider = self._suggestion_provider
+        if provider is None:
+            return []
+        try:
+            return list(provider(plc_id, variable_name, limit))[:limit]
+        except Exception as e:
+            logger.debug(f"Symbol-Vorschläge fehlgeschlagen für {plc_id}/{variable_name}: {e}")
+            return []
+
     def get_statistics(self) -> dict:
         """
         Gibt Statistiken zurück
@@ -415,9 +492,12 @@ class VariableManager:
         """
         return {
             'total_symbols': len(self.symbols),
+            'aliases': len(self.alias_map),
+            'alias_index_keys': self.resolver.get_stats()['alias_keys'],
+            'resolver': self.resolver.get_stats(),
             'total_subscriptions': len(self.subscriptions),
             'total_widgets': len(self.widget_mappings),
-            'cached_values': len(self.value_cache),
+            'cached_values': len(self.value_store),
             'subscribed_variables': len(self.subscriptions),
             'unique_plcs': len(set(plc_id for plc_id, _ in self.symbols.keys()))
         }
@@ -449,18 +529,9 @@ class VariableManager:
         Args:
             max_age_seconds: Maximales Alter in Sekunden (Standard: 60s)
         """
-        now = time.time()
-        to_remove = []
-
-        for key, (value, timestamp) in self.value_cache.items():
-            if now - timestamp > max_age_seconds:
-                to_remove.append(key)
-
-        for key in to_remove:
-            del self.value_cache[key]
-
-        if to_remove:
-            logger.info(f"🗑️  {len(to_remove)} alte Cache-Einträge gelöscht")
+        removed = self.value_store.prune(max_age_seconds)
+        if removed:
+            logger.info(f"🗑️  {removed} alte Cache-Einträge gelöscht")
 
 
 # Factory-Funktion für einfache Integration
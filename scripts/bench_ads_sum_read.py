@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark: ADS Einzel-Reads vs. Sum-Read (offline, FakeADSConnection).
+
+Misst für ein Poll-Fenster mit N Symbolen:
+- Roundtrips und Laufzeit mit read_by_name() pro Symbol
+- Roundtrips und Laufzeit mit read_list_by_name() (Chunking)
+- Verhalten bei unbekannten Symbolen (Chunk-Fallback + Ausschluss)
+
+Beispiel:
+    python scripts/bench_ads_sum_read.py --symbols 2000 --latency-ms 0.5
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import pyads  # noqa: E402
+
+from modules.core.ads_sum_read import MAX_ADS_SUB_COMMANDS  # noqa: E402
+from modules.core.fake_ads import FakeADSConnection  # noqa: E402
+from modules.core.plc_communication import PLCCommunication  # noqa: E402
+
+
+def _make_comm(values, latency_s, chunk_size):
+    comm = PLCCommunication()
+    comm.plc = FakeADSConnection(values, latency_s=latency_s)
+    comm.connected = True
+    comm.sum_read_chunk_size = chunk_size
+    return comm
+
+
+def _run_single(comm, names, cycles):
+    start = time.perf_counter()
+    for _ in range(cycles):
+        for name in names:
+            comm.read_by_name(name, pyads.PLCTYPE_DINT, use_cache=False)
+    return time.perf_counter() - start
+
+
+def _run_batch(comm, names, cycles):
+    types = {name: pyads.PLCTYPE_DINT for name in names}
+    start = time.perf_counter()
+    for _ in range(cycles):
+        comm.read_list_by_name(names, types, use_cache=False)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="ADS Sum-Read Benchmark (FakeADSConnection)")
+    parser.add_argument("--symbols", type=int, default=2000, help="Symbole pro Poll-Fenster")
+    parser.add_argument("--cycles", type=int, default=5, help="Anzahl Poll-Zyklen")
+    parser.add_argument("--latency-ms", type=float, default=0.2, help="Simulierte Latenz pro Roundtrip")
+    parser.add_argument("--chunk", type=int, default=MAX_ADS_SUB_COMMANDS, help="Max. Sub-Kommandos pro Request")
+    parser.add_argument("--missing", type=int, default=3, help="Unbekannte Symbole im Fallback-Szenario")
+    args = parser.parse_args()
+
+    names = [f"MAIN.aValues[{i}]" for i in range(args.symbols)]
+    values = {name: i for i, name in enumerate(names)}
+    latency_s = args.latency_ms / 1000.0
+
+    single = _make_comm(values, latency_s, args.chunk)
+    t_single = _run_single(single, names, args.cycles)
+
+    batch = _make_comm(values, latency_s, args.chunk)
+    batch.read_list_by_name(names, use_cache=False)  # Symbol-Info-Cache aufwärmen
+    batch.plc.reset_counters()
+    t_batch = _run_batch(batch, names, args.cycles)
+
+    missing = [f"MAIN.missing{i}" for i in range(args.missing)]
+    mixed = names + missing
+    fallback = _make_comm(values, latency_s, args.chunk)
+    fallback.read_list_by_name(mixed, use_cache=False)
+    first_trips = fallback.plc.round_trips
+    fallback.plc.reset_counters()
+    fallback.read_list_by_name(mixed, use_cache=False)
+
+    print(f"Symbole: {args.symbols}, Zyklen: {args.cycles}, Latenz: {args.latency_ms} ms, Chunk: {args.chunk}")
+    print(f"  Einzel-Reads : {single.plc.round_trips / args.cycles:8.0f} Roundtrips/Zyklus  {t_single / args.cycles * 1000:9.1f} ms/Zyklus")
+    print(f"  Sum-Read     : {batch.plc.round_trips / args.cycles:8.0f} Roundtrips/Zyklus  {t_batch / args.cycles * 1000:9.1f} ms/Zyklus")
+    if t_batch > 0:
+        print(f"  Speedup      : {t_single / t_batch:8.1f}x")
+    print(f"  Fallback ({args.missing} fehlende Symbole): 1. Zyklus {first_trips} Roundtrips, "
+          f"danach {fallback.plc.round_trips} Roundtrips "
+          f"(ausgeschlossen: {len(fallback._sum_read_excluded)})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
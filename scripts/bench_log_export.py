@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Log-Export als Dokument vs. Streaming (Speicherspitze).
+
+- bisher (hier nachgebaut): export_logs() lädt bis zu 50000 Zeilen als
+  Liste von Dicts, CSV wird komplett in einem StringIO/BytesIO gebaut
+- Streaming: iter_logs() in Keyset-Blöcken → build_export_stream()
+  (NDJSON bzw. CSV, optional gzip) in Chunks
+
+Gemessen wird die Python-Speicherspitze (tracemalloc) beim vollständigen
+Erzeugen der Antwort.
+
+Beispiel:
+    python scripts/bench_log_export.py --rows 50000
+"""
+
+import argparse
+import csv
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from modules.core.database_logger import DatabaseLogger  # noqa: E402
+from modules.core.stream_export import build_export_stream  # noqa: E402
+
+
+def _legacy_csv(db_path, limit):
+    """Bisheriger CSV-Pfad von /api/admin/logs/export"""
+    logs = DatabaseLogger.export_logs(db_path, limit=limit)
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=DatabaseLogger.EXPORT_FIELDS)
+    writer.writeheader()
+    for row in logs:
+        writer.writerow(row)
+    out = io.BytesIO(buffer.getvalue().encode('utf-8'))
+    return len(out.getvalue())
+
+
+def _stream(db_path, limit, export_format, compress):
+    chunks, _, _ = build_export_stream(
+        DatabaseLogger.iter_logs(db_path, limit=limit), export_format,
+        fieldnames=DatabaseLogger.EXPORT_FIELDS, compress=compress
+    )
+    return sum(len(chunk) for chunk in chunks)
+
+
+def _measure(func):
+    tracemalloc.start()
+    started = time.perf_counter()
+    size = func()
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, size
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Log-Export Benchmark")
+    parser.add_argument("--rows", type=int, default=50000, help="Exportierte Einträge")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "system_logs.db")
+        writer = DatabaseLogger.get_writer(db_path)
+        for i in range(args.rows):
+            writer.enqueue(DatabaseLogger._utc_timestamp(), 'WARNING', f'modules.m{i % 7}',
+                           f"Symbol nicht gefunden: plc_001/MAIN.fbRoom{i // 50}.nVar{i}")
+            if i % 1000 == 999:
+                writer.flush()
+        writer.flush()
+
+        results = [
+            ("CSV bisher", _measure(lambda: _legacy_csv(db_path, args.rows))),
+            ("CSV Stream", _measure(lambda: _stream(db_path, args.rows, 'csv', False))),
+            ("NDJSON Stream", _measure(lambda: _stream(db_path, args.rows, 'ndjson', False))),
+            ("NDJSON+gzip", _measure(lambda: _stream(db_path, args.rows, 'ndjson', True))),
+        ]
+        writer.stop()
+
+    print(f"📤 Export von {args.rows} Log-Einträgen")
+    for label, (elapsed, peak, size) in results:
+        print(f"  {label:14s} {elapsed * 1000:8.1f} ms  Spitze {peak / 1024 / 1024:7.2f} MiB  "
+              f"Antwort {size / 1024 / 1024:7.2f} MiB")
+    legacy_size = results[0][1][2]
+    ok = results[1][1][2] == legacy_size and results[1][1][1] < results[0][1][1]
+    print(f"  CSV identisch groß, Spitze kleiner: {'✅' if ok else '❌'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
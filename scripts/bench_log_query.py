@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark: /api/admin/logs-Abfragen auf einer vollen Log-DB.
+
+- bisher (hier nachgebaut): Restart-Filter laden bis zu 5000 neueste
+  Zeilen per get_recent_logs() und filtern in Python (JSON-Parse der
+  Audit-Einträge, Substring-Suche); Volltext gab es nicht
+- neu: query_logs() mit Filtern in SQL (category-Index, FTS5, Keyset)
+
+Beispiel:
+    python scripts/bench_log_query.py --rows 20000 --repeat 20
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from modules.core.database_logger import DatabaseLogger  # noqa: E402
+
+
+def _legacy_restart_daemon(db_path, limit):
+    """Bisheriger Pfad von get_system_logs(filter=restart_daemon)"""
+    raw_logs = DatabaseLogger.get_recent_logs(db_path, limit=min(limit * 10, 5000))
+    result = []
+    for log_row in raw_logs:
+        msg = str(log_row.get('message') or '').lower()
+        action = ''
+        if str(log_row.get('module') or '').lower() == 'audit':
+            try:
+                action = str(json.loads(msg).get('action') or '').strip().lower()
+            except Exception:
+                pass
+        if action in ('daemon_restart_scheduled', 'daemon_restart_rejected') or 'type=daemon' in msg:
+            result.append(log_row)
+    return result[:limit]
+
+
+def _fill(db_path, rows):
+    writer = DatabaseLogger.get_writer(db_path)
+    for i in range(rows):
+        if i % 997 == 0:
+            DatabaseLogger.audit_event(db_path, 'daemon_restart_scheduled', 'bench', {'delay_seconds': 1})
+        else:
+            writer.enqueue(DatabaseLogger._utc_timestamp(), 'WARNING', f'modules.m{i % 7}',
+                           f"Symbol nicht gefunden: plc_001/MAIN.fbRoom{i // 50}.nVar{i}")
+        if i % 1000 == 999:
+            writer.flush()
+    writer.flush()
+    return writer
+
+
+def _time(func, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - started) / repeat, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Log-Abfrage Benchmark")
+    parser.add_argument("--rows", type=int, default=20000, help="Einträge in der DB (Retention-Limit)")
+    parser.add_argument("--limit", type=int, default=50, help="Seitengröße")
+    parser.add_argument("--repeat", type=int, default=20, help="Wiederholungen pro Abfrage")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "system_logs.db")
+        writer = _fill(db_path, args.rows)
+        pattern = DatabaseLogger.CATEGORY_FILTERS['restart_daemon']
+
+        t_legacy, legacy = _time(lambda: _legacy_restart_daemon(db_path, args.limit), args.repeat)
+        t_new, new = _time(lambda: DatabaseLogger.query_logs(db_path, limit=args.limit, category=pattern),
+                           args.repeat)
+        t_search, found = _time(lambda: DatabaseLogger.query_logs(db_path, limit=args.limit,
+                                                                  search="MAIN.fbRoom7.nVar371"), args.repeat)
+        t_page, page = _time(lambda: DatabaseLogger.query_logs(db_path, limit=args.limit, module='modules.m3',
+                                                               before_id=args.rows // 10), args.repeat)
+        writer.stop()
+
+    total = args.rows // 997 + 1
+    print(f"🔎 {args.rows} Log-Einträge, Seitengröße {args.limit}")
+    print(f"  restart_daemon bisher: {t_legacy * 1000:8.2f} ms  ({len(legacy)} von {total} Treffern)")
+    print(f"  restart_daemon neu:    {t_new * 1000:8.2f} ms  ({len(new)} von {total} Treffern)")
+    print(f"  Volltext (FTS5):       {t_search * 1000:8.2f} ms  ({len(found)} Treffer)")
+    print(f"  Keyset-Seite (module): {t_page * 1000:8.2f} ms  ({len(page)} Einträge)")
+    ok = len(new) == min(total, args.limit) and len(found) == 1
+    print(f"  Ergebnisse vollständig: {'✅' if ok else '❌'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Hash-Ketten-Prüfung der System-Logs (voll vs. inkrementell).
+
+- voll (bisheriger Pfad, hier nachgebaut): alle Zeilen per fetchall()
+  laden und die gesamte Kette neu rechnen
+- inkrementell: verify_chain(incremental=True) ab dem Checkpoint, liest
+  nur die seit der letzten Prüfung neuen Zeilen blockweise
+
+Gemessen werden Laufzeit und Python-Speicherspitze (tracemalloc) einer
+Prüfung nach --new-rows neuen Einträgen auf einer Tabelle mit --rows
+Einträgen.
+
+Beispiel:
+    python scripts/bench_log_verify.py --rows 20000 --new-rows 100
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from modules.core.database_logger import DatabaseLogger  # noqa: E402
+
+
+def _legacy_verify(db_path):
+    """Bisheriger DatabaseLogger.verify_chain()"""
+    with sqlite3.connect(db_path) as conn:
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute(
+            "SELECT id, timestamp, level, module, message, prev_hash, entry_hash FROM system_logs ORDER BY id ASC"
+        ).fetchall()
+    prev_hash = ''
+    checked = 0
+    for row in rows:
+        checked += 1
+        row_prev_hash = row['prev_hash'] or ''
+        if not row['entry_hash']:
+            continue
+        expected = DatabaseLogger._entry_hash(row['timestamp'], row['level'], row['module'], row['message'],
+                                              row_prev_hash)
+        if row_prev_hash != prev_hash or row['entry_hash'] != expected:
+            return {'ok': False, 'checked': checked, 'broken_at_id': row['id']}
+        prev_hash = row['entry_hash']
+    return {'ok': True, 'checked': checked, 'broken_at_id': None}
+
+
+def _fill(writer, start, count):
+    for i in range(start, start + count):
+        writer.enqueue(DatabaseLogger._utc_timestamp(), "WARNING", "bench.verify",
+                       f"Symbol nicht gefunden: plc_001/MAIN.fbRoom{i // 50}.nVar{i}")
+        if i % 1000 == 999:
+            writer.flush()  # Queue nie überlaufen lassen
+    writer.flush()
+
+
+def _measure(func):
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Log-Hash-Ketten-Prüfung Benchmark")
+    parser.add_argument("--rows", type=int, default=20000, help="Bereits geprüfte Einträge")
+    parser.add_argument("--new-rows", type=int, default=100, help="Neue Einträge seit der letzten Prüfung")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "system_logs.db")
+        writer = DatabaseLogger.get_writer(db_path)
+        _fill(writer, 0, args.rows)
+        DatabaseLogger.verify_chain(db_path, incremental=True)  # Checkpoint (z.B. durch den Hintergrund-Prüfer)
+        _fill(writer, args.rows, args.new_rows)
+
+        t_full, peak_full, full = _measure(lambda: _legacy_verify(db_path))
+        t_inc, peak_inc, inc = _measure(lambda: DatabaseLogger.verify_chain(db_path, incremental=True))
+        writer.stop()
+
+    same = full == {k: inc[k] for k in ('ok', 'checked', 'broken_at_id')}
+    print(f"🔗 {args.rows} geprüfte + {args.new_rows} neue Log-Einträge")
+    print(f"  voll:          {t_full * 1000:8.1f} ms, Speicherspitze {peak_full / 1024:8.1f} KiB")
+    print(f"  inkrementell:  {t_inc * 1000:8.1f} ms, Speicherspitze {peak_inc / 1024:8.1f} KiB "
+          f"({inc['new_rows']} Zeilen gelesen)")
+    print(f"  Ergebnis gleich: {'✅' if same else '❌'}  Kette: {'✅' if inc['ok'] else '❌'}")
+    return 0 if same and inc['ok'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
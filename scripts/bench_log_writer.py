@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Logging-Durchsatz des SQLite-Handlers (Warn-Sturm).
+
+- synchron (bisheriger Pfad, hier nachgebaut): pro Record Lock,
+  ensure_schema(), neue Verbindung, letzten Hash lesen, Insert, Commit
+- asynchron: SQLiteHandler → SQLiteLogWriter (Queue, WAL-Verbindung,
+  Batches, Hash-Kette im Speicher)
+
+Gemessen wird die Zeit im Logging-Aufruf (Hot-Path der Aufrufer) und die
+Zeit bis alle Einträge in der DB stehen; danach wird die Hash-Kette geprüft.
+
+Beispiel:
+    python scripts/bench_log_writer.py --records 5000 --threads 4
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from modules.core.database_logger import DatabaseLogger, SQLiteHandler  # noqa: E402
+
+_legacy_lock = threading.Lock()
+
+
+def _legacy_insert(db_path, timestamp, level, module, message):
+    """Bisheriger DatabaseLogger._insert_log_entry()"""
+    with _legacy_lock:
+        DatabaseLogger.ensure_schema(db_path)
+        with sqlite3.connect(db_path) as conn:
+            row = conn.execute("SELECT entry_hash FROM system_logs ORDER BY id DESC LIMIT 1").fetchone()
+            prev_hash = row[0] if row and row[0] else ''
+            payload = f"{timestamp}|{level}|{module}|{message}|{prev_hash}"
+            entry_hash = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+            conn.execute(
+                "INSERT INTO system_logs (timestamp, level, module, message, prev_hash, entry_hash) VALUES (?, ?, ?, ?, ?, ?)",
+                (timestamp, level, module, message, prev_hash, entry_hash)
+            )
+
+
+class _LegacyHandler(logging.Handler):
+    def __init__(self, db_path):
+        super().__init__(logging.WARNING)
+        self.db_path = db_path
+        DatabaseLogger.ensure_schema(db_path)
+
+    def emit(self, record):
+        _legacy_insert(self.db_path, DatabaseLogger._utc_timestamp(), record.levelname,
+                       record.name, self.format(record))
+
+
+def _storm(handler, records, threads):
+    log = logging.getLogger(f"bench.storm.{id(handler)}")
+    log.propagate = False
+    log.setLevel(logging.WARNING)
+    log.addHandler(handler)
+    per_thread = records // threads
+
+    def worker(n):
+        for i in range(per_thread):
+            log.warning("Symbol nicht gefunden: plc_001/MAIN.fbRoom%d.nVar%d", n, i)
+
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    started = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    emitted = time.perf_counter() - started
+    handler.flush()
+    done = time.perf_counter() - started
+    log.removeHandler(handler)
+    return emitted, done, per_thread * threads
+
+
+def _count(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM system_logs").fetchone()[0]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="SQLite-Log-Writer Benchmark")
+    parser.add_argument("--records", type=int, default=5000, help="Warnungen insgesamt")
+    parser.add_argument("--threads", type=int, default=4, help="Parallel loggende Threads")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_db = os.path.join(tmp, "legacy.db")
+        async_db = os.path.join(tmp, "async.db")
+
+        t_legacy_emit, t_legacy_done, total = _storm(_LegacyHandler(legacy_db), args.records, args.threads)
+        handler = SQLiteHandler(async_db)
+        t_async_emit, t_async_done, _ = _storm(handler, args.records, args.threads)
+        stats = handler.writer.get_stats()
+        handler.writer.stop()
+
+        rows_ok = _count(legacy_db) == total and _count(async_db) + stats['dropped'] == total
+        chain_ok = DatabaseLogger.verify_chain(async_db)['ok']
+
+    print(f"🪵 {total} Warnungen aus {args.threads} Threads")
+    print(f"  synchron:  Hot-Path {t_legacy_emit * 1000:8.1f} ms  "
+          f"({total / max(t_legacy_emit, 1e-9):9.0f} Records/s), fertig nach {t_legacy_done * 1000:8.1f} ms")
+    print(f"  asynchron: Hot-Path {t_async_emit * 1000:8.1f} ms  "
+          f"({total / max(t_async_emit, 1e-9):9.0f} Records/s), fertig nach {t_async_done * 1000:8.1f} ms")
+    print(f"  Writer: {stats['batches']} Transaktionen (max. {stats['batch_size']}), "
+          f"Queue max. {stats['max_queue']}/{stats['queue_size']}, verworfen {stats['dropped']}")
+    print(f"  Einträge vollständig: {'✅' if rows_ok else '❌'}  Hash-Kette: {'✅' if chain_ok else '❌'}")
+    return 0 if rows_ok and chain_ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
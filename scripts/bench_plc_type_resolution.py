@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: PLC-Typauflösung pro Read im Poll-Loop.
+
+Vergleicht für einen Poll mit N Symbolen:
+- vorher: pro Read `import pyads` + type_map-Dict bauen + symbol_type.upper()
+- nachher: bei Registrierung aufgelöster SymbolInfo.plc_type (Attribut-Zugriff)
+
+Optional inkl. Read über FakeADSConnection (--with-read).
+
+Beispiel:
+    python scripts/bench_plc_type_resolution.py --symbols 5000 --cycles 20
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from modules.core.fake_ads import FakeADSConnection  # noqa: E402
+from modules.gateway.data_gateway import DataGateway  # noqa: E402
+from modules.plc.variable_manager import SymbolInfo, VariableManager  # noqa: E402
+
+TYPES = ['BOOL', 'INT', 'DINT', 'REAL', 'LREAL', 'BYTE', 'STRING(80)', 'UDINT', 'eMode', 'TIME']
+
+
+def _legacy_resolve(symbol_info):
+    """Entspricht der früheren Inline-Auflösung in _read_subscribed_variables"""
+    plc_type = None
+    try:
+        if symbol_info and isinstance(symbol_info.symbol_type, str):
+            import pyads
+            type_map = {
+                'BOOL': pyads.PLCTYPE_BOOL,
+                'INT': pyads.PLCTYPE_INT,
+                'DINT': pyads.PLCTYPE_DINT,
+                'REAL': pyads.PLCTYPE_REAL,
+                'LREAL': pyads.PLCTYPE_LREAL,
+                'STRING': pyads.PLCTYPE_STRING,
+                'BYTE': pyads.PLCTYPE_BYTE
+            }
+            plc_type = type_map.get(symbol_info.symbol_type.upper(), None)
+    except Exception:
+        plc_type = None
+    if plc_type is None:
+        import pyads
+        plc_type = pyads.PLCTYPE_BYTE
+    return plc_type
+
+
+def _time_cycles(infos, resolver, cycles, plc=None):
+    start = time.perf_counter()
+    for _ in range(cycles):
+        for info in infos:
+            plc_type = resolver(info)
+            if plc is not None:
+                plc.read_by_name(info.name, plc_type)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="PLC-Typauflösung: vorher/nachher")
+    parser.add_argument("--symbols", type=int, default=5000)
+    parser.add_argument("--cycles", type=int, default=20)
+    parser.add_argument("--with-read", action="store_true", help="inkl. FakeADSConnection.read_by_name")
+    args = parser.parse_args()
+
+    vm = VariableManager()
+    vm.set_type_aliases({'eMode': 'INT'})
+    infos = []
+    for i in range(args.symbols):
+        info = SymbolInfo(f"MAIN.aVar{i}", TYPES[i % len(TYPES)], 0, 0, 4, "")
+        vm.register_symbol(info)
+        infos.append(info)
+
+    gateway = DataGateway()
+    plc = FakeADSConnection({info.name: 0 for info in infos}) if args.with_read else None
+
+    t_before = _time_cycles(infos, _legacy_resolve, args.cycles, plc)
+    t_after = _time_cycles(infos, gateway._resolve_plc_type, args.cycles, plc)
+
+    per_read_before = t_before / (args.cycles * args.symbols) * 1e9
+    per_read_after = t_after / (args.cycles * args.symbols) * 1e9
+    print(f"Symbole: {args.symbols}, Zyklen: {args.cycles}, mit Read: {args.with_read}")
+    print(f"  vorher : {t_before / args.cycles * 1000:8.2f} ms/Poll  {per_read_before:8.0f} ns/Read")
+    print(f"  nachher: {t_after / args.cycles * 1000:8.2f} ms/Poll  {per_read_after:8.0f} ns/Read")
+    if t_after > 0:
+        print(f"  Faktor : {t_before / t_after:8.1f}x")
+    unresolved = sum(1 for info in infos if info.plc_type is None)
+    print(f"  Ohne aufgelösten Typ (Fallback BYTE): {unresolved}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
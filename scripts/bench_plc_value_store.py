@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Speicherbedarf der PLC-Werte-Caches vorher/nachher (tracemalloc).
+
+Abo-Satz mit --variables Symbolen, ein Poll-Zyklus per Sum-Read:
+- vorher: TTL-Dict der Verbindung {symbol: (wert, zeit)} (FIFO, max.
+  --old-plc-cache-limit Einträge wie SMARTHOME_PLC_CACHE_MAX_ENTRIES) plus
+  VariableManager.value_cache {(plc_id, symbol): (wert, zeit)}
+- nachher: ein PLCValueStore-Eintrag pro (plc_id, symbol), den Verbindung
+  und VariableManager gemeinsam nutzen
+
+Der Telemetrie-Spiegel (PLC.<symbol>) ist in beiden Varianten gleich und
+wird nicht mitgemessen. Die Werte selbst gehören der SPS-Simulation und
+werden von allen Caches nur referenziert.
+
+Beispiel:
+    python scripts/bench_plc_value_store.py --variables 10000
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from modules.core.fake_ads import FakeADSConnection  # noqa: E402
+from modules.core.plc_communication import PLCCommunication  # noqa: E402
+from modules.plc.variable_manager import VariableManager  # noqa: E402
+
+PLC_ID = 'plc_001'
+
+
+def _values(count):
+    values = {}
+    for i in range(count):
+        kind = i % 3
+        values[f"MAIN.fbRoom{i // 50}.var{i}"] = (i * 0.5) if kind == 0 else (i if kind == 1 else bool(i & 4))
+    return values
+
+
+def _measure(build):
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    keep = build()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return current - baseline, keep
+
+
+def _build_before(read_values, plc_cache_limit):
+    """Nachbau der bisherigen Strukturen (PLCCommunication.cache + value_cache)"""
+    plc_cache = {}
+    stamp = time.time()
+    for name, value in read_values.items():
+        if name not in plc_cache and len(plc_cache) >= plc_cache_limit:
+            del plc_cache[next(iter(plc_cache))]
+        plc_cache[name] = (value, stamp)
+    value_cache = {}
+    for name, value in read_values.items():
+        value_cache[(PLC_ID, name)] = (value, time.time())
+    return plc_cache, value_cache
+
+
+def _build_after(comm, vm, names):
+    read_values = comm.read_list_by_name(names)
+    return sum(1 for name, value in read_values.items() if vm.update_value(name, value, PLC_ID))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="PLC Value Store Speicher-Benchmark")
+    parser.add_argument("--variables", type=int, default=10000, help="Abonnierte Symbole")
+    parser.add_argument("--old-plc-cache-limit", type=int, default=5000,
+                        help="Bisheriges Limit des Verbindungs-Caches")
+    args = parser.parse_args()
+
+    values = _values(args.variables)
+    names = list(values)
+    comm = PLCCommunication()
+    comm.plc = FakeADSConnection(values)
+    comm.connected = True
+    read_values = {name: comm.plc.values[name] for name in names}
+
+    before_bytes, (plc_cache, value_cache) = _measure(lambda: _build_before(read_values, args.old_plc_cache_limit))
+    vm = VariableManager()
+    comm.value_store = vm.value_store  # wie DataGateway._bind_value_store()
+    after_bytes, changed = _measure(lambda: _build_after(comm, vm, names))
+    store = vm.value_store
+
+    ok = len(store) == args.variables and changed == args.variables
+    print(f"💾 {args.variables} abonnierte Variablen, ein Poll-Zyklus")
+    print(f"  vorher:  {before_bytes / 1024:9.1f} KiB  "
+          f"({len(plc_cache)} Verbindungs-Cache + {len(value_cache)} value_cache Einträge)")
+    print(f"  nachher: {after_bytes / 1024:9.1f} KiB  ({len(store)} Store-Einträge, "
+          f"{store.get_stats()['max_entries']} max.)")
+    print(f"  Ersparnis: {(1 - after_bytes / max(before_bytes, 1)) * 100:5.1f} %  "
+          f"({before_bytes / max(len(value_cache), 1):.0f} → {after_bytes / max(len(store), 1):.0f} Bytes/Variable)")
+    print(f"  Einträge vollständig: {'✅' if ok else '❌'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
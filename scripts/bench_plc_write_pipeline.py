@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: direkte PLC-Writes vs. Write-Pipeline (offline, FakeADSConnection).
+
+Simuliert mehrere Slider-Widgets, die parallel alle --interval-ms einen Wert
+auf ihr Symbol schicken (Writes überlappen sich wie parallele HTTP-Requests):
+- direkt: write_by_name() pro Write (ein Roundtrip je Write, Writes stauen sich)
+- Pipeline: Coalescing pro Symbol + Sum-Write über PLCWritePipeline
+
+Gemessen wird die Zeit bis alle Writes quittiert sind.
+
+Beispiel:
+    python scripts/bench_plc_write_pipeline.py --sliders 4 --writes 200 --latency-ms 2
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import pyads  # noqa: E402
+
+from modules.core.fake_ads import FakeADSConnection  # noqa: E402
+from modules.core.plc_communication import PLCCommunication  # noqa: E402
+from modules.core.plc_write_pipeline import PLCWritePipeline  # noqa: E402
+
+
+def _make_comm(names, latency_s):
+    comm = PLCCommunication()
+    comm.plc = FakeADSConnection({name: 0 for name in names}, latency_s=latency_s)
+    comm.connected = True
+    return comm
+
+
+def _run(names, writes, interval_s, submit_fn):
+    """submit_fn(name, value) → callable, das bis zur Quittung wartet"""
+    waits = []
+
+    def slider(name):
+        for value in range(1, writes + 1):
+            waits.append(submit_fn(name, value))
+            time.sleep(interval_s)
+
+    threads = [threading.Thread(target=slider, args=(name,)) for name in names]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for wait in waits:
+        wait()
+    return time.perf_counter() - start
+
+
+def _direct_submitter(comm):
+    """Direkter Write im eigenen Thread pro Request (wie Flask threaded)"""
+    def submit(name, value):
+        thread = threading.Thread(target=comm.write_by_name, args=(name, value, pyads.PLCTYPE_REAL))
+        thread.start()
+        return thread.join
+    return submit
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="PLC Write-Pipeline Benchmark (FakeADSConnection)")
+    parser.add_argument("--sliders", type=int, default=4, help="Parallele Slider (je ein Symbol)")
+    parser.add_argument("--writes", type=int, default=200, help="Writes pro Slider")
+    parser.add_argument("--interval-ms", type=float, default=1.0, help="Abstand der Writes pro Slider")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Simulierte Latenz pro Roundtrip")
+    parser.add_argument("--window-ms", type=float, default=20.0, help="Sammelfenster der Pipeline")
+    args = parser.parse_args()
+
+    names = [f"MAIN.rSlider{i}" for i in range(args.sliders)]
+    latency_s = args.latency_ms / 1000.0
+    interval_s = args.interval_ms / 1000.0
+    total = args.sliders * args.writes
+
+    direct = _make_comm(names, latency_s)
+    t_direct = _run(names, args.writes, interval_s, _direct_submitter(direct))
+
+    piped = _make_comm(names, latency_s)
+    pipeline = PLCWritePipeline(piped, window_s=args.window_ms / 1000.0)
+    t_piped = _run(names, args.writes, interval_s,
+                   lambda name, value: pipeline.submit(name, value, pyads.PLCTYPE_REAL).wait)
+    pipeline.stop()
+    stats = pipeline.get_stats()
+    # Direkt: Reihenfolge der Request-Threads ist nicht garantiert
+    final_ok = all(piped.plc.values[name] == args.writes for name in names)
+
+    print(f"📝 {args.sliders} Slider x {args.writes} Writes = {total} Writes, Latenz {args.latency_ms} ms/Roundtrip")
+    print(f"  direkt:   {t_direct * 1000:8.1f} ms  {direct.plc.round_trips:6d} Roundtrips  "
+          f"{direct.plc.writes:6d} PLC-Writes")
+    print(f"  Pipeline: {t_piped * 1000:8.1f} ms  {piped.plc.round_trips:6d} Roundtrips  "
+          f"{len(piped.plc.write_log):6d} PLC-Writes  ({stats['coalesced']} zusammengefasst, "
+          f"{stats['batches']} Batches, max. {stats['max_batch']} pro Batch)")
+    print(f"  Endwerte korrekt: {'✅' if final_ok else '❌'}")
+    return 0 if final_ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Ring-Event-Speicherung (SQLite) pro Event vs. persistenter Writer.
+
+- bisher (hier nachgebaut): pro Event neue Verbindung, CREATE-Statements,
+  INSERT, danach zweite Verbindung mit COUNT(*) + sortiertem DELETE
+- neu: RingEventStore.record_events() - eine WAL-Verbindung, Schema
+  einmalig, ein executemany-Batch pro Kamera-Zyklus, Retention
+  amortisiert über Rowid-Grenzen
+
+Simuliert werden ring_event_loop-Zyklen mit 6 Events pro Kamera, davon
+die Hälfte bereits gespeichert.
+
+Beispiel:
+    python scripts/bench_ring_event_store.py --cycles 2000 --max-entries 2000
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from modules.gateway.ring_event_store import SQLITE_INSERT_SQL, RingEventStore  # noqa: E402
+
+
+def _cycle_events(cycle, batch):
+    start = cycle * batch // 2
+    return [
+        {"id": f"evt-{i}", "cam_id": "cam1", "kind": "motion" if i % 3 else "ding", "ding_ts": 1700000000 + i}
+        for i in range(start, start + batch)
+    ]
+
+
+def _legacy_store(store, db_path, event, max_entries):
+    """Bisheriger Pfad von _write_sqlite_event + _enforce_sqlite_retention"""
+    conn = sqlite3.connect(db_path)
+    store._create_sqlite_schema(conn)
+    conn.close()
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute(SQLITE_INSERT_SQL, store._event_row(store._normalize_event(event)))
+    conn.close()
+    conn = sqlite3.connect(db_path)
+    with conn:
+        total = conn.execute("SELECT COUNT(*) FROM ring_events").fetchone()[0]
+        if total > max_entries:
+            conn.execute(
+                """
+                DELETE FROM ring_events
+                WHERE id IN (
+                    SELECT id FROM ring_events
+                    ORDER BY COALESCE(ding_ts, 0) DESC, COALESCE(created_at, '') DESC, stored_at DESC
+                    LIMIT -1 OFFSET ?
+                )
+                """,
+                (max_entries,),
+            )
+    conn.close()
+
+
+def _count(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM ring_events").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Ring-Event-Store Benchmark")
+    parser.add_argument("--cycles", type=int, default=2000, help="Abfragezyklen (eine Kamera)")
+    parser.add_argument("--batch", type=int, default=6, help="Events pro Zyklus")
+    parser.add_argument("--max-entries", type=int, default=2000, help="Retention-Limit")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_dir = os.path.join(tmp, "legacy")
+        legacy = RingEventStore(legacy_dir, legacy_dir)
+        os.makedirs(legacy_dir)
+        started = time.perf_counter()
+        for cycle in range(args.cycles):
+            for event in _cycle_events(cycle, args.batch):
+                _legacy_store(legacy, legacy.default_sqlite_path, event, args.max_entries)
+        t_legacy = time.perf_counter() - started
+        legacy_rows = _count(legacy.default_sqlite_path)
+
+        store_dir = os.path.join(tmp, "writer")
+        store = RingEventStore(store_dir, store_dir)
+        config = {"backend": "sqlite", "max_entries": args.max_entries}
+        started = time.perf_counter()
+        for cycle in range(args.cycles):
+            store.record_events(_cycle_events(cycle, args.batch), config)
+        t_new = time.perf_counter() - started
+        stats = store.get_writer_stats()["sqlite"][0]
+        newest = store.list_events(1, None, config)[0]["id"]
+        store.close()
+        new_rows = _count(store.default_sqlite_path)
+
+    total = args.cycles * args.batch
+    print(f"🔔 {args.cycles} Zyklen × {args.batch} Events ({total} Aufrufe), max_entries {args.max_entries}")
+    print(f"  bisher pro Event:   {t_legacy * 1000:9.1f} ms  ({t_legacy / total * 1e6:7.1f} µs/Event, {legacy_rows} Zeilen)")
+    print(f"  Writer + Batches:   {t_new * 1000:9.1f} ms  ({t_new / total * 1e6:7.1f} µs/Event, {new_rows} Zeilen)")
+    print(f"  Retention-Läufe:    {stats['retention_runs']} (statt {total})")
+    expected_newest = f"evt-{(args.cycles - 1) * args.batch // 2 + args.batch - 1}"
+    ok = newest == expected_newest and new_rows <= args.max_entries + store.retention_every
+    print(f"  Ergebnis konsistent: {'✅' if ok else '❌'}  (neuestes Event {json.dumps(newest)})")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
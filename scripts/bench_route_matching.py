@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: Route-Matching in DataGateway.route_data().
+
+Vergleicht pro Datenpunkt:
+- vorher: lineare Schleife über alle Routen (enabled/from/startswith pro Route)
+- nachher: kompilierter RouteIndex (exact-Map + Präfix-Trie + Ergebnis-LRU)
+
+Gemessen wird für steigende Routenanzahl, jeweils mit und ohne LRU.
+
+Beispiel:
+    python scripts/bench_route_matching.py --routes 10 100 500 1000 --packets 20000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from modules.gateway.route_index import RouteIndex  # noqa: E402
+
+
+def _legacy_match(routes, source_id, tag):
+    """Entspricht dem früheren _match_routes()"""
+    matched = []
+    full_path = f"{source_id}.{tag}"
+    for route in routes:
+        if not route.get('enabled', True):
+            continue
+        pattern = route.get('from', '')
+        if pattern == '*':
+            matched.append(route)
+            continue
+        if pattern == full_path or pattern == tag or pattern == source_id:
+            matched.append(route)
+            continue
+        if pattern.endswith('*') and full_path.startswith(pattern[:-1]):
+            matched.append(route)
+            continue
+    return matched
+
+
+def _make_routes(count):
+    routes = [{'id': 'all', 'from': '*', 'to': ['unified_data_space']}]
+    for i in range(count - 1):
+        kind = i % 3
+        if kind == 0:
+            pattern = f"plc_{i % 20:03d}.MAIN.fb{i}.*"
+        elif kind == 1:
+            pattern = f"bt.bms_{i % 50:03d}.cell{i}"
+        else:
+            pattern = f"mqtt.broker_{i % 5}.sensors/{i}"
+        routes.append({'id': f"r{i}", 'from': pattern, 'to': ['widgets'], 'enabled': i % 17 != 0})
+    return routes
+
+
+def _make_packets(count, distinct):
+    rnd = random.Random(42)
+    keys = []
+    for i in range(distinct):
+        kind = i % 3
+        if kind == 0:
+            keys.append((f"plc_{i % 20:03d}", f"MAIN.fb{i}.rValue"))
+        elif kind == 1:
+            keys.append((f"bt.bms_{i % 50:03d}", f"cell{i}"))
+        else:
+            keys.append((f"mqtt.broker_{i % 5}", f"sensors/{i}"))
+    return [keys[rnd.randrange(distinct)] for _ in range(count)]
+
+
+def _time(fn, packets):
+    start = time.perf_counter()
+    for source_id, tag in packets:
+        fn(source_id, tag)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Route-Matching: linear vs. RouteIndex")
+    parser.add_argument("--routes", type=int, nargs="+", default=[10, 100, 500, 1000])
+    parser.add_argument("--packets", type=int, default=20000)
+    parser.add_argument("--distinct", type=int, default=500, help="Anzahl unterschiedlicher source/tag-Keys")
+    args = parser.parse_args()
+
+    packets = _make_packets(args.packets, args.distinct)
+    print(f"Pakete: {args.packets}, unterschiedliche Keys: {args.distinct}")
+    print(f"{'Routen':>7} | {'linear µs/Paket':>16} | {'Index µs/Paket':>15} | {'Index+LRU µs/Paket':>19} | Faktor")
+
+    for count in args.routes:
+        routes = _make_routes(count)
+        no_cache = RouteIndex(routes, cache_size=0)
+        cached = RouteIndex(routes, cache_size=4096)
+
+        for source_id, tag in packets[:200]:
+            legacy = [r['id'] for r in _legacy_match(routes, source_id, tag)]
+            assert legacy == [r['id'] for r in no_cache.match(source_id, tag)]
+
+        t_linear = _time(lambda s, t: _legacy_match(routes, s, t), packets)
+        t_index = _time(no_cache.match, packets)
+        t_cached = _time(cached.match, packets)
+
+        per = lambda t: t / len(packets) * 1e6  # noqa: E731
+        factor = t_linear / t_cached if t_cached > 0 else 0.0
+        print(
+            f"{count:>7} | {per(t_linear):>16.2f} | {per(t_index):>15.2f} | "
+            f"{per(t_cached):>19.2f} | {factor:6.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
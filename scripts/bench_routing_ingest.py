@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Multi-Thread-Ingest über DataGateway.route_data().
+
+N Ingest-Threads (je eine Quelle, z.B. BMS/MQTT-Callbacks) routen Datenpunkte
+auf ein MQTT-Ziel mit simulierter Publish-Latenz. Verglichen werden:
+- vorher:   globaler Lock über die gesamte Pipeline (emuliert durch äußeres
+            `with gateway.lock`, entspricht dem früheren route_data())
+- inline:   Lock-Splitting, Auslieferung im Aufrufer-Thread
+- worker:   Lock-Splitting + Dispatch-Lanes pro Zielart (SMARTHOME_ROUTING_WORKERS)
+
+Beispiel:
+    python scripts/bench_routing_ingest.py --threads 1 2 4 8 --packets 200 --latency-ms 1
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from modules.gateway.data_gateway import DataGateway  # noqa: E402
+from modules.gateway.route_dispatch import RouteDispatcher  # noqa: E402
+
+
+class _SlowMQTT:
+    connected = True
+
+    def __init__(self, latency_s):
+        self.latency_s = latency_s
+        self.published = 0
+        self._lock = threading.Lock()
+
+    def publish(self, topic, payload):
+        time.sleep(self.latency_s)
+        with self._lock:
+            self.published += 1
+        return True
+
+
+def _make_gateway(latency_s, workers):
+    gateway = DataGateway()
+    gateway.DEFAULT_MAX_PPS = 10 ** 9
+    gateway.mqtt = _SlowMQTT(latency_s)
+    gateway.route_dispatcher.stop()
+    gateway.route_dispatcher = RouteDispatcher(workers=workers, queue_size=256)
+    gateway.route_dispatcher.start()
+    gateway.routes = [{'id': 'to_mqtt', 'from': '*', 'to': ['mqtt.broker_local.bench/out']}]
+    gateway._validate_routes()
+    return gateway
+
+
+def _run(gateway, threads, packets, global_lock):
+    def ingest(idx):
+        source = f"bt.bms_{idx:03d}"
+        for n in range(packets):
+            if global_lock:
+                with gateway.lock:
+                    gateway.route_data(source, "voltage", float(n))
+            else:
+                gateway.route_data(source, "voltage", float(n))
+
+    workers = [threading.Thread(target=ingest, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    ingest_elapsed = time.perf_counter() - start
+    gateway.route_dispatcher.drain(timeout=60)
+    elapsed = time.perf_counter() - start
+    gateway.route_dispatcher.stop()
+    return ingest_elapsed, elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Routing-Ingest: globaler Lock vs. Lock-Splitting/Worker")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--packets", type=int, default=200, help="Pakete pro Thread")
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="simulierte MQTT-Publish-Latenz")
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    latency_s = args.latency_ms / 1000.0
+    print(f"Pakete/Thread: {args.packets}, Publish-Latenz: {args.latency_ms} ms, Worker: {args.workers}")
+    print(f"{'Threads':>7} | {'vorher pkt/s':>12} | {'inline pkt/s':>12} | {'worker pkt/s':>12} | {'worker µs/Aufruf':>16}")
+
+    for threads in args.threads:
+        total = threads * args.packets
+        results = []
+        ingest_us = 0.0
+        for global_lock, workers in ((True, 0), (False, 0), (False, args.workers)):
+            gateway = _make_gateway(latency_s, workers)
+            ingest_elapsed, elapsed = _run(gateway, threads, args.packets, global_lock)
+            assert gateway.mqtt.published == total, gateway.mqtt.published
+            results.append(total / elapsed)
+            ingest_us = ingest_elapsed / args.packets * 1e6
+        print(
+            f"{threads:>7} | {results[0]:>12.0f} | {results[1]:>12.0f} | "
+            f"{results[2]:>12.0f} | {ingest_us:>16.0f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
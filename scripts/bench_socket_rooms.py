@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark: ausgehende Socket.IO-Bytes bei variable_updates.
+
+N Clients abonnieren je K von V Variablen (zufällig, fester Seed). Pro
+Poll-Zyklus ändern sich alle V Variablen. Verglichen werden:
+- global: variable_updates mit allen Variablen an jeden Client (bisher)
+- rooms:  nur die abonnierten Variablen pro Client (SMARTHOME_SOCKET_ROOMS)
+
+Gemessen werden die tatsächlich kodierten Engine.IO-Pakete am Server.
+
+Beispiel:
+    python scripts/bench_socket_rooms.py --clients 10 50 100 --variables 200 --per-client 5
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from modules.gateway.web_manager import WebManager  # noqa: E402
+
+
+class _Gateway:
+    def get_all_telemetry(self):
+        return {}
+
+
+class _VariableManager:
+    def subscribe_widget(self, widget_id, variable, plc_id):
+        pass
+
+    def unsubscribe_widget(self, widget_id):
+        pass
+
+    def get_cached_value(self, variable, plc_id):
+        return None
+
+
+def _make_web_manager(rooms: bool) -> WebManager:
+    os.environ['SMARTHOME_SOCKET_ROOMS'] = 'true' if rooms else 'false'
+    wm = WebManager()
+    wm.data_gateway = _Gateway()
+    wm.variable_manager = _VariableManager()
+    wm.app_context = SimpleNamespace(module_manager=SimpleNamespace(get_module=lambda name: None))
+    wm._setup_flask()
+    wm._setup_socketio()
+    wm.socketio.manage_session = False
+    wm.running = True
+    return wm
+
+
+def _run(rooms: bool, clients: int, variables: int, per_client: int, cycles: int):
+    wm = _make_web_manager(rooms)
+    sent = {'bytes': 0, 'packets': 0}
+
+    def _send(eio_sid, pkt):
+        sent['bytes'] += len(str(pkt.data).encode('utf-8'))
+        sent['packets'] += 1
+
+    wm.socketio.server._send_eio_packet = _send
+    names = [f"MAIN.Zone{i:03d}.rValue" for i in range(variables)]
+    rng = random.Random(42)
+    sockets = []
+    for c in range(clients):
+        client = wm.socketio.test_client(wm.app)
+        for n, name in enumerate(rng.sample(names, per_client)):
+            client.emit('subscribe_variable', {'widget_id': f"w{c}_{n}", 'variable': name, 'plc_id': 'plc_001'})
+        sockets.append(client)
+
+    sent['bytes'] = sent['packets'] = 0
+    start = time.perf_counter()
+    for cycle in range(cycles):
+        wm.emit_variable_updates({'plc_001': {
+            name: {'value': cycle + i * 0.5, 'timestamp': time.time(), 'type': 'REAL', 'plc_id': 'plc_001'}
+            for i, name in enumerate(names)
+        }})
+    elapsed = time.perf_counter() - start
+    for client in sockets:
+        client.disconnect()
+    return sent['bytes'] / cycles, sent['packets'] / cycles, elapsed / cycles * 1000.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="variable_updates: globaler Broadcast vs. Räume")
+    parser.add_argument("--clients", type=int, nargs="+", default=[10, 50, 100])
+    parser.add_argument("--variables", type=int, default=200)
+    parser.add_argument("--per-client", type=int, default=5)
+    parser.add_argument("--cycles", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"Variablen: {args.variables}, Abos/Client: {args.per_client}, Zyklen: {args.cycles}")
+    print(f"{'Clients':>7} | {'global KB/Zyklus':>16} | {'rooms KB/Zyklus':>15} | "
+          f"{'Faktor':>6} | {'rooms Emits':>11} | {'rooms ms/Zyklus':>15}")
+    for clients in args.clients:
+        global_bytes, _, _ = _run(False, clients, args.variables, args.per_client, args.cycles)
+        room_bytes, room_packets, room_ms = _run(True, clients, args.variables, args.per_client, args.cycles)
+        factor = global_bytes / room_bytes if room_bytes else float('inf')
+        print(f"{clients:>7} | {global_bytes / 1024:>16.1f} | {room_bytes / 1024:>15.1f} | "
+              f"{factor:>6.1f} | {room_packets:>11.0f} | {room_ms:>15.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Symbol-Cache JSON vs. Binärformat.
+
+Nutzt config/cache/symbol_cache.json (oder --json) und misst pro Format:
+- Dateigröße
+- Laden (load_cache_from_file) inkl. Spitzenspeicher (tracemalloc)
+- get_symbols (Dict-Liste für API/Variable-Manager)
+- Suchindex-Aufbau
+
+Beispiel:
+    python scripts/bench_symbol_cache.py --repeat 5
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from modules.plc.symbol_browser import PLCSymbolBrowser  # noqa: E402
+
+
+def _browser(cache_file: str) -> PLCSymbolBrowser:
+    browser = PLCSymbolBrowser()
+    browser.cache_file = cache_file
+    return browser
+
+
+def _measure(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(samples), peak / (1024 * 1024)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Symbol-Cache: JSON vs. Binärformat")
+    parser.add_argument("--json", default=os.path.join(ROOT, 'config', 'cache', 'symbol_cache.json'))
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix='symbol_cache_')
+    json_path = os.path.join(work_dir, 'symbol_cache.json')
+    bin_path = os.path.join(work_dir, 'symbol_cache.bin')
+    shutil.copyfile(args.json, json_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        _browser(bin_path).load_cache_from_file(bin_path)  # Migration JSON → Binär
+    probe = _browser(bin_path)
+    probe.load_cache_from_file(bin_path)
+    connection_id = next(iter(probe.symbol_cache))
+
+    print(f"Symbole: {len(probe.symbol_cache[connection_id])}")
+    print(f"{'Format':>6} | {'Datei KB':>8} | {'Laden ms':>8} | {'Laden MB':>8} | "
+          f"{'get_symbols ms':>14} | {'Index ms':>8}")
+    for label, path in (('json', json_path), ('binär', bin_path)):
+        def load():
+            browser = _browser(path)
+            browser.load_cache_from_file(path)
+            return browser
+
+        load_ms, load_mb = _measure(load, args.repeat)
+        loaded = load()
+        with contextlib.redirect_stdout(io.StringIO()):
+            symbols_ms, _ = _measure(lambda: loaded.get_symbols(connection_id), args.repeat)
+
+        def build_index():
+            browser = load()
+            browser.get_search_index(connection_id)
+
+        index_ms, _ = _measure(build_index, args.repeat)
+        print(f"{label:>6} | {os.path.getsize(path) / 1024:>8.0f} | {load_ms:>8.2f} | {load_mb:>8.2f} | "
+              f"{symbols_ms:>14.2f} | {index_ms - load_ms:>8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Variablensuche linear vs. Symbol-Suchindex.
+
+Lädt die mitgelieferten plc_data/*.tpy, vervielfacht die Symbole mit
+Präfix ("Anlage07.MAIN....") bis zur Zielgröße und vergleicht:
+- linear: bisheriger Pfad (to_dict() pro Symbol + `query in name.lower()`)
+- index:  SymbolSearchIndex (Trigramme, Präfix-Bereich, Typ-Facette);
+          erste Abfrage je Query (Ranking) und Folgeseite (Cache) getrennt
+
+Beispiel:
+    python scripts/bench_symbol_search.py --symbols 50000
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from modules.plc.symbol_browser import PLCSymbol, PLCSymbolBrowser  # noqa: E402
+from modules.plc.symbol_index import SymbolSearchIndex  # noqa: E402
+
+QUERIES = ['light', 'bon', 'main.fb', 'temperatur', 'rset', 'anlage03.main', 'xyz_not_there', 'nvalue']
+
+
+def _load_symbols(target: int):
+    browser = PLCSymbolBrowser()
+    browser.cache_file = os.path.join(tempfile.mkdtemp(), 'symbol_cache.json')
+    base = {}
+    for path in sorted(glob.glob(os.path.join(ROOT, 'plc_data', '*.tpy'))):
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            count = browser.load_symbols_from_tpy(path, 'bench')
+        if count:
+            for sym in browser.symbol_cache['bench']:
+                base.setdefault(sym.name, sym)
+    if not base:
+        raise SystemExit("Keine Symbole in plc_data/*.tpy gefunden")
+
+    symbols = []
+    copy = 0
+    while len(symbols) < target:
+        for sym in base.values():
+            symbols.append(PLCSymbol(
+                name=f"Anlage{copy:02d}.{sym.name}", symbol_type=sym.symbol_type,
+                index_group=sym.index_group, index_offset=sym.index_offset,
+                size=sym.size, comment=sym.comment
+            ))
+            if len(symbols) >= target:
+                break
+        copy += 1
+    return symbols
+
+
+def _linear(symbols, query, limit):
+    results = []
+    for sym in (s.to_dict() for s in symbols):
+        if query and query not in sym['name'].lower():
+            continue
+        results.append(sym)
+        if len(results) >= limit:
+            break
+    return results
+
+
+def _timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return samples
+
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Variablensuche: linear vs. Suchindex")
+    parser.add_argument("--symbols", type=int, default=50000)
+    parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    symbols = _load_symbols(args.symbols)
+    entries = [(s.name, s.symbol_type, s.comment) for s in symbols]
+    start = time.perf_counter()
+    index = SymbolSearchIndex(entries, generation=1)
+    build_ms = (time.perf_counter() - start) * 1000.0
+    # Ohne Ergebnis-Cache: misst jede Abfrage als "erste Seite"
+    uncached = SymbolSearchIndex(entries, generation=1, cache_size=0)
+    stats = index.get_stats()
+    print(f"Symbole: {len(index)}, Trigramme: {stats['ngrams']}, Typen: {stats['types']}, Aufbau: {build_ms:.0f} ms")
+    print(f"{'Query':>15} | {'Treffer':>7} | {'linear p50':>10} | {'index p50':>9} | "
+          f"{'index p99':>9} | {'Folgeseite p50':>14}")
+
+    linear_all, index_all = [], []
+    for query in QUERIES:
+        linear = _timed(lambda: _linear(symbols, query, args.limit), args.repeat)
+        first = _timed(lambda: uncached.search(query, limit=args.limit), args.repeat)
+        result = index.search(query, limit=args.limit)
+        page = _timed(lambda: index.search(query, limit=args.limit, cursor=result['next_cursor']), args.repeat)
+        linear_all.extend(linear)
+        index_all.extend(first)
+        print(f"{query:>15} | {result['total']:>7} | {statistics.median(linear):>10.2f} | "
+              f"{statistics.median(first):>9.3f} | {_percentile(first, 99):>9.3f} | {statistics.median(page):>14.3f}")
+
+    print(f"\nGesamt (ms): linear p50 {statistics.median(linear_all):.2f} / p99 {_percentile(linear_all, 99):.2f}, "
+          f"index p50 {statistics.median(index_all):.3f} / p99 {_percentile(index_all, 99):.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Symbolbaum pro Aufruf neu aufbauen vs. vorberechneter Index.
+
+Vergleicht den bisherigen get_tree()-Aufbau (lineare Kindsuche pro Ebene)
+mit SymbolTreeIndex (Aufbau einmal pro Generation, danach ebenenweise
+Abfragen) auf synthetischen, breiten Strukturen.
+
+Beispiel:
+    python scripts/bench_symbol_tree.py --symbols 50000 --width 2000
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from modules.plc.symbol_tree import SymbolTreeIndex  # noqa: E402
+
+
+def _legacy_tree(symbols):
+    """Bisheriger Aufbau aus PLCSymbolBrowser.get_tree()"""
+    tree = {'name': 'PLC_ROOT', 'children': [], 'type': 'folder'}
+    for symbol in symbols:
+        current = tree
+        parts = symbol['name'].split('.')
+        for i, part in enumerate(parts):
+            full_name = '.'.join(parts[:i + 1])
+            child = next((c for c in current.get('children', []) if c['name'] == part), None)
+            if child is None:
+                is_leaf = i == len(parts) - 1
+                child = {'name': part, 'full_name': full_name,
+                         'type': symbol['type'] if is_leaf else 'STRUCT', 'is_leaf': is_leaf}
+                if not is_leaf:
+                    child['children'] = []
+                current.setdefault('children', []).append(child)
+            current = child
+    return tree
+
+
+def _symbols(count, width):
+    return [
+        {'name': f"MAIN.fbRoom{i % width:05d}.stVar{i // width:04d}", 'type': 'BOOL',
+         'size': 1, 'comment': '', 'index_group': 16448, 'index_offset': i}
+        for i in range(count)
+    ]
+
+
+def _median_ms(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Symbolbaum: Neuaufbau vs. Index")
+    parser.add_argument("--symbols", type=int, default=50000)
+    parser.add_argument("--width", type=int, default=2000, help="Kinder unter MAIN")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    symbols = _symbols(args.symbols, args.width)
+    names = [s['name'] for s in symbols]
+
+    legacy_ms = _median_ms(lambda: _legacy_tree(symbols), args.repeat)
+    build_ms = _median_ms(lambda: SymbolTreeIndex(names, symbols.__getitem__), args.repeat)
+    index = SymbolTreeIndex(names, symbols.__getitem__)
+    level_ms = _median_ms(lambda: index.level('MAIN', 0, 500), max(args.repeat, 20))
+    deep_ms = _median_ms(lambda: index.level(f"MAIN.fbRoom{args.width - 1:05d}"), max(args.repeat, 20))
+
+    print(f"Symbole: {args.symbols}, Breite unter MAIN: {args.width}")
+    print(f"Bisher (Neuaufbau pro Aufruf):    {legacy_ms:>9.2f} ms")
+    print(f"Index-Aufbau (1x pro Generation): {build_ms:>9.2f} ms")
+    print(f"Ebene MAIN (500 Kinder):          {level_ms:>9.3f} ms")
+    print(f"Ebene MAIN.fbRoom (letzter):      {deep_ms:>9.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
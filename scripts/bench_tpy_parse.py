@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark: TPY-Parsing (Laufzeit und Spitzenspeicher).
+
+Vergleicht pro Datei:
+- dom:       ET.parse() des ganzen Dokuments + findall-Sweeps (Untergrenze
+             des bisherigen Pfads, ohne dessen rekursive Expansion)
+- streaming: tpy_reader.parse_tpy (iterparse, memoisierte Expansion)
+- disk:      read_tpy mit Disk-Parse-Cache (Neustart, Datei unverändert)
+- memory:    read_tpy mit RAM-Parse-Cache (erneuter Upload)
+
+Spitzenspeicher per tracemalloc, Laufzeit als Median ohne tracemalloc.
+
+Beispiel:
+    python scripts/bench_tpy_parse.py --repeat 5
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from modules.plc import tpy_reader  # noqa: E402
+
+FILES = ['HausAutomation.tpy', 'TwinCAT_Project.tpy']
+
+
+def _dom(path):
+    root = ET.parse(path).getroot()
+    datatypes = {dt.findtext('Name'): dt for dt in root.findall('.//DataTypes/DataType')}
+    symbols = root.findall('.//Symbol')
+    return len(datatypes) + len(symbols)
+
+
+def _measure(fn, repeat, prepare=None):
+    samples = []
+    for _ in range(repeat):
+        if prepare:
+            prepare()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    if prepare:
+        prepare()
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(samples), peak / (1024 * 1024)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="TPY-Parsing: DOM vs. Streaming vs. Parse-Cache")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("files", nargs="*", help="TPY-Dateien (Default: plc_data/HausAutomation.tpy, TwinCAT_Project.tpy)")
+    args = parser.parse_args()
+
+    files = args.files or [os.path.join(ROOT, 'plc_data', name) for name in FILES]
+    cache_dir = tempfile.mkdtemp(prefix='tpy_cache_')
+
+    print(f"{'Datei':>28} | {'Variante':>9} | {'ms (p50)':>9} | {'Peak MB':>8} | {'Symbole':>7}")
+    for path in files:
+        size_kb = os.path.getsize(path) / 1024
+        symbols = len(tpy_reader.parse_tpy(path).symbols)
+        variants = [
+            ('dom', lambda: _dom(path), None),
+            ('streaming', lambda: tpy_reader.parse_tpy(path), None),
+            ('disk', lambda: tpy_reader.read_tpy(path, cache_dir=cache_dir), tpy_reader.clear_memory_cache),
+            ('memory', lambda: tpy_reader.read_tpy(path, cache_dir=cache_dir), None),
+        ]
+        tpy_reader.read_tpy(path, cache_dir=cache_dir)
+        label = f"{os.path.basename(path)} ({size_kb:.0f} KB)"
+        for name, fn, prepare in variants:
+            ms, peak = _measure(fn, args.repeat, prepare)
+            print(f"{label:>28} | {name:>9} | {ms:>9.2f} | {peak:>8.2f} | {symbols:>7}")
+            label = ''
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
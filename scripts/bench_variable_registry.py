@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Symbol-Registrierung im VariableManager.
+
+Liest die gebündelten TPY-Dateien (plc_data/*.tpy, über den TPY-Reader) und
+misst pro Durchlauf:
+- register_symbols_bulk (Zeit, Spitzenspeicher via tracemalloc)
+- Registry-Größe (Einträge in symbols / Alias-Index)
+- Alias-Lookups (erster Lookup baut ggf. den Alias-Index)
+
+Beispiel:
+    python scripts/bench_variable_registry.py --copies 10
+"""
+
+import argparse
+import glob
+import logging
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from modules.plc.tpy_reader import read_tpy  # noqa: E402
+from modules.plc.variable_manager import VariableManager  # noqa: E402
+
+
+def _load_symbols(copies):
+    symbols = []
+    seen = set()
+    for path in sorted(glob.glob(os.path.join(ROOT, 'plc_data', '*.tpy'))):
+        try:
+            result = read_tpy(path)
+        except Exception as e:
+            print(f"⚠️  {os.path.basename(path)} übersprungen: {e}")
+            continue
+        for sym in result.symbols:
+            if sym.name not in seen:
+                seen.add(sym.name)
+                symbols.append({'name': sym.name, 'type': sym.type, 'comment': sym.comment,
+                                'index_group': sym.index_group, 'index_offset': sym.index_offset,
+                                'size': sym.size})
+    base = list(symbols)
+    for copy in range(1, copies):
+        symbols.extend(dict(s, name=f"{s['name']}_c{copy}") for s in base)
+    return symbols
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="VariableManager: Registrierung und Alias-Lookups")
+    parser.add_argument("--copies", type=int, default=1, help="Symbolmenge n-fach (mit Suffix) vervielfachen")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    symbols = _load_symbols(args.copies)
+    samples = []
+    for _ in range(args.repeat):
+        manager = VariableManager()
+        start = time.perf_counter()
+        manager.register_symbols_bulk(symbols)
+        samples.append((time.perf_counter() - start) * 1000.0)
+
+    tracemalloc.start()
+    manager = VariableManager()
+    manager.register_symbols_bulk(symbols)
+    registry_mb = tracemalloc.get_traced_memory()[0] / (1024 * 1024)
+    manager.get_symbol_info('__bench_miss__')  # baut ggf. den Alias-Index
+    with_aliases_mb = tracemalloc.get_traced_memory()[0] / (1024 * 1024)
+    tracemalloc.stop()
+    manager = VariableManager()
+    manager.register_symbols_bulk(symbols)
+
+    leaves = [s['name'].rsplit('.', 1)[-1] for s in symbols[::max(1, len(symbols) // 200)]]
+    start = time.perf_counter()
+    for leaf in leaves:
+        manager.get_symbol_info(leaf.lower())
+    first_ms = (time.perf_counter() - start) * 1000.0
+    start = time.perf_counter()
+    for leaf in leaves:
+        manager.get_symbol_info(leaf.lower())
+    warm_ms = (time.perf_counter() - start) * 1000.0
+
+    stats = manager.get_statistics()
+    print(f"Symbole: {len(symbols)}")
+    print(f"register_symbols_bulk:   {statistics.median(samples):>9.1f} ms")
+    print(f"Registry-Speicher:       {registry_mb:>9.1f} MB")
+    print(f"inkl. Alias-Index:       {with_aliases_mb:>9.1f} MB")
+    print(f"Einträge symbols:        {len(manager.symbols):>9}")
+    print(f"Alias-Einträge:          {stats.get('alias_index_keys', len(manager.alias_map)):>9}")
+    print(f"{len(leaves)} Alias-Lookups:      {first_ms:>9.2f} ms (erster) / {warm_ms:.2f} ms (warm)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,144 @@
+import pyads
+
+from modules.core.fake_ads import FakeADSConnection
+from modules.core.plc_communication import PLCCommunication
+from modules.gateway.data_gateway import DataGateway
+from modules.plc.variable_manager import SymbolInfo, VariableManager
+
+
+def _make_comm(values, **fake_kwargs):
+    comm = PLCCommunication()
+    comm.plc = FakeADSConnection(values, **fake_kwargs)
+    comm.connected = True
+    return comm
+
+
+def test_sum_read_chunks_by_max_sub_commands():
+    names = [f"MAIN.a[{i}]" for i in range(1200)]
+    comm = _make_comm({name: i for i, name in enumerate(names)})
+    comm.sum_read_chunk_size = 500
+
+    values = comm.read_list_by_name(names, use_cache=False)
+    assert values == {name: i for i, name in enumerate(names)}
+
+    comm.plc.reset_counters()
+    comm.read_list_by_name(names, use_cache=False)
+    assert comm.plc.sum_reads == 3
+    assert comm.plc.round_trips == 3
+    assert comm.plc.single_reads == 0
+
+
+def test_sum_read_isolates_sub_command_errors():
+    comm = _make_comm({"MAIN.a": 1, "MAIN.b": 2, "MAIN.c": 3}, fail_symbols={"MAIN.b"})
+
+    values = comm.read_list_by_name(["MAIN.a", "MAIN.b", "MAIN.c"], use_cache=False)
+
+    assert values == {"MAIN.a": 1, "MAIN.c": 3}
+    assert comm.sum_read_stats["symbol_errors"] == 1
+    assert comm.plc.single_reads == 0
+
+
+def test_sum_read_falls_back_and_excludes_unknown_symbols():
+    names = ["MAIN.a", "MAIN.gone", "MAIN.c"]
+    comm = _make_comm({"MAIN.a": 1, "MAIN.c": 3})
+    types = {name: pyads.PLCTYPE_DINT for name in names}
+
+    values = comm.read_list_by_name(names, types, use_cache=False)
+    assert values == {"MAIN.a": 1, "MAIN.c": 3}
+    assert comm.sum_read_stats["chunk_fallbacks"] == 1
+    assert "MAIN.gone" in comm._sum_read_excluded
+
+    comm.plc.reset_counters()
+    values = comm.read_list_by_name(names, types, use_cache=False)
+    assert values == {"MAIN.a": 1, "MAIN.c": 3}
+    # 1 Sum-Read für die gültigen Symbole + 1 Einzel-Read für das ausgeschlossene
+    assert comm.plc.sum_reads == 1
+    assert comm.plc.single_reads == 1
+
+
+def test_data_gateway_poll_uses_sum_read():
+    names = [f"MAIN.a[{i}]" for i in range(50)]
+    comm = _make_comm({name: i for i, name in enumerate(names)})
+
+    vm = VariableManager()
+    for name in names:
+        vm.register_symbol(SymbolInfo(name, "DINT", 0, 0, 4, ""))
+        vm.subscribe_widget(f"w-{name}", name)
+
+    gateway = DataGateway()
+    gateway.plc = comm
+    gateway.variable_manager = vm
+
+    updates = gateway._read_subscribed_variables(vm.get_all_subscribed_variables())
+    assert len(updates["plc_001"]) == 50
+    assert updates["plc_001"]["MAIN.a[7]"]["value"] == 7
+    assert comm.plc.single_reads == 0
+    assert comm.plc.sum_reads == 1
+
+    comm.plc.set_value("MAIN.a[7]", 700)
+    comm.clear_cache()
+    updates = gateway._read_subscribed_variables(vm.get_all_subscribed_variables())
+    assert list(updates["plc_001"]) == ["MAIN.a[7]"]
+    assert gateway.get_telemetry("PLC.MAIN.a[7]") == 700
+
+
+def test_transient_link_loss_does_not_exclude_symbols():
+    names = [f"MAIN.n{i}" for i in range(5)]
+    comm = _make_comm({name: i for i, name in enumerate(names)})
+    types = {name: pyads.PLCTYPE_DINT for name in names}
+    fake = comm.plc
+    outage = {"active": True}
+    real_sum_read, real_read = fake.read_list_by_name, fake.read_by_name
+
+    def flaky_sum_read(*args, **kwargs):
+        if outage["active"]:
+            raise pyads.ADSError(text="timeout elapsed")
+        return real_sum_read(*args, **kwargs)
+
+    def flaky_read(*args, **kwargs):
+        if outage["active"]:
+            raise pyads.ADSError(text="timeout elapsed")
+        return real_read(*args, **kwargs)
+
+    fake.read_list_by_name, fake.read_by_name = flaky_sum_read, flaky_read
+
+    assert comm.read_list_by_name(names, types, use_cache=False) == {}
+    assert comm._sum_read_excluded == {}
+
+    outage["active"] = False
+    fake.reset_counters()
+    values = comm.read_list_by_name(names, types, use_cache=False)
+    assert values == {name: i for i, name in enumerate(names)}
+    assert fake.sum_reads == 1
+    assert fake.single_reads == 0
+
+
+def test_symbol_exclusion_expires():
+    names = ["MAIN.a", "MAIN.gone", "MAIN.c"]
+    comm = _make_comm({"MAIN.a": 1, "MAIN.c": 3})
+    types = {name: pyads.PLCTYPE_DINT for name in names}
+    comm.read_list_by_name(names, types, use_cache=False)
+    assert "MAIN.gone" in comm._sum_read_excluded
+
+    # Symbol nach PLC-Download wieder vorhanden + Ausschluss abgelaufen
+    comm.plc.values["MAIN.gone"] = 2
+    comm._sum_read_excluded["MAIN.gone"] = 0.0
+    comm.plc.reset_counters()
+    values = comm.read_list_by_name(names, types, use_cache=False)
+    assert values == {"MAIN.a": 1, "MAIN.gone": 2, "MAIN.c": 3}
+    assert comm._sum_read_excluded == {}
+    assert comm.plc.sum_reads == 1
+    assert comm.plc.single_reads == 0
+
+
+def test_string_value_equal_to_ads_error_text_is_kept():
+    names = ["MAIN.sStatus", "MAIN.nCount", "MAIN.b"]
+    comm = _make_comm({"MAIN.sStatus": "timeout elapsed", "MAIN.nCount": 3, "MAIN.b": 2},
+                      fail_symbols={"MAIN.b"})
+    types = {"MAIN.sStatus": pyads.PLCTYPE_STRING, "MAIN.nCount": pyads.PLCTYPE_DINT, "MAIN.b": pyads.PLCTYPE_DINT}
+
+    values = comm.read_list_by_name(names, types, use_cache=False)
+
+    # STRING-Wert ist kein Fehler, der echte Sub-Kommando-Fehler schon
+    assert values == {"MAIN.sStatus": "timeout elapsed", "MAIN.nCount": 3}
+    assert comm.sum_read_stats["symbol_errors"] == 1
@@ -209,11 +209,15 @@ def test_contract_socket_payloads(web_fixture):
     wm, _ = web_fixture
     captured = []
 
-    def _capture(event_name, payload):
+    def _capture(event_name, payload, **kwargs):
         captured.append((event_name, payload))
 
     wm.running = True
     wm.socketio.emit = _capture
+    # Ein Client im Vollstrom-Raum (Default nach connect)
+    wm.socket_rooms.bind("contract-sid", "__telemetry_all__", "telemetry:*")
+    # Per-Key-Event ist Legacy (Default: telemetry_batch-Frames)
+    wm._telemetry_legacy_events = True
 
     wm.broadcast_telemetry("Light.Light_EG_WZ.bOn", True)
     wm.broadcast_event("camera_alert", {"cam_id": "cam01", "source": "contract-test"})
@@ -230,6 +234,14 @@ def test_contract_socket_payloads(web_fixture):
     assert custom_payload["cam_id"] == "cam01"
     assert custom_payload["source"] == "contract-test"
 
+    captured.clear()
+    wm.telemetry_broadcaster.flush()
+    batch_event, batch_payload = captured[0]
+    assert batch_event == "telemetry_batch"
+    for key in ("frame", "count", "updates", "timestamps", "timestamp", "timestamp_utc"):
+        assert key in batch_payload
+    assert batch_payload["updates"] == {"Light.Light_EG_WZ.bOn": True}
+
 
 def test_contract_read_cache_hit_and_invalidation(web_fixture):
     _, client = web_fixture
@@ -0,0 +1,45 @@
+import pytest
+
+from modules.gateway.data_gateway import DataGateway
+
+
+@pytest.mark.parametrize("tag", [
+    "voltage",
+    "MAIN.bAlarm",
+    "sensors/temp1",
+    "GVL.aValues[3]",
+    "MAIN.stData.aCells[0].rVoltage",
+    "zone:1-a",
+])
+def test_plain_and_indexed_tags_are_accepted(tag):
+    gateway = DataGateway()
+    valid, reason, _, normalized_tag, _, _ = gateway._validate_ingress_datapoint("bt.bms_001", tag, 1, None)
+    assert valid is True, reason
+    assert normalized_tag == tag
+
+
+@pytest.mark.parametrize("tag", [
+    "temp 1",
+    "temp;DROP",
+    "a\\b",
+    "x'y",
+    "<script>",
+    "wertä",
+    "a" * (DataGateway.MAX_TAG_LEN + 1),
+])
+def test_tags_with_unsafe_characters_are_rejected(tag):
+    gateway = DataGateway()
+    valid, _, _, _, _, _ = gateway._validate_ingress_datapoint("bt.bms_001", tag, 1, None)
+    assert valid is False
+
+
+def test_route_data_counts_rejects_and_routes_valid_tags():
+    gateway = DataGateway()
+    # Spam-Protection wertet das allererste Paket als ~1000 pps - hier nicht Gegenstand
+    gateway.DEFAULT_MAX_PPS = 10 ** 6
+    assert gateway.route_data("bt.bms_001", "voltage", 52.3) is True
+    assert gateway.get_telemetry("bt.bms_001.voltage") == 52.3
+
+    assert gateway.route_data("bt.bms_001", "volt age", 1) is False
+    assert gateway.route_data("bt bms", "voltage", 1) is False
+    assert gateway.stats['validation_rejects'] == 2
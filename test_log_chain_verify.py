@@ -0,0 +1,81 @@
+"""
+Tests für die inkrementelle Hash-Ketten-Prüfung (Checkpoint, Blöcke, Hintergrund-Prüfer)
+"""
+
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.core.database_logger import DatabaseLogger, LogChainVerifier
+
+
+def _fill(writer, start, count):
+    for i in range(start, start + count):
+        writer.enqueue(DatabaseLogger._utc_timestamp(), "WARNING", "verify", f"m{i}")
+    writer.flush()
+
+
+def _checkpoint(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT last_id, checked, ok, broken_at_id FROM system_logs_checkpoint").fetchone()
+
+
+def test_incremental_verify_resumes_from_checkpoint(tmp_path):
+    db_path = str(tmp_path / "system_logs.db")
+    writer = DatabaseLogger.get_writer(db_path)
+    try:
+        _fill(writer, 0, 250)
+        first = DatabaseLogger.verify_chain(db_path, incremental=True, chunk_size=64)
+        assert first["ok"] is True and first["checked"] == 250
+        assert first["new_rows"] == 250 and first["resumed"] is False and first["last_id"] == 250
+        assert _checkpoint(db_path) == (250, 250, 1, None)
+
+        # Nur neue Zeilen werden gelesen, Ergebnis wie bei voller Prüfung
+        _fill(writer, 250, 30)
+        second = DatabaseLogger.verify_chain(db_path, incremental=True, chunk_size=64)
+        assert second["new_rows"] == 30 and second["resumed"] is True
+        assert {k: second[k] for k in ("ok", "checked", "broken_at_id")} == \
+            DatabaseLogger.verify_chain(db_path, chunk_size=7)
+        assert DatabaseLogger.verify_chain(db_path, incremental=True)["new_rows"] == 0
+
+        # limit prüft wie bisher nur die ersten Zeilen und lässt den Checkpoint stehen
+        assert DatabaseLogger.verify_chain(db_path, limit=10) == {"ok": True, "checked": 10, "broken_at_id": None}
+        assert _checkpoint(db_path)[0] == 280
+
+        # Manipulation der Checkpoint-Zeile → Checkpoint ungültig, volle Prüfung findet den Bruch
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("UPDATE system_logs SET message = 'x' WHERE id = 280")
+        broken = DatabaseLogger.verify_chain(db_path, incremental=True)
+        assert broken["ok"] is False and broken["broken_at_id"] == 280 and broken["resumed"] is False
+        again = DatabaseLogger.verify_chain(db_path, incremental=True)
+        assert again["broken_at_id"] == 280 and again["new_rows"] == 0
+
+        # Löschungen verwerfen den Checkpoint
+        DatabaseLogger.clear_old_logs(db_path, keep_count=0)
+        _fill(writer, 0, 5)
+        fresh = DatabaseLogger.verify_chain(db_path, incremental=True)
+        assert fresh["ok"] is True and fresh["checked"] == 5 and fresh["resumed"] is False
+    finally:
+        writer.stop()
+
+
+def test_background_verifier_records_result(tmp_path):
+    db_path = str(tmp_path / "system_logs.db")
+    writer = DatabaseLogger.get_writer(db_path)
+    try:
+        _fill(writer, 0, 40)
+        verifier = LogChainVerifier(db_path, interval=60)
+        result = verifier.run_once()
+        assert result["ok"] is True and result["checked"] == 40
+        _fill(writer, 40, 3)
+        assert verifier.run_once()["new_rows"] == 3
+
+        status = verifier.get_status()
+        assert status["runs"] == 2 and status["rows_checked"] == 43 and status["errors"] == 0
+        assert status["last_result"]["checked"] == 43 and _checkpoint(db_path) == (43, 43, 1, None)
+
+        assert DatabaseLogger.start_verifier(db_path, interval=0) is None
+    finally:
+        writer.stop()
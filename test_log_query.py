@@ -0,0 +1,145 @@
+"""
+Tests für die SQL-seitige Log-Abfrage (abgeleitete Spalten, FTS5, Keyset-Pagination)
+"""
+
+import json
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.core.database_logger import DatabaseLogger
+
+
+def _legacy_db(db_path):
+    """DB im alten Schema (ohne category/action/actor und FTS-Index)"""
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE system_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                level TEXT NOT NULL,
+                module TEXT NOT NULL,
+                message TEXT NOT NULL,
+                prev_hash TEXT,
+                entry_hash TEXT,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.executemany(
+            "INSERT INTO system_logs (timestamp, level, module, message) VALUES (?, ?, ?, ?)",
+            [
+                ("2026-01-01T00:00:00+00:00", "WARNING", "web", "Admin restart scheduled: type=app delay=2s"),
+                ("2026-01-01T00:00:01+00:00", "AUDIT", "audit",
+                 '{"action": "daemon_restart_rejected", "actor": "admin", "details": {}}'),
+                ("2026-01-01T00:00:02+00:00", "ERROR", "plc", "Symbol nicht gefunden: MAIN.fbLight"),
+            ]
+        )
+
+
+def test_migration_backfills_columns_and_fts(tmp_path):
+    db_path = str(tmp_path / "system_logs.db")
+    _legacy_db(db_path)
+    DatabaseLogger.ensure_schema(db_path)
+
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute("SELECT category, action, actor FROM system_logs ORDER BY id").fetchall()
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(system_logs)")}
+    assert rows == [
+        ("restart.app", None, None),
+        ("restart.daemon.error", "daemon_restart_rejected", "admin"),
+        (None, None, None),
+    ]
+    assert {"idx_module_level_id", "idx_category_id", "idx_action_id"} <= indexes
+
+    # FTS-Index enthält den Altbestand
+    assert [row["id"] for row in DatabaseLogger.query_logs(db_path, search="fbLight")] == [3]
+
+
+def test_query_logs_filters_and_keyset_pagination(tmp_path):
+    db_path = str(tmp_path / "system_logs.db")
+    writer = DatabaseLogger.get_writer(db_path)
+    try:
+        for i in range(120):
+            writer.enqueue(DatabaseLogger._utc_timestamp(), "WARNING" if i % 2 else "ERROR",
+                           f"mod{i % 3}", f"Symbol nicht gefunden: MAIN.var{i}")
+        writer.enqueue(DatabaseLogger._utc_timestamp(), "WARNING", "web",
+                       "Admin restart rejected: type=daemon reason=disabled")
+        writer.flush()
+        DatabaseLogger.audit_event(db_path, "daemon_restart_scheduled", "alice", {"delay_seconds": 1})
+        DatabaseLogger.audit_event(db_path, "logs_export", "bob")
+
+        # Restart-Filter per category statt Python-Nachfilterung
+        daemon = DatabaseLogger.query_logs(db_path, category=DatabaseLogger.CATEGORY_FILTERS["restart_daemon"])
+        assert [row["category"] for row in daemon] == ["restart.daemon", "restart.daemon.error"]
+        errors = DatabaseLogger.query_logs(db_path, category=DatabaseLogger.CATEGORY_FILTERS["restart_error"])
+        assert [row["message"] for row in errors] == ["Admin restart rejected: type=daemon reason=disabled"]
+        audit = DatabaseLogger.query_logs(db_path, category="audit*", actor="bob")
+        assert len(audit) == 1 and audit[0]["action"] == "logs_export"
+        assert DatabaseLogger.query_logs(db_path, action="DAEMON_RESTART_SCHEDULED")[0]["actor"] == "alice"
+
+        # Volltext: alle Wörter, Benutzereingabe ohne FTS-Syntax
+        assert [row["message"] for row in DatabaseLogger.query_logs(db_path, search="MAIN.var7 Symbol")] == \
+            ["Symbol nicht gefunden: MAIN.var7"]
+        assert DatabaseLogger.query_logs(db_path, search='"OR* NEAR(') == []
+
+        # Keyset-Pagination über module + level (Index module, level, id)
+        seen = []
+        before_id = None
+        while True:
+            page = DatabaseLogger.query_logs(db_path, limit=7, before_id=before_id, module="mod1", level="warning,error")
+            seen.extend(row["id"] for row in page)
+            if len(page) < 7:
+                break
+            before_id = page[-1]["id"]
+        assert len(seen) == 40 and seen == sorted(seen, reverse=True)
+
+        with sqlite3.connect(db_path) as conn:
+            plan = " ".join(str(row[-1]) for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM system_logs WHERE module = ? AND level = ? AND id < ? "
+                "ORDER BY id DESC LIMIT 7", ("mod1", "ERROR", 100)))
+        assert "idx_module_level_id" in plan
+
+        # Löschungen halten den FTS-Index konsistent
+        DatabaseLogger.clear_old_logs(db_path, keep_count=2)
+        assert DatabaseLogger.query_logs(db_path, search="Symbol") == []
+        assert len(DatabaseLogger.query_logs(db_path)) == 2
+    finally:
+        writer.stop()
+
+
+def test_restart_categories_match_legacy_filter_predicates(tmp_path):
+    classify = DatabaseLogger.classify_entry
+    # type=app ohne Restart-Wort: App-Filter ja, Restart-Filter nein
+    assert classify("WARNING", "web", "Service control: type=app delay=2s")[0] == "app"
+    assert classify("WARNING", "web", "Neustart geplant")[0] == "restart"
+    assert classify("ERROR", "web", "Steuerung type=daemon fehlgeschlagen: Fehler")[0] == "daemon.error"
+    assert classify("WARNING", "web", "Symbol fehlt: MAIN.x")[0] is None
+    # Audit-Aktionen: Fehlerwort im Payload markiert auch geplante Restarts als Fehler
+    scheduled = json.dumps({"action": "daemon_restart_scheduled", "actor": "a", "details": {"note": "retry after failed"}})
+    assert classify("AUDIT", "audit", scheduled)[0] == "restart.daemon.error"
+    rejected = json.dumps({"action": "daemon_restart_rejected", "actor": "a", "details": {}})
+    assert classify("AUDIT", "audit", rejected)[0] == "restart.daemon.error"
+    app = json.dumps({"action": "service_restart_scheduled", "actor": "a", "details": {}})
+    assert classify("AUDIT", "audit", app)[0] == "restart.app"
+
+    db_path = str(tmp_path / "system_logs.db")
+    writer = DatabaseLogger.get_writer(db_path)
+    messages = ["Service control: type=app delay=2s", "Neustart geplant", "Admin restart scheduled: type=daemon",
+                "Steuerung type=daemon fehlgeschlagen: Fehler", "Symbol fehlt: MAIN.x"]
+    try:
+        for message in messages:
+            writer.enqueue(DatabaseLogger._utc_timestamp(), "WARNING", "web", message)
+        writer.flush()
+
+        def _filtered(mode):
+            rows = DatabaseLogger.query_logs(db_path, category=DatabaseLogger.CATEGORY_FILTERS[mode])
+            return sorted(row["message"] for row in rows)
+
+        assert _filtered("restart") == sorted(messages[1:3])
+        assert _filtered("restart_app") == [messages[0]]
+        assert _filtered("restart_daemon") == sorted(messages[2:4])
+        assert _filtered("restart_error") == [messages[3]]
+    finally:
+        writer.stop()
@@ -0,0 +1,158 @@
+"""
+Tests für das parallele Multi-PLC-Polling (ein Reader-Thread pro Verbindung)
+"""
+
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.core.connection_manager import ConnectionStatus
+from modules.core.fake_ads import FakeADSConnection
+from modules.core.plc_communication import PLCCommunication
+from modules.core.plc_connection import PLCConnection
+from modules.gateway.data_gateway import DataGateway
+from modules.gateway.plc_poll_workers import PLCPollWorkers
+from modules.plc.variable_manager import SymbolInfo, VariableManager
+
+LATENCY = 0.15
+
+
+class _Modules:
+    def __init__(self, modules):
+        self.modules = modules
+
+    def get_module(self, name):
+        return self.modules.get(name)
+
+
+class _ConnectionManager:
+    def __init__(self, connections):
+        self.connections = connections
+
+    def get_connection(self, connection_id):
+        return self.connections.get(connection_id)
+
+
+def _plc_connection(connection_id, values):
+    conn = PLCConnection(connection_id, {"ams_net_id": "127.0.0.1.1.1"}, SimpleNamespace())
+    conn.plc = FakeADSConnection(values, latency_s=LATENCY)
+    conn.status = ConnectionStatus.CONNECTED
+    return conn
+
+
+def _gateway():
+    default = PLCCommunication()
+    default.plc = FakeADSConnection({"MAIN.a": 1, "MAIN.b": 2}, latency_s=LATENCY)
+    default.connected = True
+    garage = _plc_connection("plc_002", {"MAIN.a": 10, "MAIN.b": 20})
+    keller = _plc_connection("plc_003", {"MAIN.a": 100, "MAIN.b": 200})
+
+    vm = VariableManager()
+    for plc_id in ("plc_001", "plc_002", "plc_003"):
+        for name in ("MAIN.a", "MAIN.b"):
+            vm.register_symbol(SymbolInfo(name, "DINT", 0, 0, 4, "", plc_id))
+            vm.subscribe_widget(f"w-{plc_id}-{name}", name, plc_id)
+
+    gateway = DataGateway()
+    gateway.plc = default
+    gateway.variable_manager = vm
+    gateway._app_context = SimpleNamespace(module_manager=_Modules({
+        "connection_manager": _ConnectionManager({"plc_002": garage, "plc_003": keller})
+    }))
+    return gateway, vm, default, garage, keller
+
+
+def test_each_plc_is_read_through_its_own_connection_in_parallel():
+    gateway, vm, default, garage, keller = _gateway()
+    try:
+        started = time.monotonic()
+        updates = gateway._read_subscribed_variables(vm.get_all_subscribed_variables())
+        elapsed = time.monotonic() - started
+
+        # Ein gemeinsamer Frame mit den Werten der jeweiligen PLC
+        assert updates["plc_001"]["MAIN.a"]["value"] == 1
+        assert updates["plc_002"]["MAIN.b"]["value"] == 20
+        assert updates["plc_003"]["MAIN.a"]["value"] == 100
+        assert garage.plc.sum_reads == 1 and keller.plc.sum_reads == 1
+
+        # Zykluszeit ≈ langsamste Verbindung statt Summe aller Verbindungen
+        stats = gateway.get_system_status()["plc_pollers"]
+        assert set(stats["connections"]) == {"default", "plc_002", "plc_003"}
+        slowest = max(conn["last_ms"] for conn in stats["connections"].values())
+        assert elapsed * 1000.0 < 0.6 * stats["last_serial_ms"], stats
+        assert elapsed * 1000.0 < slowest + 3 * LATENCY * 1000.0, stats
+
+        # Writes gehen an die Verbindung der plc_id
+        assert gateway.write_variable("MAIN.b", 21, "plc_002") is True
+        assert garage.plc.read_by_name("MAIN.b") == 21
+        assert default.plc.read_by_name("MAIN.b") == 2
+        gateway._route_to_plc("plc_003.MAIN.a", {"value": 101}, {})
+        deadline = time.monotonic() + 2
+        while keller.plc.read_by_name("MAIN.a") != 101 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert keller.plc.read_by_name("MAIN.a") == 101
+    finally:
+        gateway.plc_poll_workers.stop()
+
+
+def test_hanging_connection_does_not_hold_back_the_others():
+    release = threading.Event()
+    workers = PLCPollWorkers(timeout=0.2)
+    try:
+        results = workers.run({"plc_001": lambda: "ok", "plc_002": release.wait})
+        assert results == {"plc_001": "ok"}
+
+        # Worker ist noch belegt → kein zweiter Auftrag, keine Warteschlange
+        results = workers.run({"plc_001": lambda: "ok", "plc_002": lambda: "neu"})
+        assert results == {"plc_001": "ok"}
+        stats = workers.get_stats()["connections"]["plc_002"]
+        assert stats["busy"] and stats["timeouts"] == 1 and stats["busy_skips"] == 1
+
+        release.set()
+        time.sleep(0.05)
+        assert workers.run({"plc_002": lambda: "neu"}) == {"plc_002": "neu"}
+    finally:
+        release.set()
+        workers.stop()
+
+
+def test_single_variable_poll_uses_sum_read_without_routing():
+    gateway, vm, default, garage, keller = _gateway()
+    routed = []
+    garage._route_to_gateway = lambda symbol, value: routed.append(symbol)
+    try:
+        # Ein Symbol verhält sich wie jeder andere Batch: Sum-Read, kein route_data()
+        updates = gateway._read_subscribed_variables([("plc_002", "MAIN.a")])
+        assert updates["plc_002"]["MAIN.a"]["value"] == 10
+        assert garage.plc.sum_reads == 1 and routed == []
+    finally:
+        gateway.plc_poll_workers.stop()
+
+
+def test_timed_out_connection_is_not_reported_as_unchanged():
+    gateway, vm, default, garage, keller = _gateway()
+    release = threading.Event()
+    # plc_003 hängt länger als der Zyklus-Timeout
+    keller.read_list_by_name = lambda *args, **kwargs: release.wait() and {}
+    gateway.plc_poll_workers.timeout = 10 * LATENCY
+    try:
+        unread = set()
+        updates = gateway._read_subscribed_variables(vm.get_all_subscribed_variables(), unread)
+        assert unread == {("plc_003", "MAIN.a"), ("plc_003", "MAIN.b")}
+        assert "plc_002" in updates and not updates["plc_003"]
+
+        # Scheduler: nicht gelesene Variablen ohne Backoff neu einplanen
+        scheduler = gateway.poll_scheduler
+        scheduler.sync({key: "normal" for key in unread}, now=0.0)
+        assert len(scheduler.pop_due(now=0.0)) == 2
+        for key in unread:
+            scheduler.retry(key, now=0.0)
+        assert all(scheduler.interval_of(key) == scheduler.base_interval for key in unread)
+        assert scheduler.next_due() == scheduler.base_interval
+    finally:
+        release.set()
+        gateway.plc_poll_workers.stop()
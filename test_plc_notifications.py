@@ -0,0 +1,133 @@
+import pyads
+
+from modules.core.fake_ads import FakeADSConnection
+from modules.core.plc_communication import PLCCommunication
+from modules.gateway.data_gateway import DataGateway
+from modules.plc.variable_manager import SymbolInfo, VariableManager
+
+
+class _RecordingSocketIO:
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event, data=None, **kwargs):
+        self.events.append((event, data))
+
+
+def _make_comm(values):
+    comm = PLCCommunication()
+    comm.plc = FakeADSConnection(values)
+    comm.connected = True
+    comm.notifications.bind(comm.plc)
+    return comm
+
+
+def _make_gateway(monkeypatch, comm, symbols):
+    monkeypatch.setenv("SMARTHOME_PLC_NOTIFICATIONS", "1")
+    vm = VariableManager()
+    for name, symbol_type in symbols.items():
+        vm.register_symbol(SymbolInfo(name, symbol_type, 0, 0, 4, ""))
+
+    gateway = DataGateway()
+    gateway.plc = comm
+    gateway.variable_manager = vm
+    gateway.socketio = _RecordingSocketIO()
+    vm.add_subscription_listener(gateway._on_subscription_change)
+    return gateway, vm
+
+
+def test_notification_handles_are_reference_counted():
+    comm = _make_comm({"MAIN.nValue": 1})
+    callback = lambda symbol, value: None
+
+    assert comm.add_value_notification("MAIN.nValue", callback, pyads.PLCTYPE_DINT) is True
+    assert comm.add_value_notification("MAIN.nValue", callback, pyads.PLCTYPE_DINT) is True
+    assert comm.plc.active_notifications == 1
+
+    assert comm.remove_value_notification("MAIN.nValue") is False
+    assert comm.has_value_notification("MAIN.nValue") is True
+    assert comm.remove_value_notification("MAIN.nValue") is True
+    assert comm.plc.active_notifications == 0
+    assert comm.has_value_notification("MAIN.nValue") is False
+
+
+def test_widget_subscriptions_drive_push_updates(monkeypatch):
+    comm = _make_comm({"MAIN.rTemp": 20.0})
+    gateway, vm = _make_gateway(monkeypatch, comm, {"MAIN.rTemp": "REAL"})
+
+    vm.subscribe_widget("sid-a:w1", "MAIN.rTemp")
+    vm.subscribe_widget("sid-b:w1", "MAIN.rTemp")
+    assert comm.plc.active_notifications == 1
+    assert comm.notifications.ref_count("MAIN.rTemp") == 2
+    assert gateway._is_push_served("plc_001", "MAIN.rTemp") is True
+
+    comm.plc.set_value("MAIN.rTemp", 21.5)
+    assert gateway.get_telemetry("PLC.MAIN.rTemp") == 21.5
+    assert vm.get_cached_value("MAIN.rTemp")[0] == 21.5
+    event, payload = gateway.socketio.events[-1]
+    assert event == "variable_updates"
+    assert payload["plc_001"]["MAIN.rTemp"]["value"] == 21.5
+
+    vm.unsubscribe_widget("sid-a:w1")
+    assert comm.plc.active_notifications == 1
+    vm.unsubscribe_widget("sid-b:w1")
+    assert comm.plc.active_notifications == 0
+
+
+def test_failed_registration_falls_back_to_polling(monkeypatch):
+    comm = _make_comm({"MAIN.bKnown": True})
+    gateway, vm = _make_gateway(monkeypatch, comm, {"MAIN.bKnown": "BOOL", "MAIN.bOffline": "BOOL"})
+
+    vm.subscribe_widget("w-known", "MAIN.bKnown")
+    vm.subscribe_widget("w-offline", "MAIN.bOffline")
+
+    assert gateway._is_push_served("plc_001", "MAIN.bKnown") is True
+    assert gateway._is_push_served("plc_001", "MAIN.bOffline") is False
+    assert gateway.get_notification_stats()["fallbacks"] == 1
+
+    # Nach Reconnect/Symbol-Download wird das Handle nachregistriert
+    comm.plc.values["MAIN.bOffline"] = False
+    assert comm.notifications.reattach() == 1
+    assert gateway._is_push_served("plc_001", "MAIN.bOffline") is True
+
+
+def test_unresolved_types_stay_on_poll_path(monkeypatch):
+    comm = _make_comm({"MAIN.stMotor": b"\x00" * 16, "MAIN.aNames": ["a", "b"]})
+    gateway, vm = _make_gateway(monkeypatch, comm, {
+        "MAIN.stMotor": "ST_Motor",
+        "MAIN.aNames": "ARRAY [1..2] OF STRING(10)",
+    })
+
+    vm.subscribe_widget("w-motor", "MAIN.stMotor")
+    vm.subscribe_widget("w-names", "MAIN.aNames")
+
+    assert comm.plc.active_notifications == 0
+    assert gateway._is_push_served("plc_001", "MAIN.stMotor") is False
+    assert gateway._is_push_served("plc_001", "MAIN.aNames") is False
+    assert gateway.get_notification_stats()["fallbacks"] == 2
+
+
+def test_notification_stats_include_connection_manager_connections(monkeypatch):
+    comm = _make_comm({"MAIN.rTemp": 20.0})
+    gateway, vm = _make_gateway(monkeypatch, comm, {"MAIN.rTemp": "REAL"})
+    vm.subscribe_widget("w1", "MAIN.rTemp")
+
+    # Zweite PLC-Verbindung des ConnectionManagers mit eigener Registry
+    other = PLCCommunication()
+    other.plc = FakeADSConnection({"GVL.bPump": False, "GVL.nLevel": 3})
+    other.connected = True
+    other.notifications.bind(other.plc)
+    other.add_value_notification("GVL.bPump", lambda symbol, value: None, pyads.PLCTYPE_BOOL)
+    other.add_value_notification("GVL.nLevel", lambda symbol, value: None, pyads.PLCTYPE_DINT)
+
+    class _ConnectionManager:
+        def get_all_connections(self):
+            return {"plc_002": other, "mqtt_main": object()}
+
+    gateway.connection_manager = _ConnectionManager()
+    stats = gateway.get_notification_stats()
+
+    assert sorted(stats["connections"]) == ["default", "plc_002"]
+    assert stats["registry"]["active"] == 1
+    assert stats["connections"]["plc_002"]["active"] == 2
+    assert stats["total"]["active"] == 3 and stats["total"]["registrations"] == 3
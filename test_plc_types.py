@@ -0,0 +1,79 @@
+import ctypes
+
+import pyads
+
+from modules.core.fake_ads import FakeADSConnection
+from modules.core.plc_communication import PLCCommunication
+from modules.gateway.data_gateway import DataGateway
+from modules.plc.plc_types import PLCTypeResolver, resolve_plc_type
+from modules.plc.variable_manager import SymbolInfo, VariableManager
+
+
+def test_resolver_handles_primitives_strings_and_arrays():
+    assert resolve_plc_type("BOOL") is pyads.PLCTYPE_BOOL
+    assert resolve_plc_type("udint") is pyads.PLCTYPE_UDINT
+    assert resolve_plc_type("INT16") is pyads.PLCTYPE_INT
+    assert resolve_plc_type("REAL (VAR_IN_OUT)") is pyads.PLCTYPE_REAL
+
+    string_80 = resolve_plc_type("STRING(80)")
+    assert ctypes.sizeof(string_80) == 81
+    assert string_80._type_ is pyads.PLCTYPE_STRING
+
+    array_type = resolve_plc_type("ARRAY [1..10] OF UDINT")
+    assert array_type._length_ == 10
+    assert ctypes.sizeof(array_type) == 40
+    assert ctypes.sizeof(resolve_plc_type("ARRAY [0..1, 0..2] OF INT")) == 12
+
+    assert resolve_plc_type("FB_Light") is None
+    assert resolve_plc_type("ARRAY [1..2] OF STRING(10)") is None
+
+
+def test_resolver_follows_tpy_aliases():
+    resolver = PLCTypeResolver({
+        "eMode": "INT",
+        "T_AmsNetId": "STRING(23)",
+        "T_Buffer": "ARRAY [0..3] OF BYTE",
+        "T_Nested": "eMode",
+    })
+    assert resolver.resolve("eMode") is pyads.PLCTYPE_INT
+    assert resolver.resolve("T_Nested") is pyads.PLCTYPE_INT
+    assert ctypes.sizeof(resolver.resolve("T_AmsNetId")) == 24
+    assert ctypes.sizeof(resolver.resolve("T_Buffer")) == 4
+
+
+def test_symbols_carry_resolved_type_after_registration():
+    vm = VariableManager()
+    vm.register_symbol(SymbolInfo("MAIN.eMode", "eMode", 0, 0, 2, ""))
+    vm.register_symbol(SymbolInfo("MAIN.rTemp", "REAL", 0, 0, 4, ""))
+    assert vm.get_symbol_info("MAIN.eMode").plc_type is None
+    assert vm.get_symbol_info("MAIN.rTemp").plc_type is pyads.PLCTYPE_REAL
+
+    vm.set_type_aliases({"eMode": "INT"})
+    assert vm.get_symbol_info("MAIN.eMode").plc_type is pyads.PLCTYPE_INT
+
+
+def test_poll_reads_use_precomputed_type():
+    class _TypeRecordingPLC(PLCCommunication):
+        def __init__(self):
+            super().__init__()
+            self.seen_types = {}
+
+        def read_list_by_name(self, variables, plc_types=None, use_cache=True):
+            self.seen_types.update(plc_types or {})
+            return super().read_list_by_name(variables, plc_types, use_cache)
+
+    plc = _TypeRecordingPLC()
+    plc.plc = FakeADSConnection({"MAIN.sName": "Wohnzimmer"})
+    plc.connected = True
+
+    vm = VariableManager()
+    vm.register_symbol(SymbolInfo("MAIN.sName", "STRING(80)", 0, 0, 81, ""))
+    vm.subscribe_widget("w1", "MAIN.sName")
+
+    gateway = DataGateway()
+    gateway.plc = plc
+    gateway.variable_manager = vm
+
+    updates = gateway._read_subscribed_variables(vm.get_all_subscribed_variables())
+    assert updates["plc_001"]["MAIN.sName"]["value"] == "Wohnzimmer"
+    assert plc.seen_types["MAIN.sName"] is vm.get_symbol_info("MAIN.sName").plc_type
@@ -0,0 +1,154 @@
+"""
+Tests für den gemeinsamen PLC-Wertespeicher (TTL, Sequenzen, Write-Through)
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pyads
+
+from modules.core.fake_ads import FakeADSConnection
+from modules.core.plc_communication import PLCCommunication
+from modules.core.plc_value_store import PLCValueStore
+from modules.gateway.data_gateway import DataGateway
+from modules.plc.variable_manager import SymbolInfo, VariableManager
+
+
+def test_ttl_reads_sequences_and_bounded_size():
+    store = PLCValueStore(max_entries=100)
+    seq = store.put("plc_001", "MAIN.a", 1)
+    assert store.get("plc_001", "MAIN.a", max_age=1.0) == 1
+    assert store.get("plc_001", "MAIN.a", max_age=0.0) is None
+
+    # Gleicher Wert → Sequenz bleibt, Änderung → neue Sequenz
+    assert store.put("plc_001", "MAIN.a", 1) == seq
+    assert store.put("plc_001", "MAIN.a", 2) > seq
+
+    # Write-Through: Wert bekannt, TTL-Read geht trotzdem zur SPS
+    store.put("plc_001", "MAIN.a", 3, fresh=False)
+    assert store.get("plc_001", "MAIN.a", max_age=1.0) is None
+    assert store.get("plc_001", "MAIN.a") == 3
+    store.put("plc_001", "MAIN.a", 3)
+    store.invalidate("plc_001", "MAIN.a")
+    assert store.get("plc_001", "MAIN.a", max_age=1.0) is None
+
+    # publish(): Änderung seit der letzten Veröffentlichung, auch nach einem Read
+    assert store.publish("plc_001", "MAIN.a", 3) is True
+    assert store.publish("plc_001", "MAIN.a", 3) is False
+    store.put("plc_001", "MAIN.a", 4)
+    assert store.publish("plc_001", "MAIN.a", 4) is True
+
+    # LRU nach Aktualisierung, Zähler pro PLC
+    for i in range(150):
+        store.put("plc_002", f"MAIN.v{i}", i)
+    stats = store.get_stats()
+    assert len(store) == 100 and stats["evictions"] == 51
+    assert ("plc_001", "MAIN.a") not in store
+    assert store.count("plc_002") == 100 and stats["plcs"] == {"plc_002": 100}
+
+    # prune(): nur Einträge ohne Aktualisierung seit max_age
+    aged = PLCValueStore()
+    aged.put("plc_001", "MAIN.old1", 1, stamp=time.time() - 120)
+    aged.put("plc_001", "MAIN.old2", 2, stamp=time.time() - 90)
+    aged.put("plc_001", "MAIN.new", 3)
+    assert aged.prune(60.0) == 2 and aged.get("plc_001", "MAIN.new") == 3
+
+
+def test_gateway_poll_and_connection_share_one_entry_per_symbol():
+    comm = PLCCommunication()
+    comm.plc = FakeADSConnection({"MAIN.a": 1, "MAIN.b": 2})
+    comm.connected = True
+    comm.cache_timeout = 5.0  # TTL-Treffer unabhängig vom Testtempo
+    vm = VariableManager()
+    for name in ("MAIN.a", "MAIN.b"):
+        vm.register_symbol(SymbolInfo(name, "DINT", 0, 0, 4, ""))
+        vm.subscribe_widget(f"w-{name}", name, "plc_001")
+
+    gateway = DataGateway()
+    gateway.plc = comm
+    gateway.variable_manager = vm
+    try:
+        updates = gateway._read_subscribed_variables(vm.get_all_subscribed_variables())
+        assert set(updates["plc_001"]) == {"MAIN.a", "MAIN.b"}
+        assert comm.value_store is vm.value_store and len(vm.value_store) == 2
+        assert vm.get_cached_value("MAIN.a")[0] == 1
+
+        # Unverändert → kein Update; TTL-Treffer ohne Roundtrip
+        round_trips = comm.plc.round_trips
+        assert not gateway._read_subscribed_variables(vm.get_all_subscribed_variables()).get("plc_001")
+        assert comm.plc.round_trips == round_trips
+
+        # Änderung, die ein anderer Leser zuerst sieht, wird trotzdem gebroadcastet
+        comm.plc.set_value("MAIN.b", 5)
+        assert comm.read_by_name("MAIN.b", pyads.PLCTYPE_DINT, use_cache=False) == 5
+        updates = gateway._read_subscribed_variables(vm.get_all_subscribed_variables())
+        assert updates == {"plc_001": {"MAIN.b": updates["plc_001"]["MAIN.b"]}}
+        assert updates["plc_001"]["MAIN.b"]["value"] == 5
+        assert gateway.get_telemetry("PLC.MAIN.b") == 5
+        assert comm.get_connection_status()["cached_variables"] == 2
+    finally:
+        gateway.shutdown()
+
+
+def test_default_plc_uses_configured_plc_id():
+    comm = PLCCommunication(plc_id="plc_main")
+    comm.plc = FakeADSConnection({"MAIN.a": 1})
+    comm.connected = True
+    comm.cache_timeout = 5.0
+    vm = VariableManager()
+    vm.register_symbol(SymbolInfo("MAIN.a", "DINT", 0, 0, 4, "", plc_id="plc_main"))
+    vm.subscribe_widget("w-a", "MAIN.a", "plc_main")
+
+    gateway = DataGateway()
+    gateway.plc = comm
+    gateway.variable_manager = vm
+    try:
+        updates = gateway._read_subscribed_variables(vm.get_all_subscribed_variables())
+        assert updates["plc_main"]["MAIN.a"]["value"] == 1
+        # Verbindung und VariableManager teilen sich den Eintrag unter plc_main
+        assert len(vm.value_store) == 1 and vm.value_store.count("plc_main") == 1
+        assert vm.value_store.count("plc_001") == 0
+
+        assert gateway.write_plc("MAIN.a", 7, pyads.PLCTYPE_DINT) is True
+        assert vm.get_cached_value("MAIN.a", "plc_main")[0] == 7
+        assert gateway.get_telemetry("PLC.MAIN.a") == 7
+
+        # clear_cache() invalidiert den Slot der eigenen plc_id
+        vm.value_store.put("plc_main", "MAIN.a", 7)
+        comm.clear_cache()
+        assert vm.value_store.get("plc_main", "MAIN.a", comm.cache_timeout) is None
+    finally:
+        gateway.shutdown()
+
+
+def test_default_plc_id_follows_env_and_config(monkeypatch):
+    class _Config:
+        def get_config_value(self, key, default=None):
+            return {"plc_id": "plc_config"}.get(key, default)
+
+    class _Modules:
+        def get_module(self, name):
+            return _Config() if name == "config_manager" else None
+
+    app_context = type("AppContext", (), {"module_manager": _Modules()})()
+
+    # module_manager instanziiert ohne Argumente → Config-Wert aus initialize()
+    monkeypatch.delenv("SMARTHOME_DEFAULT_PLC_ID", raising=False)
+    comm = PLCCommunication()
+    assert comm.plc_id == "plc_001"
+    comm.initialize(app_context)
+    gateway = DataGateway()
+    gateway.plc = comm
+    assert gateway._default_plc_id() == "plc_config"
+
+    # Env hat Vorrang vor der Config
+    monkeypatch.setenv("SMARTHOME_DEFAULT_PLC_ID", "plc_env")
+    comm = PLCCommunication()
+    assert comm.plc_id == "plc_env"
+    comm.initialize(app_context)
+    gateway.plc = comm
+    assert gateway._default_plc_id() == "plc_env"
+    gateway.shutdown()
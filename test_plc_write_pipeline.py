@@ -0,0 +1,168 @@
+"""
+Tests für die PLC-Write-Pipeline (Coalescing, Sum-Write, Quittungen, Caches)
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pyads
+
+from modules.core.ads_sum_read import sum_write
+from modules.core.fake_ads import FakeADSConnection
+from modules.core.plc_communication import PLCCommunication
+from modules.core.plc_write_pipeline import PLCWritePipeline
+from modules.gateway.data_gateway import DataGateway
+from modules.plc.variable_manager import SymbolInfo, VariableManager
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+def _make_comm(values, **fake_kwargs):
+    comm = PLCCommunication()
+    comm.plc = FakeADSConnection(values, **fake_kwargs)
+    comm.connected = True
+    return comm
+
+
+def test_repeated_writes_coalesce_and_keep_call_order():
+    comm = _make_comm({"MAIN.rSlider": 0, "MAIN.bLight": False})
+    batches = []
+    pipeline = PLCWritePipeline(comm, window_s=0.3, on_written=batches.append)
+    try:
+        # Einzelner Write nach einer Pause geht sofort raus und öffnet das Fenster
+        assert pipeline.write("MAIN.rSlider", 1, timeout=1.0)
+
+        slider = [pipeline.submit("MAIN.rSlider", value) for value in range(2, 12)]
+        light = pipeline.submit("MAIN.bLight", True)
+        last = pipeline.submit("MAIN.rSlider", 99)
+        assert last.wait(2.0) and light.wait(2.0)
+
+        # Zwischenwerte zusammengefasst; der Slider rückt hinter das Licht
+        # (Teilfolge der Aufrufreihenfolge: ..., Licht=True, Slider=99)
+        assert comm.plc.write_log == [("MAIN.rSlider", 1), ("MAIN.bLight", True), ("MAIN.rSlider", 99)]
+        assert all(ticket.ok and ticket.value == 99 and ticket.coalesced for ticket in slider)
+        assert not last.coalesced
+        assert comm.plc.sum_writes == 1
+        assert [len(batch) for batch in batches] == [1, 2]
+        assert batches[1][1][:4] == (None, "MAIN.rSlider", 99, True)
+
+        # Heißes Symbol: ein einzelner Folge-Write wartet nur das Fenster ab
+        assert pipeline.write("MAIN.rSlider", 100, timeout=2.0)
+        assert comm.plc.write_log[-1] == ("MAIN.rSlider", 100)
+
+        stats = pipeline.get_stats()
+        assert stats["submitted"] == 14 and stats["coalesced"] == 10
+        assert stats["batches"] == 3 and stats["multi_writes"] == 1 and stats["pending"] == 0
+    finally:
+        pipeline.stop()
+
+
+def test_sum_write_reports_per_symbol_results_and_falls_back():
+    fake = FakeADSConnection({"MAIN.a": 0, "MAIN.b": 0, "MAIN.c": 0}, fail_symbols={"MAIN.b"})
+    results, stats = sum_write(fake, {"MAIN.a": 1, "MAIN.b": 2, "MAIN.c": 3}, 500, lambda n, v: False)
+    assert results == {"MAIN.a": True, "MAIN.b": False, "MAIN.c": True}
+    assert stats["round_trips"] == 1 and stats["symbol_errors"] == 1
+
+    # Unbekanntes Symbol → Symbol-Info-Lookup scheitert → Einzel-Writes in Reihenfolge
+    comm = _make_comm({"MAIN.a": 0, "MAIN.c": 0})
+    types = {"MAIN.a": pyads.PLCTYPE_DINT, "MAIN.gone": pyads.PLCTYPE_DINT, "MAIN.c": pyads.PLCTYPE_DINT}
+    results = comm.write_list_by_name({"MAIN.a": 5, "MAIN.gone": 1, "MAIN.c": 7}, types)
+    assert results == {"MAIN.a": True, "MAIN.gone": False, "MAIN.c": True}
+    assert [name for name, _ in comm.plc.write_log] == ["MAIN.a", "MAIN.c"]
+    assert comm.get_connection_status()["sum_write"]["chunk_fallbacks"] == 1
+
+
+def test_gateway_write_acknowledges_and_refreshes_caches():
+    comm = _make_comm({"MAIN.nSetpoint": 10})
+    vm = VariableManager()
+    vm.register_symbol(SymbolInfo("MAIN.nSetpoint", "DINT", 0, 0, 4, ""))
+    gateway = DataGateway()
+    gateway.plc = comm
+    gateway.variable_manager = vm
+    frames = []
+    gateway._emit_variable_updates = frames.append
+    try:
+        assert comm.read_by_name("MAIN.nSetpoint", pyads.PLCTYPE_DINT) == 10
+        assert comm.value_store.get("plc_001", "MAIN.nSetpoint", comm.cache_timeout) == 10
+
+        assert gateway.write_variable("MAIN.nSetpoint", 42, "plc_001") is True
+        # Gemeinsamer Store: geschriebener Wert bekannt, TTL-Read geht wieder zur SPS
+        assert comm.value_store is vm.value_store
+        assert comm.value_store.get("plc_001", "MAIN.nSetpoint", comm.cache_timeout) is None
+        assert vm.get_cached_value("MAIN.nSetpoint")[0] == 42
+        assert gateway.get_telemetry("PLC.MAIN.nSetpoint") == 42
+        assert frames[-1]["plc_001"]["MAIN.nSetpoint"]["value"] == 42
+
+        # Route-Writes laufen über dieselbe Pipeline, ohne auf die Quittung zu warten
+        assert gateway._route_to_plc("plc_001.MAIN.nSetpoint", {"value": 43}, {}) is True
+        assert _wait_for(lambda: gateway.get_write_pipeline_stats()["default"]["written"] == 2)
+        assert comm.plc.values["MAIN.nSetpoint"] == 43
+
+        # write_plc() nutzt ebenfalls die Pipeline der Standard-PLC
+        assert gateway.write_plc("MAIN.nSetpoint", 44, pyads.PLCTYPE_DINT) is True
+        assert comm.plc.values["MAIN.nSetpoint"] == 44
+        assert gateway.get_write_pipeline_stats()["default"]["written"] == 3
+        assert gateway.get_telemetry("PLC.MAIN.nSetpoint") == 44
+
+        # Unbekanntes Symbol in der SPS → negative Quittung
+        vm.register_symbol(SymbolInfo("MAIN.nGone", "DINT", 0, 0, 4, ""))
+        assert gateway.write_variable("MAIN.nGone", 1, "plc_001") is False
+    finally:
+        gateway.shutdown()
+
+
+def test_route_write_does_not_block_ingest_thread():
+    comm = _make_comm({"MAIN.nSetpoint": 10}, latency_s=0.3)
+    gateway = DataGateway()
+    gateway.plc = comm
+    try:
+        started = time.perf_counter()
+        assert gateway._route_to_plc("plc_001.MAIN.nSetpoint", {"value": 7}, {}) is True
+        # Der Aufrufer (z.B. MQTT-Thread bei workers=0) wartet nicht auf die SPS
+        assert time.perf_counter() - started < 0.2
+        assert _wait_for(lambda: comm.plc.values["MAIN.nSetpoint"] == 7)
+
+        # Fehlschlag meldet der Writer-Thread: DLQ-Eintrag und Breaker-Fehler
+        gateway._send_to_target("plc_001.MAIN.nGone", {"source_id": "mqtt", "tag": "t", "value": 1},
+                                {"id": "route_gone"})
+        assert _wait_for(lambda: gateway.get_write_pipeline_stats()["default"]["failed"] == 1, timeout=3)
+        assert _wait_for(lambda: len(gateway.get_dead_letters()) == 1)
+        entry = gateway.get_dead_letters()[0]
+        assert entry["route_id"] == "route_gone" and entry["target"] == "plc_001.MAIN.nGone"
+        assert entry["datapoint"]["value"] == 1
+        breaker = gateway.get_circuit_breaker_stats()["plc:plc_001:route"]
+        # Erfolg zählt erst mit der Quittung (erster Route-Write oben)
+        assert breaker["total_failure"] == 1 and breaker["total_success"] == 1
+    finally:
+        gateway.shutdown()
+
+
+def test_failing_route_settle_does_not_skip_rest_of_batch():
+    gateway = DataGateway()
+    enqueue = gateway._enqueue_dead_letter
+    calls = []
+
+    def flaky_enqueue(**kwargs):
+        calls.append(kwargs["target"])
+        if len(calls) == 1:
+            raise RuntimeError("broadcast kaputt")
+        enqueue(**kwargs)
+
+    gateway._enqueue_dead_letter = flaky_enqueue
+    context = {"route": {"id": "r"}, "datapoint": {"value": 1}}
+    gateway._on_plc_writes([
+        ("plc_001", "MAIN.a", 1, False, {**context, "target": "plc_001.MAIN.a"}),
+        ("plc_001", "MAIN.b", 1, False, {**context, "target": "plc_001.MAIN.b"}),
+    ])
+    assert calls == ["plc_001.MAIN.a", "plc_001.MAIN.b"]
+    assert [entry["target"] for entry in gateway.get_dead_letters()] == ["plc_001.MAIN.b"]
+    assert gateway.get_circuit_breaker_stats()["plc:plc_001:route"]["total_failure"] == 2
+    gateway.shutdown()
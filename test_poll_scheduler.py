@@ -0,0 +1,120 @@
+"""
+Tests für die adaptive Poll-Planung (PollScheduler im DataGateway)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.gateway.data_gateway import DataGateway
+from modules.gateway.poll_scheduler import PollScheduler, fastest_poll_class, resolve_poll_class
+from modules.plc.variable_manager import VariableManager
+
+FAST = ("plc_001", "MAIN.bAlarm")
+NORMAL = ("plc_001", "MAIN.nLevel")
+SLOW = ("plc_001", "MAIN.rTemperature")
+
+
+def test_poll_classes_from_widget_type_and_binding():
+    assert resolve_poll_class(None, "switch") == "fast"
+    assert resolve_poll_class("", "chart") == "slow"
+    assert resolve_poll_class("slow", "switch") == "slow"
+    assert resolve_poll_class("turbo", "unknown") == "normal"
+    assert fastest_poll_class(["slow", "fast", "normal"]) == "fast"
+
+
+def test_due_heap_backs_off_unchanged_and_resets_on_change():
+    scheduler = PollScheduler(base_interval=1.0, budget=100)
+    scheduler.sync({FAST: "fast", NORMAL: "normal", SLOW: "slow"}, now=0.0)
+    assert set(scheduler.pop_due(now=0.0)) == {FAST, NORMAL, SLOW}
+    for key in (FAST, NORMAL, SLOW):
+        scheduler.report(key, changed=False, now=0.0)
+    # Erster Backoff: Basis-Intervall x 1.5
+    assert scheduler.interval_of(FAST) == 0.75
+    assert scheduler.interval_of(SLOW) == 15.0
+    assert scheduler.next_due() == 0.75
+
+    assert scheduler.pop_due(now=1.0) == [FAST]
+    assert scheduler.pop_due(now=1.5) == [NORMAL]
+
+    # Unveränderte Werte bis zum Klassen-Maximum, Änderung → Basis-Intervall
+    for _ in range(20):
+        scheduler.report(NORMAL, changed=False, now=2.0)
+    assert scheduler.interval_of(NORMAL) == 8.0
+    scheduler.report(NORMAL, changed=True, now=2.0)
+    assert scheduler.interval_of(NORMAL) == 1.0
+
+    # Klassenwechsel und Abmeldung
+    scheduler.sync({NORMAL: "fast"}, now=3.0)
+    assert len(scheduler) == 1 and scheduler.interval_of(NORMAL) == 0.5
+    assert scheduler.pop_due(now=3.0) == [NORMAL]
+
+
+def test_budget_limits_reads_and_reports_lag_per_class():
+    scheduler = PollScheduler(base_interval=1.0, budget=2, stats_window=1.0)
+    keys = {("plc_001", f"MAIN.a{i}"): "normal" for i in range(5)}
+    scheduler.sync(keys, now=0.0)
+
+    assert len(scheduler.pop_due(now=0.0)) == 2
+    assert scheduler.last_backlog == 3
+    # Tokens erst nach einem Basis-Intervall wieder verfügbar
+    assert scheduler.pop_due(now=0.2) == []
+    assert len(scheduler.pop_due(now=1.0)) == 2
+
+    stats = scheduler.get_stats()
+    assert stats["scheduled"] == 5 and stats["budget_per_interval"] == 2
+    assert stats["utilisation"] == 1.0
+    assert stats["classes"]["normal"]["backlog"] == 1
+    assert stats["classes"]["normal"]["lag_ms_max"] == 1000.0
+    assert stats["classes"]["fast"]["variables"] == 0
+
+
+def test_backlog_skips_count_once_per_due_period():
+    scheduler = PollScheduler(base_interval=1.0, budget=2)
+    keys = {("plc_001", f"MAIN.a{i}"): "normal" for i in range(5)}
+    scheduler.sync(keys, now=0.0)
+
+    served = scheduler.pop_due(now=0.0)
+    assert scheduler.last_skipped == 3 and scheduler.last_backlog == 3
+    # Poll-Loop dreht im Stau alle ~10 ms: dieselben Variablen zählen nicht erneut
+    for step in range(1, 50):
+        assert scheduler.pop_due(now=step * 0.01) == []
+        assert scheduler.last_skipped == 0
+    assert scheduler.get_stats()["skipped"] == 3
+
+    # Backlog wird in Fälligkeitsreihenfolge abgebaut, next_due zeigt auf den Rückstand
+    assert scheduler.next_due() == 0.0
+    for key in served:
+        scheduler.report(key, changed=True, now=0.5)
+    batch = scheduler.pop_due(now=1.0)
+    assert len(batch) == 2 and not set(batch) & set(served)
+    assert scheduler.last_backlog == 1 and scheduler.last_skipped == 0
+
+    # Neu geplante Variable im Backlog verlässt ihn, ohne doppelt zu zählen
+    rest = [key for key in keys if key not in served and key not in batch]
+    scheduler.report(rest[0], changed=False, now=1.0)
+    assert scheduler.pop_due(now=1.0) == []
+    assert scheduler.last_backlog == 0 and scheduler.get_stats()["classes"]["normal"]["backlog"] == 0
+    assert scheduler.get_stats()["skipped"] == 3
+
+
+def test_gateway_syncs_widget_poll_classes_into_status():
+    vm = VariableManager()
+    vm.subscribe_widget("w1", "MAIN.bAlarm", poll_class="fast")
+    vm.subscribe_widget("w2", "MAIN.rTemperature", poll_class="slow")
+    vm.subscribe_widget("w3", "MAIN.rTemperature", poll_class="normal")
+
+    gateway = DataGateway()
+    gateway.variable_manager = vm
+    gateway._sync_poll_schedule()
+
+    classes = gateway.get_system_status()["poll_scheduler"]["classes"]
+    assert classes["fast"]["variables"] == 1 and classes["normal"]["variables"] == 1
+    assert classes["slow"]["variables"] == 0
+
+    version = vm.subscription_version
+    vm.unsubscribe_widget("w1")
+    assert vm.subscription_version > version
+    gateway._sync_poll_schedule()
+    assert gateway.poll_scheduler.get_stats()["scheduled"] == 1
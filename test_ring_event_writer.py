@@ -0,0 +1,162 @@
+"""
+Tests für die persistenten Ring-Event-Writer (SQLite-WAL-Verbindung, MySQL-Pool, amortisierte Retention)
+"""
+
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.gateway.ring_event_store import RingEventStore
+
+
+def _events(start, count, kind="motion"):
+    return [{"id": f"evt-{i}", "kind": kind, "ding_ts": 1700000000 + i} for i in range(start, start + count)]
+
+
+def test_sqlite_writer_batches_and_amortized_retention(tmp_path, monkeypatch):
+    monkeypatch.setenv("SMARTHOME_RING_EVENT_RETENTION_EVERY", "50")
+    store = RingEventStore(str(tmp_path), str(tmp_path))
+    config = {"backend": "sqlite", "max_entries": 100}
+
+    schema_calls = []
+    create_schema = RingEventStore._create_sqlite_schema
+    monkeypatch.setattr(store, "_create_sqlite_schema", lambda conn: (schema_calls.append(1), create_schema(conn)))
+
+    try:
+        # Zyklen wie ring_event_loop: 6 Events pro Kamera, davon 3 bereits bekannt
+        sizes = []
+        for cycle in range(40):
+            assert store.record_events(_events(cycle * 3, 6), config) == 6
+            with sqlite3.connect(store.default_sqlite_path) as conn:
+                sizes.append(conn.execute("SELECT COUNT(*) FROM ring_events").fetchone()[0])
+            # Lesen direkt nach dem Schreiben sieht den Batch
+            assert store.list_events(1, None, config)[0]["id"] == f"evt-{cycle * 3 + 5}"
+        assert store.record_event({"kind": "ding"}, config) is False
+
+        stats = store.get_writer_stats()["sqlite"][0]
+        assert schema_calls == [1] and stats["batches"] == 40 and stats["inserted"] == 123
+        # Retention nur alle 50 Inserts, Überhang bleibt darunter begrenzt
+        assert stats["retention_runs"] == 2 and max(sizes) < 100 + 50 and sizes[-1] > 100
+
+        store.configure(config)
+        ids = [event["id"] for event in store.iter_events(None, config)]
+        assert ids == [f"evt-{i}" for i in range(122, 22, -1)]
+
+        writer = store._sqlite_writers[store.default_sqlite_path]
+        assert writer.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        conn = writer.conn
+        health = store.record_health_status({"last_error_message": "timeout"}, config)
+        assert health["last_error_message"] == "timeout" and health["storage_backend"] == "sqlite"
+        assert writer.conn is conn
+    finally:
+        store.close()
+    assert store.get_writer_stats()["sqlite"] == []
+
+
+class _FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rowcount = 0
+        self._result = []
+
+    def execute(self, sql, params=None):
+        statement = " ".join(sql.split())
+        self.conn.server.statements.append(statement)
+        if statement.startswith("SELECT stored_at"):
+            offset = params[0]
+            stored = sorted(self.conn.server.rows.values(), reverse=True)
+            self._result = [{"stored_at": stored[offset]}] if len(stored) > offset else []
+        elif statement.startswith("DELETE"):
+            doomed = [key for key, stored_at in self.conn.server.rows.items() if stored_at < params[0]]
+            for key in doomed:
+                del self.conn.server.rows[key]
+            self.rowcount = len(doomed)
+
+    def executemany(self, sql, rows):
+        if self.conn.server.fail:
+            raise RuntimeError("server weg")
+        self.conn.server.statements.append("EXECUTEMANY " + " ".join(sql.split())[:20])
+        before = len(self.conn.server.rows)
+        for row in rows:
+            self.conn.server.rows.setdefault(row[0], row[-1])
+        self.rowcount = len(self.conn.server.rows) - before
+
+    def fetchone(self):
+        return self._result[0] if self._result else None
+
+    def fetchall(self):
+        return list(self._result)
+
+    def close(self):
+        pass
+
+
+class _FakeConnection:
+    def __init__(self, server):
+        self.server = server
+        self.closed = False
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+    def ping(self, reconnect=False):
+        if self.server.ping_fails:
+            self.server.ping_fails -= 1
+            raise RuntimeError("gone away")
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeServer:
+    def __init__(self):
+        self.rows = {}
+        self.statements = []
+        self.connections = []
+        self.ping_fails = 0
+        self.fail = False
+
+    def connect(self, _config):
+        conn = _FakeConnection(self)
+        self.connections.append(conn)
+        return conn, "pymysql"
+
+
+def test_mysql_pool_reuses_connections_and_schema(tmp_path, monkeypatch):
+    monkeypatch.setenv("SMARTHOME_RING_EVENT_RETENTION_EVERY", "100")
+    server = _FakeServer()
+    store = RingEventStore(str(tmp_path), str(tmp_path))
+    monkeypatch.setattr(store, "_connect_mysql", server.connect)
+    monkeypatch.setattr(store, "_mysql_connector_available", lambda: True)
+    config = {"backend": "mysql", "max_entries": 100, "mysql": {"user": "ring"}}
+    assert store.get_status(config)["active_backend"] == "mysql"
+
+    for cycle in range(50):
+        assert store.record_events(_events(cycle * 6, 6), config) == 6
+
+    creates = [s for s in server.statements if s.startswith("CREATE TABLE")]
+    batches = [s for s in server.statements if s.startswith("EXECUTEMANY")]
+    retention = [s for s in server.statements if s.startswith("DELETE")]
+    assert len(server.connections) == 1 and len(creates) == 2
+    assert len(batches) == 50 and len(retention) == 2
+    assert 196 <= len(server.rows) < 200 and min(server.rows, key=server.rows.get) != "evt-0"
+    stats = store.get_writer_stats()["mysql"]
+    assert (stats["created"], stats["reused"], stats["inserted"]) == (1, 50, 300)
+
+    # Abgebrochene Verbindung wird beim ping erkannt und ersetzt
+    server.ping_fails = 1
+    store.record_events(_events(1000, 1), config)
+    assert len(server.connections) == 2 and server.connections[0].closed
+
+    # Serverfehler: Fallback auf SQLite, Pool wird verworfen und neu aufgebaut
+    server.fail = True
+    assert store.record_events(_events(2000, 2), config) == 2
+    assert store._status_note.endswith("Fallback: sqlite.")
+    assert store.get_writer_stats()["mysql"] is None
+    assert [e["id"] for e in store.list_events(5, None, {**config, "backend": "sqlite"})] == ["evt-2001", "evt-2000"]
+    server.fail = False
+    store.record_events(_events(3000, 1), config)
+    assert len([s for s in server.statements if s.startswith("CREATE TABLE")]) == 4
+    store.close()
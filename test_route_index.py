@@ -0,0 +1,70 @@
+from modules.gateway.data_gateway import DataGateway
+from modules.gateway.route_index import RouteIndex
+
+
+def _legacy_match(routes, source_id, tag):
+    full_path = f"{source_id}.{tag}"
+    matched = []
+    for route in routes:
+        if not route.get('enabled', True):
+            continue
+        pattern = route.get('from', '')
+        if pattern == '*' or pattern in (full_path, tag, source_id):
+            matched.append(route)
+        elif pattern.endswith('*') and full_path.startswith(pattern[:-1]):
+            matched.append(route)
+    return matched
+
+
+ROUTES = [
+    {'id': 'all', 'from': '*', 'to': ['unified_data_space']},
+    {'id': 'plc_prefix', 'from': 'plc_001.MAIN.*', 'to': ['widgets']},
+    {'id': 'exact_path', 'from': 'plc_001.MAIN.bAlarm', 'to': ['log.system']},
+    {'id': 'by_tag', 'from': 'voltage', 'to': ['log.system']},
+    {'id': 'by_source', 'from': 'bt.bms_001', 'to': ['widgets']},
+    {'id': 'disabled', 'from': 'plc_001.*', 'to': ['widgets'], 'enabled': False},
+    {'id': 'bt_prefix', 'from': 'bt.*', 'to': ['widgets']},
+]
+
+
+def test_index_matches_legacy_semantics_in_route_order():
+    index = RouteIndex(ROUTES)
+    for source_id, tag in [
+        ('plc_001', 'MAIN.bAlarm'),
+        ('plc_001', 'GVL.nCount'),
+        ('bt.bms_001', 'voltage'),
+        ('mqtt.broker', 'sensors/temp'),
+        ('MyPlugin', 'voltage'),
+    ]:
+        expected = [r['id'] for r in _legacy_match(ROUTES, source_id, tag)]
+        assert [r['id'] for r in index.match(source_id, tag)] == expected
+
+
+def test_match_results_are_cached_and_invalidated_on_rebuild():
+    index = RouteIndex(ROUTES, cache_size=2)
+    index.match('plc_001', 'MAIN.bAlarm')
+    index.match('plc_001', 'MAIN.bAlarm')
+    assert index.get_stats()['cache_hits'] == 1
+
+    index.match('a', 'b')
+    index.match('c', 'd')
+    assert index.get_stats()['cache_evictions'] == 1
+
+    index.build([{'id': 'only', 'from': 'plc_001.MAIN.bAlarm', 'to': ['widgets']}])
+    assert [r['id'] for r in index.match('plc_001', 'MAIN.bAlarm')] == ['only']
+    assert index.get_stats()['cache_entries'] == 1
+
+
+def test_gateway_rebuilds_index_on_validate():
+    gateway = DataGateway()
+    gateway.routes = list(ROUTES)
+    gateway._validate_routes()
+    matched = gateway._match_routes({'source_id': 'bt.bms_001', 'tag': 'voltage'})
+    assert [r['id'] for r in matched] == ['all', 'by_tag', 'by_source', 'bt_prefix']
+
+    # Reload: ungültige Routen werden vor dem Tausch verworfen
+    gateway._validate_routes([{'id': 'new', 'from': 'bt.*', 'to': ['widgets']}, {'id': 'broken', 'from': 'bt.*'}])
+    matched = gateway._match_routes({'source_id': 'bt.bms_001', 'tag': 'voltage'})
+    assert [r['id'] for r in matched] == ['new']
+    assert [r['id'] for r in gateway.routes] == ['new']
+    assert gateway.get_routing_stats()['route_index']['routes'] == 1
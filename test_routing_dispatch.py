@@ -0,0 +1,159 @@
+import threading
+import time
+
+from modules.gateway.data_gateway import DataGateway
+from modules.gateway.route_dispatch import RouteDispatcher
+
+
+class _SlowMQTT:
+    connected = True
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.published = []
+
+    def publish(self, topic, payload):
+        self.release.wait(timeout=5)
+        self.published.append(topic)
+        return True
+
+
+def _make_gateway(workers=0, routes=None):
+    gateway = DataGateway()
+    gateway.DEFAULT_MAX_PPS = 10 ** 6
+    gateway.route_dispatcher.stop()
+    gateway.route_dispatcher = RouteDispatcher(workers=workers, queue_size=64)
+    gateway.route_dispatcher.start()
+    gateway.routes = routes or [{'id': 'all', 'from': '*', 'to': ['unified_data_space']}]
+    gateway._validate_routes()
+    return gateway
+
+
+def test_subscribers_run_without_gateway_lock():
+    gateway = _make_gateway()
+    lock_free = []
+
+    def probe():
+        acquired = gateway.lock.acquire(timeout=0.5)
+        lock_free.append(acquired)
+        if acquired:
+            gateway.lock.release()
+
+    def on_value(datapoint):
+        # Anderer Thread (z.B. Poll-Loop) muss den Lock währenddessen bekommen
+        thread = threading.Thread(target=probe)
+        thread.start()
+        thread.join()
+
+    gateway.subscribe("bt.bms_001.*", on_value)
+    assert gateway.route_data("bt.bms_001", "voltage", 52.3) is True
+    assert lock_free == [True]
+    assert gateway.get_telemetry("bt.bms_001.voltage") == 52.3
+
+
+def test_worker_lanes_preserve_per_source_order():
+    gateway = _make_gateway(workers=4)
+    seen = {}
+    cids = set()
+
+    def on_value(datapoint):
+        seen.setdefault(datapoint['source_id'], []).append(datapoint['value'])
+        cids.add(gateway.get_correlation_id() == datapoint['correlation_id'])
+
+    gateway.subscribe("*", on_value)
+
+    def ingest(source):
+        for n in range(200):
+            gateway.route_data(source, "cell1", n)
+
+    threads = [threading.Thread(target=ingest, args=(f"bt.bms_{i:03d}",)) for i in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert gateway.route_dispatcher.drain(timeout=5)
+
+    assert sorted(seen) == ["bt.bms_000", "bt.bms_001", "bt.bms_002"]
+    for values in seen.values():
+        assert values == list(range(200))
+    assert cids == {True}
+
+    stats = gateway.get_routing_stats()['dispatch']['targets']['subscribers']
+    assert stats['submitted'] == 600
+    assert stats['completed'] == 600
+    gateway.shutdown()
+
+
+def test_slow_mqtt_target_does_not_stall_subscribers():
+    gateway = _make_gateway(workers=1, routes=[
+        {'id': 'to_mqtt', 'from': 'bt.*', 'to': ['mqtt.broker_local.bms/voltage']}
+    ])
+    gateway.mqtt = _SlowMQTT()
+    seen = []
+    gateway.subscribe("bt.bms_001.*", lambda dp: seen.append(dp['value']))
+
+    for n in range(3):
+        gateway.route_data("bt.bms_001", "voltage", n)
+
+    deadline = time.time() + 2
+    while len(seen) < 3 and time.time() < deadline:
+        time.sleep(0.005)
+    # MQTT-Publish hängt noch, Subscriber derselben Quelle sind trotzdem durch
+    assert seen == [0, 1, 2]
+    assert gateway.mqtt.published == []
+
+    gateway.mqtt.release.set()
+    assert gateway.route_dispatcher.drain(timeout=5)
+    assert len(gateway.mqtt.published) == 3
+    gateway.shutdown()
+
+
+def test_full_lane_applies_backpressure():
+    dispatcher = RouteDispatcher(workers=1, queue_size=1)
+    dispatcher.start()
+    release = threading.Event()
+    done = []
+
+    dispatcher.submit("mqtt", "a", release.wait)          # blockiert den Worker
+    time.sleep(0.05)
+    dispatcher.submit("mqtt", "a", done.append, 1)        # füllt die Queue
+    blocked = threading.Thread(target=dispatcher.submit, args=("mqtt", "a", done.append, 2))
+    blocked.start()
+    time.sleep(0.05)
+    assert blocked.is_alive()
+
+    release.set()
+    blocked.join(timeout=2)
+    assert dispatcher.drain(timeout=2)
+    assert done == [1, 2]
+    stats = dispatcher.get_stats()['targets']['mqtt']
+    assert stats['backpressure_waits'] == 1
+    assert stats['backpressure_wait_ms_max'] > 0
+    dispatcher.stop()
+
+
+def test_block_wait_ended_by_stop_runs_inline():
+    dispatcher = RouteDispatcher(workers=1, queue_size=1)
+    dispatcher.start()
+    release = threading.Event()
+    done = []
+
+    dispatcher.submit("mqtt", "a", release.wait)          # blockiert den Worker
+    time.sleep(0.05)
+    dispatcher.submit("mqtt", "a", done.append, 1)        # füllt die Queue
+    results = []
+    blocked = threading.Thread(
+        target=lambda: results.append(dispatcher.submit("mqtt", "a", done.append, 2))
+    )
+    blocked.start()
+    time.sleep(0.05)
+    assert blocked.is_alive()
+
+    dispatcher.stop(timeout=0.1)
+    blocked.join(timeout=2)
+    # Auftrag landet nicht mehr in der beendeten Lane, sondern läuft inline
+    assert results == [False] and done == [2]
+    lane = dispatcher._lanes["mqtt"][0]
+    assert [item[1] for item in lane.items] == [(1,)]
+    assert dispatcher.get_stats()['inline_calls'] == 1
+    release.set()
@@ -0,0 +1,102 @@
+import threading
+import time
+
+from modules.gateway.data_gateway import DataGateway
+from modules.gateway.route_dispatch import RouteDispatcher, parse_queue_policies
+
+
+class _BlockingMQTT:
+    connected = True
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.payloads = []
+
+    def publish(self, topic, payload):
+        self.started.set()
+        self.release.wait(timeout=5)
+        self.payloads.append(payload)
+        return True
+
+
+def _make_gateway(policy, queue_size=2):
+    gateway = DataGateway()
+    gateway.DEFAULT_MAX_PPS = 10 ** 6
+    gateway.route_dispatcher.stop()
+    gateway.route_dispatcher = RouteDispatcher(
+        workers=1,
+        queue_size=queue_size,
+        policies={'mqtt': policy},
+        on_overflow=gateway._on_dispatch_overflow
+    )
+    gateway.route_dispatcher.start()
+    gateway.routes = [{'id': 'bms_out', 'from': 'bt.*', 'to': ['mqtt.broker_local.bms/out']}]
+    gateway._validate_routes()
+    gateway.mqtt = _BlockingMQTT()
+    return gateway
+
+
+def _fill(gateway, values, tag="voltage"):
+    gateway.route_data("bt.bms_001", tag, values[0])
+    assert gateway.mqtt.started.wait(timeout=2)   # Worker hängt im ersten Publish
+    for value in values[1:]:
+        gateway.route_data("bt.bms_001", tag, value)
+
+
+def _finish(gateway):
+    gateway.mqtt.release.set()
+    assert gateway.route_dispatcher.drain(timeout=5)
+    delivered = [int(p.split('"value": ')[1].split(',')[0]) for p in gateway.mqtt.payloads]
+    gateway.shutdown()
+    return delivered
+
+
+def test_parse_queue_policies_ignores_unknown_entries():
+    assert parse_queue_policies("plc:block, mqtt:coalesce,log:drop_oldest,foo:block,widgets:nope") == {
+        'plc': 'block', 'mqtt': 'coalesce', 'log': 'drop_oldest'
+    }
+
+
+def test_drop_oldest_overflow_goes_to_dead_letter_queue():
+    gateway = _make_gateway('drop_oldest')
+    _fill(gateway, [0, 1, 2, 3, 4])
+
+    dlq = gateway.get_dead_letters()
+    assert [entry['datapoint']['value'] for entry in dlq] == [1, 2]
+    assert {entry['error_class'] for entry in dlq} == {'queue_overflow'}
+
+    stats = gateway.get_routing_stats()['dispatch']
+    assert stats['targets']['mqtt']['dropped'] == 2
+    assert stats['overflow_dlq_total'] == 2
+    assert _finish(gateway) == [0, 3, 4]
+
+
+def test_drop_newest_keeps_queued_values():
+    gateway = _make_gateway('drop_newest')
+    _fill(gateway, [0, 1, 2, 3])
+    assert [entry['datapoint']['value'] for entry in gateway.get_dead_letters()] == [3]
+    assert _finish(gateway) == [0, 1, 2]
+
+
+def test_coalesce_replaces_pending_value_per_datapoint():
+    gateway = _make_gateway('coalesce', queue_size=10)
+    _fill(gateway, list(range(10)))
+    gateway.route_data("bt.bms_001", "current", 99)
+
+    mqtt_stats = gateway.get_routing_stats()['dispatch']['targets']['mqtt']
+    assert mqtt_stats['coalesced'] == 8
+    assert mqtt_stats['max_depth'] == 2
+    assert gateway.get_dead_letters() == []
+    assert _finish(gateway) == [0, 9, 99]
+
+
+def test_latency_and_depth_are_reported():
+    gateway = _make_gateway('block', queue_size=10)
+    _fill(gateway, [0, 1, 2])
+    time.sleep(0.02)
+    assert gateway.get_dispatch_stats()['targets']['mqtt']['queued'] == 2
+    _finish(gateway)
+    stats = gateway.get_dispatch_stats()['targets']['mqtt']
+    assert stats['completed'] == 3
+    assert stats['latency_ms_max'] >= 20
@@ -0,0 +1,159 @@
+"""
+Tests für raumbasierte Socket.IO-Zustellung (variable_updates, telemetry_batch)
+"""
+
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.gateway.socket_rooms import SocketRoomRegistry, variable_room
+from modules.gateway.web_manager import WebManager
+
+
+class _Gateway:
+    def get_all_telemetry(self):
+        return {}
+
+
+class _VariableManager:
+    def __init__(self):
+        self.subs = {}
+
+    def subscribe_widget(self, widget_id, variable, plc_id, poll_class="normal"):
+        self.subs[widget_id] = (variable, plc_id)
+
+    def unsubscribe_widget(self, widget_id):
+        self.subs.pop(widget_id, None)
+
+    def get_cached_value(self, variable, plc_id):
+        return None
+
+
+class _ModuleManager:
+    def get_module(self, name):
+        return None
+
+
+class _Wire:
+    """Zeichnet die tatsächlich kodierten Engine.IO-Pakete pro Client auf"""
+
+    def __init__(self, server):
+        self.packets = {}
+        server._send_eio_packet = self._send
+
+    def _send(self, eio_sid, eio_pkt):
+        data = eio_pkt.data if isinstance(eio_pkt.data, str) else str(eio_pkt.data)
+        self.packets.setdefault(eio_sid, []).append(data)
+
+    def take(self, client, event):
+        """Liefert (Bytes, Payloads) eines Events und leert die Aufzeichnung"""
+        packets = self.packets.pop(client.eio_sid, [])
+        size, payloads = 0, []
+        for data in packets:
+            if not data.startswith("2"):
+                continue
+            name, *args = json.loads(data[1:])
+            if name == event:
+                size += len(data.encode("utf-8"))
+                payloads.append(args[0] if args else None)
+        return size, payloads
+
+
+def _web_manager(monkeypatch, rooms=True):
+    monkeypatch.setenv("SMARTHOME_SOCKET_ROOMS", "true" if rooms else "false")
+    wm = WebManager()
+    wm.data_gateway = _Gateway()
+    wm.variable_manager = _VariableManager()
+    wm.app_context = SimpleNamespace(module_manager=_ModuleManager())
+    wm._setup_flask()
+    wm._setup_socketio()
+    # Flask-SocketIO 5.3 kann die Flask-3-Session im Test-Client nicht ersetzen
+    wm.socketio.manage_session = False
+    # Test-Client von Flask-SocketIO 5.3 fängt python-socketio 5.14 Pakete
+    # nicht ab → Versand direkt an der Engine.IO-Grenze mitschneiden
+    wm.wire = _Wire(wm.socketio.server)
+    wm.running = True
+    return wm
+
+
+def _updates(variables):
+    return {"plc_001": {name: {"value": i, "type": "INT", "plc_id": "plc_001"} for i, name in enumerate(variables)}}
+
+
+def _load_run(monkeypatch, rooms, clients=20):
+    wm = _web_manager(monkeypatch, rooms=rooms)
+    variables = [f"MAIN.Room{i:02d}.rTemp" for i in range(clients)]
+    sockets = []
+    for i, variable in enumerate(variables):
+        client = wm.socketio.test_client(wm.app)
+        client.emit("subscribe_variable", {"widget_id": f"w{i}", "variable": variable, "plc_id": "plc_001"})
+        sockets.append(client)
+    wm.wire.packets.clear()
+
+    for _ in range(10):
+        wm.emit_variable_updates(_updates(variables))
+    per_client = [wm.wire.take(client, "variable_updates")[0] for client in sockets]
+    for client in sockets:
+        client.disconnect()
+    return wm, per_client
+
+
+def test_outbound_bytes_scale_with_interest(monkeypatch):
+    _, global_bytes = _load_run(monkeypatch, rooms=False)
+    wm, room_bytes = _load_run(monkeypatch, rooms=True)
+
+    assert all(size > 0 for size in room_bytes)
+    # Jeder Client bekommt nur seine eine von 20 Variablen
+    assert sum(room_bytes) * 10 < sum(global_bytes)
+    assert max(room_bytes) * 10 < min(global_bytes)
+    stats = wm.socket_rooms.get_stats()
+    assert stats["clients"] == 0 and stats["rooms"] == 0
+
+
+def test_shared_variable_room_is_refcounted(monkeypatch):
+    wm = _web_manager(monkeypatch)
+    client = wm.socketio.test_client(wm.app)
+    other = wm.socketio.test_client(wm.app)
+    for widget in ("a", "b"):
+        client.emit("subscribe_variable", {"widget_id": widget, "variable": "MAIN.bOn", "plc_id": "plc_001"})
+    client.emit("unsubscribe_variable", {"widget_id": "a"})
+    wm.wire.packets.clear()
+
+    wm.emit_variable_updates(_updates(["MAIN.bOn"]))
+    _, received = wm.wire.take(client, "variable_updates")
+    assert received[0]["plc_001"]["MAIN.bOn"]["value"] == 0
+    assert wm.wire.take(other, "variable_updates") == (0, [])
+
+    client.emit("unsubscribe_variable", {"widget_id": "b"})
+    wm.emit_variable_updates(_updates(["MAIN.bOn"]))
+    assert wm.wire.take(client, "variable_updates") == (0, [])
+
+
+def test_telemetry_frames_follow_key_subscriptions(monkeypatch):
+    wm = _web_manager(monkeypatch)
+    full = wm.socketio.test_client(wm.app)
+    scoped = wm.socketio.test_client(wm.app)
+    scoped.emit("subscribe_telemetry", {"keys": ["PLC.MAIN.bOn"]})
+
+    wm.broadcast_telemetry("PLC.MAIN.bOn", True)
+    wm.broadcast_telemetry("bluetooth.temp", 21.5)
+    wm.telemetry_broadcaster.flush()
+
+    _, full_frames = wm.wire.take(full, "telemetry_batch")
+    _, scoped_frames = wm.wire.take(scoped, "telemetry_batch")
+    assert set(full_frames[0]["updates"]) == {"PLC.MAIN.bOn", "bluetooth.temp"}
+    assert scoped_frames[0]["updates"] == {"PLC.MAIN.bOn": True}
+    assert scoped_frames[0]["count"] == 1
+
+
+def test_registry_rebind_and_drop():
+    registry = SocketRoomRegistry()
+    room_a, room_b = variable_room("plc_001", "A"), variable_room("plc_001", "B")
+    assert registry.bind("s1", "w1", room_a) == (True, None)
+    assert registry.bind("s1", "w1", room_b) == (True, room_a)
+    assert registry.members(room_a) == set()
+    assert registry.drop_sid("s1") == [room_b]
+    assert registry.get_stats()["memberships"] == 0
@@ -0,0 +1,113 @@
+"""
+Tests für den asynchronen SQLite-Log-Writer (Queue, Batches, Hash-Kette, Überlauf)
+"""
+
+import logging
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.core.database_logger import DatabaseLogger, SQLiteHandler, SQLiteLogWriter
+
+
+def _rows(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT level, module, message FROM system_logs ORDER BY id").fetchall()
+
+
+def test_handler_writes_batched_and_keeps_hash_chain(tmp_path):
+    db_path = str(tmp_path / "logs" / "system_logs.db")
+    handler = SQLiteHandler(db_path)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log = logging.getLogger("test.sqlite_log_writer")
+    log.propagate = False
+    log.addHandler(handler)
+    try:
+        for i in range(300):
+            log.warning("Symbol fehlt: MAIN.x%d", i)
+            if i == 150:
+                # Synchroner Audit-Eintrag landet hinter allen wartenden Warnungen
+                row_id = DatabaseLogger.audit_event(db_path, "test_action", "pytest")
+                assert row_id == 152
+        log.info("nicht gespeichert")
+        handler.flush()
+
+        rows = _rows(db_path)
+        assert len(rows) == 301
+        assert rows[0] == ("WARNING", "test.sqlite_log_writer", "Symbol fehlt: MAIN.x0")
+        assert rows[151][0] == "AUDIT" and rows[-1][2] == "Symbol fehlt: MAIN.x299"
+        assert DatabaseLogger.verify_chain(db_path) == {"ok": True, "checked": 301, "broken_at_id": None}
+
+        stats = handler.writer.get_stats()
+        assert stats["written"] == 301 and stats["dropped"] == 0 and stats["sync_writes"] == 1
+
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+        # Nach Löschungen liest der Writer den letzten Hash neu
+        DatabaseLogger.clear_old_logs(db_path, keep_count=0)
+        log.error("nach dem Leeren")
+        assert DatabaseLogger.verify_chain(db_path) == {"ok": True, "checked": 1, "broken_at_id": None}
+    finally:
+        log.removeHandler(handler)
+        handler.writer.stop()
+
+
+def test_full_queue_drops_oldest_and_counts_overflow(tmp_path):
+    db_path = str(tmp_path / "system_logs.db")
+    writer = SQLiteLogWriter(db_path, queue_size=10, batch_size=4)
+    try:
+        # Writer-Thread blockiert (z.B. langsame Platte) → emit() wartet trotzdem nicht
+        with writer._io_lock:
+            for i in range(25):
+                writer.enqueue(DatabaseLogger._utc_timestamp(), "WARNING", "storm", f"m{i}")
+            assert writer.get_stats()["queued"] == 10
+        writer.flush()
+
+        assert [row[2] for row in _rows(db_path)] == [f"m{i}" for i in range(15, 25)]
+        stats = writer.get_stats()
+        assert stats["dropped"] == 15 and stats["written"] == 10 and stats["max_queue"] == 10
+        assert stats["batches"] == 3  # batch_size=4 → 4 + 4 + 2 Einträge pro Transaktion
+        assert DatabaseLogger.verify_chain(db_path)["ok"] is True
+    finally:
+        writer.stop()
+
+
+def test_failed_batch_is_retried_once_then_counted_as_dropped(tmp_path, capsys):
+    db_path = str(tmp_path / "system_logs.db")
+    writer = SQLiteLogWriter(db_path, batch_size=10)
+    connect = writer._connection
+    failures = {"left": 1}
+
+    def flaky_connection():
+        if failures["left"]:
+            failures["left"] -= 1
+            raise sqlite3.OperationalError("disk I/O error")
+        return connect()
+
+    writer._connection = flaky_connection
+    try:
+        # Verbindung scheitert einmal → Batch wird vor neueren Einträgen wiederholt
+        with writer._io_lock:
+            for i in range(3):
+                writer.enqueue(DatabaseLogger._utc_timestamp(), "WARNING", "flaky", f"m{i}")
+        writer.flush()
+        writer.enqueue(DatabaseLogger._utc_timestamp(), "WARNING", "flaky", "m3")
+        writer.flush()
+        assert [row[2] for row in _rows(db_path)] == ["m0", "m1", "m2", "m3"]
+        stats = writer.get_stats()
+        assert stats["errors"] == 1 and stats["retried"] == 3 and stats["dropped"] == 0
+        assert DatabaseLogger.verify_chain(db_path)["ok"] is True
+
+        # Scheitert auch die Wiederholung, werden die Einträge gezählt und gemeldet
+        failures["left"] = 2
+        with writer._io_lock:
+            writer.enqueue(DatabaseLogger._utc_timestamp(), "WARNING", "flaky", "lost")
+        writer.flush()
+        assert writer.get_stats()["dropped"] == 1 and writer.get_stats()["queued"] == 0
+        assert "1 Log-Einträge verworfen" in capsys.readouterr().err
+        assert len(_rows(db_path)) == 4
+    finally:
+        writer.stop()
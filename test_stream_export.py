@@ -0,0 +1,108 @@
+"""
+Tests für den Streaming-Export (NDJSON/CSV/gzip) von System-Logs und Ring-Events
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+import sys
+import tracemalloc
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.core.database_logger import DatabaseLogger
+from modules.core.stream_export import build_export_stream
+from modules.gateway.ring_event_store import RingEventStore
+from modules.gateway.web_manager import WebManager
+
+
+def _fill_logs(db_path, count):
+    writer = DatabaseLogger.get_writer(db_path)
+    for i in range(count):
+        writer.enqueue(DatabaseLogger._utc_timestamp(), "WARNING", "export", f"Meldung {i} " + "x" * 200)
+        if i % 1000 == 999:
+            writer.flush()
+    writer.flush()
+    return writer
+
+
+def test_log_stream_formats_and_constant_memory(tmp_path):
+    db_path = str(tmp_path / "system_logs.db")
+    writer = _fill_logs(db_path, 5000)
+    try:
+        # NDJSON: neueste zuerst, Keyset-Blöcke ohne Lücken
+        chunks, mimetype, extension = build_export_stream(
+            DatabaseLogger.iter_logs(db_path, chunk_size=333), "ndjson", chunk_bytes=8192
+        )
+        tracemalloc.start()
+        lines = 0
+        total = 0
+        last_id = None
+        for chunk in chunks:
+            total += len(chunk)
+            for line in chunk.splitlines():
+                row = json.loads(line)
+                assert last_id is None or row["id"] == last_id - 1
+                last_id = row["id"]
+                lines += 1
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert (mimetype, extension, lines, last_id) == ("application/x-ndjson", "ndjson", 5000, 1)
+        assert total > 2_500_000 and peak < 1_000_000  # Spitze hängt an chunk_size, nicht an der Exportgröße
+
+        # CSV + gzip, limit und before_id
+        chunks, mimetype, extension = build_export_stream(
+            DatabaseLogger.iter_logs(db_path, limit=10, before_id=100), "csv",
+            fieldnames=DatabaseLogger.EXPORT_FIELDS, compress=True
+        )
+        rows = list(csv.DictReader(io.StringIO(gzip.decompress(b"".join(chunks)).decode("utf-8"))))
+        assert (mimetype, extension) == ("application/gzip", "csv.gz")
+        assert [int(row["id"]) for row in rows] == list(range(99, 89, -1))
+        assert rows[0]["message"].startswith("Meldung 98 ")
+
+        chunks, _, _ = build_export_stream(iter(()), "csv", fieldnames=["id", "message"])
+        assert b"".join(chunks) == b"id,message\r\n"
+    finally:
+        writer.stop()
+
+
+def test_export_endpoints_stream(tmp_path, monkeypatch):
+    monkeypatch.setenv("SMARTHOME_ADMIN_API_KEY", "")
+    monkeypatch.setenv("SMARTHOME_ALLOW_LOOPBACK_WITHOUT_KEY", "true")
+    root = os.path.dirname(os.path.abspath(__file__))
+    db_path = os.path.join(root, "config", "system_logs.db")
+    for i in range(3):
+        DatabaseLogger.audit_event(db_path, "stream_export_seed", "pytest", {"n": i})
+
+    store = RingEventStore(str(tmp_path), str(tmp_path))
+    config = {"backend": "sqlite", "max_entries": 5000}
+    for i in range(1200):
+        store.record_event({"id": f"evt-{i}", "kind": "ding" if i % 2 else "motion", "ding_ts": 1700000000 + i}, config)
+
+    wm = WebManager()
+    wm.app_context = SimpleNamespace(module_manager=None)
+    wm._setup_flask()
+    wm._ring_event_store = store
+    wm._get_ring_event_storage_settings = lambda: config
+    client = wm.app.test_client()
+
+    res = client.get("/api/admin/logs/export?format=ndjson&limit=3")
+    assert res.status_code == 200 and res.is_streamed
+    assert res.headers["Content-Disposition"].endswith("system_logs_export.ndjson")
+    rows = [json.loads(line) for line in res.get_data().splitlines()]
+    # Export beginnt vor dem eigenen Audit-Eintrag
+    own_audit = DatabaseLogger.query_logs(db_path, limit=1, action="logs_export")[0]
+    assert len(rows) == 3 and rows[0]["id"] < own_audit["id"]
+    assert [row["id"] for row in rows] == sorted((row["id"] for row in rows), reverse=True)
+
+    res = client.get("/api/ring/events/export?format=csv&kinds=ding&gzip=1")
+    assert res.status_code == 200 and res.is_streamed and res.mimetype == "application/gzip"
+    events = list(csv.DictReader(io.StringIO(gzip.decompress(res.get_data()).decode("utf-8"))))
+    assert len(events) == 600 and events[0]["id"] == "evt-1199" and events[-1]["id"] == "evt-1"
+    assert [e["id"] for e in store.iter_events(None, config, limit=100, chunk_size=7)] == \
+        [e["id"] for e in store.list_events(100, None, config)]
+
+    assert client.get("/api/ring/events/export?format=xml").status_code == 400
@@ -0,0 +1,106 @@
+"""
+Tests für den binären Symbol-Cache (Format, lazy Zugriff, Migration von symbol_cache.json)
+"""
+
+import json
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.plc.symbol_browser import PLCSymbol, PLCSymbolBrowser
+from modules.plc.symbol_cache_file import (
+    MappedSymbolTable, SymbolCacheFormatError, export_json, write_symbol_cache
+)
+
+
+def _symbols(count=50):
+    return [
+        PLCSymbol(name=f"MAIN.fbRoom{i:02d}.bLicht", symbol_type="BOOL" if i % 2 else "REAL",
+                  index_group=16448, index_offset=4 * i, size=1 if i % 2 else 4,
+                  comment="Küche ☀" if i % 3 == 0 else "")
+        for i in range(count)
+    ]
+
+
+def test_roundtrip_is_lazy_and_compact(tmp_path):
+    path = str(tmp_path / "symbol_cache.bin")
+    symbols = _symbols()
+    write_symbol_cache(path, "plc_001", 123.5, symbols, {"eMode": "INT"})
+
+    table = MappedSymbolTable(path, PLCSymbol)
+    assert table.connection_id == "plc_001" and table.timestamp == 123.5
+    assert table.type_aliases == {"eMode": "INT"}
+    assert len(table) == 50
+    # Namen einzeln, Typen/Kommentare dedupliziert
+    assert table.get_stats()["strings"] == 50 + 2 + 2
+    assert table.get_stats()["materialized_symbols"] == 0
+
+    assert table.to_dicts() == [s.to_dict() for s in symbols]
+    assert table[3].comment == "Küche ☀" and table[-1].name == "MAIN.fbRoom49.bLicht"
+    assert table[3] is table[3]
+    assert table.get_stats()["materialized_symbols"] == 2
+
+    exported = str(tmp_path / "export.json")
+    assert export_json(path, exported) == 50
+    with open(exported, encoding="utf-8") as f:
+        assert json.load(f)["symbols"] == table.to_dicts()
+    table.close()
+
+    with open(path, "r+b") as f:
+        f.seek(6)
+        f.write(b"\x63\x00")
+    with pytest.raises(SymbolCacheFormatError):
+        MappedSymbolTable(path, PLCSymbol)
+
+
+def test_legacy_json_is_migrated_transparently(tmp_path):
+    legacy = tmp_path / "symbol_cache.json"
+    symbols = _symbols(20)
+    legacy.write_text(json.dumps({
+        "connection_id": "plc_001", "timestamp": 42.0,
+        "symbols": [s.to_dict() for s in symbols], "type_aliases": {"eMode": "INT"}
+    }), encoding="utf-8")
+
+    browser = PLCSymbolBrowser()
+    browser.cache_file = str(tmp_path / "symbol_cache.bin")
+    assert browser.load_cache_from_file(browser.cache_file)
+    assert os.path.exists(browser.cache_file)
+    assert [s.name for s in browser.symbol_cache["plc_001"]] == [s.name for s in symbols]
+
+    # Neustart: Binär-Cache wird gemappt, unveränderte Datei nicht neu geladen
+    restarted = PLCSymbolBrowser()
+    restarted.cache_file = browser.cache_file
+    assert restarted.load_cache_from_file(restarted.cache_file)
+    assert isinstance(restarted.symbol_cache["plc_001"], MappedSymbolTable)
+    assert restarted.get_type_aliases("plc_001") == {"eMode": "INT"}
+    generation = restarted.symbol_generation["plc_001"]
+    assert restarted.load_cache_from_file(restarted.cache_file)
+    assert restarted.symbol_generation["plc_001"] == generation
+    index = restarted.get_search_index("plc_001")
+    assert index.search("room07")["variables"][0]["name"] == "MAIN.fbRoom07.bLicht"
+
+    # Neuer Binär-Cache (z.B. TPY-Upload): altes Mapping wird freigegeben
+    mapped = restarted.symbol_cache["plc_001"]
+    assert restarted.get_tree_index("plc_001") is not None
+    write_symbol_cache(restarted.cache_file, "plc_001", 43.0, symbols[:5], {})
+    future = time.time() + 5
+    os.utime(restarted.cache_file, (future, future))
+    assert restarted.load_cache_from_file(restarted.cache_file)
+    assert mapped._mmap.closed and len(restarted.symbol_cache["plc_001"]) == 5
+    assert restarted.get_tree_index("plc_001").level("MAIN")["total"] == 5
+    mapped = restarted.symbol_cache["plc_001"]
+
+    # Neueres JSON (z.B. manuell ersetzt) gewinnt und wird erneut migriert
+    future = time.time() + 10
+    legacy.write_text(json.dumps({"connection_id": "plc_001", "symbols": [symbols[0].to_dict()]}),
+                      encoding="utf-8")
+    os.utime(legacy, (future, future))
+    assert restarted.load_cache_from_file(restarted.cache_file)
+    assert len(restarted.symbol_cache["plc_001"]) == 1
+    # Mapping vor dem Überschreiben der Cache-Datei geschlossen
+    assert mapped._mmap.closed
+    assert restarted.symbol_generation["plc_001"] > generation
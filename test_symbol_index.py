@@ -0,0 +1,97 @@
+"""
+Tests für den Symbol-Suchindex (/api/variables/search)
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.plc.symbol_browser import PLCSymbolBrowser
+from modules.plc.symbol_index import StaleCursorError, SymbolSearchIndex
+from modules.gateway.web_manager import WebManager
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+TPY = os.path.join(ROOT, "plc_data", "HausAutomation.tpy")
+
+
+@pytest.fixture()
+def browser(tmp_path):
+    browser = PLCSymbolBrowser()
+    browser.cache_file = str(tmp_path / "symbol_cache.json")
+    browser.tpy_cache_dir = str(tmp_path / "tpy")
+    assert browser.load_symbols_from_tpy(TPY, "plc_001") > 1000
+    return browser
+
+
+def _linear(browser, query, type_filter=""):
+    return {
+        s.name for s in browser.symbol_cache["plc_001"]
+        if query in s.name.lower() and type_filter in s.symbol_type.upper()
+    }
+
+
+def test_index_matches_linear_scan(browser):
+    index = browser.get_search_index("plc_001")
+    for query in ("light", "bon", "main.", "x", "zz_missing", ".b"):
+        result = index.search(query, limit=100000)
+        assert {v["name"] for v in result["variables"]} == _linear(browser, query)
+        assert result["total"] == len(_linear(browser, query))
+    typed = index.search("light", type_filter="BOOL", limit=100000)
+    assert {v["name"] for v in typed["variables"]} == _linear(browser, "light", "BOOL")
+    assert set(typed["facets"]) <= {v["type"] for v in typed["variables"]}
+
+
+def test_ranking_cursor_and_generation(browser):
+    index = SymbolSearchIndex([
+        ("MAIN.fbLight.bOn", "BOOL", ""),
+        ("GVL.bLightAll", "BOOL", ""),
+        ("Light", "INT", ""),
+        ("MAIN.Lights.nCount", "INT", ""),
+        ("MAIN.fbHall.xLightningOverride", "BOOL", ""),
+    ], generation=7)
+    names = [v["name"] for v in index.search("light")["variables"]]
+    assert names[0] == "Light"                       # exakt
+    assert names[1] == "MAIN.Lights.nCount"          # Segment-Anfang
+    assert names[2:] == [                            # Teilstring, kürzere zuerst
+        "GVL.bLightAll", "MAIN.fbLight.bOn", "MAIN.fbHall.xLightningOverride"
+    ]
+
+    first = index.search("light", limit=2)
+    assert first["next_cursor"] == "7:2"
+    second = index.search("light", limit=2, cursor=first["next_cursor"])
+    assert [v["name"] for v in second["variables"]] == names[2:4]
+    scoped = index.search("", path_prefix="main.", limit=10)
+    assert [v["name"] for v in scoped["variables"]] == [
+        "MAIN.fbHall.xLightningOverride", "MAIN.fbLight.bOn", "MAIN.Lights.nCount"
+    ]
+    with pytest.raises(StaleCursorError):
+        index.search("light", cursor="6:2")
+
+    # Neue Symbolmenge → neuer Index mit neuer Generation
+    before = browser.get_search_index("plc_001")
+    assert browser.get_search_index("plc_001") is before
+    browser.load_symbols_from_tpy(TPY, "plc_001")
+    assert browser.get_search_index("plc_001").generation > before.generation
+
+
+def test_search_endpoint_paginates(browser):
+    wm = WebManager()
+    wm.symbol_browser = browser
+    wm.app_context = SimpleNamespace(module_manager=SimpleNamespace(get_module=lambda name: None))
+    wm._setup_flask()
+    client = wm.app.test_client()
+
+    res = client.get("/api/variables/search?q=light&limit=5")
+    payload = res.get_json()
+    assert res.status_code == 200 and payload["count"] == 5
+    assert payload["total"] == len(_linear(browser, "light"))
+    nxt = client.get(f"/api/variables/search?q=light&limit=5&cursor={payload['next_cursor']}").get_json()
+    assert not {v["name"] for v in nxt["variables"]} & {v["name"] for v in payload["variables"]}
+
+    stale = client.get("/api/variables/search?q=light&cursor=0:5")
+    assert stale.status_code == 409
+    assert stale.get_json()["error_code"] == "cursor_stale"
@@ -0,0 +1,62 @@
+"""
+Tests für die Fallback-Auflösung im VariableManager (normalisierter Index,
+Negativ-Cache, "Meinten Sie"-Vorschläge)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.plc.symbol_index import SymbolSearchIndex
+from modules.plc.symbol_resolver import SymbolResolver, normalize_symbol_key
+from modules.plc.variable_manager import SymbolInfo, VariableManager
+
+NAMES = ["MAIN.nCounter", "MAIN.fbLights.bKitchen", "MAIN.fbLights.bHall", "GVL.rTemperature"]
+
+
+def _manager():
+    vm = VariableManager()
+    for name in NAMES:
+        vm.register_symbol(SymbolInfo(name, "BOOL", 0, 0, 1, "", plc_id="plc_009"))
+    return vm
+
+
+def test_normalized_lookup_and_negative_cache_with_generation():
+    assert normalize_symbol_key(" MAIN.NCounter ") == "ncounter"
+    vm = _manager()
+    for variant in ("ncounter", "NCOUNTER", "main.ncounter", "MAIN.NCOUNTER", "fblights.bkitchen", "gvl.rtemperature"):
+        assert vm.get_symbol_info(variant, "plc_009") is not None, variant
+    assert vm.resolver.get_stats()["index_builds"] == 1
+
+    assert vm.get_symbol_info("MAIN.fbLights.bKitchn", "plc_009") is None
+    assert vm.get_symbol_info("MAIN.fbLights.bKitchn", "plc_009") is None
+    stats = vm.get_statistics()["resolver"]
+    assert stats["negative_entries"] == 1 and stats["negative_hits"] == 1
+
+    # Neues Symbol → neue Generation, der gemerkte Fehlschlag gilt nicht mehr
+    vm.register_symbol(SymbolInfo("MAIN.fbLights.bKitchn", "BOOL", 0, 0, 1, "", plc_id="plc_009"))
+    assert vm.get_symbol_info("main.fblights.bkitchn", "plc_009").name == "MAIN.fbLights.bKitchn"
+    assert vm.resolver.get_stats()["index_builds"] == 1
+
+
+def test_negative_cache_is_bounded():
+    resolver = SymbolResolver(miss_cache_size=2)
+    for name in ("a", "b", "c"):
+        resolver.remember_miss("plc_001", name)
+    assert not resolver.is_known_miss("plc_001", "a")
+    assert resolver.is_known_miss("plc_001", "c")
+    assert resolver.get_stats()["negative_entries"] == 2
+    resolver.invalidate("plc_001")
+    assert not resolver.is_known_miss("plc_001", "c")
+
+
+def test_suggestions_from_search_index():
+    index = SymbolSearchIndex((name, "BOOL", "") for name in NAMES)
+    assert index.suggest("MAIN.fbLight.bKitchen")[0] == "MAIN.fbLights.bKitchen"
+    assert index.suggest("xyz") == []
+
+    vm = _manager()
+    assert vm.suggest_symbols("MAIN.fbLight.bKitchen", "plc_009") == []
+    vm.set_suggestion_provider(lambda plc_id, name, limit: index.suggest(name, limit=limit))
+    assert vm.suggest_symbols("GVL.rTemperatur", "plc_009", limit=1) == ["GVL.rTemperature"]
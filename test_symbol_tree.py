@@ -0,0 +1,78 @@
+"""
+Tests für den vorberechneten Symbolbaum (/api/plc/symbols/tree)
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.gateway.web_manager import WebManager
+from modules.plc.symbol_browser import PLCSymbol, PLCSymbolBrowser
+from modules.plc.symbol_tree import split_symbol_path
+
+
+def _browser(tmp_path):
+    browser = PLCSymbolBrowser()
+    browser.cache_file = str(tmp_path / "symbol_cache.bin")
+    browser.set_symbols("plc_001", [
+        PLCSymbol(".ADSIGRP_DEVICE_DATA", "UDINT", 16448, 2344),
+        PLCSymbol("MAIN.fbLights", "FB_Lights", 16448, 100, 24),
+        PLCSymbol("MAIN.fbLights.bKitchen", "BOOL", 16448, 100, 1, "Küche"),
+        PLCSymbol("MAIN.fbLights.bHall", "BOOL", 16448, 101, 1),
+        PLCSymbol("MAIN.fbLights.stDimmer.nLevel", "INT", 16448, 102, 2),
+        PLCSymbol("MAIN.nCounter", "DINT", 16448, 200, 4),
+        PLCSymbol("GVL.bAlarm", "BOOL", 16448, 300, 1),
+    ])
+    return browser
+
+
+def test_levels_with_counts_and_leaf_metadata(tmp_path):
+    assert split_symbol_path(".ADSIGRP_DEVICE_DATA") == [".ADSIGRP_DEVICE_DATA"]
+    browser = _browser(tmp_path)
+    tree = browser.get_tree_index("plc_001")
+    assert tree.get_stats()["symbols"] == 7
+
+    root = tree.level("")
+    assert [c["name"] for c in root["children"]] == [".ADSIGRP_DEVICE_DATA", "MAIN", "GVL"]
+    main = root["children"][1]
+    assert main["type"] == "folder" and main["child_count"] == 2 and main["leaf_count"] == 5
+    assert main["is_symbol"] is False
+
+    lights = tree.level("MAIN.fbLights")
+    assert lights["node"]["is_symbol"] and lights["node"]["data_type"] == "FB_Lights"
+    assert [c["name"] for c in lights["children"]] == ["bKitchen", "bHall", "stDimmer"]
+    kitchen = lights["children"][0]
+    assert kitchen["type"] == "symbol" and kitchen["data_type"] == "BOOL" and kitchen["comment"] == "Küche"
+    assert lights["children"][2]["child_count"] == 1 and "data_type" not in lights["children"][2]
+
+    page = tree.level("MAIN.fbLights", offset=1, limit=1)
+    assert [c["name"] for c in page["children"]] == ["bHall"] and page["has_more"] is True
+    assert tree.level("MAIN.missing") is None
+
+    nested = browser.get_tree("plc_001")
+    assert nested["children"][1]["children"][0]["children"][0]["full_name"] == "MAIN.fbLights.bKitchen"
+
+    # Gleiche Generation → gleicher Baum, neue Symbolmenge → neu gebaut
+    assert browser.get_tree_index("plc_001") is tree
+    browser.set_symbols("plc_001", [PLCSymbol("MAIN.x", "BOOL")])
+    assert browser.get_tree_index("plc_001").level("MAIN")["total"] == 1
+
+
+def test_tree_endpoint_returns_one_level(tmp_path):
+    wm = WebManager()
+    wm.symbol_browser = _browser(tmp_path)
+    wm.app_context = SimpleNamespace(module_manager=SimpleNamespace(get_module=lambda name: None))
+    wm._setup_flask()
+    client = wm.app.test_client()
+
+    payload = client.get("/api/plc/symbols/tree?path=MAIN").get_json()
+    assert payload["success"] and payload["path"] == "MAIN" and payload["total"] == 2
+    assert {c["full_path"]: c["child_count"] for c in payload["children"]} == {
+        "MAIN.fbLights": 3, "MAIN.nCounter": 0
+    }
+    assert "children" not in payload["children"][0]
+
+    assert client.get("/api/plc/symbols/tree?path=NOPE").status_code == 404
+    assert client.get("/api/plc/symbols/tree?limit=abc").status_code == 400
@@ -0,0 +1,118 @@
+import time
+
+from modules.gateway.telemetry_broadcaster import TelemetryBroadcaster
+from modules.gateway.web_manager import WebManager
+
+
+class _Recorder:
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event, payload=None, **kwargs):
+        self.events.append((event, payload))
+
+
+def test_frame_keeps_last_value_per_key():
+    rec = _Recorder()
+    broadcaster = TelemetryBroadcaster(rec.emit, frame_hz=10)
+    for n in range(100):
+        broadcaster.publish("PLC.MAIN.rTemp", n)
+    broadcaster.publish("bt.bms_001.voltage", 52.3, correlation_id="cid-1")
+
+    assert broadcaster.flush() == 2
+    assert broadcaster.flush() == 0  # leere Frames werden nicht gesendet
+
+    event, payload = rec.events[0]
+    assert len(rec.events) == 1
+    assert event == "telemetry_batch"
+    assert payload["updates"] == {"PLC.MAIN.rTemp": 99, "bt.bms_001.voltage": 52.3}
+    assert payload["count"] == 2
+    assert payload["correlation_id"] == "cid-1"
+
+    stats = broadcaster.get_stats()
+    assert stats["published"] == 101
+    assert stats["coalesced"] == 99
+    assert stats["frames"] == 1
+    assert stats["emits_saved"] == 100
+
+
+def test_late_older_publish_does_not_overwrite_newer_value():
+    rec = _Recorder()
+    broadcaster = TelemetryBroadcaster(rec.emit, frame_hz=10)
+    # Zwei Threads: seq 8 (neuer Wert) erreicht publish() vor seq 7
+    broadcaster.publish("PLC.MAIN.rTemp", 21.5, seq=8)
+    broadcaster.publish("PLC.MAIN.rTemp", 21.0, seq=7)
+    broadcaster.publish("PLC.MAIN.rTemp", 22.0, seq=9)
+    broadcaster.publish("PLC.MAIN.rTemp", 21.0, seq=7)
+    broadcaster.flush()
+
+    payload = rec.events[0][1]
+    assert payload["updates"] == {"PLC.MAIN.rTemp": 22.0}
+    assert payload["seq"] == 9
+    assert broadcaster.get_stats()["stale_dropped"] == 2
+
+
+def test_late_older_publish_after_flush_is_dropped():
+    rec = _Recorder()
+    broadcaster = TelemetryBroadcaster(rec.emit, frame_hz=10, max_keys=2)
+    broadcaster.publish("k", "new", seq=6)
+    broadcaster.flush()
+    # Der neuere Wert ist schon gesendet - der verspätete ältere darf ihn nicht ersetzen
+    broadcaster.publish("k", "old", seq=5)
+    assert broadcaster.flush() == 0
+    assert [payload["updates"] for _, payload in rec.events] == [{"k": "new"}]
+    assert broadcaster.get_stats()["stale_dropped"] == 1
+
+    # Gemerkte Sequenzen sind begrenzt (ältester Key fällt raus)
+    broadcaster.publish("a", 1, seq=7)
+    broadcaster.publish("b", 1, seq=8)
+    broadcaster.publish("k", "older", seq=4)
+    broadcaster.flush()
+    assert rec.events[-1][1]["updates"] == {"a": 1, "b": 1, "k": "older"}
+
+
+def test_flush_thread_emits_at_frame_rate():
+    rec = _Recorder()
+    broadcaster = TelemetryBroadcaster(rec.emit, frame_hz=20)
+    broadcaster.start()
+    try:
+        for n in range(20):
+            broadcaster.publish("PLC.MAIN.nCounter", n)
+            time.sleep(0.01)
+        time.sleep(0.12)
+    finally:
+        broadcaster.stop()
+
+    frames = [payload for event, payload in rec.events if event == "telemetry_batch"]
+    assert 2 <= len(frames) <= 8
+    assert frames[-1]["updates"]["PLC.MAIN.nCounter"] == 19
+    stats = broadcaster.get_stats()
+    assert stats["flush_latency_ms_max"] < 500
+    assert stats["running"] is False
+
+
+def test_web_manager_batches_by_default_and_keeps_legacy_flag(monkeypatch):
+    monkeypatch.delenv("SMARTHOME_TELEMETRY_LEGACY_EVENTS", raising=False)
+    # Globale Zustellung (Raum-Routing: test_socket_rooms.py)
+    monkeypatch.setenv("SMARTHOME_SOCKET_ROOMS", "false")
+    wm = WebManager()
+    wm.running = True
+    wm.socketio = _Recorder()
+    wm.broadcast_telemetry("PLC.MAIN.bOn", True)
+    wm.broadcast_telemetry("PLC.MAIN.bOn", False)
+    assert wm.socketio.events == []
+    wm.telemetry_broadcaster.flush()
+    assert [event for event, _ in wm.socketio.events] == ["telemetry_batch"]
+    assert wm.socketio.events[0][1]["updates"] == {"PLC.MAIN.bOn": False}
+
+    monkeypatch.setenv("SMARTHOME_TELEMETRY_LEGACY_EVENTS", "true")
+    legacy = WebManager()
+    legacy.running = True
+    legacy.socketio = _Recorder()
+    legacy.broadcast_telemetry("PLC.MAIN.bOn", True)
+    assert [event for event, _ in legacy.socketio.events] == ["telemetry_update"]
+
+    monkeypatch.setenv("SMARTHOME_TELEMETRY_BATCH_HZ", "0")
+    unbatched = WebManager()
+    assert unbatched.telemetry_broadcaster is None
+    assert unbatched._telemetry_legacy_events is True
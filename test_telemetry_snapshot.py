@@ -0,0 +1,115 @@
+"""
+Tests für versionierte Telemetrie-Snapshots (Reconnect-Delta, Seiten beim Kaltstart)
+"""
+
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.gateway.data_gateway import DataGateway
+from modules.gateway.web_manager import WebManager
+
+
+def _gateway(keys=0):
+    gateway = DataGateway()
+    for i in range(keys):
+        gateway.update_telemetry(f"bt.bms_{i:03d}.voltage", 50.0 + i)
+    return gateway
+
+
+def test_cold_start_pages_cover_cache_and_late_changes():
+    gateway = _gateway(keys=25)
+    page = gateway.get_telemetry_page(after_seq=0, limit=10)
+    assert page["mode"] == "full" and page["count"] == 10 and page["has_more"] is True
+    seen = dict(page["updates"])
+
+    # Während des Blätterns geänderter Key rutscht ans Ende und kommt trotzdem
+    gateway.update_telemetry("bt.bms_000.voltage", 99.0)
+    while page["has_more"]:
+        page = gateway.get_telemetry_page(page["next_cursor"], limit=10, epoch=page["epoch"])
+        assert page["mode"] == "delta"
+        seen.update(page["updates"])
+
+    assert len(seen) == 25
+    assert seen["bt.bms_000.voltage"] == 99.0
+    assert page["next_cursor"] == gateway.telemetry_seq
+
+
+def test_reconnect_delta_contains_only_changes():
+    gateway = _gateway(keys=200)
+    cursor, epoch = gateway.telemetry_seq, gateway.telemetry_epoch
+    gateway.update_telemetry("bt.bms_007.voltage", 1.0)
+    gateway.update_telemetry("PLC.MAIN.bOn", True)
+    gateway.update_telemetry("bt.bms_007.voltage", 2.0)
+
+    delta = gateway.get_telemetry_page(cursor, limit=500, epoch=epoch)
+    assert delta["mode"] == "delta"
+    assert delta["updates"] == {"PLC.MAIN.bOn": True, "bt.bms_007.voltage": 2.0}
+    assert delta["has_more"] is False and delta["next_cursor"] == gateway.telemetry_seq
+
+    idle = gateway.get_telemetry_page(delta["next_cursor"], epoch=epoch)
+    assert idle["count"] == 0 and idle["mode"] == "delta"
+
+    # Fremde Epoch (Server-Neustart) oder Cursor aus der Zukunft → voller Snapshot
+    assert gateway.get_telemetry_page(cursor, limit=500, epoch="other")["count"] == 201
+    assert gateway.get_telemetry_page(10 ** 9, limit=500, epoch=epoch)["mode"] == "full"
+
+
+class _ModuleManager:
+    def get_module(self, name):
+        return None
+
+
+def _web_manager(gateway):
+    wm = WebManager()
+    wm.data_gateway = gateway
+    wm.app_context = SimpleNamespace(module_manager=_ModuleManager())
+    wm._setup_flask()
+    wm._setup_socketio()
+    # Flask-SocketIO 5.3 kann die Flask-3-Session im Test-Client nicht ersetzen
+    wm.socketio.manage_session = False
+    events = {}
+
+    def _send(eio_sid, pkt):
+        data = str(pkt.data)
+        if data.startswith("2"):
+            name, *args = json.loads(data[1:])
+            events.setdefault(eio_sid, []).append((name, args[0] if args else None))
+
+    wm.socketio.server._send_eio_packet = _send
+    return wm, events
+
+
+def test_connect_with_cursor_gets_delta_instead_of_full_telemetry(monkeypatch):
+    monkeypatch.setenv("SMARTHOME_TELEMETRY_SNAPSHOT_CHUNK", "50")
+    gateway = _gateway(keys=120)
+    wm, events = _web_manager(gateway)
+
+    legacy = wm.socketio.test_client(wm.app)
+    names = [name for name, _ in events[legacy.eio_sid]]
+    assert "initial_telemetry" in names and "telemetry_snapshot" not in names
+
+    cold = wm.socketio.test_client(wm.app, auth={"telemetry_epoch": None, "telemetry_seq": 0})
+    first = [p for n, p in events[cold.eio_sid] if n == "telemetry_snapshot"][0]
+    assert first["mode"] == "full" and first["count"] == 50 and first["has_more"] is True
+    cold.emit("request_telemetry_snapshot", {"epoch": first["epoch"], "cursor": first["next_cursor"]})
+    second = [p for n, p in events[cold.eio_sid] if n == "telemetry_snapshot"][1]
+    assert second["cursor"] == first["next_cursor"] and second["count"] == 50
+
+    cursor = gateway.telemetry_seq
+    gateway.update_telemetry("bt.bms_042.voltage", 0.5)
+    warm = wm.socketio.test_client(
+        wm.app, auth={"telemetry_epoch": gateway.telemetry_epoch, "telemetry_seq": cursor}
+    )
+    delta = [p for n, p in events[warm.eio_sid] if n == "telemetry_snapshot"][0]
+    assert delta["mode"] == "delta"
+    assert delta["updates"] == {"bt.bms_042.voltage": 0.5}
+    assert all(name != "initial_telemetry" for name, _ in events[warm.eio_sid])
+
+    stats = wm._telemetry_snapshot_stats
+    assert stats["legacy_connects"] == 1 and stats["full_connects"] == 1 and stats["delta_connects"] == 1
+    for client in (legacy, cold, warm):
+        client.disconnect()
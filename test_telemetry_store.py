@@ -0,0 +1,101 @@
+"""
+Tests für den LRU-Telemetrie-Cache (TelemetryStore)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.gateway.data_gateway import DataGateway
+from modules.gateway.telemetry_store import TelemetryStore, parse_source_quotas, telemetry_source
+
+
+def test_evicts_least_recently_updated_key():
+    store = TelemetryStore(limit=3)
+    store.set("PLC.MAIN.bPump", True)      # zuerst registriert, aber heiß
+    store.set("bt.bms_001.voltage", 52.0)
+    store.set("bt.bms_002.voltage", 51.0)
+    store.set("PLC.MAIN.bPump", False)
+    store.set("bt.bms_003.voltage", 50.0)
+
+    assert "PLC.MAIN.bPump" in store
+    assert "bt.bms_001.voltage" not in store
+    assert len(store) == 3
+    assert store.get_stats()["sources"]["bt"]["evictions_lru"] == 1
+
+
+def test_source_quota_protects_other_sources():
+    store = TelemetryStore(limit=100, quotas=parse_source_quotas("mqtt:10, bad, x:abc"))
+    for i in range(20):
+        store.set(f"PLC.MAIN.nValue{i}", i)
+    for i in range(500):
+        store.set(f"mqtt.broker_local.sensors/{i}", i)
+
+    stats = store.get_stats()
+    assert stats["sources"]["PLC"]["entries"] == 20
+    assert stats["sources"]["mqtt"]["entries"] == 10
+    assert stats["sources"]["mqtt"]["evictions_quota"] == 490
+    assert stats["sources"]["PLC"]["evictions_lru"] == 0
+    assert store.get("mqtt.broker_local.sensors/499") == 499
+    assert telemetry_source("PLC.MAIN.x") == "PLC"
+
+
+def test_quota_of_one_keeps_single_entry_per_source():
+    store = TelemetryStore(limit=100, quotas={"mqtt": 1})
+    for key in ("mqtt.a", "mqtt.b", "mqtt.c"):
+        store.set(key, 1)
+    assert len(store) == 1 and "mqtt.c" in store
+    assert store.get_stats()["sources"]["mqtt"]["entries"] == 1
+
+    # Update des einzigen Keys und Nachfolger nach erneuter Verdrängung
+    store.set("mqtt.c", 5)
+    assert store.get("mqtt.c") == 5
+    store.set("mqtt.b", 6)
+    store.set("mqtt.b", 7)
+    assert len(store) == 1 and store.get("mqtt.b") == 7 and "mqtt.c" not in store
+    assert store.get_stats()["sources"]["mqtt"]["evictions_quota"] == 3
+
+
+def test_gateway_keeps_hot_keys_and_reports_per_source(monkeypatch):
+    monkeypatch.setenv("SMARTHOME_TELEMETRY_CACHE_SIZE", "100")
+    monkeypatch.setenv("SMARTHOME_TELEMETRY_SOURCE_QUOTAS", "mqtt:40")
+    gateway = DataGateway()
+    gateway.update_telemetry("PLC.MAIN.bAlarm", False)
+    for i in range(300):
+        gateway.update_telemetry(f"bt.bms_{i:03d}.voltage", float(i))
+        if i % 50 == 0:
+            gateway.update_telemetry("PLC.MAIN.bAlarm", i % 100 == 0)
+    for i in range(100):
+        gateway.update_telemetry(f"mqtt.broker.t{i}", i)
+
+    assert gateway.get_telemetry("PLC.MAIN.bAlarm") is False
+    assert len(gateway.get_all_telemetry()) == 100
+    status = gateway.get_system_status()
+    sources = status["telemetry_store"]["sources"]
+    assert sources["mqtt"]["entries"] == 40
+    assert sources["mqtt"]["evictions_quota"] == 60
+    assert status["telemetry_evictions"] == status["telemetry_store"]["evictions"]
+
+
+def test_change_pages_start_at_cursor_and_skip_superseded_keys():
+    store = TelemetryStore(limit=50)
+    for i in range(40):
+        store.set(f"bt.k{i}", i)
+    for i in range(0, 40, 2):
+        store.set(f"bt.k{i}", -i)  # ältere Positionen werden überholt
+    store.set("bt.new", 1)  # LRU verdrängt nichts, limit 50
+
+    expected = store.changes_since(10)
+    assert list(store.iter_changes_since(10)) == expected
+    assert store.count_changes_since(10) == len(expected) == 36
+    assert store.count_changes_since(0) == len(store) == 41
+
+    # Viele Updates: Log wird kompaktiert, Seiten bleiben korrekt
+    for n in range(500):
+        store.set(f"bt.k{n % 5}", n)
+    head = store.seq
+    assert [key for key, _, _ in store.iter_changes_since(head - 5)] == [f"bt.k{i}" for i in range(5)]
+    assert len(store._log) <= 2 * len(store) + 64
+    assert store.count_changes_since(0) == len(store)
+    assert list(store.iter_changes_since(0)) == store.changes_since(0)
@@ -0,0 +1,122 @@
+"""
+Tests für den gemeinsamen Streaming-TPY-Reader (Expansion, Parse-Cache, Konsumenten)
+"""
+
+import os
+import shutil
+import sys
+import xml.etree.ElementTree as ET
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.core.symbol_manager import SymbolManager
+from modules.gateway.plc_symbol_parser import PLCSymbolParser
+from modules.plc import tpy_reader
+from modules.plc.symbol_browser import PLCSymbolBrowser
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+TPY = os.path.join(ROOT, "plc_data", "HausAutomation.tpy")
+
+NESTED_TPY = """<?xml version="1.0"?>
+<PlcProjectInfo>
+  <DataTypes>
+    <DataType><Name>R_TRIG</Name><FbInfo/>
+      <SubItem><Name>CLK</Name><Type>BOOL</Type><BitSize>8</BitSize></SubItem>
+      <SubItem><Name>Q</Name><Type>BOOL</Type><BitSize>8</BitSize></SubItem>
+    </DataType>
+    <DataType><Name>FB_Light</Name><FbInfo/>
+      <SubItem><Name>bOn</Name><Type>BOOL</Type><BitSize>8</BitSize><Comment>Licht an</Comment></SubItem>
+      <SubItem><Name>rtOn</Name><Type>R_TRIG</Type><BitSize>16</BitSize></SubItem>
+    </DataType>
+    <DataType><Name>ST_Room</Name>
+      <SubItem><Name>fbCeiling</Name><Type>FB_Light</Type></SubItem>
+      <SubItem><Name>fbWall</Name><Type>FB_Light</Type></SubItem>
+    </DataType>
+    <DataType><Name>eMode</Name><Type>INT</Type></DataType>
+  </DataTypes>
+  <Programs>
+    <Program><Name>MAIN</Name><PrgInfo><Symbol><Name>MAIN.stKitchen</Name></Symbol></PrgInfo></Program>
+  </Programs>
+  <Symbols>
+    <Symbol><Name>MAIN.stKitchen</Name><Type>ST_Room</Type><IGroup>16448</IGroup><IOffset>12</IOffset><BitSize>64</BitSize></Symbol>
+    <Symbol><Name>MAIN.eMode</Name><Type>eMode</Type><IGroup>16448</IGroup><IOffset>20</IOffset><BitSize>16</BitSize></Symbol>
+  </Symbols>
+</PlcProjectInfo>
+"""
+
+
+@pytest.fixture(autouse=True)
+def _fresh_memory_cache():
+    tpy_reader.clear_memory_cache()
+    yield
+    tpy_reader.clear_memory_cache()
+
+
+def test_nested_expansion_and_duplicate_priority(tmp_path):
+    path = tmp_path / "nested.tpy"
+    path.write_text(NESTED_TPY, encoding="utf-8")
+
+    result = tpy_reader.parse_tpy(str(path))
+    by_name = {sym.name: sym for sym in result.symbols}
+
+    assert [sym.name for sym in result.symbols[:4]] == [
+        "MAIN.stKitchen", "MAIN.stKitchen.fbCeiling", "MAIN.stKitchen.fbCeiling.bOn",
+        "MAIN.stKitchen.fbCeiling.rtOn"
+    ]
+    # Programmvariable ohne Typ wird durch den Symbol-Eintrag mit Typ ersetzt
+    assert by_name["MAIN.stKitchen"].type == "ST_Room"
+    assert by_name["MAIN.stKitchen"].index_offset == 12 and by_name["MAIN.stKitchen"].size == 8
+    assert by_name["MAIN.stKitchen.fbWall.rtOn.Q"].type == "BOOL"
+    assert by_name["MAIN.stKitchen.fbWall.bOn"].comment == "Licht an"
+    assert len(result.symbols) == 1 + 2 * (1 + 1 + 1 + 2) + 1
+    assert result.type_aliases == {"eMode": "INT"}
+    assert result.fb_types == {"R_TRIG", "FB_Light"}
+
+
+def test_parse_cache_by_content_hash(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    path = str(tmp_path / "upload.tpy")
+    shutil.copyfile(TPY, path)
+
+    first = tpy_reader.read_tpy(path, cache_dir=cache_dir)
+    assert first.source == "parse" and len(first.symbols) > 1000
+    assert tpy_reader.read_tpy(path, cache_dir=cache_dir).source == "memory"
+
+    # Neustart: RAM leer, Disk-Cache liefert dasselbe Ergebnis ohne Parsen
+    tpy_reader.clear_memory_cache()
+    from_disk = tpy_reader.read_tpy(path, cache_dir=cache_dir)
+    assert from_disk.source == "disk"
+    assert from_disk.symbols == first.symbols and from_disk.type_aliases == first.type_aliases
+
+    # Geänderter Inhalt → neuer Hash → neu parsen
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("\n")
+    assert tpy_reader.read_tpy(path, cache_dir=cache_dir).source == "parse"
+
+    broken = tmp_path / "broken.tpy"
+    broken.write_text("not xml", encoding="utf-8")
+    with pytest.raises(ET.ParseError):
+        tpy_reader.read_tpy(str(broken))
+
+
+def test_consumers_share_one_symbol_set(tmp_path, capsys):
+    browser = PLCSymbolBrowser()
+    browser.cache_file = str(tmp_path / "symbol_cache.json")
+    browser.tpy_cache_dir = str(tmp_path / "tpy")
+    count = browser.load_symbols_from_tpy(TPY, "plc_001")
+
+    parser = PLCSymbolParser(TPY)
+    assert parser.parse()
+
+    manager = SymbolManager()
+    manager.cache_file = str(tmp_path / "manager_cache.json")
+    assert manager.import_from_tpy(TPY)
+
+    names = [s.name for s in browser.symbol_cache["plc_001"]]
+    assert count == len(names)
+    assert [s["name"] for s in parser.symbols] == names
+    assert [s["name"] for s in manager.symbols] == names
+    assert browser.get_type_aliases("plc_001") == tpy_reader.read_tpy(TPY).type_aliases
+    assert {s["category"] for s in parser.symbols} >= {"FunctionBlock", "Variable"}
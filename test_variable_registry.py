@@ -0,0 +1,62 @@
+"""
+Tests für die kompakte Symbol-Registry im VariableManager (Slots, lazy Alias-Index)
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.plc.variable_manager import SymbolInfo, VariableManager
+
+
+def _manager():
+    vm = VariableManager()
+    vm.register_symbols_bulk([
+        {"name": "MAIN.VbAusgang6", "type": "BOOL", "size": 1},
+        {"name": "MAIN.fbLichter.bLichtWohnzimmer", "type": "BOOL", "size": 1},
+        {"name": "GVL.bLichtWohnzimmer", "type": "BOOL", "size": 1},
+        {"name": "MAIN.nCounter", "type": "DINT", "size": 4},
+    ])
+    return vm
+
+
+def test_aliases_are_resolved_lazily_from_normalized_index():
+    vm = _manager()
+    assert not hasattr(SymbolInfo("x", "BOOL", 0, 0, 1, ""), "__dict__")
+    # Nur echte Symbolnamen in der Registry, Alias-Index noch nicht gebaut
+    assert len(vm.symbols) == 4
+    assert vm.get_statistics()["alias_index_keys"] == 0
+
+    assert vm.get_symbol_info("MAIN.nCounter").symbol_type == "DINT"
+    assert vm.get_symbol_info("nCounter").name == "MAIN.nCounter"
+    for alias in ("VbAusgang6", "VBAUSGANG6", "vb_ausgang6", "Vb_Ausgang6"):
+        assert vm.get_symbol_info(alias).name == "MAIN.VbAusgang6", alias
+    # Erstes registriertes Symbol gewinnt bei gleichem Alias
+    assert vm.get_symbol_info("licht_wohnzimmer").name == "MAIN.fbLichter.bLichtWohnzimmer"
+    assert vm.get_symbol_info("Licht_Wohnzimmer").name == "MAIN.fbLichter.bLichtWohnzimmer"
+    assert vm.get_symbol_info("fblichter.blichtwohnzimmer").name == "MAIN.fbLichter.bLichtWohnzimmer"
+    assert vm.get_symbol_info("unbekannt") is None
+    assert vm.get_statistics()["alias_index_keys"] > 0
+
+    # Nach dem Aufbau werden neue Symbole inkrementell aufgenommen
+    vm.register_symbol(SymbolInfo("MAIN.rTemperaturAussen", "REAL", 0, 0, 4, ""))
+    assert vm.get_symbol_info("temperatur_aussen").symbol_type == "REAL"
+    assert vm.get_symbol_info("temperatur_aussen", plc_id="plc_002") is None
+
+
+def test_config_aliases_apply_before_and_after_registration(tmp_path):
+    cfg = tmp_path / "alias_mappings.json"
+    cfg.write_text(json.dumps({"plc_001": {"Licht_WZ": "GVL.bLichtWohnzimmer", "Zaehler": "MAIN.nCounter"}}),
+                   encoding="utf-8")
+    vm = VariableManager()
+    vm.register_symbol(SymbolInfo("MAIN.nCounter", "DINT", 0, 0, 4, ""))
+    assert vm.load_alias_mappings(str(cfg))
+    vm.register_symbols_bulk([{"name": "MAIN.fbLichter.bLichtWohnzimmer", "type": "BOOL"},
+                              {"name": "GVL.bLichtWohnzimmer", "type": "BOOL"}])
+
+    assert vm.get_symbol_info("Zaehler").name == "MAIN.nCounter"
+    assert vm.get_symbol_info("Licht_WZ").name == "GVL.bLichtWohnzimmer"
+    assert ("plc_001", "GVL.bLichtWohnzimmer") not in vm.pending_aliases
+    assert vm.get_symbol_info("Licht_WZ") is vm.symbols[("plc_001", "GVL.bLichtWohnzimmer")]
@@ -1207,11 +1207,24 @@ class SmartHomeApp {
             this.updateAllWidgets(data);
         });
 
+        // Telemetrie-Snapshot-Seiten (Reconnect-Delta bzw. Kaltstart)
+        this.socket.registerCallback('telemetry_snapshot', (data) => {
+            this.updateAllWidgets((data && data.updates) || {});
+        });
+
         // Telemetrie-Updates
         this.socket.registerCallback('telemetry_update', (data) => {
             this.updateWidget(data.key, data.value);
         });
 
+        // Gebündelte Telemetrie-Frames
+        this.socket.registerCallback('telemetry_batch', (data) => {
+            const updates = (data && data.updates) || {};
+            for (const [key, value] of Object.entries(updates)) {
+                this.updateWidget(key, value);
+            }
+        });
+
         // Blob-Updates
         this.socket.registerCallback('blob_update', (data) => {
             console.log('🖼️ Blob-Update:', data.key);
@@ -7175,7 +7188,11 @@ class SmartHomeApp {
                     // Update Widget UI
                     this.updateWidgetValue(widget.id, value, type);
                 },
-                plcId
+                plcId,
+                {
+                    widgetType: widget.type,
+                    pollClass: widget.config?.poll_class || widget.bindings.value.poll_class
+                }
             );
         }
 
@@ -25,6 +25,8 @@ class TreeView {
             expandLevel: options.expandLevel || 1, // Wie viele Ebenen initial expandiert
             onNodeClick: options.onNodeClick || null,
             onNodeDragStart: options.onNodeDragStart || null,
+            // async (node) => children; für Knoten mit child_count, aber ohne geladene Kinder
+            loadChildren: options.loadChildren || null,
             ...options
         };
 
@@ -145,7 +147,8 @@ class TreeView {
 
         const isExpanded = this.expandedNodes.has(node.full_path || node.name) || level < this.options.expandLevel;
         const hasChildren = node.children && node.children.length > 0;
-        const isLeaf = node.type === 'symbol' || !hasChildren;
+        const canLoadChildren = !node.children && node.child_count > 0 && !!this.options.loadChildren;
+        const isLeaf = node.type === 'symbol' || (!hasChildren && !canLoadChildren);
 
         // Node-Wrapper
         const nodeDiv = document.createElement('div');
@@ -162,7 +165,7 @@ class TreeView {
 
             expandIcon.addEventListener('click', (e) => {
                 e.stopPropagation();
-                this.toggleNode(node.full_path || node.name);
+                this.toggleNode(node.full_path || node.name, node);
             });
         } else {
             // Spacer für Blätter
@@ -262,11 +265,20 @@ class TreeView {
         return 'text-gray-400';
     }
 
-    toggleNode(nodePath) {
+    async toggleNode(nodePath, node = null) {
         if (this.expandedNodes.has(nodePath)) {
             this.expandedNodes.delete(nodePath);
         } else {
             this.expandedNodes.add(nodePath);
+            // Lazy Loading: Kinder erst beim ersten Aufklappen holen
+            if (node && !node.children && node.child_count > 0 && this.options.loadChildren) {
+                try {
+                    node.children = await this.options.loadChildren(node);
+                } catch (error) {
+                    console.error('TreeView: Kinder konnten nicht geladen werden:', error);
+                    this.expandedNodes.delete(nodePath);
+                }
+            }
         }
 
         this.render(this.filteredData || this.data);
@@ -29,6 +29,7 @@ class VariableExplorer {
             searchable: true,
             expandLevel: 1,
             onNodeClick: (node) => this.onVariableClick(node, 'plc'),
+            loadChildren: (node) => this.fetchPLCTreeLevel(node.full_path),
             onNodeDragStart: (node, e) => {
                 console.log('Drag Start:', node.full_path);
             }
@@ -98,16 +99,13 @@ class VariableExplorer {
         console.log('📥 Lade PLC-Symbole...');
 
         try {
-            const response = await fetch('/api/plc/symbols/tree');
-            if (!response.ok) {
-                throw new Error('Failed to load PLC symbols');
-            }
-
-            const treeData = await response.json();
+            // Nur die oberste Ebene laden, tiefere Ebenen beim Aufklappen
+            const treeData = await this.fetchPLCTreeLevel('');
 
             if (this.plcTreeView) {
                 this.plcTreeView.render(treeData);
-                console.log(`✅ ${this.countNodes(treeData)} PLC-Symbole geladen`);
+                const total = treeData.reduce((sum, node) => sum + (node.leaf_count || 0), 0);
+                console.log(`✅ ${treeData.length} Knoten (${total} PLC-Symbole) geladen`);
             }
 
         } catch (error) {
@@ -127,6 +125,28 @@ class VariableExplorer {
         }
     }
 
+    /**
+     * Lädt eine Ebene des PLC-Symbolbaums (alle Seiten)
+     * @param {string} path - Pfad des Elternknotens ('' = Wurzel)
+     */
+    async fetchPLCTreeLevel(path) {
+        const children = [];
+        let offset = 0;
+        while (true) {
+            const params = new URLSearchParams({ path, offset: String(offset), limit: '1000' });
+            const response = await fetch(`/api/plc/symbols/tree?${params}`);
+            if (!response.ok) {
+                throw new Error('Failed to load PLC symbols');
+            }
+            const level = await response.json();
+            children.push(...(level.children || []));
+            if (!level.has_more) {
+                return children;
+            }
+            offset += level.count;
+        }
+    }
+
     /**
      * Lädt MQTT-Topics vom Server
      */
@@ -15,6 +15,10 @@ class SocketHandler {
         this.socket = null;
         this.connected = false;
         this.telemetryCache = {};
+        // Reconnect-Cursor für Delta-Snapshots (Epoch + letzte Sequenz)
+        this.telemetryEpoch = null;
+        this.telemetrySeq = 0;
+        this.snapshotInProgress = false;
         this.systemCapabilities = {};
         this.reconnectAttempts = 0;
         this.maxReconnectAttempts = 10;
@@ -32,7 +36,12 @@ class SocketHandler {
             reconnection: true,
             reconnectionDelay: 1000,
             reconnectionDelayMax: 5000,
-            reconnectionAttempts: this.maxReconnectAttempts
+            reconnectionAttempts: this.maxReconnectAttempts,
+            // Wird bei jedem (Re-)Connect ausgewertet → Server sendet nur Änderungen
+            auth: (cb) => cb({
+                telemetry_epoch: this.telemetryEpoch,
+                telemetry_seq: this.telemetrySeq
+            })
         });
 
         this.setupEventHandlers();
@@ -77,6 +86,30 @@ class SocketHandler {
             }
         });
 
+        // Versionierter Snapshot (Delta seit telemetry_seq bzw. seitenweise Kaltstart)
+        this.socket.on('telemetry_snapshot', (data) => {
+            if (!data) return;
+            if (data.mode === 'full' && data.cursor === 0) {
+                this.telemetryCache = {};
+            }
+            Object.assign(this.telemetryCache, data.updates || {});
+            this.telemetryEpoch = data.epoch;
+            this.telemetrySeq = data.next_cursor;
+            this.snapshotInProgress = !!data.has_more;
+
+            if (window.updateTelemetryList) {
+                window.updateTelemetryList(this.telemetryCache);
+            }
+            this.triggerCallback('telemetry_snapshot', data);
+
+            if (data.has_more) {
+                this.socket.emit('request_telemetry_snapshot', {
+                    epoch: data.epoch,
+                    cursor: data.next_cursor
+                });
+            }
+        });
+
         this.socket.on('telemetry_update', (data) => {
             const { key, value, timestamp } = data;
             console.log('[SocketHandler] Telemetrie-Update:', key, '=', value);
@@ -93,6 +126,30 @@ class SocketHandler {
             this.triggerCallback('telemetry:' + key, value);
         });
 
+        // Gebündelte Telemetrie (ein Frame pro 1/SMARTHOME_TELEMETRY_BATCH_HZ)
+        this.socket.on('telemetry_batch', (data) => {
+            const updates = (data && data.updates) || {};
+
+            // Cursor erst nach vollständigem Snapshot weiterschieben
+            if (!this.snapshotInProgress && this.telemetryEpoch && data && data.seq > this.telemetrySeq) {
+                this.telemetrySeq = data.seq;
+            }
+
+            // Update Cache
+            Object.assign(this.telemetryCache, updates);
+
+            // Update UI (einmal pro Frame statt pro Key)
+            if (window.updateTelemetryList) {
+                window.updateTelemetryList(this.telemetryCache);
+            }
+
+            // Callbacks für spezifische Keys
+            for (const [key, value] of Object.entries(updates)) {
+                this.triggerCallback('telemetry:' + key, value);
+            }
+            this.triggerCallback('telemetry_batch', data);
+        });
+
         this.socket.on('blob_update', (data) => {
             const { key, timestamp } = data;
             console.log('[SocketHandler] Blob-Update:', key);
@@ -79,8 +79,9 @@ class VariableManager {
      * @param {string} variable - Variable-Name (z.B. "Light.Light_EG_WZ.bOn")
      * @param {function} callback - Callback für Value-Updates: (value, timestamp, type) => {}
      * @param {string} plcId - PLC-ID (Standard: 'plc_001')
+     * @param {object} options - Optional: { widgetType, pollClass ('fast' | 'normal' | 'slow') }
      */
-    subscribe(widgetId, variable, callback, plcId = 'plc_001') {
+    subscribe(widgetId, variable, callback, plcId = 'plc_001', options = {}) {
         if (!widgetId || !variable || !callback) {
             console.error('❌ subscribe(): widgetId, variable und callback erforderlich');
             return;
@@ -92,14 +93,18 @@ class VariableManager {
         this.subscriptions.set(widgetId, {
             variable: variable,
             plc_id: plcId,
-            callback: callback
+            callback: callback,
+            widget_type: options.widgetType || null,
+            poll_class: options.pollClass || null
         });
 
-        // Sende Subscribe-Request an Backend
+        // Sende Subscribe-Request an Backend (Poll-Klasse aus Widget-Typ/Binding)
         this.socket.emit('subscribe_variable', {
             widget_id: widgetId,
             variable: variable,
-            plc_id: plcId
+            plc_id: plcId,
+            widget_type: options.widgetType || null,
+            poll_class: options.pollClass || null
         });
 
         if (!hadSubscription) {
@@ -351,7 +356,9 @@ class VariableManager {
             this.socket.emit('subscribe_variable', {
                 widget_id: widgetId,
                 variable: subscription.variable,
-                plc_id: subscription.plc_id
+                plc_id: subscription.plc_id,
+                widget_type: subscription.widget_type,
+                poll_class: subscription.poll_class
             });
         }
         console.log(`📌 Re-Subscribe ausgeführt: ${this.subscriptions.size} Widgets`);